@@ -0,0 +1,552 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Persistent SQLite store of parsed backend model and TypeScript interface files.
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import time
+from array import array
+from pathlib import Path
+from typing import Any
+
+from ts_backend_check.parsers.django_parser import DjangoModel
+from ts_backend_check.parsers.typescript_parser import (
+    UNSUPPORTED_TYPE,
+    IntersectionType,
+    SourcePosition,
+    StringLiteralType,
+    TypeExpression,
+    TypeReference,
+    TypeScriptFile,
+    TypeScriptImport,
+    TypeScriptInterface,
+    TypeScriptTypeAlias,
+    UnionType,
+    UnparsedInterface,
+)
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+# MARK: Serialization
+
+
+def serialize_models(models: dict[str, DjangoModel]) -> str:
+    """
+    Serialize extracted Django models to JSON.
+
+    Parameters
+    ----------
+    models : dict[str, DjangoModel]
+        The models to serialize.
+
+    Returns
+    -------
+    str
+        The JSON representation of the models.
+    """
+    return json.dumps(
+        [[m.name, m.fields, m.blank_fields, m.line] for m in models.values()]
+    )
+
+
+def deserialize_models(data: str) -> dict[str, DjangoModel]:
+    """
+    Deserialize Django models from JSON, interning the model and field names.
+
+    Parameters
+    ----------
+    data : str
+        The JSON representation of the models from serialize_models.
+
+    Returns
+    -------
+    dict[str, DjangoModel]
+        The deserialized models.
+    """
+    models: dict[str, DjangoModel] = {}
+    for name, fields, blank_fields, line in json.loads(data):
+        models[sys.intern(name)] = DjangoModel(
+            name=sys.intern(name),
+            fields=tuple(sys.intern(f) for f in fields),
+            blank_fields=tuple(sys.intern(f) for f in blank_fields),
+            line=line,
+        )
+
+    return models
+
+
+def serialize_interface(interface: TypeScriptInterface) -> list[Any]:
+    """
+    Serialize an interface or object literal type to a list that can be dumped as JSON.
+
+    Parameters
+    ----------
+    interface : TypeScriptInterface
+        The interface to serialize.
+
+    Returns
+    -------
+    list[Any]
+        The attributes of the interface.
+    """
+    return [
+        interface.name,
+        interface.properties,
+        interface.optional_properties,
+        interface.parents,
+        interface.position,
+        list(interface.property_positions),
+    ]
+
+
+def deserialize_interface(data: list[Any]) -> TypeScriptInterface:
+    """
+    Deserialize an interface or object literal type from serialize_interface, interning all names.
+
+    Parameters
+    ----------
+    data : list[Any]
+        The attributes of the interface.
+
+    Returns
+    -------
+    TypeScriptInterface
+        The deserialized interface.
+    """
+    name, properties, optional_properties, parents, position, property_positions = data
+
+    return TypeScriptInterface(
+        name=sys.intern(name),
+        properties=tuple(sys.intern(p) for p in properties),
+        optional_properties=tuple(sys.intern(p) for p in optional_properties),
+        parents=tuple(sys.intern(p) for p in parents),
+        position=SourcePosition(*position) if position else None,
+        property_positions=array("q", property_positions),
+    )
+
+
+def serialize_interfaces(interfaces: dict[str, TypeScriptInterface]) -> str:
+    """
+    Serialize interfaces to JSON.
+
+    Parameters
+    ----------
+    interfaces : dict[str, TypeScriptInterface]
+        The interfaces to serialize.
+
+    Returns
+    -------
+    str
+        The JSON representation of the interfaces.
+    """
+    return json.dumps([serialize_interface(i) for i in interfaces.values()])
+
+
+def deserialize_interfaces(data: str) -> dict[str, TypeScriptInterface]:
+    """
+    Deserialize interfaces from serialize_interfaces.
+
+    Parameters
+    ----------
+    data : str
+        The JSON representation of the interfaces.
+
+    Returns
+    -------
+    dict[str, TypeScriptInterface]
+        The deserialized interfaces in their original order.
+    """
+    interfaces: dict[str, TypeScriptInterface] = {}
+    for interface_data in json.loads(data):
+        interface = deserialize_interface(interface_data)
+        interfaces[interface.name] = interface
+
+    return interfaces
+
+
+def serialize_type_expression(expression: TypeExpression) -> list[Any]:
+    """
+    Serialize a type expression to a list that starts with the kind of the expression.
+
+    Parameters
+    ----------
+    expression : TypeExpression
+        The type expression to serialize.
+
+    Returns
+    -------
+    list[Any]
+        The kind of the expression followed by its attributes.
+    """
+    if isinstance(expression, TypeReference):
+        return [
+            "reference",
+            expression.name,
+            [serialize_type_expression(a) for a in expression.arguments],
+        ]
+
+    if isinstance(expression, (IntersectionType, UnionType)):
+        return [
+            "intersection" if isinstance(expression, IntersectionType) else "union",
+            [serialize_type_expression(t) for t in expression.types],
+        ]
+
+    if isinstance(expression, StringLiteralType):
+        return ["string", expression.value]
+
+    if isinstance(expression, TypeScriptInterface):
+        return ["object", serialize_interface(expression)]
+
+    return ["unsupported"]
+
+
+def deserialize_type_expression(data: list[Any]) -> TypeExpression:
+    """
+    Deserialize a type expression from serialize_type_expression.
+
+    Parameters
+    ----------
+    data : list[Any]
+        The kind of the expression followed by its attributes.
+
+    Returns
+    -------
+    TypeExpression
+        The deserialized type expression.
+    """
+    kind, *attributes = data
+    if kind == "reference":
+        name, arguments = attributes
+        return TypeReference(
+            name=sys.intern(name),
+            arguments=tuple(deserialize_type_expression(a) for a in arguments),
+        )
+
+    if kind in ("intersection", "union"):
+        types = tuple(deserialize_type_expression(t) for t in attributes[0])
+        return IntersectionType(types) if kind == "intersection" else UnionType(types)
+
+    if kind == "string":
+        return StringLiteralType(attributes[0])
+
+    if kind == "object":
+        return deserialize_interface(attributes[0])
+
+    return UNSUPPORTED_TYPE
+
+
+def serialize_ts_file(ts_file: TypeScriptFile) -> str:
+    """
+    Serialize the parsed interfaces, type aliases, ignored fields and imports of a TypeScript file to JSON.
+
+    Parameters
+    ----------
+    ts_file : TypeScriptFile
+        The parsed TypeScript file to serialize.
+
+    Returns
+    -------
+    str
+        The JSON representation of the TypeScript file.
+    """
+    return json.dumps(
+        {
+            "interfaces": [serialize_interface(i) for i in ts_file.interfaces.values()],
+            "type_aliases": [
+                [
+                    t.name,
+                    t.parameters,
+                    serialize_type_expression(t.type),
+                    t.position,
+                ]
+                for t in ts_file.type_aliases.values()
+            ],
+            "ignored_fields": sorted(ts_file.ignored_fields),
+            "imports": [list(i) for i in ts_file.imports],
+            "unparsed_interfaces": [
+                [u.name, u.parents, u.position, u.body_position]
+                for u in ts_file.unparsed_interfaces
+            ],
+        }
+    )
+
+
+def deserialize_ts_file(data: str) -> TypeScriptFile:
+    """
+    Deserialize the parsed interfaces, type aliases, ignored fields and imports of a TypeScript file from JSON, interning all names.
+
+    Parameters
+    ----------
+    data : str
+        The JSON representation of the TypeScript file from serialize_ts_file.
+
+    Returns
+    -------
+    TypeScriptFile
+        The interfaces, type aliases, ignored fields and imports of the file.
+    """
+    ts_file = json.loads(data)
+    interfaces: dict[str, TypeScriptInterface] = {}
+    for interface_data in ts_file["interfaces"]:
+        interface = deserialize_interface(interface_data)
+        interfaces[interface.name] = interface
+
+    type_aliases: dict[str, TypeScriptTypeAlias] = {}
+    for name, parameters, type_, position in ts_file["type_aliases"]:
+        type_aliases[sys.intern(name)] = TypeScriptTypeAlias(
+            name=sys.intern(name),
+            parameters=tuple(sys.intern(p) for p in parameters),
+            type=deserialize_type_expression(type_),
+            position=SourcePosition(*position) if position else None,
+        )
+
+    return TypeScriptFile(
+        interfaces=interfaces,
+        type_aliases=type_aliases,
+        ignored_fields=frozenset(sys.intern(f) for f in ts_file["ignored_fields"]),
+        imports=tuple(
+            TypeScriptImport(
+                name=sys.intern(name),
+                imported_name=sys.intern(imported_name),
+                module=module,
+                is_export=is_export,
+            )
+            for name, imported_name, module, is_export in ts_file["imports"]
+        ),
+        unparsed_interfaces=tuple(
+            UnparsedInterface(
+                name=sys.intern(name),
+                parents=tuple(sys.intern(p) for p in parents),
+                position=SourcePosition(*position) if position else None,
+                body_position=SourcePosition(*body_position),
+            )
+            for name, parents, position, body_position in ts_file["unparsed_interfaces"]
+        ),
+    )
+
+
+# MARK: Artifact Store
+
+
+class ArtifactStore:
+    """
+    SQLite store of parse artifacts keyed by the content hash of a file and the version of the parser.
+
+    The store uses write-ahead logging and short transactions so that several processes can read and write it at once.
+    Lookups only read from the database, with the usage statistics and last use times that they record being written in a single transaction via flush.
+
+    Parameters
+    ----------
+    db_path : Path
+        The path to the SQLite database file.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        self._connection: sqlite3.Connection | None = None
+        self._connection_pid: int | None = None
+        self._pending_stats: dict[str, int] = {}
+        self._pending_used_at: dict[str, float] = {}
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """
+        The connection to the database, which is reopened in forked processes.
+
+        Returns
+        -------
+        sqlite3.Connection
+            The connection to the database for the current process.
+        """
+        if self._connection is None or self._connection_pid != os.getpid():
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(
+                self.db_path, timeout=30, isolation_level=None
+            )
+            self._connection_pid = os.getpid()
+            # Lookups of the parent process are flushed by the parent rather than by forked processes.
+            self._pending_stats = {}
+            self._pending_used_at = {}
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS artifacts ("
+                "key TEXT PRIMARY KEY, kind TEXT NOT NULL, data TEXT NOT NULL, "
+                "size INTEGER NOT NULL, created_at REAL NOT NULL, last_used_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+            )
+
+        return self._connection
+
+    def _increment_stat(self, name: str) -> None:
+        """
+        Increment a usage statistic of the store until the next flush.
+
+        Parameters
+        ----------
+        name : str
+            The name of the statistic to increment.
+        """
+        self._pending_stats[name] = self._pending_stats.get(name, 0) + 1
+
+    def flush(self) -> None:
+        """
+        Write the usage statistics and last use times that lookups recorded since the last flush in a single transaction.
+        """
+        connection = self.connection
+        if not self._pending_stats and not self._pending_used_at:
+            return
+
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.executemany(
+                "UPDATE artifacts SET last_used_at = ? WHERE key = ?",
+                [(used_at, key) for key, used_at in self._pending_used_at.items()],
+            )
+            connection.executemany(
+                "INSERT INTO stats (name, value) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+                list(self._pending_stats.items()),
+            )
+            connection.execute("COMMIT")
+
+        except sqlite3.Error:
+            connection.execute("ROLLBACK")
+            raise
+
+        self._pending_stats = {}
+        self._pending_used_at = {}
+
+    def get(self, key: str) -> str | None:
+        """
+        Get the artifact for a key and record the lookup in the usage statistics until the next flush.
+
+        Parameters
+        ----------
+        key : str
+            The key of the artifact.
+
+        Returns
+        -------
+        str | None
+            The serialized artifact, or None if the key isn't in the store.
+        """
+        row = self.connection.execute(
+            "SELECT data FROM artifacts WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self._increment_stat("misses")
+            return None
+
+        self._pending_used_at[key] = time.time()
+        self._increment_stat("hits")
+
+        return row[0]
+
+    def put(self, key: str, kind: str, data: str) -> None:
+        """
+        Store the artifact for a key.
+
+        Parameters
+        ----------
+        key : str
+            The key of the artifact.
+
+        kind : str
+            The kind of file the artifact was parsed from ('models' or 'ts').
+
+        data : str
+            The serialized artifact.
+        """
+        now = time.time()
+        self.connection.execute(
+            "INSERT OR REPLACE INTO artifacts (key, kind, data, size, created_at, last_used_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (key, kind, data, len(data), now, now),
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get the size and usage statistics of the store.
+
+        Returns
+        -------
+        dict[str, Any]
+            The number of entries, their total size in bytes, the size of the database file and the hits and misses of lookups.
+        """
+        self.flush()
+        entries, size = self.connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM artifacts"
+        ).fetchone()
+        stats = dict(self.connection.execute("SELECT name, value FROM stats"))
+
+        return {
+            "entries": entries,
+            "size": size,
+            "file_size": self.db_path.stat().st_size,
+            "hits": stats.get("hits", 0),
+            "misses": stats.get("misses", 0),
+        }
+
+    def prune(self, max_size: int, max_age_days: float) -> int:
+        """
+        Evict entries that haven't been used within the max age, then least recently used entries until the store is within the max size.
+
+        Parameters
+        ----------
+        max_size : int
+            The maximum total size of the entries in bytes.
+
+        max_age_days : float
+            The maximum number of days since an entry was last used.
+
+        Returns
+        -------
+        int
+            The number of entries that were evicted.
+        """
+        # Entries that were just used are kept even if they haven't been flushed yet.
+        self.flush()
+        connection = self.connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            evicted = connection.execute(
+                "DELETE FROM artifacts WHERE last_used_at < ?",
+                (time.time() - max_age_days * SECONDS_PER_DAY,),
+            ).rowcount
+
+            total_size = 0
+            keys_to_evict = []
+            for key, size in connection.execute(
+                "SELECT key, size FROM artifacts ORDER BY last_used_at DESC"
+            ):
+                total_size += size
+                if total_size > max_size:
+                    keys_to_evict.append((key,))
+
+            connection.executemany("DELETE FROM artifacts WHERE key = ?", keys_to_evict)
+            connection.execute("COMMIT")
+
+        except sqlite3.Error:
+            connection.execute("ROLLBACK")
+            raise
+
+        connection.execute("VACUUM")
+
+        return evicted + len(keys_to_evict)
+
+    def close(self) -> None:
+        """
+        Flush the recorded lookups and close the connection to the database.
+        """
+        if self._connection is not None and self._connection_pid == os.getpid():
+            self.flush()
+            self._connection.close()
+
+        self._connection = None
+        self._connection_pid = None
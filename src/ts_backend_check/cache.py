@@ -0,0 +1,1104 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Caches for parsed backend model and TypeScript interface files.
+"""
+
+import hashlib
+import importlib.metadata
+import json
+import os
+import time
+from concurrent.futures import Executor, Future
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Iterable, Mapping
+
+from ts_backend_check.artifact_store import (
+    SECONDS_PER_DAY,
+    ArtifactStore,
+    deserialize_interfaces,
+    deserialize_models,
+    deserialize_ts_file,
+    serialize_interfaces,
+    serialize_models,
+    serialize_ts_file,
+)
+from ts_backend_check.diagnostics import Diagnostic
+from ts_backend_check.import_graph import ImportGraphLoader
+from ts_backend_check.interface_index import InterfaceIndex
+from ts_backend_check.model_index import ModelIndex
+from ts_backend_check.parsers import django_parser, typescript_parser
+from ts_backend_check.parsers.django_parser import DjangoModel, extract_model_fields
+from ts_backend_check.parsers.typescript_parser import (
+    TypeScriptFile,
+    TypeScriptInterface,
+    UnparsedInterface,
+    parse_ts_file,
+    parse_ts_interfaces,
+)
+from ts_backend_check.utils import get_backend_model_file_paths
+
+CACHE_DIR_PATH = Path.cwd() / ".tsbc-cache"
+ARTIFACT_STORE_FILE_NAME = "artifacts.sqlite3"
+# Increment when the format of cached results changes.
+RESULT_CACHE_VERSION = 4
+
+
+def get_tool_version() -> str:
+    """
+    Get the installed version of ts-backend-check to key cached results with.
+
+    Returns
+    -------
+    str
+        The installed version of ts-backend-check, or 'unknown' if it isn't installed via pip.
+    """
+    try:
+        return importlib.metadata.version("ts-backend-check")
+
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def write_json_atomically(file_path: Path, data: Any) -> None:
+    """
+    Write JSON to a file such that concurrent readers never see a partially written file.
+
+    Parameters
+    ----------
+    file_path : Path
+        The path of the file to write.
+
+    data : Any
+        The data to serialize as JSON.
+    """
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file_path = file_path.with_name(f"{file_path.name}.{os.getpid()}.tmp")
+    tmp_file_path.write_text(json.dumps(data), encoding="utf-8")
+    os.replace(tmp_file_path, file_path)
+
+
+def hash_key(*parts: Any) -> str:
+    """
+    Derive a cache key from its component parts.
+
+    Parameters
+    ----------
+    *parts : Any
+        The parts that identify the cached item.
+
+    Returns
+    -------
+    str
+        The SHA-256 hex digest of the parts.
+    """
+    return hashlib.sha256("\0".join(str(p) for p in parts).encode("utf-8")).hexdigest()
+
+
+def hash_file(file_path: str | Path) -> str:
+    """
+    Derive a hash of the contents of a file, reading it in chunks so that large files aren't held in memory.
+
+    Parameters
+    ----------
+    file_path : str | Path
+        The path to the file to hash.
+
+    Returns
+    -------
+    str
+        The SHA-256 hex digest of the bytes of the file.
+    """
+    with open(file_path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def parse_models_file(
+    models_file: str | Path,
+    models_to_ignore: list[str] | None,
+    timeout: float | None = None,
+) -> dict[str, DjangoModel]:
+    """
+    Extract the models of a backend models file from its bytes.
+
+    Parameters
+    ----------
+    models_file : str | Path
+        A models.py file that defines Django models.
+
+    models_to_ignore : list[str] | None
+        Model classes to ignore, obtained from the config file.
+
+    timeout : float, default=None
+        The number of seconds that extracting the models can take before a ParseTimeoutError is raised, with no limit if not passed.
+
+    Returns
+    -------
+    dict[str, DjangoModel]
+        The models from the models file with their ordered and blank fields.
+    """
+    return extract_model_fields(
+        models_file=str(models_file),
+        models_to_ignore=models_to_ignore,
+        # Newlines aren't translated so that the source is the same as the hashed bytes.
+        source=Path(models_file).read_bytes().decode("utf-8"),
+        timeout=timeout,
+    )
+
+
+# MARK: Parse Cache
+
+
+class ParseCache:
+    """
+    In-process cache of parsed files keyed by path and revalidated by modification time, size and content hash.
+
+    A single cache is shared across all identifiers in a run so that each distinct file is only parsed once.
+    Only the latest parse of each file is kept so that long running sessions such as watch mode don't grow the cache as files are edited.
+
+    Parameters
+    ----------
+    artifact_store : ArtifactStore, default=None
+        A persistent store that is checked for parsed files that aren't in memory and that newly parsed files are written to.
+
+    parse_timeout : float, default=None
+        The number of seconds that parsing each file can take before a ParseTimeoutError is raised, with no limit if not passed.
+
+    executor : Executor, default=None
+        A process pool that the models and TypeScript files of an identifier are parsed on in parallel and that large TypeScript files are split across, with files being parsed in this process if not passed.
+
+    max_workers : int, default=1
+        The number of workers of the executor, which is the number of segments that large TypeScript files are split into.
+    """
+
+    def __init__(
+        self,
+        artifact_store: ArtifactStore | None = None,
+        parse_timeout: float | None = None,
+        executor: Executor | None = None,
+        max_workers: int = 1,
+    ) -> None:
+        self.artifact_store = artifact_store
+        self.parse_timeout = parse_timeout
+        self.executor = executor
+        self.max_workers = max_workers
+        self._entries: dict[tuple[Any, ...], tuple[tuple[int, int], str, Any]] = {}
+        # Files are parsed lazily when imports are followed so that only the interfaces that are needed are parsed in full.
+        self.import_graph_loader = ImportGraphLoader(
+            get_ts_file=lambda ts_file: self.get_ts_file(ts_file, lazy=True)
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def _get(
+        self,
+        key: tuple[Any, ...],
+        file_path: str | Path,
+        parse: Callable[[str], Any],
+    ) -> Any:
+        """
+        Return the cached parse of a file, hashing it only if its modification time or size changed and parsing it only if its contents changed.
+
+        Parameters
+        ----------
+        key : tuple[Any, ...]
+            The key of the parse, which starts with the resolved path of the file.
+
+        file_path : str | Path
+            The path to the file.
+
+        parse : Callable[[str], Any]
+            A function that parses the file given the hash of its contents.
+
+        Returns
+        -------
+        Any
+            The parsed file.
+        """
+        stale = self._find_stale(key=key, file_path=file_path)
+        if stale is None:
+            self.hits += 1
+            return self._entries[key][2]
+
+        signature, digest = stale
+        self.misses += 1
+        parsed = parse(digest)
+        self._entries[key] = (signature, digest, parsed)
+
+        return parsed
+
+    def _find_stale(
+        self, key: tuple[Any, ...], file_path: str | Path
+    ) -> tuple[tuple[int, int], str] | None:
+        """
+        Check whether the cached parse of a file is missing or out of date, hashing the file only if its modification time or size changed.
+
+        Parameters
+        ----------
+        key : tuple[Any, ...]
+            The key of the parse, which starts with the resolved path of the file.
+
+        file_path : str | Path
+            The path to the file.
+
+        Returns
+        -------
+        tuple[tuple[int, int], str] | None
+            The modification time and size of the file and the hash of its contents if it needs to be parsed, or None if the cached parse is up to date.
+        """
+        stat = os.stat(file_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == signature:
+            return None
+
+        digest = hash_file(file_path)
+        if entry is not None and entry[1] == digest:
+            self._entries[key] = (signature, digest, entry[2])
+            return None
+
+        return signature, digest
+
+    def _parse_models(
+        self,
+        models_file: str | Path,
+        models_to_ignore: list[str] | None,
+        digest: str,
+    ) -> dict[str, DjangoModel]:
+        """
+        Parse a backend models file, reusing a parse from the artifact store if there is one.
+
+        Parameters
+        ----------
+        models_file : str | Path
+            A models.py file that defines Django models.
+
+        models_to_ignore : list[str] | None
+            Model classes to ignore, obtained from the config file.
+
+        digest : str
+            The hash of the contents of the models file.
+
+        Returns
+        -------
+        dict[str, DjangoModel]
+            The models from the models file with their ordered and blank fields.
+        """
+        store_key = hash_key(
+            "models",
+            django_parser.PARSER_VERSION,
+            digest,
+            *sorted(models_to_ignore or []),
+        )
+        if self.artifact_store is not None and (
+            data := self.artifact_store.get(store_key)
+        ):
+            return deserialize_models(data)
+
+        models = parse_models_file(
+            models_file, models_to_ignore, timeout=self.parse_timeout
+        )
+        self._store_parse(
+            store_key=store_key, data=serialize_models, parsed=models, kind="models"
+        )
+
+        return models
+
+    def _parse_ts_file(
+        self, ts_file: str | Path, digest: str, lazy: bool = False
+    ) -> TypeScriptFile:
+        """
+        Parse a TypeScript file via a memory map, reusing a parse from the artifact store if there is one.
+
+        Parameters
+        ----------
+        ts_file : str | Path
+            The path to the TypeScript file.
+
+        digest : str
+            The hash of the contents of the TypeScript file.
+
+        lazy : bool, default=False
+            Whether the bodies of interfaces are skipped and recorded as unparsed interfaces.
+
+        Returns
+        -------
+        TypeScriptFile
+            The interfaces, type aliases and ignored fields of the file.
+        """
+        store_key = hash_key(
+            "ts-lazy" if lazy else "ts", typescript_parser.PARSER_VERSION, digest
+        )
+        if self.artifact_store is not None and (
+            data := self.artifact_store.get(store_key)
+        ):
+            return deserialize_ts_file(data)
+
+        parsed = parse_ts_file(
+            ts_file,
+            lazy=lazy,
+            timeout=self.parse_timeout,
+            executor=self.executor,
+            max_segments=self.max_workers,
+        )
+        self._store_parse(store_key=store_key, data=serialize_ts_file, parsed=parsed)
+
+        return parsed
+
+    def _parse_ts_interfaces(
+        self,
+        ts_file: str | Path,
+        unparsed_interfaces: tuple[UnparsedInterface, ...],
+        digest: str,
+    ) -> dict[str, TypeScriptInterface]:
+        """
+        Parse the bodies of interfaces that a lazy parse skipped, reusing a parse from the artifact store if there is one.
+
+        Parameters
+        ----------
+        ts_file : str | Path
+            The path to the TypeScript file.
+
+        unparsed_interfaces : tuple[UnparsedInterface, ...]
+            The interfaces from the lazy parse of the file that are needed.
+
+        digest : str
+            The hash of the contents of the TypeScript file.
+
+        Returns
+        -------
+        dict[str, TypeScriptInterface]
+            The parsed interfaces in the order they're declared.
+        """
+        store_key = hash_key(
+            "ts-interfaces",
+            typescript_parser.PARSER_VERSION,
+            digest,
+            *(u.body_position.offset for u in unparsed_interfaces),
+        )
+        if self.artifact_store is not None and (
+            data := self.artifact_store.get(store_key)
+        ):
+            return deserialize_interfaces(data)
+
+        interfaces = parse_ts_interfaces(
+            ts_file, unparsed_interfaces, timeout=self.parse_timeout
+        )
+        self._store_parse(
+            store_key=store_key, data=serialize_interfaces, parsed=interfaces
+        )
+
+        return interfaces
+
+    def _store_parse(
+        self,
+        store_key: str,
+        data: Callable[[Any], str],
+        parsed: Any,
+        kind: str = "ts",
+    ) -> None:
+        """
+        Write a parsed file or parsed interface bodies to the artifact store if there is one.
+
+        Parameters
+        ----------
+        store_key : str
+            The key of the parse within the artifact store.
+
+        data : Callable[[Any], str]
+            The function that serializes the parse, which is only called if there's an artifact store.
+
+        parsed : Any
+            The parsed file or interfaces.
+
+        kind : str, default="ts"
+            The kind of file that was parsed ('models' or 'ts').
+        """
+        if self.artifact_store is not None:
+            self.artifact_store.put(key=store_key, kind=kind, data=data(parsed))
+
+    def get_models(
+        self, models_file: str | Path, models_to_ignore: list[str] | None
+    ) -> dict[str, DjangoModel]:
+        """
+        Return the models of a backend models file, parsing it only if it hasn't been seen with the same contents.
+
+        Parameters
+        ----------
+        models_file : str | Path
+            A models.py file that defines Django models.
+
+        models_to_ignore : list[str] | None
+            Model classes to ignore, obtained from the config file.
+
+        Returns
+        -------
+        dict[str, DjangoModel]
+            The models from the models file with their ordered and blank fields.
+        """
+        key = (
+            "models",
+            str(Path(models_file).resolve()),
+            frozenset(models_to_ignore or []),
+        )
+
+        return self._get(
+            key=key,
+            file_path=models_file,
+            parse=lambda digest: self._parse_models(
+                models_file, models_to_ignore, digest
+            ),
+        )
+
+    def get_ts_file(self, ts_file: str | Path, lazy: bool = False) -> TypeScriptFile:
+        """
+        Return the interfaces, type aliases and ignored fields of a TypeScript file, parsing it only if it hasn't been seen with the same contents.
+
+        Parameters
+        ----------
+        ts_file : str | Path
+            A TypeScript file that defines interfaces.
+
+        lazy : bool, default=False
+            Whether the bodies of interfaces are skipped and recorded as unparsed interfaces.
+
+        Returns
+        -------
+        TypeScriptFile
+            The interfaces, type aliases and ignored fields of the file.
+        """
+        return self._get(
+            key=("ts-lazy" if lazy else "ts", str(Path(ts_file).resolve())),
+            file_path=ts_file,
+            parse=lambda digest: self._parse_ts_file(ts_file, digest, lazy=lazy),
+        )
+
+    def get_ts_interfaces(
+        self, ts_file: str | Path, unparsed_interfaces: tuple[UnparsedInterface, ...]
+    ) -> dict[str, TypeScriptInterface]:
+        """
+        Return the interfaces that a lazy parse of a TypeScript file skipped, parsing their bodies only if they haven't been parsed with the same contents.
+
+        Parameters
+        ----------
+        ts_file : str | Path
+            A TypeScript file that has been parsed lazily via get_ts_file.
+
+        unparsed_interfaces : tuple[UnparsedInterface, ...]
+            The interfaces from the lazy parse of the file that are needed.
+
+        Returns
+        -------
+        dict[str, TypeScriptInterface]
+            The parsed interfaces in the order they're declared.
+        """
+        key = (
+            "ts-interfaces",
+            str(Path(ts_file).resolve()),
+            tuple(u.name for u in unparsed_interfaces),
+        )
+        parse = lambda digest: (  # noqa: E731
+            unparsed_interfaces,
+            self._parse_ts_interfaces(ts_file, unparsed_interfaces, digest),
+        )
+        parsed = self._get(key=key, file_path=ts_file, parse=parse)
+        # Bodies are parsed again if they were parsed from the spans of an earlier version of the file.
+        if parsed[0] != unparsed_interfaces:
+            self._entries.pop(key)
+            parsed = self._get(key=key, file_path=ts_file, parse=parse)
+
+        return parsed[1]
+
+    def prefetch_models(
+        self, models_files: Iterable[str | Path], models_to_ignore: list[str] | None
+    ) -> None:
+        """
+        Parse the backend models files that aren't cached in parallel on the executor so that get_models returns them from the cache.
+
+        Parameters
+        ----------
+        models_files : Iterable[str | Path]
+            The models files that are about to be parsed.
+
+        models_to_ignore : list[str] | None
+            Model classes to ignore, obtained from the config file.
+        """
+        ignored_models = frozenset(models_to_ignore or [])
+        self._prefetch(
+            parses={
+                ("models", str(Path(models_file).resolve()), ignored_models): (
+                    models_file,
+                    lambda digest: hash_key(
+                        "models",
+                        django_parser.PARSER_VERSION,
+                        digest,
+                        *sorted(ignored_models),
+                    ),
+                    partial(
+                        parse_models_file,
+                        models_file,
+                        models_to_ignore,
+                        timeout=self.parse_timeout,
+                    ),
+                )
+                for models_file in models_files
+            },
+            deserialize=deserialize_models,
+            serialize=serialize_models,
+            kind="models",
+        )
+
+    def prefetch_ts_files(
+        self, ts_files: Iterable[str | Path], lazy: bool = False
+    ) -> None:
+        """
+        Parse the TypeScript files that aren't cached in parallel on the executor so that get_ts_file returns them from the cache.
+
+        Parameters
+        ----------
+        ts_files : Iterable[str | Path]
+            The TypeScript files that are about to be parsed.
+
+        lazy : bool, default=False
+            Whether the bodies of interfaces are skipped and recorded as unparsed interfaces.
+        """
+        kind = "ts-lazy" if lazy else "ts"
+        self._prefetch(
+            parses={
+                (kind, str(Path(ts_file).resolve())): (
+                    ts_file,
+                    partial(hash_key, kind, typescript_parser.PARSER_VERSION),
+                    partial(
+                        parse_ts_file, ts_file, lazy=lazy, timeout=self.parse_timeout
+                    ),
+                )
+                for ts_file in ts_files
+            },
+            deserialize=deserialize_ts_file,
+            serialize=serialize_ts_file,
+        )
+
+    def prefetch_ts_interfaces(
+        self, ts_files: Iterable[tuple[Path, tuple[UnparsedInterface, ...]]]
+    ) -> None:
+        """
+        Parse the interface bodies that lazy parses skipped in parallel on the executor so that get_ts_interfaces returns them from the cache.
+
+        Parameters
+        ----------
+        ts_files : Iterable[tuple[Path, tuple[UnparsedInterface, ...]]]
+            The lazily parsed TypeScript files along with their interfaces that are needed.
+        """
+        parses = {}
+        unparsed_by_key = {}
+        for ts_file, unparsed_interfaces in ts_files:
+            key = (
+                "ts-interfaces",
+                str(Path(ts_file).resolve()),
+                tuple(u.name for u in unparsed_interfaces),
+            )
+            entry = self._entries.get(key)
+            # Bodies are parsed again if they were parsed from the spans of an earlier version of the file.
+            if entry is not None and entry[2][0] != unparsed_interfaces:
+                self._entries.pop(key)
+
+            offsets = [u.body_position.offset for u in unparsed_interfaces]
+            unparsed_by_key[key] = unparsed_interfaces
+            parses[key] = (
+                ts_file,
+                lambda digest, offsets=offsets: hash_key(
+                    "ts-interfaces", typescript_parser.PARSER_VERSION, digest, *offsets
+                ),
+                partial(
+                    parse_ts_interfaces,
+                    ts_file,
+                    unparsed_interfaces,
+                    timeout=self.parse_timeout,
+                ),
+            )
+
+        self._prefetch(
+            parses=parses,
+            deserialize=deserialize_interfaces,
+            serialize=serialize_interfaces,
+            get_entry=lambda key, interfaces: (unparsed_by_key[key], interfaces),
+        )
+
+    def _prefetch(
+        self,
+        parses: Mapping[
+            tuple[Any, ...], tuple[str | Path, Callable[[str], str], Callable[[], Any]]
+        ],
+        deserialize: Callable[[str], Any],
+        serialize: Callable[[Any], str],
+        get_entry: Callable[[tuple[Any, ...], Any], Any] | None = None,
+        kind: str = "ts",
+    ) -> None:
+        """
+        Run the parses of files whose cached parses are missing or out of date in parallel on the executor, reusing parses from the artifact store.
+
+        Workers read the files via memory maps rather than being sent their contents and send back the parsed declarations, which pickle compactly.
+        Nothing is done unless there's an executor and several files need parsing, as a single large file is split across the workers when it's parsed instead.
+
+        Parameters
+        ----------
+        parses : Mapping[tuple[Any, ...], tuple[str | Path, Callable[[str], str], Callable[[], Any]]]
+            The path to the file, a function that gets the key within the artifact store from the hash of the file and the parse function by the key of each parse.
+
+        deserialize : Callable[[str], Any]
+            The function that loads parses from the artifact store.
+
+        serialize : Callable[[Any], str]
+            The function that serializes parses for the artifact store.
+
+        get_entry : Callable[[tuple[Any, ...], Any], Any], default=None
+            The function that gets the cached value from the key and the result of a parse, with the result being cached if not passed.
+
+        kind : str, default="ts"
+            The kind of the files that are parsed ('models' or 'ts').
+        """
+        if self.executor is None:
+            return
+
+        stale_parses = {}
+        for key, (file_path, get_store_key, parse) in parses.items():
+            if (stale := self._find_stale(key=key, file_path=file_path)) is not None:
+                signature, digest = stale
+                stale_parses[key] = (signature, digest, get_store_key(digest), parse)
+
+        if len(stale_parses) < 2:
+            return
+
+        futures: dict[tuple[Any, ...], Future[Any]] = {}
+        for key, (signature, digest, store_key, parse) in stale_parses.items():
+            if self.artifact_store is not None and (
+                data := self.artifact_store.get(store_key)
+            ):
+                parsed = deserialize(data)
+
+            else:
+                futures[key] = self.executor.submit(parse)
+                continue
+
+            self.misses += 1
+            self._entries[key] = (
+                signature,
+                digest,
+                parsed if get_entry is None else get_entry(key, parsed),
+            )
+
+        for key, future in futures.items():
+            signature, digest, store_key, _ = stale_parses[key]
+            parsed = future.result()
+            self._store_parse(
+                store_key=store_key, data=serialize, parsed=parsed, kind=kind
+            )
+            self.misses += 1
+            self._entries[key] = (
+                signature,
+                digest,
+                parsed if get_entry is None else get_entry(key, parsed),
+            )
+
+    def get_model_index(
+        self, models_files: list[str] | list[Path], models_to_ignore: list[str] | None
+    ) -> ModelIndex:
+        """
+        Return the merged models of backend models files along with the files that define them.
+
+        Parameters
+        ----------
+        models_files : list[str] | list[Path]
+            The models files of an identifier, such as the modules of a models package.
+
+        models_to_ignore : list[str] | None
+            Model classes to ignore, obtained from the config file.
+
+        Returns
+        -------
+        ModelIndex
+            The models of all files in the order they're defined.
+
+        Notes
+        -----
+        Each file is parsed on its own, with models in later files replacing those of the same name in earlier files and being recorded as duplicates.
+        The files are parsed in parallel if the cache has an executor.
+        """
+        self.prefetch_models(models_files, models_to_ignore)
+        model_index = ModelIndex()
+        for models_file in models_files:
+            model_index.add_file(
+                file_path=str(models_file),
+                models=self.get_models(models_file, models_to_ignore),
+            )
+
+        return model_index
+
+    def get_ts_files(
+        self,
+        ts_files: list[str] | list[Path],
+        interface_names: Iterable[str] | None = None,
+    ) -> InterfaceIndex:
+        """
+        Return the merged interfaces and ignored fields of TypeScript files along with the files that declare them.
+
+        Parameters
+        ----------
+        ts_files : list[str] | list[Path]
+            The TypeScript files that define interfaces.
+
+        interface_names : Iterable[str], default=None
+            The names of the checked interfaces, whose declarations are loaded from the files that the TypeScript files import them from.
+
+        Returns
+        -------
+        InterfaceIndex
+            The interfaces of all files in the order they're defined and the fields marked as ignored within them.
+
+        Notes
+        -----
+        Each file is parsed on its own, with interfaces in later files replacing those of the same name in earlier files and being recorded as duplicates.
+        Imports are only followed if interface names are passed, with imported files being added after the TypeScript files.
+        Files are then parsed lazily, with only the bodies of the interfaces that the checked interfaces and type aliases need being parsed.
+        The TypeScript files and then the needed bodies are parsed in parallel if the cache has an executor.
+        """
+        entry_files = [Path(p) for p in ts_files]
+        self.prefetch_ts_files(entry_files, lazy=interface_names is not None)
+        loaded_files = (
+            [(p, self.get_ts_file(p)) for p in entry_files]
+            if interface_names is None
+            else self.import_graph_loader.load(
+                entry_files=entry_files, names=interface_names
+            )
+        )
+        self.prefetch_ts_interfaces(
+            (p, ts_file.unparsed_interfaces)
+            for p, ts_file in loaded_files
+            if ts_file.unparsed_interfaces
+        )
+        # Repeated entry files are loaded once, so files are labeled by their paths rather than their positions.
+        entry_file_labels = {Path(p): str(p) for p in reversed(ts_files)}
+        interface_index = InterfaceIndex()
+        for p, ts_file in loaded_files:
+            interfaces = ts_file.interfaces
+            if ts_file.unparsed_interfaces:
+                interfaces = {
+                    **interfaces,
+                    **self.get_ts_interfaces(p, ts_file.unparsed_interfaces),
+                }
+
+            interface_index.add_file(
+                file_path=entry_file_labels.get(p, str(p)),
+                interfaces=interfaces,
+                ignored_fields=ts_file.ignored_fields,
+                type_aliases=ts_file.type_aliases,
+            )
+            if p not in entry_file_labels:
+                interface_index.imported_files.append(str(p))
+
+        interface_index.resolve_type_aliases()
+
+        return interface_index
+
+
+# MARK: Result Cache
+
+
+class ResultCache:
+    """
+    On-disk cache of the results of checks for identifiers.
+
+    Results are keyed by the contents of the checked files, the configuration of the identifier and the version of ts-backend-check.
+    File hashes are reused when the modification time and size of a file haven't changed so that unchanged files aren't read.
+
+    Parameters
+    ----------
+    cache_dir : Path, default=CACHE_DIR_PATH
+        The directory to store cached results in.
+    """
+
+    def __init__(self, cache_dir: Path = CACHE_DIR_PATH) -> None:
+        self.cache_dir = cache_dir
+        self.results_dir = cache_dir / "results"
+        self.model_results_dir = cache_dir / "model_results"
+        self.file_hashes_path = cache_dir / "file_hashes.json"
+        self.tool_version = get_tool_version()
+        try:
+            self.file_hashes: dict[str, list[Any]] = json.loads(
+                self.file_hashes_path.read_text(encoding="utf-8")
+            )
+
+        except (OSError, ValueError):
+            self.file_hashes = {}
+
+        self._file_hashes_changed = False
+
+    def get_file_hash(self, file_path: str | Path) -> str:
+        """
+        Get the hash of a file, only reading it if its modification time or size have changed.
+
+        Parameters
+        ----------
+        file_path : str | Path
+            The path to the file to hash.
+
+        Returns
+        -------
+        str
+            The SHA-256 hex digest of the bytes of the file.
+        """
+        resolved_path = str(Path(file_path).resolve())
+        stat = os.stat(resolved_path)
+        mtime_ns, size, digest = self.file_hashes.get(resolved_path, (None, None, ""))
+        if mtime_ns == stat.st_mtime_ns and size == stat.st_size:
+            return digest
+
+        digest = hash_file(resolved_path)
+        self.file_hashes[resolved_path] = [stat.st_mtime_ns, stat.st_size, digest]
+        self._file_hashes_changed = True
+
+        return digest
+
+    def get_key(
+        self,
+        backend_model_file_path: Path,
+        ts_interface_file_paths: list[Path],
+        **identifier_config: Any,
+    ) -> str:
+        """
+        Derive the key for the results of an identifier from its files and configuration.
+
+        Parameters
+        ----------
+        backend_model_file_path : Path
+            The path to the backend models of the identifier, which can be a file, a directory or a glob.
+
+        ts_interface_file_paths : list[Path]
+            The paths to the TypeScript interfaces of the identifier.
+
+        **identifier_config : Any
+            The remaining configuration parameters of the identifier from extract_identifier_config.
+
+        Returns
+        -------
+        str
+            The key for the cached results of the identifier.
+        """
+        key_data = {
+            "cache_version": RESULT_CACHE_VERSION,
+            "tool_version": self.tool_version,
+            # The models files are listed as files can be added to or removed from directories and globs.
+            "backend_model_files": [
+                [str(p), self.get_file_hash(p)]
+                for p in get_backend_model_file_paths(backend_model_file_path)
+            ],
+            "ts_interface_files": [
+                [str(p), self.get_file_hash(p)] for p in ts_interface_file_paths
+            ],
+            "config": identifier_config,
+        }
+
+        return hashlib.sha256(
+            json.dumps(key_data, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
+    def get_identifier_key(
+        self,
+        backend_model_file_path: Path,
+        ts_interface_file_paths: list[Path],
+        **identifier_config: Any,
+    ) -> str:
+        """
+        Derive a key for an identifier from its file paths and configuration, but not the contents of its files.
+
+        Parameters
+        ----------
+        backend_model_file_path : Path
+            The path to the backend models of the identifier, which can be a file, a directory or a glob.
+
+        ts_interface_file_paths : list[Path]
+            The paths to the TypeScript interfaces of the identifier.
+
+        **identifier_config : Any
+            The remaining configuration parameters of the identifier from extract_identifier_config.
+
+        Returns
+        -------
+        str
+            The key for the identifier that stays the same as its files change.
+        """
+        key_data = {
+            "cache_version": RESULT_CACHE_VERSION,
+            "tool_version": self.tool_version,
+            "backend_model_file": str(backend_model_file_path),
+            "ts_interface_files": [str(p) for p in ts_interface_file_paths],
+            "config": identifier_config,
+        }
+
+        return hashlib.sha256(
+            json.dumps(key_data, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
+    def load(
+        self, key: str, imported_files: set[Path] | None = None
+    ) -> list[Diagnostic] | None:
+        """
+        Load the cached results for a key if the files that the checked files imported from haven't changed.
+
+        Parameters
+        ----------
+        key : str
+            The key for the results from get_key.
+
+        imported_files : set[Path], default=None
+            A set that the resolved paths of the files that the checked files imported from are added to.
+
+        Returns
+        -------
+        list[Diagnostic] | None
+            The cached diagnostics, or None if there are no valid cached results for the key.
+        """
+        result_path = self.results_dir / f"{key}.json"
+        try:
+            result = json.loads(result_path.read_text(encoding="utf-8"))
+            # Imported files aren't part of the key as they're only known once the checked files are parsed.
+            if any(
+                self.get_file_hash(p) != digest
+                for p, digest in result["imported_files"]
+            ):
+                return None
+
+            errors = [Diagnostic.from_dict(e) for e in result["errors"]]
+            # Touching the file marks it as recently used for pruning.
+            os.utime(result_path)
+
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+
+        if imported_files is not None:
+            imported_files.update(
+                Path(p).resolve() for p, _ in result["imported_files"]
+            )
+
+        return errors
+
+    def save(
+        self, key: str, errors: list[Diagnostic], imported_files: list[str] = []
+    ) -> None:
+        """
+        Save the results for a key.
+
+        Parameters
+        ----------
+        key : str
+            The key for the results from get_key.
+
+        errors : list[Diagnostic]
+            The diagnostics of the check.
+
+        imported_files : list[str], default=[]
+            The files that the checked files imported needed declarations from, whose hashes are checked when the results are loaded.
+        """
+        write_json_atomically(
+            file_path=self.results_dir / f"{key}.json",
+            data={
+                "errors": [e.to_dict() for e in errors],
+                "imported_files": [[p, self.get_file_hash(p)] for p in imported_files],
+            },
+        )
+
+    def load_model_results(self, key: str) -> dict[str, tuple[str, list[Diagnostic]]]:
+        """
+        Load the results of the individual models of an identifier from its last check.
+
+        Parameters
+        ----------
+        key : str
+            The key for the identifier from get_identifier_key.
+
+        Returns
+        -------
+        dict[str, tuple[str, list[Diagnostic]]]
+            The dependency key and diagnostics of each model, which is empty if the identifier hasn't been checked.
+        """
+        try:
+            model_results = json.loads(
+                (self.model_results_dir / f"{key}.json").read_text(encoding="utf-8")
+            )
+            return {
+                m: (k, [Diagnostic.from_dict(e) for e in errors])
+                for m, (k, errors) in model_results.items()
+            }
+
+        except (OSError, ValueError, TypeError):
+            return {}
+
+    def save_model_results(
+        self, key: str, model_results: dict[str, tuple[str, list[Diagnostic]]]
+    ) -> None:
+        """
+        Save the results of the individual models of an identifier.
+
+        Parameters
+        ----------
+        key : str
+            The key for the identifier from get_identifier_key.
+
+        model_results : dict[str, tuple[str, list[Diagnostic]]]
+            The dependency key and diagnostics of each model from TypeChecker.model_results.
+        """
+        write_json_atomically(
+            file_path=self.model_results_dir / f"{key}.json",
+            data={
+                m: (k, [e.to_dict() for e in errors])
+                for m, (k, errors) in model_results.items()
+            },
+        )
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get the number and total size of the cached results.
+
+        Returns
+        -------
+        dict[str, int]
+            The number of cached results and their total size in bytes.
+        """
+        sizes = [p.stat().st_size for p in self.results_dir.glob("*.json")]
+        return {"entries": len(sizes), "size": sum(sizes)}
+
+    def prune(self, max_age_days: float) -> int:
+        """
+        Remove cached identifier and model results that haven't been used within the max age.
+
+        Parameters
+        ----------
+        max_age_days : float
+            The maximum number of days since a result was last used.
+
+        Returns
+        -------
+        int
+            The number of results that were removed.
+        """
+        cutoff = time.time() - max_age_days * SECONDS_PER_DAY
+        removed = 0
+        for result_path in [
+            *self.results_dir.glob("*.json"),
+            *self.model_results_dir.glob("*.json"),
+        ]:
+            if result_path.stat().st_mtime < cutoff:
+                result_path.unlink(missing_ok=True)
+                removed += 1
+
+        return removed
+
+    def close(self) -> None:
+        """
+        Persist the hashes of files that have been read so later runs can skip reading unchanged files.
+        """
+        if self._file_hashes_changed:
+            write_json_atomically(
+                file_path=self.file_hashes_path, data=self.file_hashes
+            )
+            self._file_hashes_changed = False
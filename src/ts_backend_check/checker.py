@@ -3,14 +3,62 @@
 Main module for checking Django models against TypeScript types.
 """
 
+import hashlib
+from typing import Iterable, Iterator
+
+from ts_backend_check.diagnostics import (
+    BLANK_FIELD_NOT_OPTIONAL,
+    DUPLICATE_INTERFACE,
+    DUPLICATE_MODEL,
+    MISSING_FIELD,
+    MISSING_INTERFACE,
+    UNORDERED_PROPERTIES,
+    Diagnostic,
+)
+from ts_backend_check.interface_index import InterfaceIndex
+from ts_backend_check.model_index import ModelIndex
 from ts_backend_check.parsers.django_parser import (
+    DjangoModel,
     DjangoModelVisitor,
     extract_model_fields,
 )
-from ts_backend_check.parsers.typescript_parser import TypeScriptParser
+from ts_backend_check.parsers.typescript_parser import (
+    SourcePosition,
+    TypeScriptInterface,
+    TypeScriptParser,
+)
+from ts_backend_check.type_evaluator import TypeEvaluator
 from ts_backend_check.utils import is_ordered_subset, snake_to_camel
 
 
+def get_interface_names(
+    model_names: Iterable[str], model_name_conversions: dict[str, list[str]]
+) -> list[str]:
+    """
+    Get the names of the TypeScript interfaces that backend models are matched with.
+
+    Parameters
+    ----------
+    model_names : Iterable[str]
+        The names of the backend models.
+
+    model_name_conversions : dict[str, list[str]]
+        A dictionary of backend model names to their corresponding TypeScript interfaces when snake to camel case isn't valid.
+
+    Returns
+    -------
+    list[str]
+        The potential interface names of each model in order without duplicates.
+    """
+    return list(
+        dict.fromkeys(
+            name
+            for model_name in model_names
+            for name in model_name_conversions.get(model_name, [model_name])
+        )
+    )
+
+
 class TypeChecker:
     """
     Main class for checking Django models against TypeScript types.
@@ -20,7 +68,7 @@ class TypeChecker:
     models_file : str
         The file path for the models file to check.
 
-    concatenated_types_file : str
+    concatenated_types_file : str, default=""
         A concatenated file text joined from all paths in ts_interface_file_paths.
 
     check_blank : bool, default=False
@@ -31,32 +79,129 @@ class TypeChecker:
 
     backend_models_to_ignore : list[str], default=None | []
         A list containing all Django models to be ignored by tsbc.
+
+    models : dict[str, DjangoModel], default=None
+        Models that have already been extracted from the models file, in which case the file isn't parsed again.
+
+    ts_interfaces : dict[str, TypeScriptInterface], default=None
+        Interfaces and evaluated type aliases that have already been parsed, in which case concatenated_types_file isn't parsed.
+
+    ignored_fields : set[str], default=None
+        Fields marked as ignored that have already been parsed alongside ts_interfaces.
+
+    interface_index : InterfaceIndex, default=None
+        The interfaces of the TypeScript files along with where they're declared, in which case ts_interfaces and ignored_fields aren't used.
+
+    previous_model_results : dict[str, tuple[str, list[Diagnostic]]], default=None
+        The model_results of a previous check that are reused for models whose dependencies haven't changed.
+
+    model_index : ModelIndex, default=None
+        The models of several models files along with where they're defined, in which case models_file and models aren't used to find models.
     """
 
     def __init__(
         self,
         models_file: str,
-        concatenated_types_file: str,
+        concatenated_types_file: str = "",
         check_blank: bool = False,
         model_name_conversions: dict[str, list[str]] = {},
         backend_models_to_ignore: list[str] = [],
+        models: dict[str, DjangoModel] | None = None,
+        ts_interfaces: dict[str, TypeScriptInterface] | None = None,
+        ignored_fields: set[str] | None = None,
+        interface_index: InterfaceIndex | None = None,
+        previous_model_results: dict[str, tuple[str, list[Diagnostic]]] | None = None,
+        model_index: ModelIndex | None = None,
     ) -> None:
         self.models_file = models_file
         self.concatenated_types_file = concatenated_types_file
         self.check_blank = check_blank
         self.model_name_conversions = model_name_conversions
         self.django_model_visitor = DjangoModelVisitor
-        (
-            self.models_all_fields_and_blank_fields_ordered,
-            self.models_all_fields,
-            self.models_all_blank_fields,
-        ) = extract_model_fields(
-            models_file=models_file,
-            models_to_ignore=backend_models_to_ignore,
-        )
-        self.ts_parser = TypeScriptParser(concatenated_types_file)
-        self.ts_interfaces = self.ts_parser.parse_interfaces()
-        self.backend_only = self.ts_parser.get_ignored_fields()
+        self.model_index = model_index
+        if model_index is not None:
+            self.models = model_index.models
+
+        else:
+            self.models = (
+                models
+                if models is not None
+                else extract_model_fields(
+                    models_file=models_file,
+                    models_to_ignore=backend_models_to_ignore,
+                )
+            )
+        self.interface_index = interface_index
+        if interface_index is not None:
+            self.ts_interfaces = interface_index.interfaces
+            self.backend_only = interface_index.ignored_fields
+            self.type_evaluator = TypeEvaluator(
+                interfaces=interface_index.interfaces,
+                type_aliases=interface_index.type_aliases,
+                files=interface_index.interface_files,
+            )
+
+        elif ts_interfaces is not None:
+            self.ts_interfaces = ts_interfaces
+            self.backend_only = ignored_fields or set()
+            self.type_evaluator = TypeEvaluator(
+                interfaces=ts_interfaces, type_aliases={}
+            )
+
+        else:
+            # The parser isn't kept so that its encoded copy of the text is released once it's been parsed.
+            ts_file = TypeScriptParser(concatenated_types_file).parse_file()
+            self.type_evaluator = TypeEvaluator(
+                interfaces=ts_file.interfaces, type_aliases=ts_file.type_aliases
+            )
+            self.ts_interfaces = {
+                **ts_file.interfaces,
+                **self.type_evaluator.evaluate_type_aliases(),
+            }
+            self.backend_only = set(ts_file.ignored_fields)
+
+        self.model_interfaces = self._build_model_interfaces_index()
+        self.previous_model_results = previous_model_results or {}
+        self.model_results: dict[str, tuple[str, list[Diagnostic]]] = {}
+        self.rechecked_models: list[str] = []
+
+    # MARK: Interface Index
+
+    def _build_model_interfaces_index(
+        self,
+    ) -> dict[str, dict[str, TypeScriptInterface]]:
+        """
+        Resolve the matching TypeScript interfaces for every backend model once.
+
+        Matching interfaces include the properties that they inherit along their extends chains, which are flattened once for each interface.
+
+        Returns
+        -------
+        dict[str, dict[str, TypeScriptInterface]]
+            The flattened interfaces that match each model name.
+        """
+        # Positions allow matched interfaces to be reported in the order of the TypeScript files.
+        interface_positions = {name: i for i, name in enumerate(self.ts_interfaces)}
+        flattened_interfaces: dict[str, TypeScriptInterface] = {}
+        model_interfaces = {}
+        for model_name in self.models:
+            potential_names = self.model_name_conversions.get(model_name, [model_name])
+            matched_names = sorted(
+                {name for name in potential_names if name in interface_positions},
+                key=interface_positions.__getitem__,
+            )
+            for name in matched_names:
+                if name not in flattened_interfaces:
+                    flattened_interfaces[name] = (
+                        self.type_evaluator.get_interface(name)
+                        or self.ts_interfaces[name]
+                    )
+
+            model_interfaces[model_name] = {
+                name: flattened_interfaces[name] for name in matched_names
+            }
+
+        return model_interfaces
 
     # MARK: Run Check
 
@@ -64,291 +209,482 @@ class TypeChecker:
         """
         Check models against TypeScript types.
 
+        Models whose dependencies are unchanged from the results passed as previous_model_results reuse their previous errors.
+
         Returns
         -------
         list
             A list of fields missing from the TypeScript file.
         """
-        error_fields: list[str] = []
+        return list(self.iter_check())
 
-        for model_name in list(self.models_all_fields_and_blank_fields_ordered.keys()):
-            fields_and_blank_fields_ordered = (
-                self.models_all_fields_and_blank_fields_ordered[model_name]
-            )
-            blank_fields: list[str] = self.models_all_blank_fields.get(model_name, [])
+    def iter_check(self) -> Iterator[str]:
+        """
+        Check models against TypeScript types, yielding the errors of each model as it's checked.
 
-            missing_fields_exist = False
-            interfaces, _ = self._find_matching_interfaces(model_name=model_name)
+        Models whose dependencies are unchanged from the results passed as previous_model_results reuse their previous errors.
+        Models aren't checked past the point at which the caller stops consuming errors.
 
-            if not interfaces:
-                error_fields.append(
-                    self._format_missing_interface_message(model_name=model_name)
-                )
-                continue
-
-            for field in fields_and_blank_fields_ordered:
-                if not self._field_is_accounted_for(field=field, interfaces=interfaces):
-                    error_fields.append(
-                        self._format_missing_field_message(
-                            field=field, model_name=model_name, interfaces=interfaces
-                        )
-                    )
-                    missing_fields_exist = True
-
-            if self.check_blank and blank_fields:
-                error_fields.extend(
-                    self._format_optional_properties_message(
-                        field=bf,
-                        model_name=model_name,
-                        models_file=self.models_file,
-                    )
-                    for bf in blank_fields
-                    if not self._property_is_optional_when_field_is_blank(
-                        model_name=model_name,
-                        field=bf,
-                    )
+        Yields
+        ------
+        str
+            The errors of the models in the order of the models file.
+        """
+        for diagnostic in self.iter_diagnostics():
+            yield diagnostic.message
+
+    def iter_diagnostics(self) -> Iterator[Diagnostic]:
+        """
+        Check models against TypeScript types, yielding the diagnostics of each model as it's checked.
+
+        Models whose dependencies are unchanged from the results passed as previous_model_results reuse their previous diagnostics.
+        Models aren't checked past the point at which the caller stops consuming diagnostics.
+
+        Yields
+        ------
+        Diagnostic
+            The diagnostics of the models in the order of the models file.
+        """
+        self.model_results = {}
+        self.rechecked_models = []
+
+        for model_name in self.models:
+            dependency_key = self._get_model_dependency_key(model_name=model_name)
+            previous_result = self.previous_model_results.get(model_name)
+            if previous_result is not None and previous_result[0] == dependency_key:
+                model_errors = list(previous_result[1])
+
+            else:
+                model_errors = self._check_model(model_name=model_name)
+                self.rechecked_models.append(model_name)
+
+            self.model_results[model_name] = (dependency_key, model_errors)
+            yield from model_errors
+
+    def _check_model(self, model_name: str) -> list[Diagnostic]:
+        """
+        Check a single model against its matching TypeScript interfaces.
+
+        Parameters
+        ----------
+        model_name : str
+            The name of the model to check.
+
+        Returns
+        -------
+        list[Diagnostic]
+            The diagnostics that were found for the model.
+        """
+        model = self.models[model_name]
+        model_errors: list[Diagnostic] = []
+        interfaces = self._find_matching_interfaces(model_name=model_name)
+
+        if self.model_index is not None and model_name in self.model_index.duplicates:
+            model_errors.append(
+                self._create_diagnostic(code=DUPLICATE_MODEL, model=model)
+            )
+
+        if not interfaces:
+            model_errors.append(
+                self._create_diagnostic(code=MISSING_INTERFACE, model=model)
+            )
+            return model_errors
+
+        interface_names = tuple(interfaces)
+        if self.interface_index is not None:
+            model_errors.extend(
+                self._create_diagnostic(
+                    code=DUPLICATE_INTERFACE,
+                    model=model,
+                    interfaces=(name,),
+                    location=self.interface_index.get_location(name),
                 )
+                for name in interface_names
+                if name in self.interface_index.duplicates
+            )
 
-            if not missing_fields_exist and not self._ts_interface_properties_ordered(
-                model_name=model_name, fields=fields_and_blank_fields_ordered
-            ):
-                error_fields.append(
-                    self._format_unordered_interface_properties_message(
-                        models_file=self.models_file
-                    )
+        missing_field_errors = self._check_missing_fields(
+            model=model, interfaces=interfaces
+        )
+        model_errors.extend(missing_field_errors)
+        if self.check_blank:
+            model_errors.extend(
+                self._check_blank_fields(
+                    model_name=model_name, model=model, interfaces=interfaces
                 )
+            )
 
-        return error_fields
+        if not missing_field_errors and not self._ts_interface_properties_ordered(
+            model_name=model_name, fields=model.fields
+        ):
+            model_errors.append(
+                self._create_diagnostic(
+                    code=UNORDERED_PROPERTIES,
+                    model=model,
+                    interfaces=interface_names,
+                    location=self._get_interface_location(interface_names[0]),
+                )
+            )
 
-    # MARK: Matching Interfaces
+        return model_errors
 
-    def _find_matching_interfaces(
-        self, model_name: str
-    ) -> tuple[dict[str, list[str]], dict[str, list[str]]]:
+    def _check_missing_fields(
+        self, model: DjangoModel, interfaces: dict[str, TypeScriptInterface]
+    ) -> list[Diagnostic]:
         """
-        Find matching TypeScript interfaces for a model.
+        Check that each field of a model is accounted for in its matching TypeScript interfaces.
 
         Parameters
         ----------
-        model_name : str
-            The name of the model to check the frontend TypeScript file for.
+        model : DjangoModel
+            The model to check.
+
+        interfaces : dict[str, TypeScriptInterface]
+            The interfaces that match the model.
 
         Returns
         -------
-        tuple[dict[str, list[str]], dict[str, list[str]]]
-            Interfaces that match a model name.
+        list[Diagnostic]
+            The diagnostics for the fields that aren't accounted for.
         """
-        if self.model_name_conversions and model_name in self.model_name_conversions:
-            potential_names = self.model_name_conversions[model_name]
+        interface_names = tuple(interfaces)
+        return [
+            self._create_diagnostic(
+                code=MISSING_FIELD,
+                model=model,
+                field=field,
+                interfaces=interface_names,
+                location=self._get_interface_location(interface_names[0]),
+            )
+            for field in model.fields
+            if not self._field_is_accounted_for(field=field, interfaces=interfaces)
+        ]
 
-        else:
-            potential_names = [model_name]
+    def _check_blank_fields(
+        self,
+        model_name: str,
+        model: DjangoModel,
+        interfaces: dict[str, TypeScriptInterface],
+    ) -> list[Diagnostic]:
+        """
+        Check that the properties of the fields of a model that can be blank are optional.
 
-        interfaces = {
-            name: interface.properties
-            for name, interface in self.ts_interfaces.items()
-            if any(potential == name for potential in potential_names)
-        }
-        interfaces_with_optional_properties = {
-            name: interface.optional_properties
-            for name, interface in self.ts_interfaces.items()
-            if any(potential == name for potential in potential_names)
-        }
+        Parameters
+        ----------
+        model_name : str
+            The name of the model to check.
 
-        return interfaces, interfaces_with_optional_properties
+        model : DjangoModel
+            The model to check.
 
-    # MARK: Field Checks
+        interfaces : dict[str, TypeScriptInterface]
+            The interfaces that match the model.
 
-    def _field_is_accounted_for(
-        self, field: str, interfaces: dict[str, list[str]]
-    ) -> bool:
+        Returns
+        -------
+        list[Diagnostic]
+            The diagnostics for the fields whose properties aren't optional.
         """
-        Check if a field is accounted for in TypeScript.
+        return [
+            self._create_diagnostic(
+                code=BLANK_FIELD_NOT_OPTIONAL,
+                model=model,
+                field=bf,
+                interfaces=tuple(interfaces),
+                location=self._get_property_location(interfaces=interfaces, field=bf),
+            )
+            for bf in model.blank_fields
+            if not self._property_is_optional_when_field_is_blank(
+                model_name=model_name,
+                field=bf,
+            )
+        ]
+
+    # MARK: Locations
+
+    def _create_diagnostic(
+        self,
+        code: str,
+        model: DjangoModel,
+        field: str | None = None,
+        interfaces: tuple[str, ...] = (),
+        location: tuple[str, SourcePosition | None] | None = None,
+    ) -> Diagnostic:
+        """
+        Create a diagnostic for a model that's located at a TypeScript declaration or the definition of the model.
 
         Parameters
         ----------
-        field : str
-            The field that should be used in the frontend TypeScript file.
+        code : str
+            The kind of inconsistency.
 
-        interfaces : dict[str, list[str]]
-            The interfaces from the frontend TypeScript file.
+        model : DjangoModel
+            The model that the inconsistency is for.
+
+        field : str, default=None
+            The field of the model that the inconsistency is for, if any.
+
+        interfaces : tuple[str, ...], default=()
+            The TypeScript interfaces that match the model.
+
+        location : tuple[str, SourcePosition | None], default=None
+            The TypeScript file and position that the inconsistency is located at, with the definition of the model being used if not passed.
 
         Returns
         -------
-        Bool
-            Whether the field is accounted for in the frontend TypeScript file.
+        Diagnostic
+            The diagnostic, which has no position if neither the TypeScript position nor the line of the model is known.
         """
-        camel_field = snake_to_camel(input_str=field)
-        return (
-            camel_field in self.backend_only
-            or field in self.backend_only
-            or any(camel_field in fields for fields in interfaces.values())
+        models_file = self._get_models_file(model_name=model.name)
+        file, line, column = models_file, model.line or None, 1
+        if location is not None:
+            location_file, position = location
+            if position is not None:
+                file, line, column = location_file, position.line, position.column
+
+        return Diagnostic(
+            code=code,
+            model=model.name,
+            models_file=models_file,
+            field=field,
+            interfaces=interfaces,
+            file=file,
+            line=line,
+            column=column if line else None,
         )
 
-    def _property_is_optional_when_field_is_blank(
-        self, model_name: str, field: str
-    ) -> bool:
+    def _get_models_file(self, model_name: str) -> str:
         """
-        Check that if the field is 'blank=True' that the corresponding interface property is optional (?).
+        Get the path of the models file that defines a model.
 
         Parameters
         ----------
         model_name : str
-            The name of the model to check the frontend TypeScript file for.
+            The name of the model.
+
+        Returns
+        -------
+        str
+            The path of the models file of the model, which is models_file if the files of the models aren't known.
+        """
+        if self.model_index is None:
+            return self.models_file
+
+        return self.model_index.model_files.get(model_name, self.models_file)
+
+    def _get_interface_location(
+        self, interface_name: str
+    ) -> tuple[str, SourcePosition | None] | None:
+        """
+        Get the file and position of the declaration of an interface.
+
+        Parameters
+        ----------
+        interface_name : str
+            The name of the interface.
+
+        Returns
+        -------
+        tuple[str, SourcePosition | None] | None
+            The location of the interface, or None if the files of the interfaces aren't known.
+        """
+        if self.interface_index is None:
+            return None
+
+        return self.interface_index.get_location(interface_name)
+
+    def _get_property_location(
+        self, interfaces: dict[str, TypeScriptInterface], field: str
+    ) -> tuple[str, SourcePosition | None] | None:
+        """
+        Get the file and position of the first property for a field, or of the first interface if no interface declares it.
+
+        Parameters
+        ----------
+        interfaces : dict[str, TypeScriptInterface]
+            The interfaces that match the model of the field.
 
         field : str
-            The field that should match the optional state of the property in the TypeScript file.
+            The field of the model.
 
         Returns
         -------
-        Bool
-            Whether the blank status of the model field matches the optional status of the interface property.
+        tuple[str, SourcePosition | None] | None
+            The location of the property, or None if the files of the interfaces aren't known.
         """
+        if self.interface_index is None:
+            return None
+
         camel_field = snake_to_camel(input_str=field)
-        _, interfaces_with_optional_properties = self._find_matching_interfaces(
-            model_name
-        )
+        for name, interface in interfaces.items():
+            if camel_field in interface.property_set:
+                # Inherited properties are located via the flattened interface as the index only has the properties that interfaces declare.
+                return (
+                    self.interface_index.interface_files[name],
+                    interface.get_property_position(camel_field) or interface.position,
+                )
 
-        return any(
-            camel_field in properties
-            for properties in interfaces_with_optional_properties.values()
-        )
+        return self.interface_index.get_location(next(iter(interfaces)))
 
-    def _ts_interface_properties_ordered(
-        self, model_name: str, fields: list[str]
-    ) -> bool:
+    # MARK: Dependencies
+
+    def _get_model_dependency_key(self, model_name: str) -> str:
         """
-        Check if the order of the TypeScript interface properties exactly matches that of the backend model fields.
+        Derive a key from everything that the result of checking a model depends on.
+
+        The key covers the fields of the model including those inherited via comments and where it's defined, the interfaces it could match along with where they're declared, the ignore comments for its fields and the options of the check.
 
         Parameters
         ----------
         model_name : str
-            The name of the model to check the frontend TypeScript file for.
-
-        fields : list[str]
-            The fields of the backend model.
+            The name of the model to derive the dependency key for.
 
         Returns
         -------
-        bool
-            Whether the order of the properties of the TypeScript interface file match that of the backend model fields.
+        str
+            The hex digest of the dependencies of the model.
         """
-        camel_fields = [snake_to_camel(input_str=f) for f in fields]
-        interfaces, _ = self._find_matching_interfaces(model_name)
-
-        return all(
-            is_ordered_subset(
-                reference_list=camel_fields, candidate_sub_list=interfaces[i]
+        model = self.models[model_name]
+        # Locations are included as they're reported by the diagnostics of the model.
+        interfaces = [
+            (
+                name,
+                i.properties,
+                i.optional_properties,
+                i.position and i.position[1:],
+                # Only lines and columns are included as offsets change with any edit above the interface.
+                list(i.property_positions[1::3]),
+                list(i.property_positions[2::3]),
+                self.interface_index.interface_files.get(name)
+                if self.interface_index is not None
+                else None,
+                name in self.interface_index.duplicates
+                if self.interface_index is not None
+                else False,
             )
-            for i in interfaces
+            for name, i in self._find_matching_interfaces(model_name).items()
+        ]
+        ignored_fields = sorted(
+            f
+            for f in model.fields
+            if f in self.backend_only
+            or snake_to_camel(input_str=f) in self.backend_only
         )
+        dependencies = (
+            self._get_models_file(model_name=model_name),
+            self.model_index.duplicates.get(model_name)
+            if self.model_index is not None
+            else None,
+            self.check_blank,
+            model.name,
+            model.line,
+            model.fields,
+            model.blank_fields,
+            interfaces,
+            ignored_fields,
+        )
+
+        return hashlib.blake2b(
+            repr(dependencies).encode("utf-8"), digest_size=16
+        ).hexdigest()
 
-    # MARK: Messages
+    # MARK: Matching Interfaces
 
-    @staticmethod
-    def _format_missing_interface_message(model_name: str) -> str:
+    def _find_matching_interfaces(
+        self, model_name: str
+    ) -> dict[str, TypeScriptInterface]:
         """
-        Format message for missing interface.
+        Find matching TypeScript interfaces for a model from the index built on initialization.
 
         Parameters
         ----------
         model_name : str
-            The name of the model that an interface is missing from.
+            The name of the model to check the frontend TypeScript file for.
 
         Returns
         -------
-        str
-            The message displayed to the user when missing interfaces are found.
+        dict[str, TypeScriptInterface]
+            Interfaces that match a model name.
         """
-        return (
-            f"\nNo matching TypeScript interface found for the model '{model_name}'."
-            "\nPlease name your TypeScript interfaces the same as the corresponding backend models."
-            "\nYou can also use the 'backend_to_ts_model_name_conversions' option within the configuration file."
-            "\nThe key is the backend model name and the value is a list of the corresponding interfaces."
-            "\nThis option is also how you can break larger backend models into multiple interfaces that extend one another."
-        )
+        return self.model_interfaces.get(model_name, {})
 
-    @staticmethod
-    def _format_missing_field_message(
-        field: str, model_name: str, interfaces: dict[str, list[str]]
-    ) -> str:
+    # MARK: Field Checks
+
+    def _field_is_accounted_for(
+        self, field: str, interfaces: dict[str, TypeScriptInterface]
+    ) -> bool:
         """
-        Format message for missing field.
+        Check if a field is accounted for in TypeScript.
 
         Parameters
         ----------
         field : str
-            The model field that's missing.
-
-        model_name : str
-            The name of the model that the field is missing from.
+            The field that should be used in the frontend TypeScript file.
 
-        interfaces : dict[str, set[str]]
-            The interfaces that have been searched.
+        interfaces : dict[str, TypeScriptInterface]
+            The interfaces from the frontend TypeScript file.
 
         Returns
         -------
-        str
-            The message displayed to the user when missing fields are found.
+        Bool
+            Whether the field is accounted for in the frontend TypeScript file.
         """
         camel_field = snake_to_camel(input_str=field)
-        interface_of_interfaces = (
-            "interface" if len(interfaces.keys()) == 1 else "interfaces"
-        )
-
         return (
-            f"\nField '{field}' (camelCase: '{camel_field}') from model '{model_name}' is missing in the TypeScript interfaces."
-            f"\nExpected to find this field in the frontend {interface_of_interfaces}: {', '.join(interfaces.keys())}"
-            f"\nTo ignore this field, add the following comment to the TypeScript file (in the sane order as the model fields): '// ts-backend-check: ignore {camel_field}'"
+            camel_field in self.backend_only
+            or field in self.backend_only
+            or any(camel_field in i.property_set for i in interfaces.values())
         )
 
-    @staticmethod
-    def _format_optional_properties_message(
-        field: str, model_name: str, models_file: str
-    ) -> str:
+    def _property_is_optional_when_field_is_blank(
+        self, model_name: str, field: str
+    ) -> bool:
         """
-        Format message for when the blank status of a model field doesn't match the optional status of the corresponding property.
+        Check that if the field is 'blank=True' that the corresponding interface property is optional (?).
 
         Parameters
         ----------
-        field : str
-            The model field that doesn't match blank and optional states.
-
         model_name : str
-            The name of the model that the mismatch occurs in.
+            The name of the model to check the frontend TypeScript file for.
 
-        models_file : str
-            The file path for the models file to check.
+        field : str
+            The field that should match the optional state of the property in the TypeScript file.
 
         Returns
         -------
-        str
-            The message displayed to the user when missing fields are found.
+        Bool
+            Whether the blank status of the model field matches the optional status of the interface property.
         """
         camel_field = snake_to_camel(input_str=field)
+        interfaces = self._find_matching_interfaces(model_name)
 
-        return (
-            f"\nField '{field}' (camelCase: '{camel_field}') from model '{model_name}' doesn't match the TypeScript interfaces based on blank to optional agreement."
-            f"\nPlease check '{models_file}' and the corresponding files in 'ts_interface_paths' to make sure that all 'blank=True' fields are optional (?) in the TypeScript interfaces file."
-        )
+        return any(camel_field in i.optional_property_set for i in interfaces.values())
 
-    @staticmethod
-    def _format_unordered_interface_properties_message(models_file: str) -> str:
+    def _ts_interface_properties_ordered(
+        self, model_name: str, fields: tuple[str, ...]
+    ) -> bool:
         """
-        Format message for unordered interface properties.
+        Check if the order of the TypeScript interface properties exactly matches that of the backend model fields.
 
         Parameters
         ----------
-        models_file : str
-            The file path for the models file to check.
+        model_name : str
+            The name of the model to check the frontend TypeScript file for.
+
+        fields : tuple[str, ...]
+            The fields of the backend model.
 
         Returns
         -------
-        str
-            The message displayed to the user when unordered interface properties are found.
+        bool
+            Whether the order of the properties of the TypeScript interface file match that of the backend model fields.
         """
-        return (
-            "\nThe interface properties of the 'ts_interface_paths' files are unordered."
-            f"\nAll interface properties should exactly match the order of the corresponding fields in the '{models_file}' backend model."
-            "\nIf the model is synced with multiple interfaces, then their properties should follow the order prescribed by the model fields."
+        camel_fields = [snake_to_camel(input_str=f) for f in fields]
+        interfaces = self._find_matching_interfaces(model_name)
+
+        return all(
+            is_ordered_subset(
+                reference_list=camel_fields, candidate_sub_list=i.properties
+            )
+            for i in interfaces.values()
         )
@@ -4,195 +4,1541 @@ Setup and commands for the ts-backend-check command line interface.
 """
 
 import argparse
+import io
+import multiprocessing
+import signal
 import sys
+import time
 from argparse import ArgumentParser
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import ExitStack, redirect_stderr, redirect_stdout
+from multiprocessing.context import BaseContext
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator, NoReturn
 
+import rich
 import yaml
 from rich import print as rprint
 from rich.text import Text
 
-from ts_backend_check.checker import TypeChecker
+from ts_backend_check.artifact_store import ArtifactStore
+from ts_backend_check.cache import (
+    ARTIFACT_STORE_FILE_NAME,
+    CACHE_DIR_PATH,
+    ParseCache,
+    ResultCache,
+)
+from ts_backend_check.checker import TypeChecker, get_interface_names
 from ts_backend_check.cli.generate_config_file import (
     config_file_is_valid,
     generate_config_file,
 )
 from ts_backend_check.cli.generate_test_project import generate_test_project
+from ts_backend_check.cli.manage_cache import print_cache_stats, prune_cache
 from ts_backend_check.cli.upgrade import upgrade_cli
 from ts_backend_check.cli.version import get_version_message
-from ts_backend_check.utils import get_config_file_path
+from ts_backend_check.daemon import (
+    DAEMON_IS_SUPPORTED,
+    DaemonState,
+    get_daemon_socket_path,
+    is_daemon_running,
+    send_request,
+    serve,
+)
+from ts_backend_check.diagnostics import Diagnostic
+from ts_backend_check.utils import (
+    ParseTimeoutError,
+    get_available_cpu_count,
+    get_backend_model_file_paths,
+    get_config_file_path,
+)
+from ts_backend_check.watcher import (
+    InotifyWatcher,
+    PollingWatcher,
+    create_file_watcher,
+)
+from ts_backend_check.writers import (
+    OUTPUT_FORMATS,
+    TEXT_OUTPUT_FORMAT,
+    DiagnosticWriter,
+    create_writer,
+)
+
+# MARK: Error Budget
+
+
+class ErrorBudget:
+    """
+    The number of errors that can still be printed before checks stop.
+
+    Parameters
+    ----------
+    max_errors : int, default=None
+        The maximum number of errors to print across all identifiers, with None not limiting errors.
+    """
+
+    def __init__(self, max_errors: int | None = None) -> None:
+        self.max_errors = max_errors
+        self.remaining = max_errors
+
+    @property
+    def exhausted(self) -> bool:
+        """
+        Whether the maximum number of errors has been printed.
+
+        Returns
+        -------
+        bool
+            Whether no more errors can be printed.
+        """
+        return self.remaining is not None and self.remaining <= 0
+
+    def limit(self, errors: Iterable[Diagnostic]) -> Iterator[Diagnostic]:
+        """
+        Yield errors until the budget is exhausted without consuming errors past the budget.
+
+        Parameters
+        ----------
+        errors : Iterable[Diagnostic]
+            The errors to limit, which can be a generator of errors as they're found.
+
+        Yields
+        ------
+        Diagnostic
+            The errors within the budget.
+        """
+        if self.exhausted:
+            return
+
+        for error in errors:
+            yield error
+
+            if self.remaining is not None:
+                self.remaining -= 1
+                if self.remaining <= 0:
+                    return
+
+
+# MARK: Base Paths
+
+
+def get_invalid_paths_message(
+    identifier: str,
+    backend_model_file_path: Path,
+    ts_interface_file_paths: list[Path],
+) -> str | None:
+    """
+    Derive the message for the user if the paths for the given identifier don't lead to valid files.
+
+    Parameters
+    ----------
+    identifier : str
+        The model in the .ts-backend-check.yaml configuration file to check models and interfaces for.
+
+    backend_model_file_path : Path
+        The path to the backend models as defined in the .ts-backend-check.yaml configuration file, which can be a file, a directory or a glob.
+
+    ts_interface_file_paths : list[Path]
+        The paths to the TypeScript interfaces as defined in the .ts-backend-check.yaml configuration file.
+
+    Returns
+    -------
+    str | None
+        The message to print if a path is invalid, or None if the backend models path leads to files and all TypeScript paths are valid files.
+    """
+    if not get_backend_model_file_paths(backend_model_file_path):
+        return f"[red]❌ The 'backend_model_file_path' argument, {backend_model_file_path}, is not a valid file. This should be a file that contains the '{identifier}' backend models. A directory or a glob of models files can also be used. Please check the .ts-backend-check.yaml configuration file and try again.[/red]"
+
+    if invalid_ts_interface_file_paths := [
+        str(p) for p in ts_interface_file_paths if not p.is_file()
+    ]:
+        return (
+            f"[red]❌ The 'ts_interface_file_paths' argument should contain paths to the '{identifier}' TypeScript types. The following paths do not lead to valid files:\n\n- {'\n- '.join(invalid_ts_interface_file_paths)}\n"
+            "\nPlease check the .ts-backend-check.yaml configuration file and try again.[/red]"
+        )
+
+    return None
+
+
+def iter_check_errors(
+    backend_model_file_path: Path,
+    ts_interface_file_paths: list[Path],
+    check_blank: bool = False,
+    model_name_conversions: dict[str, list[str]] = {},
+    backend_models_to_ignore: list[str] = [],
+    parse_cache: ParseCache | None = None,
+    result_cache: ResultCache | None = None,
+    model_results: dict[str, tuple[str, list[Diagnostic]]] | None = None,
+    imported_files: set[Path] | None = None,
+) -> Iterator[Diagnostic]:
+    """
+    Check the provided files against one another, yielding the diagnostics that are found as each model is checked.
+
+    Parameters
+    ----------
+    backend_model_file_path : Path
+        The path to the backend models as defined in the .ts-backend-check.yaml configuration file, which can be a file, a directory or a glob.
+
+    ts_interface_file_paths : list[Path]
+        The paths to the TypeScript interfaces as defined in the .ts-backend-check.yaml configuration file.
+
+    check_blank : bool, default=False
+        Whether to also check that fields marked 'blank=True' within Django models are optional (?) in the TypeScript interfaces.
+
+    model_name_conversions : dict[str, list[str]], default={}
+        A dictionary of backend model names to their corresponding TypeScript interfaces when snake to camel case isn't valid.
+
+    backend_models_to_ignore : list[str]
+        Backend model classes to ignore, obtained from the config file.
+
+    parse_cache : ParseCache, default=None
+        A cache of parsed files shared between identifiers so that each file is only parsed once per run.
+
+    result_cache : ResultCache, default=None
+        An on-disk cache of results that are replayed if the files and configuration haven't changed.
+
+    model_results : dict[str, tuple[str, list[Diagnostic]]], default=None
+        In-memory results of the models from the previous check of the identifier, which are reused for unchanged models and replaced with the results of this check.
+
+    imported_files : set[Path], default=None
+        A set that the resolved paths of the files that the TypeScript files import checked declarations from are added to.
+
+    Yields
+    ------
+    Diagnostic
+        The inconsistencies between the backend models and TypeScript interfaces.
+
+    Notes
+    -----
+    Results are only written to the caches if all errors are consumed.
+    """
+    if result_cache is not None:
+        key = result_cache.get_key(
+            backend_model_file_path=backend_model_file_path,
+            ts_interface_file_paths=ts_interface_file_paths,
+            check_blank=check_blank,
+            model_name_conversions=model_name_conversions,
+            backend_models_to_ignore=backend_models_to_ignore,
+        )
+        if (
+            cached_errors := result_cache.load(key, imported_files=imported_files)
+        ) is not None:
+            yield from cached_errors
+            return
+
+        identifier_key = result_cache.get_identifier_key(
+            backend_model_file_path=backend_model_file_path,
+            ts_interface_file_paths=ts_interface_file_paths,
+            check_blank=check_blank,
+            model_name_conversions=model_name_conversions,
+            backend_models_to_ignore=backend_models_to_ignore,
+        )
+
+    if parse_cache is None:
+        parse_cache = ParseCache()
+
+    previous_model_results = model_results
+    if previous_model_results is None and result_cache is not None:
+        previous_model_results = result_cache.load_model_results(key=identifier_key)
+
+    # The models files of directories and globs are parsed in parallel and merged into an index that records which file defines each model.
+    model_index = parse_cache.get_model_index(
+        models_files=get_backend_model_file_paths(backend_model_file_path),
+        models_to_ignore=backend_models_to_ignore,
+    )
+    # Files are parsed on their own and merged into an index that records which file declares each interface.
+    # The declarations of the checked interfaces are also loaded from the files that they're imported from.
+    interface_index = parse_cache.get_ts_files(
+        ts_interface_file_paths,
+        interface_names=get_interface_names(
+            model_names=model_index.models,
+            model_name_conversions=model_name_conversions,
+        ),
+    )
+    if imported_files is not None:
+        imported_files.update(Path(p).resolve() for p in interface_index.imported_files)
+
+    checker = TypeChecker(
+        models_file=str(backend_model_file_path),
+        model_name_conversions=model_name_conversions,
+        check_blank=check_blank,
+        backend_models_to_ignore=backend_models_to_ignore,
+        interface_index=interface_index,
+        # Models whose dependencies haven't changed since the last run reuse their results.
+        previous_model_results=previous_model_results,
+        model_index=model_index,
+    )
+    errors: list[Diagnostic] = []
+    for error in checker.iter_diagnostics():
+        # Errors are only held in memory when they need to be cached.
+        if result_cache is not None:
+            errors.append(error)
+
+        yield error
+
+    if model_results is not None:
+        model_results.clear()
+        model_results.update(checker.model_results)
+
+    if result_cache is not None:
+        result_cache.save(
+            key=key, errors=errors, imported_files=interface_index.imported_files
+        )
+        result_cache.save_model_results(
+            key=identifier_key, model_results=checker.model_results
+        )
+
+
+def print_check_results(
+    identifier: str,
+    backend_model_file_path: Path,
+    missing: Iterable[Diagnostic],
+    error_budget: ErrorBudget | None = None,
+    writer: DiagnosticWriter | None = None,
+) -> bool:
+    """
+    Print the results of the checks for the given identifier, printing each error as it arrives.
+
+    Parameters
+    ----------
+    identifier : str
+        The model in the .ts-backend-check.yaml configuration file that was checked.
+
+    backend_model_file_path : Path
+        The path to the backend models as defined in the .ts-backend-check.yaml configuration file, which can be a file, a directory or a glob.
+
+    missing : Iterable[Diagnostic]
+        The inconsistencies that were found, which can be a generator of errors as they're found.
+
+    error_budget : ErrorBudget, default=None
+        The number of errors that can still be printed, with errors past the budget not being consumed.
+
+    writer : DiagnosticWriter, default=None
+        A writer for a machine-readable output format, with the results being printed for people if not passed.
+
+    Returns
+    -------
+    bool
+        Whether the checks passed (True) or not (False).
+    """
+    if error_budget is not None:
+        missing = error_budget.limit(missing)
+
+    n_errors = 0
+    if writer is not None:
+        for diagnostic in missing:
+            writer.write(identifier=identifier, diagnostic=diagnostic)
+            n_errors += 1
+
+        writer.end_identifier(
+            identifier=identifier,
+            backend_model_file_path=backend_model_file_path,
+            n_errors=n_errors,
+        )
+
+        return n_errors == 0
+
+    for diagnostic in missing:
+        if n_errors == 0:
+            rprint(
+                f"\n[red]❌ ts-backend-check error: There are inconsistencies between the provided '{identifier}' backend models and TypeScript interfaces. Please see the output below for details.[/red]"
+            )
+
+        # Messages are styled rather than parsed as markup as they contain user-defined names.
+        rprint(Text(diagnostic.message, style="red"))
+        n_errors += 1
+
+    if n_errors:
+        error_or_errors = "errors" if n_errors > 1 else "error"
+        rprint(
+            f"[red]\nPlease fix the {n_errors} {error_or_errors} above to continue the sync of the backend models of {backend_model_file_path} and the corresponding TypeScript interfaces.[/red]"
+        )
+
+        return False
+
+    else:
+        rprint(
+            f"[green]✅ Success: All backend models are synced with their corresponding TypeScript interfaces for the provided '{identifier}' files.[/green]"
+        )
+
+        return True
+
+
+def check_files_and_print_results(
+    identifier: str,
+    backend_model_file_path: Path,
+    ts_interface_file_paths: list[Path],
+    check_blank: bool = False,
+    model_name_conversions: dict[str, list[str]] = {},
+    backend_models_to_ignore: list[str] = [],
+    parse_cache: ParseCache | None = None,
+    result_cache: ResultCache | None = None,
+    model_results: dict[str, tuple[str, list[Diagnostic]]] | None = None,
+    imported_files: set[Path] | None = None,
+    error_budget: ErrorBudget | None = None,
+    writer: DiagnosticWriter | None = None,
+) -> bool:
+    """
+    Check the provided files for the given model and print the results as they're found.
+
+    Parameters
+    ----------
+    identifier : str
+        The model in the .ts-backend-check.yaml configuration file to check models and interfaces for.
+
+    backend_model_file_path : Path
+        The path to the backend models as defined in the .ts-backend-check.yaml configuration file, which can be a file, a directory or a glob.
+
+    ts_interface_file_paths : list[Path]
+        The paths to the TypeScript interfaces as defined in the .ts-backend-check.yaml configuration file.
+
+    check_blank : bool, default=False
+        Whether to also check that fields marked 'blank=True' within Django models are optional (?) in the TypeScript interfaces.
+
+    model_name_conversions : dict[str, list[str]], default={}
+        A dictionary of backend model names to their corresponding TypeScript interfaces when snake to camel case isn't valid.
+
+    backend_models_to_ignore : list[str]
+        Backend model classes to ignore, obtained from the config file.
+
+    parse_cache : ParseCache, default=None
+        A cache of parsed files shared between identifiers so that each file is only parsed once per run.
+
+    result_cache : ResultCache, default=None
+        An on-disk cache of results that are replayed if the files and configuration haven't changed.
+
+    model_results : dict[str, tuple[str, list[Diagnostic]]], default=None
+        In-memory results of the models from the previous check of the identifier, which are reused for unchanged models and replaced with the results of this check.
+
+    imported_files : set[Path], default=None
+        A set that the resolved paths of the files that the TypeScript files import checked declarations from are added to.
+
+    error_budget : ErrorBudget, default=None
+        The number of errors that can still be printed, with checks stopping once the budget is reached.
+
+    writer : DiagnosticWriter, default=None
+        A writer for a machine-readable output format, with the results being printed for people if not passed.
+
+    Returns
+    -------
+    bool
+        Whether the checks passed (True) or not (False).
+    """
+    if invalid_paths_message := get_invalid_paths_message(
+        identifier=identifier,
+        backend_model_file_path=backend_model_file_path,
+        ts_interface_file_paths=ts_interface_file_paths,
+    ):
+        rprint(invalid_paths_message)
+        return False
+
+    missing = iter_check_errors(
+        backend_model_file_path=backend_model_file_path,
+        ts_interface_file_paths=ts_interface_file_paths,
+        check_blank=check_blank,
+        model_name_conversions=model_name_conversions,
+        backend_models_to_ignore=backend_models_to_ignore,
+        parse_cache=parse_cache,
+        result_cache=result_cache,
+        model_results=model_results,
+        imported_files=imported_files,
+    )
+
+    return print_check_results(
+        identifier=identifier,
+        backend_model_file_path=backend_model_file_path,
+        missing=missing,
+        error_budget=error_budget,
+        writer=writer,
+    )
+
+
+# MARK: Config Checks
+
+
+def extract_identifier_config(identifier_config: dict) -> dict[str, Any]:
+    """
+    Extract and normalize config fields with defaults.
+
+    Parameters
+    ----------
+    identifier_config : dict
+        A dictionary of configuration parameters, with some being unset.
+
+    Returns
+    -------
+    dict[str,Any]
+        A dict of configuration parameters to pass to checks with defaults set.
+    """
+    return {
+        "backend_model_file_path": Path(identifier_config["backend_model_path"]),
+        "ts_interface_file_paths": [
+            Path(p) for p in identifier_config["ts_interface_paths"]
+        ],
+        "check_blank": identifier_config.get("check_blank_model_fields", False),
+        "model_name_conversions": identifier_config.get(
+            "backend_to_ts_model_name_conversions", {}
+        ),
+        "backend_models_to_ignore": identifier_config.get(
+            "backend_models_to_ignore", []
+        ),
+    }
+
+
+# MARK: Checks Function
+
+
+def exit_for_unknown_identifier(identifier: str) -> NoReturn:
+    """
+    Tell the user that an identifier isn't in the configuration file and exit.
+
+    Parameters
+    ----------
+    identifier : str
+        The identifier that isn't in the configuration file.
+    """
+    rprint(
+        f"[red]{identifier} is not an index within the .ts-backend-check.yaml "
+        "configuration file. Please check the defined models and try again.[/red]"
+    )
+    sys.exit(1)
+
+
+def run_checks(
+    config: dict,
+    identifiers: list[str],
+    jobs: int = 1,
+    result_cache: ResultCache | None = None,
+    parse_cache: ParseCache | None = None,
+    model_results: dict[str, dict[str, tuple[str, list[Diagnostic]]]] | None = None,
+    executors: dict[int, ProcessPoolExecutor] | None = None,
+    max_errors: int | None = None,
+    writer: DiagnosticWriter | None = None,
+) -> list[bool]:
+    """
+    Function to run checks for the given list of identifiers.
+
+    Parameters
+    ----------
+    config : dict
+        Get a dictionary of config paths.
+
+    identifiers : list
+        Get a list of identifiers.
+
+    jobs : int, default=1
+        The number of worker processes to check identifiers on, with 0 using all available CPUs, or to parse TypeScript files on when a single identifier is checked.
+
+    result_cache : ResultCache, default=None
+        An on-disk cache of results that are replayed if the files and configuration haven't changed.
+
+    parse_cache : ParseCache, default=None
+        A cache of parsed files shared between identifiers, with a new cache being used if not passed.
+
+    model_results : dict[str, dict[str, tuple[str, list[Diagnostic]]]], default=None
+        In-memory results of the models of each identifier that are kept between runs of a long-lived process.
+
+    executors : dict[int, ProcessPoolExecutor], default=None
+        Process pools by their number of workers that are kept between runs of a long-lived process.
+
+    max_errors : int, default=None
+        The number of errors after which checks stop, with identifiers after the one that reaches it not being checked.
+
+    writer : DiagnosticWriter, default=None
+        A writer for a machine-readable output format, with the results being printed for people if not passed.
+
+    Returns
+    -------
+    list[bool]
+        Returns a list of boolean values that define whether checks have passed.
+    """
+    if parse_cache is None:
+        parse_cache = ParseCache()
+
+    error_budget = ErrorBudget(max_errors=max_errors)
+    if jobs != 1 and len(identifiers) > 1:
+        results = run_checks_in_parallel(
+            config=config,
+            identifiers=identifiers,
+            jobs=jobs,
+            result_cache=result_cache,
+            artifact_store=parse_cache.artifact_store,
+            parse_timeout=parse_cache.parse_timeout,
+            executors=executors,
+            error_budget=error_budget,
+            writer=writer,
+        )
+        print_error_budget_message(error_budget=error_budget)
+
+        return results
+
+    results: list[bool] = []
+    with ExitStack() as stack:
+        max_workers = jobs or get_available_cpu_count()
+        if max_workers > 1 and parse_cache.executor is None:
+            # Identifiers that are checked in this process parse their TypeScript files on the workers instead.
+            parse_cache.executor = (
+                get_long_lived_executor(
+                    executors=executors,
+                    max_workers=max_workers,
+                    artifact_store=parse_cache.artifact_store,
+                )
+                if executors is not None
+                else stack.enter_context(
+                    create_executor(
+                        max_workers=max_workers,
+                        artifact_store=parse_cache.artifact_store,
+                    )
+                )
+            )
+            parse_cache.max_workers = max_workers
+            stack.callback(setattr, parse_cache, "executor", None)
+
+        for identifier in identifiers:
+            if error_budget.exhausted:
+                break
+
+            if not config.get(identifier):
+                exit_for_unknown_identifier(identifier=identifier)
+
+            r = check_files_and_print_results(
+                identifier=identifier,
+                **extract_identifier_config(config[identifier]),
+                parse_cache=parse_cache,
+                result_cache=result_cache,
+                model_results=model_results.setdefault(identifier, {})
+                if model_results is not None
+                else None,
+                error_budget=error_budget,
+                writer=writer,
+            )
+            results.append(r)
+
+    print_error_budget_message(error_budget=error_budget)
+
+    return results
+
+
+def print_error_budget_message(error_budget: ErrorBudget) -> None:
+    """
+    Tell the user that checks were stopped if the maximum number of errors was reached.
+
+    Parameters
+    ----------
+    error_budget : ErrorBudget
+        The error budget of the run.
+    """
+    if error_budget.exhausted:
+        rprint(
+            f"[yellow]\nStopped checking after reaching the maximum of {error_budget.max_errors} {'error' if error_budget.max_errors == 1 else 'errors'}.[/yellow]"
+        )
+
+
+# MARK: Parallel Checks
+
+# Each worker process keeps its own cache so that files shared by its identifiers are parsed once.
+WORKER_PARSE_CACHE = ParseCache()
+
+
+def init_worker_parse_cache(artifact_store_path: Path | None) -> None:
+    """
+    Initialize the parse cache of a worker process with the artifact store of the run.
+
+    Parameters
+    ----------
+    artifact_store_path : Path | None
+        The path to the artifact store of the run, or None if parsed files aren't persisted.
+    """
+    global WORKER_PARSE_CACHE
+    WORKER_PARSE_CACHE = ParseCache(
+        artifact_store=ArtifactStore(db_path=artifact_store_path)
+        if artifact_store_path is not None
+        else None
+    )
+
+
+def get_check_errors_in_worker(
+    result_cache: ResultCache | None = None,
+    parse_timeout: float | None = None,
+    **identifier_kwargs: Any,
+) -> list[Diagnostic]:
+    """
+    Check the files of an identifier within a worker process using the cache of the process.
+
+    Parameters
+    ----------
+    result_cache : ResultCache, default=None
+        An on-disk cache that the results of the check are written to.
+
+    parse_timeout : float, default=None
+        The number of seconds that parsing each file can take, with no limit if not passed.
+
+    **identifier_kwargs : Any
+        The configuration parameters of the identifier from extract_identifier_config.
+
+    Returns
+    -------
+    list[Diagnostic]
+        The inconsistencies between the backend models and TypeScript interfaces.
+    """
+    # The timeout is passed with each check as pools of long-lived processes are reused across invocations.
+    WORKER_PARSE_CACHE.parse_timeout = parse_timeout
+    try:
+        return list(
+            iter_check_errors(
+                **identifier_kwargs,
+                parse_cache=WORKER_PARSE_CACHE,
+                result_cache=result_cache,
+            )
+        )
+
+    finally:
+        # Workers aren't closed at the end of runs, so their lookups are flushed after each check.
+        if WORKER_PARSE_CACHE.artifact_store is not None:
+            WORKER_PARSE_CACHE.artifact_store.flush()
+
+
+def create_executor(
+    max_workers: int,
+    artifact_store: ArtifactStore | None = None,
+    mp_context: BaseContext | None = None,
+) -> ProcessPoolExecutor:
+    """
+    Create a process pool whose workers each keep a cache of parsed files.
+
+    Parameters
+    ----------
+    max_workers : int
+        The number of worker processes.
+
+    artifact_store : ArtifactStore, default=None
+        A persistent store of parsed files that the worker processes share.
+
+    mp_context : BaseContext, default=None
+        The multiprocessing context to start workers with, with the default of the platform being used if not passed.
+
+    Returns
+    -------
+    ProcessPoolExecutor
+        The process pool.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=mp_context,
+        initializer=init_worker_parse_cache,
+        initargs=(artifact_store.db_path if artifact_store is not None else None,),
+    )
+
+
+def get_long_lived_executor(
+    executors: dict[int, ProcessPoolExecutor],
+    max_workers: int,
+    artifact_store: ArtifactStore | None = None,
+) -> ProcessPoolExecutor:
+    """
+    Get the process pool with a number of workers that's kept between runs of a long-lived process, creating it if needed.
+
+    Parameters
+    ----------
+    executors : dict[int, ProcessPoolExecutor]
+        Process pools by their number of workers that are kept between runs.
+
+    max_workers : int
+        The number of worker processes.
+
+    artifact_store : ArtifactStore, default=None
+        A persistent store of parsed files that the worker processes share.
+
+    Returns
+    -------
+    ProcessPoolExecutor
+        The process pool.
+    """
+    if max_workers not in executors:
+        # Pools of long-lived processes use forkserver as forking a process that already has pool threads is unsafe.
+        executors[max_workers] = create_executor(
+            max_workers=max_workers,
+            artifact_store=artifact_store,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+
+    return executors[max_workers]
+
+
+def run_checks_in_parallel(
+    config: dict,
+    identifiers: list[str],
+    jobs: int,
+    result_cache: ResultCache | None = None,
+    artifact_store: ArtifactStore | None = None,
+    parse_timeout: float | None = None,
+    executors: dict[int, ProcessPoolExecutor] | None = None,
+    error_budget: ErrorBudget | None = None,
+    writer: DiagnosticWriter | None = None,
+) -> list[bool]:
+    """
+    Run checks for the given identifiers on a pool of processes and print the results in the given order.
+
+    Parameters
+    ----------
+    config : dict
+        Get a dictionary of config paths.
+
+    identifiers : list
+        Get a list of identifiers.
+
+    jobs : int
+        The number of worker processes to check identifiers on, with 0 using all available CPUs.
+
+    result_cache : ResultCache, default=None
+        An on-disk cache of results that are replayed if the files and configuration haven't changed.
+
+    artifact_store : ArtifactStore, default=None
+        A persistent store of parsed files that the worker processes share.
+
+    parse_timeout : float, default=None
+        The number of seconds that parsing each file can take, with no limit if not passed.
+
+    executors : dict[int, ProcessPoolExecutor], default=None
+        Process pools by their number of workers that are kept between runs, with a pool being created for this run if not passed.
+
+    error_budget : ErrorBudget, default=None
+        The number of errors that can still be printed, with checks that haven't started being cancelled once it's reached.
+
+    writer : DiagnosticWriter, default=None
+        A writer for a machine-readable output format, with the results being printed for people if not passed.
+
+    Returns
+    -------
+    list[bool]
+        Returns a list of boolean values that define whether checks have passed.
+    """
+    identifier_configs = {
+        i: extract_identifier_config(config[i]) for i in identifiers if config.get(i)
+    }
+    max_workers = min(jobs or get_available_cpu_count(), len(identifier_configs) or 1)
+
+    if executors is None:
+        with create_executor(
+            max_workers=max_workers, artifact_store=artifact_store
+        ) as executor:
+            return print_results_of_executor(
+                executor=executor,
+                identifiers=identifiers,
+                identifier_configs=identifier_configs,
+                result_cache=result_cache,
+                parse_timeout=parse_timeout,
+                error_budget=error_budget,
+                writer=writer,
+            )
+
+    return print_results_of_executor(
+        executor=get_long_lived_executor(
+            executors=executors, max_workers=max_workers, artifact_store=artifact_store
+        ),
+        identifiers=identifiers,
+        identifier_configs=identifier_configs,
+        result_cache=result_cache,
+        parse_timeout=parse_timeout,
+        error_budget=error_budget,
+        writer=writer,
+    )
+
+
+def print_results_of_executor(
+    executor: ProcessPoolExecutor,
+    identifiers: list[str],
+    identifier_configs: dict[str, dict[str, Any]],
+    result_cache: ResultCache | None = None,
+    parse_timeout: float | None = None,
+    error_budget: ErrorBudget | None = None,
+    writer: DiagnosticWriter | None = None,
+) -> list[bool]:
+    """
+    Check identifiers on a process pool and print the results in the given order.
+
+    Parameters
+    ----------
+    executor : ProcessPoolExecutor
+        The process pool to check identifiers on.
+
+    identifiers : list
+        Get a list of identifiers.
+
+    identifier_configs : dict[str, dict[str, Any]]
+        The configuration parameters of each identifier that's in the configuration file from extract_identifier_config.
+
+    result_cache : ResultCache, default=None
+        An on-disk cache of results that are replayed if the files and configuration haven't changed.
+
+    parse_timeout : float, default=None
+        The number of seconds that parsing each file can take, with no limit if not passed.
+
+    error_budget : ErrorBudget, default=None
+        The number of errors that can still be printed, with checks that haven't started being cancelled once it's reached.
+
+    writer : DiagnosticWriter, default=None
+        A writer for a machine-readable output format, with the results being printed for people if not passed.
+
+    Returns
+    -------
+    list[bool]
+        Returns a list of boolean values that define whether checks have passed.
+    """
+    futures = submit_checks(
+        executor=executor,
+        identifier_configs=identifier_configs,
+        result_cache=result_cache,
+        parse_timeout=parse_timeout,
+    )
+
+    results: list[bool] = []
+    # Results are consumed in the order of the identifiers so that output matches a serial run.
+    for identifier in identifiers:
+        if error_budget is not None and error_budget.exhausted:
+            break
+
+        if identifier not in identifier_configs:
+            for future in futures.values():
+                future.cancel()
+
+            exit_for_unknown_identifier(identifier=identifier)
+
+        identifier_config = identifier_configs[identifier]
+        if identifier not in futures:
+            results.append(
+                check_files_and_print_results(
+                    identifier=identifier,
+                    **identifier_config,
+                    error_budget=error_budget,
+                    writer=writer,
+                )
+            )
+            continue
+
+        results.append(
+            print_check_results(
+                identifier=identifier,
+                backend_model_file_path=identifier_config["backend_model_file_path"],
+                missing=futures[identifier].result(),
+                error_budget=error_budget,
+                writer=writer,
+            )
+        )
+
+    for future in futures.values():
+        future.cancel()
+
+    return results
+
+
+def submit_checks(
+    executor: ProcessPoolExecutor,
+    identifier_configs: dict[str, dict[str, Any]],
+    result_cache: ResultCache | None = None,
+    parse_timeout: float | None = None,
+) -> dict[str, Future[list[Diagnostic]]]:
+    """
+    Submit the checks of identifiers with valid paths that don't have cached results to the process pool.
+
+    Parameters
+    ----------
+    executor : ProcessPoolExecutor
+        The process pool to check identifiers on.
+
+    identifier_configs : dict[str, dict[str, Any]]
+        The configuration parameters of each identifier from extract_identifier_config.
+
+    result_cache : ResultCache, default=None
+        An on-disk cache of results that are replayed if the files and configuration haven't changed.
+
+    parse_timeout : float, default=None
+        The number of seconds that parsing each file can take, with no limit if not passed.
+
+    Returns
+    -------
+    dict[str, Future[list[Diagnostic]]]
+        The future diagnostics of each identifier with valid paths.
+    """
+    futures: dict[str, Future[list[Diagnostic]]] = {}
+    for identifier, identifier_config in identifier_configs.items():
+        if get_invalid_paths_message(
+            identifier=identifier,
+            backend_model_file_path=identifier_config["backend_model_file_path"],
+            ts_interface_file_paths=identifier_config["ts_interface_file_paths"],
+        ):
+            continue
+
+        if result_cache is not None:
+            key = result_cache.get_key(**identifier_config)
+            if (cached_errors := result_cache.load(key)) is not None:
+                futures[identifier] = Future()
+                futures[identifier].set_result(cached_errors)
+                continue
+
+        # Workers write their results to the result cache, reusing the file hashes derived above.
+        futures[identifier] = executor.submit(
+            get_check_errors_in_worker,
+            result_cache=result_cache,
+            parse_timeout=parse_timeout,
+            **identifier_config,
+        )
+
+    return futures
+
+
+# MARK: Watch Mode
+
+
+def check_watched_identifiers(
+    identifiers: list[str],
+    identifier_configs: dict[str, dict[str, Any]],
+    identifier_file_paths: dict[str, set[Path]],
+    model_results: dict[str, dict[str, tuple[str, list[Diagnostic]]]],
+    parse_cache: ParseCache,
+    result_cache: ResultCache | None = None,
+) -> None:
+    """
+    Check identifiers in watch mode, printing errors from files that can't be parsed rather than stopping.
+
+    Parameters
+    ----------
+    identifiers : list[str]
+        The identifiers to check.
+
+    identifier_configs : dict[str, dict[str, Any]]
+        The normalized configurations of the identifiers.
+
+    identifier_file_paths : dict[str, set[Path]]
+        The resolved paths of the files of each identifier that imported files are added to.
+
+    model_results : dict[str, dict[str, tuple[str, list[Diagnostic]]]]
+        The in-memory results of the models of each identifier from its previous check.
+
+    parse_cache : ParseCache
+        A cache of parsed files that's kept in memory between checks.
+
+    result_cache : ResultCache, default=None
+        An on-disk cache of results that are replayed if the files and configuration haven't changed.
+    """
+    for identifier in identifiers:
+        try:
+            check_files_and_print_results(
+                identifier=identifier,
+                **identifier_configs[identifier],
+                parse_cache=parse_cache,
+                result_cache=result_cache,
+                model_results=model_results[identifier],
+                imported_files=identifier_file_paths[identifier],
+            )
+
+        except (SyntaxError, ParseTimeoutError, OSError) as e:
+            rprint(Text(f"Could not check '{identifier}': {e}", style="red"))
+
+
+def wait_for_watched_identifiers(
+    watcher: InotifyWatcher | PollingWatcher,
+    identifier_file_paths: dict[str, set[Path]],
+) -> tuple[list[str], set[Path]]:
+    """
+    Wait for changes to the files of any of the watched identifiers.
+
+    Parameters
+    ----------
+    watcher : InotifyWatcher | PollingWatcher
+        The file watcher of the files of the identifiers.
 
-# MARK: Base Paths
+    identifier_file_paths : dict[str, set[Path]]
+        The resolved paths of the files of each identifier.
 
+    Returns
+    -------
+    tuple[list[str], set[Path]]
+        The identifiers whose files changed and the paths of the changed files.
+    """
+    while True:
+        changed_paths = watcher.wait_for_changes()
+        if identifiers := [
+            identifier
+            for identifier, file_paths in identifier_file_paths.items()
+            if file_paths & changed_paths
+        ]:
+            return identifiers, changed_paths
+
+
+def watch_identifiers(
+    config: dict,
+    identifiers: list[str],
+    result_cache: ResultCache | None = None,
+    parse_cache: ParseCache | None = None,
+) -> None:
+    """
+    Check the given identifiers and re-check those whose files change until interrupted.
 
-def check_files_and_print_results(
-    identifier: str,
-    backend_model_file_path: Path,
-    ts_interface_file_paths: list[Path],
-    check_blank: bool = False,
-    model_name_conversions: dict[str, list[str]] = {},
-    backend_models_to_ignore: list[str] = [],
-) -> bool:
+    Parameters
+    ----------
+    config : dict
+        Get a dictionary of config paths.
+
+    identifiers : list
+        Get a list of identifiers.
+
+    result_cache : ResultCache, default=None
+        An on-disk cache of results that are replayed if the files and configuration haven't changed.
+
+    parse_cache : ParseCache, default=None
+        A cache of parsed files that's kept in memory between checks, with a new cache being used if not passed.
+
+    Notes
+    -----
+    Parsed files and the results of each model are kept in memory so that re-checks only parse changed files and check models whose dependencies changed.
+    The files that checked declarations are imported from are also watched once they've been loaded.
+    Files that can't be parsed are reported for each re-check and watching continues until they're fixed.
+    Changes to the configuration file and models files being added to the directories or globs of identifiers require watch mode to be restarted.
+    """
+    if parse_cache is None:
+        parse_cache = ParseCache()
+
+    identifier_configs: dict[str, dict[str, Any]] = {}
+    for identifier in dict.fromkeys(identifiers):
+        if not config.get(identifier):
+            exit_for_unknown_identifier(identifier=identifier)
+
+        identifier_configs[identifier] = extract_identifier_config(config[identifier])
+
+    identifier_file_paths = {
+        identifier: {
+            *(
+                p.resolve()
+                for p in get_backend_model_file_paths(
+                    identifier_config["backend_model_file_path"]
+                )
+            ),
+            *(p.resolve() for p in identifier_config["ts_interface_file_paths"]),
+        }
+        for identifier, identifier_config in identifier_configs.items()
+    }
+    model_results: dict[str, dict[str, tuple[str, list[Diagnostic]]]] = {
+        identifier: {} for identifier in identifier_configs
+    }
+
+    watched_file_paths = set().union(*identifier_file_paths.values())
+    watcher = create_file_watcher(watched_file_paths)
+    identifiers_to_check = list(identifier_configs)
+    try:
+        while True:
+            start_time = time.perf_counter()
+            check_watched_identifiers(
+                identifiers=identifiers_to_check,
+                identifier_configs=identifier_configs,
+                identifier_file_paths=identifier_file_paths,
+                model_results=model_results,
+                parse_cache=parse_cache,
+                result_cache=result_cache,
+            )
+
+            # Files that are newly imported from are watched along with the configured files.
+            if (
+                file_paths := set().union(*identifier_file_paths.values())
+            ) != watched_file_paths:
+                watcher.close()
+                watched_file_paths = file_paths
+                watcher = create_file_watcher(watched_file_paths)
+
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            rprint(
+                f"[dim]Checked in {elapsed_ms:.0f} ms. Watching for changes (press Ctrl+C to stop)...[/dim]"
+            )
+
+            identifiers_to_check, changed_paths = wait_for_watched_identifiers(
+                watcher=watcher, identifier_file_paths=identifier_file_paths
+            )
+
+            changed_file_names = ", ".join(sorted(p.name for p in changed_paths))
+            rprint(f"\n[dim]Changes detected in {changed_file_names}.[/dim]")
+
+    except KeyboardInterrupt:
+        rprint("\n[dim]Stopped watching for changes.[/dim]")
+
+    finally:
+        watcher.close()
+
+
+# MARK: Version Flag
+
+
+class VersionAction(argparse.Action):
     """
-    Check the provided files for the given model and print the results.
+    Print the version message and exit, fetching the latest version only when the flag is passed.
 
     Parameters
     ----------
-    identifier : str
-        The model in the .ts-backend-check.yaml configuration file to check models and interfaces for.
+    option_strings : list[str]
+        The flags of the argument.
 
-    backend_model_file_path : Path
-        The path to the backend models as defined in the .ts-backend-check.yaml configuration file.
+    dest : str, default=argparse.SUPPRESS
+        The attribute of the namespace for the argument, which isn't set.
 
-    ts_interface_file_paths : list[Path]
-        The paths to the TypeScript interfaces as defined in the .ts-backend-check.yaml configuration file.
+    default : Any, default=argparse.SUPPRESS
+        The default value of the argument, which isn't set.
 
-    check_blank : bool, default=False
-        Whether to also check that fields marked 'blank=True' within Django models are optional (?) in the TypeScript interfaces.
+    help : str, default=None
+        The help message of the argument.
+    """
 
-    model_name_conversions : dict[str, list[str]], default={}
-        A dictionary of backend model names to their corresponding TypeScript interfaces when snake to camel case isn't valid.
+    def __init__(
+        self,
+        option_strings: list[str],
+        dest: str = argparse.SUPPRESS,
+        default: Any = argparse.SUPPRESS,
+        help: str | None = None,
+    ) -> None:
+        super().__init__(
+            option_strings=option_strings,
+            dest=dest,
+            default=default,
+            nargs=0,
+            help=help,
+        )
+
+    def __call__(
+        self,
+        parser: ArgumentParser,
+        namespace: argparse.Namespace,
+        values: Any,
+        option_string: str | None = None,
+    ) -> None:
+        """
+        Print the version message and exit.
+
+        Parameters
+        ----------
+        parser : ArgumentParser
+            The parser of the CLI.
+
+        namespace : argparse.Namespace
+            The parsed arguments.
+
+        values : Any
+            The values of the argument, which are unused.
+
+        option_string : str, default=None
+            The flag that was passed.
+        """
+        print(get_version_message())
+        parser.exit()
+
+
+# MARK: Daemon Mode
 
-    backend_models_to_ignore : list[str]
-        Backend model classes to ignore, obtained from the config file.
+
+def can_forward_to_daemon(args: argparse.Namespace) -> bool:
+    """
+    Check whether an invocation only runs checks and so can be forwarded to a daemon.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The parsed command line arguments.
 
     Returns
     -------
     bool
-        Whether the checks passed (True) or not (False).
+        Whether the invocation can be forwarded.
     """
-    if not backend_model_file_path.is_file():
-        rprint(
-            f"[red]❌ The 'backend_model_file_path' argument, {backend_model_file_path}, is not a valid file. This should be a file that contains the '{identifier}' backend models. Please check the .ts-backend-check.yaml configuration file and try again.[/red]"
-        )
-        return False
+    return bool(args.identifier or args.all) and not (
+        args.daemon
+        or args.lsp
+        or args.watch
+        or args.upgrade
+        or args.generate_config_file
+        or args.generate_test_project
+        or args.cache_stats
+        or args.cache_prune
+    )
 
-    ts_interface_file_path_validities = [p.is_file() for p in ts_interface_file_paths]
-    if invalid_ts_interface_file_paths := [
-        str(p)
-        for i, p in enumerate(ts_interface_file_paths)
-        if not ts_interface_file_path_validities[i]
-    ]:
-        rprint(
-            f"[red]❌ The 'ts_interface_file_paths' argument should contain paths to the '{identifier}' TypeScript types. The following paths do not lead to valid files:\n\n- {'\n- '.join(invalid_ts_interface_file_paths)}\n"
-            "\nPlease check the .ts-backend-check.yaml configuration file and try again.[/red]"
-        )
-        return False
 
-    # We concatenate all contents of the interface files into a single interface.
-    # Note: This means that we can't report which interface file the errors are coming from.
-    concatenated_types_file = ""
-    for p in ts_interface_file_paths:
-        with open(p, "r", encoding="utf-8") as f:
-            concatenated_types_file += f.read()
+def forward_to_daemon(argv: list[str]) -> int | None:
+    """
+    Forward an invocation to the daemon of the project and print its output.
 
-    checker = TypeChecker(
-        models_file=str(backend_model_file_path),
-        concatenated_types_file=concatenated_types_file,
-        model_name_conversions=model_name_conversions,
-        check_blank=check_blank,
-        backend_models_to_ignore=backend_models_to_ignore,
+    Parameters
+    ----------
+    argv : list[str]
+        The command line arguments of the invocation.
+
+    Returns
+    -------
+    int | None
+        The exit code of the invocation, or None if there's no daemon that can handle it.
+    """
+    console = rich.get_console()
+    response = send_request(
+        argv=argv,
+        console_options={
+            "force_terminal": console.is_terminal,
+            "color_system": console.color_system,
+            "no_color": console.no_color,
+            "width": console.width,
+        },
     )
+    if response is None:
+        return None
 
-    if missing := checker.check():
-        rprint(
-            f"\n[red]❌ ts-backend-check error: There are inconsistencies between the provided '{identifier}' backend models and TypeScript interfaces. Please see the output below for details.[/red]"
-        )
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+
+    return response["exit_code"]
 
-        for msg in missing:
-            rprint(Text.from_markup(f"[red]{msg}[/red]"))
 
-        error_or_errors = "errors" if len(missing) > 1 else "error"
+def handle_daemon_request(
+    request: dict[str, Any], daemon_state: DaemonState
+) -> dict[str, Any]:
+    """
+    Run an invocation that was forwarded to the daemon and capture its output and exit code.
+
+    Parameters
+    ----------
+    request : dict[str, Any]
+        The command line arguments of the invocation and the options of the console of the client.
+
+    daemon_state : DaemonState
+        The warm state of the daemon.
+
+    Returns
+    -------
+    dict[str, Any]
+        The exit code of the invocation and what it wrote to stdout and stderr.
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    exit_code = 0
+    # Output is rendered for the terminal of the client rather than that of the daemon.
+    rich.reconfigure(**request["console"])
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            main(argv=request["argv"], daemon_state=daemon_state)
+
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                exit_code = e.code or 0
+
+            else:
+                print(e.code, file=sys.stderr)
+                exit_code = 1
+
+    return {
+        "exit_code": exit_code,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+    }
+
+
+def run_daemon() -> None:
+    """
+    Serve checks that are forwarded by the CLI from a process that keeps parsed files, model results and process pools warm.
+
+    Notes
+    -----
+    The configuration file is reloaded on every request and files are revalidated by modification time, size and content hash so that output matches a cold run.
+    """
+    if not DAEMON_IS_SUPPORTED:
         rprint(
-            f"[red]\nPlease fix the {len(missing)} {error_or_errors} above to continue the sync of the backend models of {backend_model_file_path} and the corresponding TypeScript interfaces.[/red]"
+            "[red]Daemon mode requires Unix domain sockets, which aren't available on this platform.[/red]"
         )
+        sys.exit(1)
 
-        return False
-
-    else:
+    socket_path = get_daemon_socket_path()
+    if is_daemon_running(socket_path):
         rprint(
-            f"[green]✅ Success: All backend models are synced with their corresponding TypeScript interfaces for the provided '{identifier}' files.[/green]"
+            f"[red]A ts-backend-check daemon is already running for this directory on {socket_path}.[/red]"
         )
+        sys.exit(1)
 
-        return True
+    daemon_state = DaemonState()
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    rprint(
+        f"[green]ts-backend-check daemon listening on {socket_path} (press Ctrl+C to stop).[/green]"
+    )
+    try:
+        serve(
+            handle_request=lambda request: handle_daemon_request(
+                request=request, daemon_state=daemon_state
+            ),
+            socket_path=socket_path,
+        )
 
+    except PermissionError as e:
+        rprint(Text(str(e), style="red"))
+        sys.exit(1)
 
-# MARK: Config Checks
+    except KeyboardInterrupt:
+        print("\nStopped the ts-backend-check daemon.")
 
+    finally:
+        daemon_state.close()
 
-def extract_identifier_config(identifier_config: dict) -> dict[str, Any]:
+
+def validate_args(parser: ArgumentParser, args: argparse.Namespace) -> None:
     """
-    Extract and normalize config fields with defaults.
+    Exit with a usage error if the values of the arguments are invalid.
 
     Parameters
     ----------
-    identifier_config : dict
-        A dictionary of configuration parameters, with some being unset.
+    parser : ArgumentParser
+        The parser of the arguments that prints the error.
+
+    args : argparse.Namespace
+        The parsed arguments.
+    """
+    if args.jobs < 0:
+        parser.error("The number of jobs passed to --jobs cannot be negative.")
+
+    if args.max_errors is not None and args.max_errors < 1:
+        parser.error("The number of errors passed to --max-errors must be at least 1.")
+
+    if args.parse_timeout is not None and args.parse_timeout <= 0:
+        parser.error(
+            "The number of seconds passed to --parse-timeout must be positive."
+        )
+
+    if args.watch and args.output_format != TEXT_OUTPUT_FORMAT:
+        parser.error("Watch mode only supports the text output format.")
+
+
+def run_utility_command(args: argparse.Namespace) -> bool:
+    """
+    Run the command of the arguments that doesn't need a configuration file, if any.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The parsed arguments.
 
     Returns
     -------
-    dict[str,Any]
-        A dict of configuration parameters to pass to checks with defaults set.
+    bool
+        Whether a command was run, in which case there's nothing left to do.
     """
-    return {
-        "backend_model_file_path": Path(identifier_config["backend_model_path"]),
-        "ts_interface_file_paths": [
-            Path(p) for p in identifier_config["ts_interface_paths"]
-        ],
-        "check_blank": identifier_config.get("check_blank_model_fields", False),
-        "model_name_conversions": identifier_config.get(
-            "backend_to_ts_model_name_conversions", {}
-        ),
-        "backend_models_to_ignore": identifier_config.get(
-            "backend_models_to_ignore", []
-        ),
-    }
+    if args.generate_test_project:
+        generate_test_project()
+
+    elif args.upgrade:
+        upgrade_cli()
 
+    elif args.cache_stats:
+        print_cache_stats()
 
-# MARK: Checks Function
+    elif args.cache_prune:
+        prune_cache(max_size_mb=args.cache_max_size, max_age_days=args.cache_max_age)
+
+    else:
+        return False
+
+    return True
 
 
-def run_checks(config: dict, identifiers: list[str]) -> list[bool]:
+def run_checks_for_args(
+    args: argparse.Namespace,
+    config: dict,
+    identifiers: list[str],
+    daemon_state: DaemonState | None = None,
+) -> None:
     """
-    Function to run checks for the given list of identifiers.
+    Check identifiers with the caches, output format and mode of the arguments, exiting with 1 if any checks fail.
 
     Parameters
     ----------
+    args : argparse.Namespace
+        The parsed arguments.
+
     config : dict
         Get a dictionary of config paths.
 
-    identifiers : list
-        Get a list of identifiers.
+    identifiers : list[str]
+        The identifiers to check.
 
-    Returns
-    -------
-    list[bool]
-        Returns a list of boolean values that define whether checks have passed.
+    daemon_state : DaemonState, default=None
+        The warm state of the daemon when the invocation was forwarded to it.
     """
     results: list[bool] = []
-    for identifier in identifiers:
-        identifier_config = config.get(identifier)
-        if not identifier_config:
-            rprint(
-                f"[red]{identifier} is not an index within the .ts-backend-check.yaml "
-                "configuration file. Please check the defined models and try again.[/red]"
+    result_cache = ResultCache() if args.cache else None
+    artifact_store = (
+        ArtifactStore(db_path=CACHE_DIR_PATH / ARTIFACT_STORE_FILE_NAME)
+        if args.cache
+        else None
+    )
+    parse_cache = (
+        daemon_state.parse_cache
+        if daemon_state is not None
+        else ParseCache(artifact_store=artifact_store)
+    )
+    # The parse cache of the daemon is kept between invocations, each of which can pass its own timeout.
+    parse_cache.parse_timeout = args.parse_timeout
+    writer = create_writer(output_format=args.output_format, stream=sys.stdout)
+    console = rich.get_console()
+    console_writes_to_stderr = console.stderr
+    if writer is not None:
+        # Messages for people go to stderr so that stdout only contains the machine-readable output.
+        console.stderr = True
+        writer.start()
+
+    try:
+        if args.watch:
+            watch_identifiers(
+                config,
+                identifiers,
+                result_cache=result_cache,
+                parse_cache=parse_cache,
             )
-            sys.exit(1)
-
-        r = check_files_and_print_results(
-            identifier=identifier,
-            **extract_identifier_config(identifier_config),
+            return
+
+        results = run_checks(
+            config,
+            identifiers,
+            jobs=args.jobs,
+            result_cache=result_cache,
+            parse_cache=parse_cache,
+            model_results=daemon_state.model_results
+            if daemon_state is not None
+            else None,
+            executors=daemon_state.executors if daemon_state is not None else None,
+            max_errors=1 if args.fail_fast else args.max_errors,
+            writer=writer,
         )
-        results.append(r)
 
-    return results
+    except ParseTimeoutError as e:
+        rprint(Text(str(e), style="red"))
+        sys.exit(1)
 
+    finally:
+        if writer is not None:
+            writer.end()
+            console.stderr = console_writes_to_stderr
 
-def main() -> None:
+        if result_cache is not None:
+            result_cache.close()
+
+        if artifact_store is not None:
+            artifact_store.close()
+
+    if not all(results):
+        sys.exit(1)
+
+
+def main(
+    argv: list[str] | None = None, daemon_state: DaemonState | None = None
+) -> None:
     """
     The main check function to compare a the methods within a backend model to a corresponding TypeScript file.
 
+    Parameters
+    ----------
+    argv : list[str], default=None
+        The command line arguments, with those of the process being used if not passed.
+
+    daemon_state : DaemonState, default=None
+        The warm state of the daemon when the invocation was forwarded to it.
+
     Notes
     -----
     The available command line arguments are:
@@ -203,12 +1549,31 @@ def main() -> None:
     - --generate-test-project (-gtp): Generate project to test ts-backend-check functionalities.
     - --identifier (-i): The model-interface identifier in the .ts-backend-check.yaml configuration file to check.
     - --all (-a): Run checks of all backend models against their corresponding TypeScript interfaces.
+    - --jobs (-j): The number of processes to check identifiers on, or to parse TypeScript files on when a single identifier is checked (all available CPUs if no number is passed).
+    - --watch (-w): Keep running and re-check identifiers whose files change.
+    - --daemon: Keep parsed files warm in a background process that checks are forwarded to.
+    - --lsp: Run a language server over stdio that publishes errors as diagnostics while files are edited.
+    - --fail-fast: Stop checking after the first error is found.
+    - --max-errors: Stop checking after the given number of errors are found.
+    - --parse-timeout: Stop with an error that names the file if parsing any file takes longer than the given number of seconds.
+    - --output-format: The format to write errors in (text, jsonl, sarif, junit or github).
+    - --cache: Cache results in .tsbc-cache/ and replay them for identifiers whose files and configuration haven't changed.
+    - --cache-stats: Show the size and hit rate statistics of the .tsbc-cache/ cache.
+    - --cache-prune: Evict entries from the .tsbc-cache/ cache based on --cache-max-size and --cache-max-age.
 
     Examples
     --------
     >>> ts-backend-check --generate-config-file  # -gcf
     >>> ts-backend-check --identifier <model-interface-identifier-from-config-file>  # -i
     >>> ts-backend-check --all  # -a
+    >>> ts-backend-check --all --jobs 4  # -a -j 4
+    >>> ts-backend-check --all --watch  # -a -w
+    >>> ts-backend-check --all --max-errors 10
+    >>> ts-backend-check --all --parse-timeout 30
+    >>> ts-backend-check --all --output-format sarif > results.sarif
+    >>> ts-backend-check --daemon
+    >>> ts-backend-check --lsp
+    >>> ts-backend-check --cache-prune --cache-max-size 50 --cache-max-age 7
     """
     # MARK: CLI Base
 
@@ -224,8 +1589,7 @@ def main() -> None:
     parser.add_argument(
         "-v",
         "--version",
-        action="version",
-        version=f"{get_version_message()}",
+        action=VersionAction,
         help="Show the version of the ts-backend-check CLI.",
     )
 
@@ -263,21 +1627,124 @@ def main() -> None:
         help="Run checks of all backend models against their corresponding TypeScript interfaces.",
     )
 
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        nargs="?",
+        const=0,
+        default=1,
+        help="The number of processes to check identifiers on, or to parse TypeScript files on when a single identifier is checked (all available CPUs if no number is passed).",
+    )
+
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop checking after the first error is found.",
+    )
+
+    parser.add_argument(
+        "--max-errors",
+        type=int,
+        help="Stop checking after the given number of errors are found.",
+    )
+
+    parser.add_argument(
+        "--parse-timeout",
+        type=float,
+        help="Stop with an error that names the file if parsing any file takes longer than the given number of seconds.",
+    )
+
+    parser.add_argument(
+        "--output-format",
+        choices=OUTPUT_FORMATS,
+        default=TEXT_OUTPUT_FORMAT,
+        help="The format to write errors in, with formats other than text writing other output to stderr (default: text).",
+    )
+
+    parser.add_argument(
+        "-w",
+        "--watch",
+        action="store_true",
+        help="Keep running and re-check identifiers whose files change.",
+    )
+
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Keep parsed files warm in a background process that checks are forwarded to.",
+    )
+
+    parser.add_argument(
+        "--lsp",
+        action="store_true",
+        help="Run a language server over stdio that publishes errors as diagnostics while files are edited.",
+    )
+
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Cache results in .tsbc-cache/ and replay them for identifiers whose files and configuration haven't changed.",
+    )
+
+    parser.add_argument(
+        "--cache-stats",
+        action="store_true",
+        help="Show the size and hit rate statistics of the .tsbc-cache/ cache.",
+    )
+
+    parser.add_argument(
+        "--cache-prune",
+        action="store_true",
+        help="Evict entries from the .tsbc-cache/ cache based on --cache-max-size and --cache-max-age.",
+    )
+
+    parser.add_argument(
+        "--cache-max-size",
+        type=float,
+        default=100,
+        help="The maximum size of parsed files in the cache in megabytes when pruning (default: 100).",
+    )
+
+    parser.add_argument(
+        "--cache-max-age",
+        type=float,
+        default=30,
+        help="The maximum number of days since a cache entry was used when pruning (default: 30).",
+    )
+
     # MARK: Setup CLI
 
-    args = parser.parse_args(args=None if sys.argv[1:] else ["--help"])
+    if argv is None:
+        argv = sys.argv[1:]
+
+    args = parser.parse_args(args=argv or ["--help"])
 
     if args == ["--help"]:
         parser.print_help()
 
-    YAML_CONFIG_FILE_PATH = get_config_file_path()
+    validate_args(parser=parser, args=args)
 
-    if args.generate_test_project:
-        generate_test_project()
+    if args.daemon:
+        run_daemon()
         return
 
-    if args.upgrade:
-        upgrade_cli()
+    if args.lsp:
+        # Imported here as the language server depends on the functions of this module.
+        from ts_backend_check.lsp import run_language_server
+
+        sys.exit(run_language_server())
+
+    if (
+        daemon_state is None
+        and can_forward_to_daemon(args)
+        and (exit_code := forward_to_daemon(argv)) is not None
+    ):
+        sys.exit(exit_code)
+
+    YAML_CONFIG_FILE_PATH = get_config_file_path()
+
+    if run_utility_command(args):
         return
 
     # MARK: CLI Variables
@@ -304,8 +1771,6 @@ def main() -> None:
 
     # MARK: Run Checks
 
-    results: list[bool] = []
-
     if args.identifier:
         identifiers = [args.identifier]
 
@@ -319,10 +1784,9 @@ def main() -> None:
         parser.print_help()
         return
 
-    results = run_checks(config, identifiers)
-
-    if not all(results):
-        sys.exit(1)
+    run_checks_for_args(
+        args=args, config=config, identifiers=identifiers, daemon_state=daemon_state
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,116 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Functions to show statistics for and prune the ts-backend-check cache.
+"""
+
+from pathlib import Path
+
+from rich import print as rprint
+
+from ts_backend_check.artifact_store import ArtifactStore
+from ts_backend_check.cache import (
+    ARTIFACT_STORE_FILE_NAME,
+    CACHE_DIR_PATH,
+    ResultCache,
+)
+
+BYTES_PER_MB = 1024 * 1024
+
+
+def format_size(size: int) -> str:
+    """
+    Format a size in bytes for the user.
+
+    Parameters
+    ----------
+    size : int
+        The size in bytes.
+
+    Returns
+    -------
+    str
+        The size in megabytes with two decimal places.
+    """
+    return f"{size / BYTES_PER_MB:.2f} MB"
+
+
+# MARK: Stats
+
+
+def print_cache_stats(cache_dir: Path = CACHE_DIR_PATH) -> None:
+    """
+    Print the size and hit rate statistics of the cache.
+
+    Parameters
+    ----------
+    cache_dir : Path, default=CACHE_DIR_PATH
+        The directory of the cache.
+    """
+    if not cache_dir.is_dir():
+        rprint(
+            f"[yellow]There is no ts-backend-check cache in {cache_dir}. Run checks with --cache to create one.[/yellow]"
+        )
+        return
+
+    artifact_store = ArtifactStore(db_path=cache_dir / ARTIFACT_STORE_FILE_NAME)
+    try:
+        artifact_stats = artifact_store.get_stats()
+
+    finally:
+        artifact_store.close()
+
+    result_stats = ResultCache(cache_dir=cache_dir).get_stats()
+
+    lookups = artifact_stats["hits"] + artifact_stats["misses"]
+    hit_rate = artifact_stats["hits"] / lookups if lookups else 0.0
+
+    rprint(f"ts-backend-check cache: {cache_dir}")
+    rprint(
+        f"- Parsed files: {artifact_stats['entries']} entries ({format_size(artifact_stats['size'])}, {format_size(artifact_stats['file_size'])} on disk)"
+    )
+    rprint(
+        f"- Parsed file hit rate: {hit_rate:.1%} ({artifact_stats['hits']} hits, {artifact_stats['misses']} misses)"
+    )
+    rprint(
+        f"- Check results: {result_stats['entries']} entries ({format_size(result_stats['size'])})"
+    )
+
+
+# MARK: Prune
+
+
+def prune_cache(
+    max_size_mb: float, max_age_days: float, cache_dir: Path = CACHE_DIR_PATH
+) -> None:
+    """
+    Evict old entries from the cache and least recently used parsed files until the cache is within the max size.
+
+    Parameters
+    ----------
+    max_size_mb : float
+        The maximum size of the parsed files in the cache in megabytes.
+
+    max_age_days : float
+        The maximum number of days since an entry was last used.
+
+    cache_dir : Path, default=CACHE_DIR_PATH
+        The directory of the cache.
+    """
+    if not cache_dir.is_dir():
+        rprint(f"[yellow]There is no ts-backend-check cache in {cache_dir}.[/yellow]")
+        return
+
+    artifact_store = ArtifactStore(db_path=cache_dir / ARTIFACT_STORE_FILE_NAME)
+    try:
+        evicted_artifacts = artifact_store.prune(
+            max_size=int(max_size_mb * BYTES_PER_MB), max_age_days=max_age_days
+        )
+
+    finally:
+        artifact_store.close()
+
+    evicted_results = ResultCache(cache_dir=cache_dir).prune(max_age_days=max_age_days)
+
+    rprint(
+        f"[green]✅ Pruned {evicted_artifacts} parsed files and {evicted_results} check results from the ts-backend-check cache.[/green]"
+    )
@@ -6,8 +6,6 @@ Functions for checking current version of the ts-backend-check CLI.
 import importlib.metadata
 from typing import Any
 
-import requests
-
 UNKNOWN_VERSION = "Unknown ts-backend-check version"
 UNKNOWN_VERSION_NOT_PIP = f"{UNKNOWN_VERSION} (Not installed via pip)"
 UNKNOWN_VERSION_NOT_FETCHED = f"{UNKNOWN_VERSION} (Unable to fetch version)"
@@ -46,6 +44,9 @@ def get_latest_version() -> Any:
         The latest version of the ts-backend-check package, or a message indicating
         that the version could not be fetched.
     """
+    # Imported here as requests is slow to import and is only needed when the version is requested.
+    import requests
+
     try:
         response = requests.get(
             "https://api.github.com/repos/activist-org/ts-backend-check/releases/latest"
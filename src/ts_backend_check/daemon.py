@@ -0,0 +1,363 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Unix socket transport between the ts-backend-check CLI and a long-lived daemon that keeps parsed files warm.
+"""
+
+import hashlib
+import json
+import os
+import socket
+import stat
+import tempfile
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from ts_backend_check.cache import ParseCache, get_tool_version
+from ts_backend_check.diagnostics import Diagnostic
+
+DAEMON_SOCKET_ENV_VAR = "TSBC_DAEMON_SOCKET"
+DAEMON_IS_SUPPORTED = hasattr(socket, "AF_UNIX") and hasattr(os, "getuid")
+# Increment when the format of requests or responses changes.
+DAEMON_PROTOCOL_VERSION = 1
+DAEMON_CONNECT_TIMEOUT_SECONDS = 1.0
+# Checks of large projects can take a while, after which the client runs the check itself.
+DAEMON_RESPONSE_TIMEOUT_SECONDS = 300.0
+
+
+def get_daemon_dir() -> Path:
+    """
+    Get the directory that the sockets of the daemons of the current user are placed in.
+
+    Returns
+    -------
+    Path
+        A directory within the runtime directory of the user, or the temporary directory if there isn't one, that's unique to the user.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+
+    return Path(runtime_dir) / f"tsbc-{os.getuid()}"
+
+
+def get_daemon_socket_path(project_dir: Path | None = None) -> Path:
+    """
+    Get the path of the socket of the daemon for a project.
+
+    Parameters
+    ----------
+    project_dir : Path, default=None
+        The directory of the project, with the current working directory being used if not passed.
+
+    Returns
+    -------
+    Path
+        The path from the TSBC_DAEMON_SOCKET environment variable if set, else a path within the daemon directory of the user that's unique to the project.
+    """
+    if socket_path := os.environ.get(DAEMON_SOCKET_ENV_VAR):
+        return Path(socket_path)
+
+    project_dir = (project_dir or Path.cwd()).resolve()
+    # Sockets aren't placed within the project as their paths are limited to around 100 characters.
+    project_hash = hashlib.sha256(os.fsencode(project_dir)).hexdigest()[:16]
+
+    return get_daemon_dir() / f"{project_hash}.sock"
+
+
+def create_private_directory(directory: Path) -> None:
+    """
+    Create a directory that only the current user can access, or check that an existing one is.
+
+    Parameters
+    ----------
+    directory : Path
+        The directory to create.
+
+    Raises
+    ------
+    PermissionError
+        If the directory is a link, is owned by another user or can be accessed by other users.
+    """
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    directory_stat = os.lstat(directory)
+    if (
+        not stat.S_ISDIR(directory_stat.st_mode)
+        or directory_stat.st_uid != os.getuid()
+        or directory_stat.st_mode & 0o077
+    ):
+        raise PermissionError(
+            f"The daemon socket directory {directory} must be owned by and only accessible to the current user."
+        )
+
+
+def is_own_socket(socket_path: Path) -> bool:
+    """
+    Check whether a path is a socket that's owned by the current user.
+
+    Parameters
+    ----------
+    socket_path : Path
+        The path of the socket.
+
+    Returns
+    -------
+    bool
+        Whether the path is a socket rather than a link or another kind of file, and is owned by the current user.
+    """
+    try:
+        socket_stat = os.lstat(socket_path)
+
+    except OSError:
+        return False
+
+    return stat.S_ISSOCK(socket_stat.st_mode) and socket_stat.st_uid == os.getuid()
+
+
+@dataclass
+class DaemonState:
+    """
+    Warm state that the daemon keeps in memory between requests.
+
+    Attributes
+    ----------
+    parse_cache : ParseCache
+        The parsed files, which are revalidated by modification time, size and content hash on every request.
+
+    model_results : dict[str, dict[str, tuple[str, list[Diagnostic]]]]
+        The results of the models of each identifier from its last check.
+
+    executors : dict[int, ProcessPoolExecutor]
+        The process pools for parallel checks by their number of workers.
+    """
+
+    parse_cache: ParseCache = field(default_factory=ParseCache)
+    model_results: dict[str, dict[str, tuple[str, list[Diagnostic]]]] = field(
+        default_factory=dict
+    )
+    executors: dict[int, ProcessPoolExecutor] = field(default_factory=dict)
+
+    def close(self) -> None:
+        """
+        Shut down the process pools of the daemon.
+        """
+        for executor in self.executors.values():
+            executor.shutdown(cancel_futures=True)
+
+        self.executors.clear()
+
+
+# MARK: Messages
+
+
+def send_message(connection: socket.socket, message: dict[str, Any]) -> None:
+    """
+    Send a message as a line of JSON.
+
+    Parameters
+    ----------
+    connection : socket.socket
+        The connected socket to send the message on.
+
+    message : dict[str, Any]
+        The message to send.
+    """
+    connection.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+
+def receive_message(connection: socket.socket) -> dict[str, Any] | None:
+    """
+    Receive a message that was sent as a line of JSON.
+
+    Parameters
+    ----------
+    connection : socket.socket
+        The connected socket to receive the message from.
+
+    Returns
+    -------
+    dict[str, Any] | None
+        The message, or None if the connection was closed before a message was sent.
+    """
+    with connection.makefile("rb") as connection_file:
+        line = connection_file.readline()
+
+    return json.loads(line) if line else None
+
+
+# MARK: Client
+
+
+def is_daemon_running(socket_path: Path) -> bool:
+    """
+    Check whether a daemon is accepting connections on a socket.
+
+    Parameters
+    ----------
+    socket_path : Path
+        The path of the socket of the daemon.
+
+    Returns
+    -------
+    bool
+        Whether a daemon accepted a connection on the socket.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(str(socket_path))
+
+        except OSError:
+            return False
+
+    return True
+
+
+def send_request(
+    argv: list[str], console_options: dict[str, Any], socket_path: Path | None = None
+) -> dict[str, Any] | None:
+    """
+    Forward an invocation of the CLI to the daemon of the project.
+
+    Parameters
+    ----------
+    argv : list[str]
+        The command line arguments of the invocation.
+
+    console_options : dict[str, Any]
+        The options of the console of the client so that the daemon renders output as the client would.
+
+    socket_path : Path, default=None
+        The path of the socket of the daemon, with the path for the current working directory being used if not passed.
+
+    Returns
+    -------
+    dict[str, Any] | None
+        The exit code and output of the invocation, or None if there's no daemon of the current user that can handle it in time.
+    """
+    if not DAEMON_IS_SUPPORTED:
+        return None
+
+    socket_path = socket_path or get_daemon_socket_path()
+    # Sockets of other users could be placed at the path to receive the invocation or return forged output.
+    if not is_own_socket(socket_path):
+        return None
+
+    request = {
+        "protocol": DAEMON_PROTOCOL_VERSION,
+        "version": get_tool_version(),
+        "cwd": os.getcwd(),
+        "argv": argv,
+        "console": console_options,
+    }
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(DAEMON_CONNECT_TIMEOUT_SECONDS)
+            client.connect(str(socket_path))
+            client.settimeout(DAEMON_RESPONSE_TIMEOUT_SECONDS)
+            send_message(client, request)
+            response = receive_message(client)
+
+    except (OSError, ValueError):
+        return None
+
+    if not response or "exit_code" not in response:
+        return None
+
+    return response
+
+
+# MARK: Server
+
+
+def serve(
+    handle_request: Callable[[dict[str, Any]], dict[str, Any]],
+    socket_path: Path | None = None,
+) -> None:
+    """
+    Serve requests from clients one at a time until interrupted.
+
+    Parameters
+    ----------
+    handle_request : Callable[[dict[str, Any]], dict[str, Any]]
+        A function that runs the invocation of a request and returns its exit code and output.
+
+    socket_path : Path, default=None
+        The path of the socket to listen on, with the path for the current working directory being used if not passed.
+
+    Raises
+    ------
+    PermissionError
+        If the directory of the socket isn't private to the current user.
+
+    Notes
+    -----
+    The socket is placed in a directory that only the current user can access so that other users can't connect to it or replace it.
+    Requests from other versions of ts-backend-check or other directories are rejected so that their clients run the check themselves.
+    """
+    socket_path = socket_path or get_daemon_socket_path()
+    create_private_directory(socket_path.parent)
+    socket_path.unlink(missing_ok=True)
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        # The socket is only accessible to the user that started the daemon.
+        previous_umask = os.umask(0o177)
+        try:
+            server.bind(str(socket_path))
+
+        finally:
+            os.umask(previous_umask)
+
+        server.listen()
+        try:
+            while True:
+                connection, _ = server.accept()
+                with connection:
+                    try:
+                        if (request := receive_message(connection)) is None:
+                            continue
+
+                        send_message(connection, get_response(request, handle_request))
+
+                    except (OSError, ValueError):
+                        continue
+
+        finally:
+            socket_path.unlink(missing_ok=True)
+
+
+def get_response(
+    request: dict[str, Any],
+    handle_request: Callable[[dict[str, Any]], dict[str, Any]],
+) -> dict[str, Any]:
+    """
+    Get the response to a request, rejecting requests that the daemon can't handle identically to the client.
+
+    Parameters
+    ----------
+    request : dict[str, Any]
+        The request from the client.
+
+    handle_request : Callable[[dict[str, Any]], dict[str, Any]]
+        A function that runs the invocation of a request and returns its exit code and output.
+
+    Returns
+    -------
+    dict[str, Any]
+        The exit code and output of the invocation, or an error that tells the client to run it itself.
+    """
+    if request.get("protocol") != DAEMON_PROTOCOL_VERSION:
+        return {"error": "The protocol of the client doesn't match the daemon."}
+
+    if request.get("version") != get_tool_version():
+        return {"error": "The version of the client doesn't match the daemon."}
+
+    if request.get("cwd") != os.getcwd():
+        return {
+            "error": "The working directory of the client doesn't match the daemon."
+        }
+
+    try:
+        return handle_request(request)
+
+    except Exception:
+        return {"error": traceback.format_exc()}
@@ -0,0 +1,300 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Structured records of the inconsistencies between backend models and TypeScript interfaces.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from ts_backend_check.utils import snake_to_camel
+
+MISSING_INTERFACE = "missing-interface"
+MISSING_FIELD = "missing-field"
+BLANK_FIELD_NOT_OPTIONAL = "blank-field-not-optional"
+UNORDERED_PROPERTIES = "unordered-properties"
+DUPLICATE_INTERFACE = "duplicate-interface"
+DUPLICATE_MODEL = "duplicate-model"
+
+DIAGNOSTIC_DESCRIPTIONS = {
+    MISSING_INTERFACE: "A backend model has no matching TypeScript interface.",
+    MISSING_FIELD: "A field of a backend model is missing from its TypeScript interfaces.",
+    BLANK_FIELD_NOT_OPTIONAL: "A 'blank=True' field of a backend model isn't optional (?) in its TypeScript interfaces.",
+    UNORDERED_PROPERTIES: "The properties of TypeScript interfaces don't follow the order of the fields of their backend model.",
+    DUPLICATE_INTERFACE: "A TypeScript interface that matches a backend model is declared in more than one file.",
+    DUPLICATE_MODEL: "A backend model is defined in more than one of the models files of an identifier.",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Diagnostic:
+    """
+    An inconsistency between a backend model and its TypeScript interfaces.
+
+    Messages aren't stored but are formatted from the other attributes when they're requested.
+
+    Attributes
+    ----------
+    code : str
+        The kind of inconsistency, which is one of the keys of DIAGNOSTIC_DESCRIPTIONS.
+
+    model : str
+        The name of the backend model.
+
+    models_file : str
+        The path of the models file that defines the model.
+
+    field : str, default=None
+        The field of the model that the inconsistency is for, if any.
+
+    interfaces : tuple[str, ...], default=()
+        The TypeScript interfaces that match the model.
+
+    file : str, default=None
+        The path of the file that the inconsistency is located in.
+
+    line : int, default=None
+        The line within the file that the inconsistency is located at, starting at 1.
+
+    column : int, default=None
+        The column within the line that the inconsistency is located at, starting at 1.
+    """
+
+    code: str
+    model: str
+    models_file: str
+    field: str | None = None
+    interfaces: tuple[str, ...] = ()
+    file: str | None = None
+    line: int | None = None
+    column: int | None = None
+
+    @property
+    def camel_field(self) -> str | None:
+        """
+        The name of the field in camelCase as it's expected in the TypeScript interfaces.
+
+        Returns
+        -------
+        str | None
+            The camelCase name of the field, or None if the diagnostic isn't for a field.
+        """
+        return snake_to_camel(input_str=self.field) if self.field else None
+
+    @property
+    def summary(self) -> str:
+        """
+        A single sentence that describes the inconsistency.
+
+        Returns
+        -------
+        str
+            The first line of the message.
+        """
+        return MESSAGE_FORMATTERS[self.code](self)[0]
+
+    @property
+    def message(self) -> str:
+        """
+        The full message for the user that describes the inconsistency and how to fix it.
+
+        Returns
+        -------
+        str
+            The lines of the message, each of which is preceded by a newline.
+        """
+        return "".join(f"\n{line}" for line in MESSAGE_FORMATTERS[self.code](self))
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert the diagnostic to a dictionary that can be serialized as JSON.
+
+        Returns
+        -------
+        dict[str, Any]
+            The attributes of the diagnostic.
+        """
+        return {
+            "code": self.code,
+            "model": self.model,
+            "models_file": self.models_file,
+            "field": self.field,
+            "interfaces": list(self.interfaces),
+            "file": self.file,
+            "line": self.line,
+            "column": self.column,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Diagnostic":
+        """
+        Create a diagnostic from a dictionary from to_dict.
+
+        Parameters
+        ----------
+        data : dict[str, Any]
+            The attributes of the diagnostic, such as those loaded from JSON.
+
+        Returns
+        -------
+        Diagnostic
+            The diagnostic, with each attribute converted to its declared type.
+        """
+        field = data.get("field")
+        file = data.get("file")
+        line = data.get("line")
+        column = data.get("column")
+
+        return cls(
+            code=str(data["code"]),
+            model=str(data["model"]),
+            models_file=str(data["models_file"]),
+            field=None if field is None else str(field),
+            interfaces=tuple(str(i) for i in data.get("interfaces", ())),
+            file=None if file is None else str(file),
+            line=None if line is None else int(line),
+            column=None if column is None else int(column),
+        )
+
+
+# MARK: Messages
+
+
+def _format_missing_interface_message(diagnostic: Diagnostic) -> list[str]:
+    """
+    Format message for missing interface.
+
+    Parameters
+    ----------
+    diagnostic : Diagnostic
+        The diagnostic for the model that an interface is missing for.
+
+    Returns
+    -------
+    list[str]
+        The lines of the message displayed to the user when missing interfaces are found.
+    """
+    return [
+        f"No matching TypeScript interface found for the model '{diagnostic.model}'.",
+        "Please name your TypeScript interfaces the same as the corresponding backend models.",
+        "You can also use the 'backend_to_ts_model_name_conversions' option within the configuration file.",
+        "The key is the backend model name and the value is a list of the corresponding interfaces.",
+        "This option is also how you can break larger backend models into multiple interfaces that extend one another.",
+    ]
+
+
+def _format_missing_field_message(diagnostic: Diagnostic) -> list[str]:
+    """
+    Format message for missing field.
+
+    Parameters
+    ----------
+    diagnostic : Diagnostic
+        The diagnostic for the field that's missing.
+
+    Returns
+    -------
+    list[str]
+        The lines of the message displayed to the user when missing fields are found.
+    """
+    interface_or_interfaces = (
+        "interface" if len(diagnostic.interfaces) == 1 else "interfaces"
+    )
+
+    return [
+        f"Field '{diagnostic.field}' (camelCase: '{diagnostic.camel_field}') from model '{diagnostic.model}' is missing in the TypeScript interfaces.",
+        f"Expected to find this field in the frontend {interface_or_interfaces}: {', '.join(diagnostic.interfaces)}",
+        f"To ignore this field, add the following comment to the TypeScript file (in the sane order as the model fields): '// ts-backend-check: ignore {diagnostic.camel_field}'",
+    ]
+
+
+def _format_blank_field_not_optional_message(diagnostic: Diagnostic) -> list[str]:
+    """
+    Format message for when the blank status of a model field doesn't match the optional status of the corresponding property.
+
+    Parameters
+    ----------
+    diagnostic : Diagnostic
+        The diagnostic for the field that doesn't match blank and optional states.
+
+    Returns
+    -------
+    list[str]
+        The lines of the message displayed to the user when blank fields aren't optional.
+    """
+    return [
+        f"Field '{diagnostic.field}' (camelCase: '{diagnostic.camel_field}') from model '{diagnostic.model}' doesn't match the TypeScript interfaces based on blank to optional agreement.",
+        f"Please check '{diagnostic.models_file}' and the corresponding files in 'ts_interface_paths' to make sure that all 'blank=True' fields are optional (?) in the TypeScript interfaces file.",
+    ]
+
+
+def _format_unordered_properties_message(diagnostic: Diagnostic) -> list[str]:
+    """
+    Format message for unordered interface properties.
+
+    Parameters
+    ----------
+    diagnostic : Diagnostic
+        The diagnostic for the model whose interfaces are unordered.
+
+    Returns
+    -------
+    list[str]
+        The lines of the message displayed to the user when unordered interface properties are found.
+    """
+    return [
+        "The interface properties of the 'ts_interface_paths' files are unordered.",
+        f"All interface properties should exactly match the order of the corresponding fields in the '{diagnostic.models_file}' backend model.",
+        "If the model is synced with multiple interfaces, then their properties should follow the order prescribed by the model fields.",
+    ]
+
+
+def _format_duplicate_interface_message(diagnostic: Diagnostic) -> list[str]:
+    """
+    Format message for an interface that's declared in more than one file.
+
+    Parameters
+    ----------
+    diagnostic : Diagnostic
+        The diagnostic for the model whose interface is declared more than once.
+
+    Returns
+    -------
+    list[str]
+        The lines of the message displayed to the user when duplicate interfaces are found.
+    """
+    return [
+        f"The TypeScript interface '{diagnostic.interfaces[0]}' for the model '{diagnostic.model}' is declared in more than one of the 'ts_interface_paths' files.",
+        f"Only the last declaration, in '{diagnostic.file}', is checked against the model.",
+        "Please give each interface a unique name and use the 'backend_to_ts_model_name_conversions' option if the model is split across several interfaces.",
+    ]
+
+
+def _format_duplicate_model_message(diagnostic: Diagnostic) -> list[str]:
+    """
+    Format message for a model that's defined in more than one models file.
+
+    Parameters
+    ----------
+    diagnostic : Diagnostic
+        The diagnostic for the model that's defined more than once.
+
+    Returns
+    -------
+    list[str]
+        The lines of the message displayed to the user when duplicate models are found.
+    """
+    return [
+        f"The backend model '{diagnostic.model}' is defined in more than one of the 'backend_model_path' files.",
+        f"Only the last definition, in '{diagnostic.models_file}', is checked against the TypeScript interfaces.",
+        "Please give each model a unique name or narrow the 'backend_model_path' of the identifier so that it only includes one of the definitions.",
+    ]
+
+
+MESSAGE_FORMATTERS: dict[str, Callable[[Diagnostic], list[str]]] = {
+    MISSING_INTERFACE: _format_missing_interface_message,
+    MISSING_FIELD: _format_missing_field_message,
+    BLANK_FIELD_NOT_OPTIONAL: _format_blank_field_not_optional_message,
+    UNORDERED_PROPERTIES: _format_unordered_properties_message,
+    DUPLICATE_INTERFACE: _format_duplicate_interface_message,
+    DUPLICATE_MODEL: _format_duplicate_model_message,
+}
@@ -0,0 +1,680 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Loading of the TypeScript files that the configured files import the checked declarations from.
+"""
+
+import json
+import os
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+from ts_backend_check.parsers.typescript_parser import (
+    IntersectionType,
+    TypeExpression,
+    TypeReference,
+    TypeScriptFile,
+    TypeScriptImport,
+    TypeScriptInterface,
+    TypeScriptTypeAlias,
+    UnionType,
+    UnparsedInterface,
+)
+
+Declaration = TypeScriptInterface | TypeScriptTypeAlias | UnparsedInterface
+
+TS_CONFIG_FILE_NAME = "tsconfig.json"
+MODULE_EXTENSIONS = (".ts", ".tsx", ".d.ts")
+# TypeScript modules are imported with the extensions of the JavaScript they compile to.
+JS_TO_TS_EXTENSIONS = {
+    ".js": (".ts", ".tsx", ".d.ts"),
+    ".jsx": (".tsx",),
+    ".mjs": (".mts", ".d.mts"),
+    ".cjs": (".cts", ".d.cts"),
+}
+TS_EXTENSIONS = (".ts", ".tsx", ".mts", ".cts")
+JSONC_COMMENT_PATTERN = r"//[^\n]*|/\*.*?\*/"
+# Unterminated block comments run to the end so that the rest isn't scanned again from each later '/*'.
+JSONC_PATTERN = re.compile(
+    rf'(?P<string>"(?:[^"\\]|\\.)*")|{JSONC_COMMENT_PATTERN}|/\*.*|,(?=(?:\s|{JSONC_COMMENT_PATTERN})*[}}\]])',
+    re.DOTALL,
+)
+
+
+# MARK: Module Resolution
+
+
+def load_jsonc(text: str) -> object:
+    """
+    Load JSON that can contain comments and trailing commas as tsconfig.json files can.
+
+    Parameters
+    ----------
+    text : str
+        The JSON with comments.
+
+    Returns
+    -------
+    object
+        The loaded JSON.
+    """
+    return json.loads(
+        JSONC_PATTERN.sub(lambda match: match["string"] or "", text),
+    )
+
+
+def find_module_file(base: Path) -> Path | None:
+    """
+    Find the TypeScript file for a module path, which can leave out the extension or be a directory with an index file.
+
+    Parameters
+    ----------
+    base : Path
+        The path of the module as it's written in the import.
+
+    Returns
+    -------
+    Path | None
+        The normalized path of the file of the module, or None if there isn't one.
+    """
+    candidates: list[Path] = []
+    if base.suffix in TS_EXTENSIONS:
+        candidates.append(base)
+
+    elif base.suffix in JS_TO_TS_EXTENSIONS:
+        candidates.extend(base.with_suffix(e) for e in JS_TO_TS_EXTENSIONS[base.suffix])
+
+    candidates.extend(Path(f"{base}{e}") for e in MODULE_EXTENSIONS)
+    candidates.extend(base / f"index{e}" for e in MODULE_EXTENSIONS)
+
+    return next(
+        (Path(os.path.normpath(c)) for c in candidates if c.is_file()),
+        None,
+    )
+
+
+@dataclass(frozen=True)
+class TsConfigPaths:
+    """
+    The options of a tsconfig.json file that non-relative imports are resolved with.
+
+    Attributes
+    ----------
+    base_url : Path | None
+        The directory that non-relative imports are resolved from, if any.
+
+    paths_base : Path
+        The directory that the targets of the path aliases are relative to.
+
+    paths : dict[str, list[str]]
+        The path aliases, which map patterns that can contain a '*' wildcard to the targets that they're resolved to.
+    """
+
+    base_url: Path | None = None
+    paths_base: Path = Path()
+    paths: dict[str, list[str]] = field(default_factory=dict)
+
+    def get_module_bases(self, specifier: str) -> list[Path]:
+        """
+        Get the paths that a non-relative import could refer to.
+
+        Parameters
+        ----------
+        specifier : str
+            The module specifier of the import.
+
+        Returns
+        -------
+        list[Path]
+            The targets of the path alias with the longest prefix that matches the specifier followed by the specifier relative to the base URL.
+        """
+        best_prefix_length = -1
+        targets: list[str] = []
+        for pattern, pattern_targets in self.paths.items():
+            prefix, wildcard, suffix = pattern.partition("*")
+            if not wildcard:
+                matched = specifier == pattern
+
+            else:
+                matched = (
+                    len(specifier) >= len(prefix) + len(suffix)
+                    and specifier.startswith(prefix)
+                    and specifier.endswith(suffix)
+                )
+
+            if matched and len(prefix) > best_prefix_length:
+                best_prefix_length = len(prefix)
+                match = specifier[len(prefix) : len(specifier) - len(suffix)]
+                targets = [t.replace("*", match) for t in pattern_targets]
+
+        bases = [self.paths_base / t for t in targets]
+        if self.base_url is not None:
+            bases.append(self.base_url / specifier)
+
+        return bases
+
+
+def read_ts_config(
+    ts_config_path: Path, extended_paths: frozenset[Path] = frozenset()
+) -> TsConfigPaths:
+    """
+    Read the module resolution options of a tsconfig.json file, including those of the configurations that it extends.
+
+    Parameters
+    ----------
+    ts_config_path : Path
+        The path of the tsconfig.json file.
+
+    extended_paths : frozenset[Path], default=frozenset()
+        The configurations that extend the file, which aren't read again if they're extended in turn.
+
+    Returns
+    -------
+    TsConfigPaths
+        The options of the file, with those that aren't set being inherited.
+
+    Raises
+    ------
+    OSError
+        If the file can't be read.
+
+    ValueError
+        If the file isn't valid JSON with comments.
+    """
+    data = load_jsonc(ts_config_path.read_text(encoding="utf-8"))
+    if not isinstance(data, dict):
+        raise ValueError(f"{ts_config_path} doesn't contain a JSON object.")
+
+    parent = TsConfigPaths(paths_base=ts_config_path.parent)
+    extends = data.get("extends")
+    # Only configurations that are extended via relative paths are followed rather than those of packages.
+    if isinstance(extends, str) and extends.startswith("."):
+        extended_path = Path(os.path.normpath(ts_config_path.parent / extends))
+        if not extended_path.is_file() and extended_path.suffix != ".json":
+            extended_path = Path(f"{extended_path}.json")
+
+        if extended_path.is_file() and extended_path not in extended_paths:
+            parent = read_ts_config(
+                extended_path, extended_paths=extended_paths | {ts_config_path}
+            )
+
+    options = data.get("compilerOptions") or {}
+    base_url = parent.base_url
+    if isinstance(options.get("baseUrl"), str):
+        base_url = ts_config_path.parent / options["baseUrl"]
+
+    if not isinstance(options.get("paths"), dict):
+        return TsConfigPaths(
+            base_url=base_url, paths_base=parent.paths_base, paths=parent.paths
+        )
+
+    return TsConfigPaths(
+        base_url=base_url,
+        paths_base=base_url or ts_config_path.parent,
+        paths={
+            pattern: [t for t in targets if isinstance(t, str)]
+            for pattern, targets in options["paths"].items()
+            if isinstance(targets, list)
+        },
+    )
+
+
+# MARK: References
+
+
+def iter_type_references(expression: TypeExpression) -> Iterator[str]:
+    """
+    Iterate over the names of the declarations that a type expression references outside of object literals.
+
+    Parameters
+    ----------
+    expression : TypeExpression
+        The type expression.
+
+    Yields
+    ------
+    str
+        The names of the referenced interfaces and type aliases.
+    """
+    if isinstance(expression, TypeReference):
+        yield expression.name
+        for argument in expression.arguments:
+            yield from iter_type_references(argument)
+
+    elif isinstance(expression, (IntersectionType, UnionType)):
+        for type_ in expression.types:
+            yield from iter_type_references(type_)
+
+
+def get_declarations(ts_file: TypeScriptFile) -> dict[str, Declaration]:
+    """
+    Get the interfaces, type aliases and unparsed interfaces of a file by name.
+
+    Parameters
+    ----------
+    ts_file : TypeScriptFile
+        The parsed TypeScript file.
+
+    Returns
+    -------
+    dict[str, Declaration]
+        The declarations of the file, with type aliases taking precedence over interfaces of the same name as they do in an InterfaceIndex.
+    """
+    return {
+        **{u.name: u for u in ts_file.unparsed_interfaces},
+        **ts_file.interfaces,
+        **ts_file.type_aliases,
+    }
+
+
+def get_declaration_references(declaration: Declaration) -> list[str]:
+    """
+    Get the names of the declarations that an interface or type alias needs to be evaluated.
+
+    Parameters
+    ----------
+    declaration : Declaration
+        The interface, type alias or unparsed interface.
+
+    Returns
+    -------
+    list[str]
+        The parents of an interface or the declarations that a type alias references other than its type parameters.
+    """
+    if not isinstance(declaration, TypeScriptTypeAlias):
+        return list(declaration.parents)
+
+    return [
+        name
+        for name in iter_type_references(declaration.type)
+        if name not in declaration.parameters
+    ]
+
+
+def get_entry_requests(
+    entry_files: list[Path], names: Iterable[str], declaring_files: dict[str, Path]
+) -> Iterator[tuple[Path, str]]:
+    """
+    Get the files that the checked names are first looked up in.
+
+    Parameters
+    ----------
+    entry_files : list[Path]
+        The TypeScript files of an identifier.
+
+    names : Iterable[str]
+        The names of the interfaces and type aliases that are checked.
+
+    declaring_files : dict[str, Path]
+        The entry file that declares each name that's declared in the entry files.
+
+    Yields
+    ------
+    tuple[Path, str]
+        The file that declares each name, or each entry file for names that have to be imported.
+    """
+    for name in names:
+        if name in declaring_files:
+            yield declaring_files[name], name
+
+        else:
+            yield from ((p, name) for p in entry_files)
+
+
+def get_imported_name(binding: TypeScriptImport, name: str) -> str | None:
+    """
+    Get the name of a declaration within the module of an import if the import provides it.
+
+    Parameters
+    ----------
+    binding : TypeScriptImport
+        The imported or re-exported binding.
+
+    name : str
+        The name of the declaration within the importing file, which can be qualified by a namespace.
+
+    Returns
+    -------
+    str | None
+        The name of the declaration within the module, or None if the binding doesn't provide it.
+    """
+    if binding.name == "*":
+        return name if binding.is_export else None
+
+    if binding.imported_name == "*":
+        namespace_prefix = f"{binding.name}."
+        return (
+            name.removeprefix(namespace_prefix)
+            if name.startswith(namespace_prefix)
+            else None
+        )
+
+    return binding.imported_name if binding.name == name else None
+
+
+def filter_declarations(
+    ts_file: TypeScriptFile, names: set[str], keep_parsed: bool
+) -> TypeScriptFile:
+    """
+    Filter the declarations of a file down to those that are needed.
+
+    Parameters
+    ----------
+    ts_file : TypeScriptFile
+        The parsed TypeScript file.
+
+    names : set[str]
+        The names of the needed declarations.
+
+    keep_parsed : bool
+        Whether the parsed interfaces and type aliases are all kept, as they are for entry files, with only unparsed interfaces being filtered.
+
+    Returns
+    -------
+    TypeScriptFile
+        The file with only the needed declarations.
+    """
+    return ts_file._replace(
+        interfaces=ts_file.interfaces
+        if keep_parsed
+        else {n: i for n, i in ts_file.interfaces.items() if n in names},
+        type_aliases=ts_file.type_aliases
+        if keep_parsed
+        else {n: a for n, a in ts_file.type_aliases.items() if n in names},
+        unparsed_interfaces=tuple(
+            u for u in ts_file.unparsed_interfaces if u.name in names
+        ),
+    )
+
+
+# MARK: Loader
+
+
+class ImportGraphLoader:
+    """
+    Load the TypeScript files that entry files import the declarations of checked interfaces from.
+
+    Only the imports that lead to needed declarations are followed so that large frontends don't have to be parsed in full.
+    Resolved modules and tsconfig.json files are cached so that files shared between identifiers are only resolved once.
+
+    Parameters
+    ----------
+    get_ts_file : Callable[[Path], TypeScriptFile]
+        A function that returns the parsed declarations of a file, such as that of a parse cache.
+    """
+
+    def __init__(self, get_ts_file: Callable[[Path], TypeScriptFile]) -> None:
+        self.get_ts_file = get_ts_file
+        self._module_paths: dict[tuple[Path, str], Path] = {}
+        self._ts_configs: dict[Path, TsConfigPaths | None] = {}
+
+    def get_ts_config(self, directory: Path) -> TsConfigPaths | None:
+        """
+        Get the module resolution options of the nearest tsconfig.json file to a directory.
+
+        Parameters
+        ----------
+        directory : Path
+            The directory of an importing file.
+
+        Returns
+        -------
+        TsConfigPaths | None
+            The options of the nearest tsconfig.json file, or None if there isn't a valid one.
+        """
+        directory = directory.resolve()
+        if directory not in self._ts_configs:
+            ts_config_path = directory / TS_CONFIG_FILE_NAME
+            if ts_config_path.is_file():
+                try:
+                    self._ts_configs[directory] = read_ts_config(ts_config_path)
+
+                except (OSError, ValueError):
+                    self._ts_configs[directory] = None
+
+            elif directory.parent != directory:
+                self._ts_configs[directory] = self.get_ts_config(directory.parent)
+
+            else:
+                self._ts_configs[directory] = None
+
+        return self._ts_configs[directory]
+
+    def resolve_module(self, importer: Path, specifier: str) -> Path | None:
+        """
+        Resolve the file of a module that's imported via a relative path or a tsconfig.json path alias.
+
+        Parameters
+        ----------
+        importer : Path
+            The path of the importing file.
+
+        specifier : str
+            The module specifier of the import.
+
+        Returns
+        -------
+        Path | None
+            The path of the file of the module, or None if it can't be resolved, such as for packages.
+        """
+        key = (importer.parent, specifier)
+        if key in self._module_paths:
+            return self._module_paths[key]
+
+        if specifier.startswith((".", "/")):
+            bases = [importer.parent / specifier]
+
+        elif (ts_config := self.get_ts_config(importer.parent)) is not None:
+            bases = ts_config.get_module_bases(specifier)
+
+        else:
+            bases = []
+
+        module_path = next(
+            (p for p in map(find_module_file, bases) if p is not None), None
+        )
+        # Unresolved modules aren't cached as they can be created while watching files.
+        if module_path is not None:
+            self._module_paths[key] = module_path
+
+        return module_path
+
+    def load(
+        self, entry_files: list[Path], names: Iterable[str]
+    ) -> list[tuple[Path, TypeScriptFile]]:
+        """
+        Load entry files and the declarations that they import for the given names.
+
+        Parameters
+        ----------
+        entry_files : list[Path]
+            The TypeScript files of an identifier.
+
+        names : Iterable[str]
+            The names of the interfaces and type aliases that are checked.
+
+        Returns
+        -------
+        list[tuple[Path, TypeScriptFile]]
+            The entry files followed by the imported files in the order they're loaded, with imported files only containing their needed declarations and only needed interfaces being left unparsed.
+
+        Notes
+        -----
+        References that aren't declared in or imported by a file are looked up in the entry files as the declarations of entry files are merged.
+        """
+        files = {p: self.get_ts_file(p) for p in entry_files}
+        declarations = {p: get_declarations(ts_file) for p, ts_file in files.items()}
+        # Files are identified by their resolved paths as modules can be imported via several paths.
+        file_paths = {p.resolve(): p for p in entry_files}
+        declaring_files = {name: p for p in entry_files for name in declarations[p]}
+        needed_names = self._find_needed_names(
+            requests=get_entry_requests(
+                entry_files=entry_files, names=names, declaring_files=declaring_files
+            ),
+            declaring_files=declaring_files,
+            file_paths=file_paths,
+            files=files,
+            declarations=declarations,
+        )
+        entry_file_set = set(entry_files)
+
+        return [
+            (
+                p,
+                filter_declarations(
+                    ts_file=ts_file,
+                    names=needed_names.get(p, set()),
+                    keep_parsed=p in entry_file_set,
+                ),
+            )
+            for p, ts_file in files.items()
+        ]
+
+    def _find_needed_names(
+        self,
+        requests: Iterable[tuple[Path, str]],
+        declaring_files: dict[str, Path],
+        file_paths: dict[Path, Path],
+        files: dict[Path, TypeScriptFile],
+        declarations: dict[Path, dict[str, Declaration]],
+    ) -> dict[Path, set[str]]:
+        """
+        Follow the references and imports of declarations from the files that names are first looked up in, loading the imported modules.
+
+        Parameters
+        ----------
+        requests : Iterable[tuple[Path, str]]
+            The files that the checked names are first looked up in along with the names.
+
+        declaring_files : dict[str, Path]
+            The entry file that declares each name that's declared in the entry files.
+
+        file_paths : dict[Path, Path]
+            The path that each loaded file was first loaded via by its resolved path.
+
+        files : dict[Path, TypeScriptFile]
+            The loaded files that imported modules are added to.
+
+        declarations : dict[Path, dict[str, Declaration]]
+            The declarations of the loaded files that those of imported modules are added to.
+
+        Returns
+        -------
+        dict[Path, set[str]]
+            The names of the declarations that are needed from each file that declares any.
+        """
+        requests = deque(requests)
+        needed_names: dict[Path, set[str]] = {}
+        seen_requests: set[tuple[Path, str]] = set()
+        while requests:
+            request = requests.popleft()
+            if request in seen_requests:
+                continue
+
+            seen_requests.add(request)
+            file_path, name = request
+            if (declaration := declarations[file_path].get(name)) is not None:
+                needed_names.setdefault(file_path, set()).add(name)
+                requests.extend(
+                    (file_path, reference)
+                    for reference in get_declaration_references(declaration)
+                )
+                continue
+
+            imported_requests = self._load_imported_modules(
+                file_path=file_path,
+                name=name,
+                file_paths=file_paths,
+                files=files,
+                declarations=declarations,
+            )
+            requests.extend(imported_requests)
+
+            # Qualified names are matched by their last part as they are when evaluated.
+            unqualified_name = name.rpartition(".")[2]
+            if not imported_requests and unqualified_name in declaring_files:
+                requests.append((declaring_files[unqualified_name], unqualified_name))
+
+        return needed_names
+
+    def _load_imported_modules(
+        self,
+        file_path: Path,
+        name: str,
+        file_paths: dict[Path, Path],
+        files: dict[Path, TypeScriptFile],
+        declarations: dict[Path, dict[str, Declaration]],
+    ) -> list[tuple[Path, str]]:
+        """
+        Load the modules that the imports of a file provide a declaration from if they haven't been loaded yet.
+
+        Parameters
+        ----------
+        file_path : Path
+            The path of the importing file.
+
+        name : str
+            The name of the declaration within the importing file.
+
+        file_paths : dict[Path, Path]
+            The path that each loaded file was first loaded via by its resolved path.
+
+        files : dict[Path, TypeScriptFile]
+            The loaded files that the modules are added to.
+
+        declarations : dict[Path, dict[str, Declaration]]
+            The declarations of the loaded files that those of the modules are added to.
+
+        Returns
+        -------
+        list[tuple[Path, str]]
+            The modules that provide the name by the path that they were first loaded via, along with the name within each module.
+        """
+        imported_requests = []
+        for module_path, imported_name in self._get_imported_requests(
+            file_path=file_path, ts_file=files[file_path], name=name
+        ):
+            module_path = file_paths.setdefault(module_path.resolve(), module_path)
+            if module_path not in files:
+                files[module_path] = self.get_ts_file(module_path)
+                declarations[module_path] = get_declarations(files[module_path])
+
+            imported_requests.append((module_path, imported_name))
+
+        return imported_requests
+
+    def _get_imported_requests(
+        self, file_path: Path, ts_file: TypeScriptFile, name: str
+    ) -> list[tuple[Path, str]]:
+        """
+        Get the modules and names that the imports of a file provide a declaration from.
+
+        Parameters
+        ----------
+        file_path : Path
+            The path of the importing file.
+
+        ts_file : TypeScriptFile
+            The parsed importing file.
+
+        name : str
+            The name of the declaration within the importing file.
+
+        Returns
+        -------
+        list[tuple[Path, str]]
+            The resolved modules of the imports that provide the name and the name within each module.
+        """
+        imported_requests = []
+        for binding in ts_file.imports:
+            if (imported_name := get_imported_name(binding, name)) is None:
+                continue
+
+            if (
+                module_path := self.resolve_module(file_path, binding.module)
+            ) is not None:
+                imported_requests.append((module_path, imported_name))
+
+        return imported_requests
@@ -0,0 +1,178 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Index of the interfaces of several TypeScript files that records where each interface is declared.
+"""
+
+from dataclasses import dataclass, field
+
+from ts_backend_check.parsers.typescript_parser import (
+    SourcePosition,
+    TypeScriptInterface,
+    TypeScriptTypeAlias,
+)
+from ts_backend_check.type_evaluator import TypeEvaluator
+
+
+@dataclass
+class InterfaceIndex:
+    """
+    The merged interfaces, type aliases and ignored fields of the TypeScript files of an identifier.
+
+    Files are parsed on their own and added in order, with declarations in later files replacing those of the same name in earlier files.
+    Replaced declarations are recorded so that they can be reported rather than being silently dropped.
+    Type aliases are evaluated into interfaces via resolve_type_aliases once all files have been added as they can reference declarations of any file.
+
+    Attributes
+    ----------
+    interfaces : dict[str, TypeScriptInterface]
+        The interfaces of all files in the order they're first declared.
+
+    type_aliases : dict[str, TypeScriptTypeAlias]
+        The type aliases of all files in the order they're first declared.
+
+    interface_files : dict[str, str]
+        The path of the file that declares each interface and type alias.
+
+    ignored_fields : set[str]
+        The fields marked as ignored within any of the files.
+
+    duplicates : dict[str, list[tuple[str, SourcePosition | None]]]
+        The files and positions of every declaration of each interface or type alias that's declared in more than one file.
+
+    imported_files : list[str]
+        The files that were added as the files of the identifier import needed declarations from them.
+    """
+
+    interfaces: dict[str, TypeScriptInterface] = field(default_factory=dict)
+    type_aliases: dict[str, TypeScriptTypeAlias] = field(default_factory=dict)
+    interface_files: dict[str, str] = field(default_factory=dict)
+    ignored_fields: set[str] = field(default_factory=set)
+    duplicates: dict[str, list[tuple[str, SourcePosition | None]]] = field(
+        default_factory=dict
+    )
+    imported_files: list[str] = field(default_factory=list)
+
+    def add_file(
+        self,
+        file_path: str,
+        interfaces: dict[str, TypeScriptInterface],
+        ignored_fields: frozenset[str] | set[str],
+        type_aliases: dict[str, TypeScriptTypeAlias] | None = None,
+    ) -> None:
+        """
+        Add the parsed interfaces, type aliases and ignored fields of a file to the index.
+
+        Parameters
+        ----------
+        file_path : str
+            The path of the file.
+
+        interfaces : dict[str, TypeScriptInterface]
+            The interfaces of the file.
+
+        ignored_fields : frozenset[str] | set[str]
+            The fields marked as ignored within the file.
+
+        type_aliases : dict[str, TypeScriptTypeAlias], default=None
+            The type aliases of the file.
+        """
+        for name, interface in interfaces.items():
+            self._add_declaration(file_path=file_path, name=name, declaration=interface)
+            self.type_aliases.pop(name, None)
+            self.interfaces[name] = interface
+
+        for name, type_alias in (type_aliases or {}).items():
+            self._add_declaration(
+                file_path=file_path, name=name, declaration=type_alias
+            )
+            self.interfaces.pop(name, None)
+            self.type_aliases[name] = type_alias
+
+        self.ignored_fields.update(ignored_fields)
+
+    def _add_declaration(
+        self,
+        file_path: str,
+        name: str,
+        declaration: TypeScriptInterface | TypeScriptTypeAlias,
+    ) -> None:
+        """
+        Record the file of a declaration and whether it replaces a declaration of another file.
+
+        Parameters
+        ----------
+        file_path : str
+            The path of the file.
+
+        name : str
+            The name of the interface or type alias.
+
+        declaration : TypeScriptInterface | TypeScriptTypeAlias
+            The interface or type alias.
+        """
+        if name in self.interface_files:
+            self.duplicates.setdefault(name, [self.get_location(name)]).append(
+                (file_path, declaration.position)
+            )
+
+        self.interface_files[name] = file_path
+
+    def resolve_type_aliases(self) -> None:
+        """
+        Evaluate the type aliases that describe object types and add them to the interfaces.
+        """
+        type_evaluator = TypeEvaluator(
+            interfaces=self.interfaces,
+            type_aliases=self.type_aliases,
+            files=self.interface_files,
+        )
+        self.interfaces.update(type_evaluator.evaluate_type_aliases())
+
+    def get_location(self, interface_name: str) -> tuple[str, SourcePosition | None]:
+        """
+        Get the file and position of the declaration of an interface or type alias that's checked.
+
+        Parameters
+        ----------
+        interface_name : str
+            The name of the interface or type alias.
+
+        Returns
+        -------
+        tuple[str, SourcePosition | None]
+            The path of the file that declares the interface and the position of its name.
+        """
+        declaration = self.type_aliases.get(interface_name) or self.interfaces.get(
+            interface_name
+        )
+
+        return (
+            self.interface_files[interface_name],
+            declaration.position if declaration is not None else None,
+        )
+
+    def get_property_location(
+        self, interface_name: str, property_name: str
+    ) -> tuple[str, SourcePosition | None]:
+        """
+        Get the file and position of a property of an interface.
+
+        Parameters
+        ----------
+        interface_name : str
+            The name of the interface.
+
+        property_name : str
+            The name of the property.
+
+        Returns
+        -------
+        tuple[str, SourcePosition | None]
+            The path of the file that declares the interface and the position of the property, or of the interface if the property isn't declared.
+        """
+        interface = self.interfaces[interface_name]
+
+        return (
+            self.interface_files[interface_name],
+            interface.get_property_position(property_name) or interface.position,
+        )
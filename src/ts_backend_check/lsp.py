@@ -0,0 +1,1031 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Language server that publishes the errors of ts-backend-check as diagnostics while files are edited.
+"""
+
+import bisect
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Any, BinaryIO, Callable
+from urllib.parse import unquote, urlparse
+
+import yaml
+
+from ts_backend_check.cache import ParseCache, get_tool_version
+from ts_backend_check.checker import TypeChecker, get_interface_names
+from ts_backend_check.cli.main import (
+    extract_identifier_config,
+    get_invalid_paths_message,
+)
+from ts_backend_check.diagnostics import (
+    BLANK_FIELD_NOT_OPTIONAL,
+    MISSING_INTERFACE,
+    Diagnostic,
+)
+from ts_backend_check.import_graph import ImportGraphLoader
+from ts_backend_check.interface_index import InterfaceIndex
+from ts_backend_check.model_index import ModelIndex
+from ts_backend_check.parsers.django_parser import DjangoModel, extract_model_fields
+from ts_backend_check.parsers.typescript_parser import (
+    SourcePosition,
+    TypeScriptFile,
+    TypeScriptParser,
+)
+from ts_backend_check.utils import (
+    ParseTimeoutError,
+    get_backend_model_file_paths,
+    get_line_starts,
+)
+
+CONFIG_FILE_NAMES = (".ts-backend-check.yaml", ".ts-backend-check.yml")
+DIAGNOSTIC_SEVERITY_ERROR = 1
+DIAGNOSTIC_SOURCE = "ts-backend-check"
+TEXT_DOCUMENT_SYNC_FULL = 1
+MESSAGE_TYPE_ERROR = 1
+JSON_RPC_PARSE_ERROR = -32700
+JSON_RPC_INVALID_REQUEST = -32600
+JSON_RPC_METHOD_NOT_FOUND = -32601
+JSON_RPC_INTERNAL_ERROR = -32603
+# Errors of files that can't be parsed, such as models files with half-typed code, which are published rather than stopping the server.
+PARSE_ERRORS = (SyntaxError, ParseTimeoutError, OSError)
+
+
+# MARK: Positions
+
+
+def uri_to_path(uri: str) -> Path:
+    """
+    Convert a file URI to a resolved path.
+
+    Parameters
+    ----------
+    uri : str
+        The file URI of a document.
+
+    Returns
+    -------
+    Path
+        The resolved path of the document.
+    """
+    return Path(unquote(urlparse(uri).path)).resolve()
+
+
+def count_utf16_code_units(text: str) -> int:
+    """
+    Count the UTF-16 code units of a text, which is how LSP positions count characters.
+
+    Parameters
+    ----------
+    text : str
+        The text to count.
+
+    Returns
+    -------
+    int
+        The number of UTF-16 code units, which is two for characters outside of the Basic Multilingual Plane.
+    """
+    return len(text.encode("utf-16-le")) // 2
+
+
+def get_position(text: str, line_starts: list[int], offset: int) -> dict[str, int]:
+    """
+    Convert an offset of a text to an LSP position, counting characters in UTF-16 code units.
+
+    Parameters
+    ----------
+    text : str
+        The text that the offset is within.
+
+    line_starts : list[int]
+        The offsets of the start of each line of the text from get_line_starts.
+
+    offset : int
+        The offset within the text.
+
+    Returns
+    -------
+    dict[str, int]
+        The zero-based line and character of the offset.
+    """
+    line = bisect.bisect_right(line_starts, offset) - 1
+
+    return {
+        "line": line,
+        "character": count_utf16_code_units(text[line_starts[line] : offset]),
+    }
+
+
+def get_range(
+    text: str, line_starts: list[int], start: int, end: int
+) -> dict[str, dict[str, int]]:
+    """
+    Convert a span of a text to an LSP range.
+
+    Parameters
+    ----------
+    text : str
+        The text that the span is within.
+
+    line_starts : list[int]
+        The offsets of the start of each line of the text from get_line_starts.
+
+    start : int
+        The offset of the start of the span.
+
+    end : int
+        The offset of the end of the span.
+
+    Returns
+    -------
+    dict[str, dict[str, int]]
+        The start and end positions of the span.
+    """
+    return {
+        "start": get_position(text, line_starts, start),
+        "end": get_position(text, line_starts, end),
+    }
+
+
+def get_name_range(
+    line_text: str, position: SourcePosition, name: str
+) -> dict[str, dict[str, int]]:
+    """
+    Convert the position of a parsed name to an LSP range via the line and column of the position.
+
+    The column counts characters, which are converted to UTF-16 code units via the text of the line, so the byte offset of the position isn't used.
+
+    Parameters
+    ----------
+    line_text : str
+        The text of the line of the name.
+
+    position : SourcePosition
+        The position of the name.
+
+    name : str
+        The name, which is on a single line.
+
+    Returns
+    -------
+    dict[str, dict[str, int]]
+        The start and end positions of the name.
+    """
+    line = position.line - 1
+    start = count_utf16_code_units(line_text[: position.column - 1])
+
+    return {
+        "start": {"line": line, "character": start},
+        "end": {"line": line, "character": start + count_utf16_code_units(name)},
+    }
+
+
+def find_model_span(text: str, model_name: str) -> tuple[int, int] | None:
+    """
+    Find the name of a model class within a models file.
+
+    Parameters
+    ----------
+    text : str
+        The text of the models file.
+
+    model_name : str
+        The name of the model.
+
+    Returns
+    -------
+    tuple[int, int] | None
+        The span of the name of the model, or None if it isn't defined in the text.
+    """
+    match = re.search(rf"^class\s+({re.escape(model_name)})\b", text, re.MULTILINE)
+
+    return match.span(1) if match else None
+
+
+def create_parse_error_diagnostic(error: Exception) -> dict[str, Any]:
+    """
+    Create a diagnostic for a file that couldn't be parsed, spanning the line of the error if it's known.
+
+    Parameters
+    ----------
+    error : Exception
+        The SyntaxError, ParseTimeoutError or OSError that was raised while parsing the file.
+
+    Returns
+    -------
+    dict[str, Any]
+        The LSP diagnostic for the error.
+    """
+    # The errors of models files wrap the SyntaxError of the parse, which has the line.
+    syntax_error = (
+        error.__cause__ if isinstance(error.__cause__, SyntaxError) else error
+    )
+    line = max((getattr(syntax_error, "lineno", None) or 1) - 1, 0)
+
+    return {
+        "range": {
+            "start": {"line": line, "character": 0},
+            "end": {"line": line + 1, "character": 0},
+        },
+        "severity": DIAGNOSTIC_SEVERITY_ERROR,
+        "source": DIAGNOSTIC_SOURCE,
+        "message": str(error),
+    }
+
+
+def get_parse_error_path(error: Exception, default_path: Path) -> Path:
+    """
+    Get the file that a parse error is about.
+
+    Parameters
+    ----------
+    error : Exception
+        The ParseTimeoutError or OSError that was raised while parsing a file.
+
+    default_path : Path
+        The path that's used if the error doesn't name a file.
+
+    Returns
+    -------
+    Path
+        The resolved path of the file that couldn't be parsed.
+    """
+    file_path = (
+        error.file_path
+        if isinstance(error, ParseTimeoutError)
+        else getattr(error, "filename", None)
+    )
+
+    return (
+        Path(file_path).resolve()
+        if isinstance(file_path, (str, Path))
+        else default_path
+    )
+
+
+# MARK: Server
+
+
+class LanguageServer:
+    """
+    Language server that checks the identifiers of open documents and publishes their errors as diagnostics.
+
+    Only the document that changed is parsed again, with the other files of its identifiers coming from a parse cache that's revalidated by modification time, size and content hash.
+
+    Parameters
+    ----------
+    input_stream : BinaryIO
+        The stream that messages from the client are read from.
+
+    output_stream : BinaryIO
+        The stream that messages to the client are written to.
+    """
+
+    def __init__(self, input_stream: BinaryIO, output_stream: BinaryIO) -> None:
+        self.input_stream = input_stream
+        self.output_stream = output_stream
+        self.root_path = Path.cwd()
+        self.identifier_configs: dict[str, dict[str, Any]] = {}
+        self.parse_cache = ParseCache()
+        self.import_graph_loader = ImportGraphLoader(get_ts_file=self.get_ts_file)
+        self.documents: dict[Path, str] = {}
+        self.document_parses: dict[Path, tuple[Any, Any]] = {}
+        self.file_texts: dict[Path, str] = {}
+        self.file_line_starts: dict[Path, list[int]] = {}
+        self.model_results: dict[str, dict[str, tuple[str, list[Diagnostic]]]] = {}
+        self.imported_files: dict[str, set[Path]] = {}
+        self.diagnostics: dict[str, dict[Path, list[dict]]] = {}
+        self.shutdown_requested = False
+        self.message_handlers: dict[str, Callable[[dict[str, Any]], Any]] = {
+            "initialize": self.initialize,
+            "shutdown": self.shutdown,
+            "textDocument/didOpen": lambda params: self.update_document(
+                uri=params["textDocument"]["uri"], text=params["textDocument"]["text"]
+            ),
+            "textDocument/didChange": lambda params: self.update_document(
+                uri=params["textDocument"]["uri"],
+                text=params["contentChanges"][-1]["text"],
+            ),
+            "textDocument/didClose": lambda params: self.update_document(
+                uri=params["textDocument"]["uri"], text=None
+            ),
+            "textDocument/didSave": lambda params: self.check_document(
+                uri=params["textDocument"]["uri"]
+            ),
+        }
+
+    # MARK: Messages
+
+    def read_message(self) -> dict[str, Any] | None:
+        """
+        Read a JSON-RPC message from the client.
+
+        Returns
+        -------
+        dict[str, Any] | None
+            The message, or None if the input stream was closed.
+        """
+        content_length = None
+        while True:
+            line = self.input_stream.readline()
+            if not line:
+                return None
+
+            if not line.strip():
+                break
+
+            name, _, value = line.decode("ascii").partition(":")
+            if name.strip().lower() == "content-length":
+                content_length = int(value.strip())
+
+        if content_length is None:
+            return None
+
+        return json.loads(self.input_stream.read(content_length))
+
+    def send_message(self, message: dict[str, Any]) -> None:
+        """
+        Write a JSON-RPC message to the client.
+
+        Parameters
+        ----------
+        message : dict[str, Any]
+            The message to send.
+        """
+        body = json.dumps({"jsonrpc": "2.0", **message}).encode("utf-8")
+        self.output_stream.write(f"Content-Length: {len(body)}\r\n\r\n".encode("ascii"))
+        self.output_stream.write(body)
+        self.output_stream.flush()
+
+    def serve(self) -> int:
+        """
+        Handle messages from the client until it sends the exit notification or closes the input stream.
+
+        Returns
+        -------
+        int
+            The exit code of the server, which is 0 if the client requested a shutdown before exiting.
+        """
+        while True:
+            try:
+                message = self.read_message()
+
+            except ValueError as e:
+                self.send_error(
+                    message_id=None, code=JSON_RPC_PARSE_ERROR, message=str(e)
+                )
+                continue
+
+            if message is None:
+                break
+
+            if not isinstance(message, dict):
+                self.send_error(
+                    message_id=None,
+                    code=JSON_RPC_INVALID_REQUEST,
+                    message="Messages must be JSON objects.",
+                )
+
+            elif message.get("method") == "exit":
+                break
+
+            else:
+                self.handle_message(message)
+
+        return 0 if self.shutdown_requested else 1
+
+    def send_error(self, message_id: Any, code: int, message: str) -> None:
+        """
+        Respond to a request with an error, or log the error to the client if the message was a notification.
+
+        Parameters
+        ----------
+        message_id : Any
+            The ID of the request, which is None for notifications and messages that couldn't be read.
+
+        code : int
+            The JSON-RPC error code.
+
+        message : str
+            The description of the error.
+        """
+        if message_id is None and code not in (
+            JSON_RPC_PARSE_ERROR,
+            JSON_RPC_INVALID_REQUEST,
+        ):
+            self.send_message(
+                {
+                    "method": "window/logMessage",
+                    "params": {"type": MESSAGE_TYPE_ERROR, "message": message},
+                }
+            )
+            return
+
+        self.send_message(
+            {"id": message_id, "error": {"code": code, "message": message}}
+        )
+
+    def handle_message(self, message: dict[str, Any]) -> None:
+        """
+        Respond to a request or notification from the client.
+
+        Errors while handling a message are sent to the client rather than stopping the server.
+
+        Parameters
+        ----------
+        message : dict[str, Any]
+            The request or notification.
+        """
+        method = message.get("method")
+        message_id = message.get("id")
+        if (handler := self.message_handlers.get(str(method))) is None:
+            if "id" in message:
+                self.send_error(
+                    message_id=message_id,
+                    code=JSON_RPC_METHOD_NOT_FOUND,
+                    message=f"Method not found: {method}",
+                )
+
+            return
+
+        try:
+            result = handler(message.get("params") or {})
+
+        except Exception as e:
+            self.send_error(
+                message_id=message_id,
+                code=JSON_RPC_INTERNAL_ERROR,
+                message=f"Failed to handle {method}: {e!r}",
+            )
+            return
+
+        if "id" in message:
+            self.send_message({"id": message_id, "result": result})
+
+    def shutdown(self, params: dict[str, Any]) -> None:
+        """
+        Record that the client requested a shutdown so that the server exits with 0.
+
+        Parameters
+        ----------
+        params : dict[str, Any]
+            The parameters of the shutdown request, which are unused.
+        """
+        self.shutdown_requested = True
+
+    def initialize(self, params: dict[str, Any]) -> dict[str, Any]:
+        """
+        Load the configuration of the workspace and return the capabilities of the server.
+
+        Parameters
+        ----------
+        params : dict[str, Any]
+            The parameters of the initialize request.
+
+        Returns
+        -------
+        dict[str, Any]
+            The capabilities and information of the server.
+        """
+        if params.get("rootUri"):
+            self.root_path = uri_to_path(params["rootUri"])
+
+        elif params.get("rootPath"):
+            self.root_path = Path(params["rootPath"]).resolve()
+
+        self.load_config()
+
+        return {
+            "capabilities": {
+                "textDocumentSync": {
+                    "openClose": True,
+                    "change": TEXT_DOCUMENT_SYNC_FULL,
+                    "save": True,
+                }
+            },
+            "serverInfo": {"name": DIAGNOSTIC_SOURCE, "version": get_tool_version()},
+        }
+
+    def load_config(self) -> None:
+        """
+        Load the identifiers from the configuration file of the workspace, resolving their paths against the root of the workspace.
+        """
+        self.identifier_configs = {}
+        config_paths = [self.root_path / name for name in CONFIG_FILE_NAMES]
+        if not (config_path := next((p for p in config_paths if p.is_file()), None)):
+            return
+
+        with open(config_path, "r", encoding="utf-8") as file:
+            config = yaml.safe_load(file) or {}
+
+        for identifier, identifier_config in config.items():
+            identifier_config = extract_identifier_config(identifier_config)
+            identifier_config["backend_model_file_path"] = (
+                self.root_path / identifier_config["backend_model_file_path"]
+            ).resolve()
+            identifier_config["ts_interface_file_paths"] = [
+                (self.root_path / p).resolve()
+                for p in identifier_config["ts_interface_file_paths"]
+            ]
+            self.identifier_configs[identifier] = identifier_config
+
+    # MARK: Documents
+
+    def update_document(self, uri: str, text: str | None) -> None:
+        """
+        Update the text of an open document and check its identifiers.
+
+        Parameters
+        ----------
+        uri : str
+            The URI of the document.
+
+        text : str | None
+            The text of the document, or None if the document was closed and its file on disk should be used.
+        """
+        path = uri_to_path(uri)
+        if text is None:
+            self.documents.pop(path, None)
+            self.document_parses.pop(path, None)
+
+        else:
+            self.documents[path] = text
+
+        self.check_document(uri=uri)
+
+    def get_text(self, path: Path) -> str:
+        """
+        Get the text of a file, preferring the text of an open document and reading files on disk at most once per check.
+
+        Parameters
+        ----------
+        path : Path
+            The resolved path of the file.
+
+        Returns
+        -------
+        str
+            The text of the file.
+        """
+        if path in self.documents:
+            return self.documents[path]
+
+        if path not in self.file_texts:
+            # Newlines aren't translated so that offsets match those of parsed files.
+            self.file_texts[path] = path.read_bytes().decode("utf-8")
+
+        return self.file_texts[path]
+
+    def get_line_starts(self, path: Path) -> list[int]:
+        """
+        Get the offsets of the start of each line of a file, indexing each file at most once per check.
+
+        Parameters
+        ----------
+        path : Path
+            The resolved path of the file.
+
+        Returns
+        -------
+        list[int]
+            The offset of the first character of each line.
+        """
+        if path not in self.file_line_starts:
+            self.file_line_starts[path] = get_line_starts(self.get_text(path))
+
+        return self.file_line_starts[path]
+
+    def get_name_range(
+        self, path: Path, position: SourcePosition, name: str
+    ) -> dict[str, dict[str, int]]:
+        """
+        Get the LSP range of a parsed name from the text of its line.
+
+        Parameters
+        ----------
+        path : Path
+            The resolved path of the file.
+
+        position : SourcePosition
+            The position of the name.
+
+        name : str
+            The name.
+
+        Returns
+        -------
+        dict[str, dict[str, int]]
+            The start and end positions of the name.
+        """
+        text = self.get_text(path)
+        line_starts = self.get_line_starts(path)
+        line_end = (
+            line_starts[position.line] if position.line < len(line_starts) else None
+        )
+
+        return get_name_range(
+            line_text=text[line_starts[position.line - 1] : line_end],
+            position=position,
+            name=name,
+        )
+
+    def get_models_files(self, identifier_config: dict[str, Any]) -> list[Path]:
+        """
+        Get the models files of an identifier, whose backend models path can be a file, a directory or a glob.
+
+        Parameters
+        ----------
+        identifier_config : dict[str, Any]
+            The configuration parameters of the identifier.
+
+        Returns
+        -------
+        list[Path]
+            The resolved paths of the models files of the identifier.
+        """
+        return [
+            p.resolve()
+            for p in get_backend_model_file_paths(
+                identifier_config["backend_model_file_path"]
+            )
+        ]
+
+    def get_model_index(
+        self,
+        identifier_config: dict[str, Any],
+        diagnostics: dict[Path, list[dict]],
+    ) -> ModelIndex:
+        """
+        Get the models of the models files of an identifier along with the files that define them.
+
+        Models files that can't be parsed, such as those with half-typed code, are skipped and reported via the diagnostics.
+
+        Parameters
+        ----------
+        identifier_config : dict[str, Any]
+            The configuration parameters of the identifier.
+
+        diagnostics : dict[Path, list[dict]]
+            The diagnostics of each file of the identifier, which the errors of models files that can't be parsed are added to.
+
+        Returns
+        -------
+        ModelIndex
+            The models of the models files of the identifier that could be parsed.
+        """
+        model_index = ModelIndex()
+        for path in self.get_models_files(identifier_config):
+            try:
+                models = self.get_models(
+                    path=path,
+                    models_to_ignore=identifier_config["backend_models_to_ignore"],
+                )
+
+            except PARSE_ERRORS as e:
+                diagnostics.setdefault(path, []).append(
+                    create_parse_error_diagnostic(error=e)
+                )
+                continue
+
+            model_index.add_file(file_path=str(path), models=models)
+
+        return model_index
+
+    def get_models(
+        self, path: Path, models_to_ignore: list[str]
+    ) -> dict[str, DjangoModel]:
+        """
+        Get the models of a models file, parsing it from its open document if there is one.
+
+        Parameters
+        ----------
+        path : Path
+            The resolved path of the models file.
+
+        models_to_ignore : list[str]
+            Model classes to ignore, obtained from the config file.
+
+        Returns
+        -------
+        dict[str, DjangoModel]
+            The models of the models file.
+        """
+        if path not in self.documents:
+            return self.parse_cache.get_models(path, models_to_ignore)
+
+        text = self.documents[path]
+        parse_key = (tuple(models_to_ignore), text)
+        if (document_parse := self.document_parses.get(path)) is None or (
+            document_parse[0] != parse_key
+        ):
+            document_parse = (
+                parse_key,
+                extract_model_fields(
+                    models_file=str(path),
+                    models_to_ignore=models_to_ignore,
+                    source=text,
+                ),
+            )
+            self.document_parses[path] = document_parse
+
+        return document_parse[1]
+
+    def get_ts_file(self, path: Path) -> TypeScriptFile:
+        """
+        Get the interfaces, type aliases and ignored fields of a TypeScript file, parsing it from its open document if there is one.
+
+        Parameters
+        ----------
+        path : Path
+            The resolved path of the TypeScript file.
+
+        Returns
+        -------
+        TypeScriptFile
+            The interfaces, type aliases and ignored fields of the file.
+        """
+        if path not in self.documents:
+            return self.parse_cache.get_ts_file(path)
+
+        text = self.documents[path]
+        if (document_parse := self.document_parses.get(path)) is None or (
+            document_parse[0] != text
+        ):
+            document_parse = (text, TypeScriptParser(text).parse_file())
+            self.document_parses[path] = document_parse
+
+        return document_parse[1]
+
+    # MARK: Checks
+
+    def check_document(self, uri: str) -> None:
+        """
+        Check the identifiers that a document belongs to and publish the diagnostics of their files.
+
+        Parameters
+        ----------
+        uri : str
+            The URI of the document.
+        """
+        path = uri_to_path(uri)
+        for identifier, identifier_config in self.identifier_configs.items():
+            if (
+                path in identifier_config["ts_interface_file_paths"]
+                or path in self.get_models_files(identifier_config)
+                or path in self.imported_files.get(identifier, ())
+            ):
+                self.check_identifier(identifier=identifier, path=path)
+
+    def check_identifier(self, identifier: str, path: Path) -> None:
+        """
+        Check an identifier and publish the diagnostics of its files.
+
+        Files that can't be parsed are reported as diagnostics of the files rather than stopping the server.
+
+        Parameters
+        ----------
+        identifier : str
+            The identifier to check.
+
+        path : Path
+            The resolved path of the document that the check is for, which parse errors that don't name a file are shown at.
+        """
+        identifier_config = self.identifier_configs[identifier]
+        previous_diagnostics = self.diagnostics.get(identifier, {})
+        if get_invalid_paths_message(
+            identifier=identifier,
+            backend_model_file_path=identifier_config["backend_model_file_path"],
+            ts_interface_file_paths=identifier_config["ts_interface_file_paths"],
+        ):
+            self.diagnostics[identifier] = {}
+
+        else:
+            try:
+                self.diagnostics[identifier] = self.get_identifier_diagnostics(
+                    identifier=identifier
+                )
+
+            except PARSE_ERRORS as e:
+                self.diagnostics[identifier] = {
+                    get_parse_error_path(error=e, default_path=path): [
+                        create_parse_error_diagnostic(error=e)
+                    ]
+                }
+
+        for file_path in sorted({*previous_diagnostics, *self.diagnostics[identifier]}):
+            self.send_message(
+                {
+                    "method": "textDocument/publishDiagnostics",
+                    "params": {
+                        "uri": file_path.as_uri(),
+                        "diagnostics": [
+                            d
+                            for identifier_diagnostics in self.diagnostics.values()
+                            for d in identifier_diagnostics.get(file_path, [])
+                        ],
+                    },
+                }
+            )
+
+    def get_identifier_diagnostics(self, identifier: str) -> dict[Path, list[dict]]:
+        """
+        Check an identifier and locate its errors within its files.
+
+        Parameters
+        ----------
+        identifier : str
+            The identifier to check.
+
+        Returns
+        -------
+        dict[Path, list[dict]]
+            The diagnostics of each file of the identifier that has errors.
+        """
+        identifier_config = self.identifier_configs[identifier]
+        self.file_texts.clear()
+        self.file_line_starts.clear()
+        diagnostics: dict[Path, list[dict]] = {}
+        model_index = self.get_model_index(identifier_config, diagnostics=diagnostics)
+        interface_index = InterfaceIndex()
+        # Open documents are used for imported files as well as for the files of the identifier.
+        loaded_files = self.import_graph_loader.load(
+            entry_files=identifier_config["ts_interface_file_paths"],
+            names=get_interface_names(
+                model_names=model_index.models,
+                model_name_conversions=identifier_config["model_name_conversions"],
+            ),
+        )
+        for ts_file, parsed_ts_file in loaded_files:
+            interface_index.add_file(
+                file_path=str(ts_file),
+                interfaces=parsed_ts_file.interfaces,
+                ignored_fields=parsed_ts_file.ignored_fields,
+                type_aliases=parsed_ts_file.type_aliases,
+            )
+
+        interface_index.resolve_type_aliases()
+        self.imported_files[identifier] = {p.resolve() for p, _ in loaded_files} - {
+            Path(p).resolve() for p in identifier_config["ts_interface_file_paths"]
+        }
+
+        checker = TypeChecker(
+            models_file=str(identifier_config["backend_model_file_path"]),
+            model_name_conversions=identifier_config["model_name_conversions"],
+            check_blank=identifier_config["check_blank"],
+            backend_models_to_ignore=identifier_config["backend_models_to_ignore"],
+            interface_index=interface_index,
+            previous_model_results=self.model_results.get(identifier),
+            model_index=model_index,
+        )
+        for error in checker.iter_diagnostics():
+            for path, error_range in self.locate_error(
+                error=error, interface_index=interface_index
+            ):
+                diagnostics.setdefault(path, []).append(
+                    {
+                        "range": error_range,
+                        "severity": DIAGNOSTIC_SEVERITY_ERROR,
+                        "source": DIAGNOSTIC_SOURCE,
+                        "code": error.code,
+                        "message": error.message.strip(),
+                    }
+                )
+
+        self.model_results[identifier] = checker.model_results
+
+        return diagnostics
+
+    def locate_error(
+        self, error: Diagnostic, interface_index: InterfaceIndex
+    ) -> list[tuple[Path, dict[str, dict[str, int]]]]:
+        """
+        Locate an error at the properties or interfaces that it's about, or at its model if it has no interfaces.
+
+        Parameters
+        ----------
+        error : Diagnostic
+            The error to locate, whose models file is the resolved path of the file that defines its model.
+
+        interface_index : InterfaceIndex
+            The interfaces of the TypeScript files of the identifier along with where they're declared.
+
+        Returns
+        -------
+        list[tuple[Path, dict[str, dict[str, int]]]]
+            The files and LSP ranges that the error should be shown at.
+        """
+        locations = []
+        if error.code == BLANK_FIELD_NOT_OPTIONAL and error.camel_field:
+            locations = self.locate_properties(
+                interface_names=error.interfaces,
+                property_name=error.camel_field,
+                interface_index=interface_index,
+            )
+
+        if not locations and error.code != MISSING_INTERFACE:
+            locations = self.locate_interfaces(
+                interface_names=error.interfaces, interface_index=interface_index
+            )
+
+        return locations or [self.locate_model(error=error)]
+
+    def locate_properties(
+        self,
+        interface_names: tuple[str, ...],
+        property_name: str,
+        interface_index: InterfaceIndex,
+    ) -> list[tuple[Path, dict[str, dict[str, int]]]]:
+        """
+        Locate the declarations of a property within interfaces.
+
+        Parameters
+        ----------
+        interface_names : tuple[str, ...]
+            The names of the interfaces.
+
+        property_name : str
+            The name of the property.
+
+        interface_index : InterfaceIndex
+            The interfaces of the TypeScript files of the identifier along with where they're declared.
+
+        Returns
+        -------
+        list[tuple[Path, dict[str, dict[str, int]]]]
+            The files and LSP ranges of the property within the interfaces that declare it.
+        """
+        locations = []
+        for name in interface_names:
+            position = interface_index.interfaces[name].get_property_position(
+                property_name
+            )
+            if position is not None:
+                path = Path(interface_index.interface_files[name])
+                locations.append(
+                    (path, self.get_name_range(path, position, property_name))
+                )
+
+        return locations
+
+    def locate_interfaces(
+        self, interface_names: tuple[str, ...], interface_index: InterfaceIndex
+    ) -> list[tuple[Path, dict[str, dict[str, int]]]]:
+        """
+        Locate the declarations of interfaces.
+
+        Parameters
+        ----------
+        interface_names : tuple[str, ...]
+            The names of the interfaces.
+
+        interface_index : InterfaceIndex
+            The interfaces of the TypeScript files of the identifier along with where they're declared.
+
+        Returns
+        -------
+        list[tuple[Path, dict[str, dict[str, int]]]]
+            The files and LSP ranges of the names of the interfaces whose positions are known.
+        """
+        locations = []
+        for name in interface_names:
+            file_path, position = interface_index.get_location(name)
+            if position is not None:
+                path = Path(file_path)
+                locations.append((path, self.get_name_range(path, position, name)))
+
+        return locations
+
+    def locate_model(self, error: Diagnostic) -> tuple[Path, dict[str, dict[str, int]]]:
+        """
+        Locate the class definition of the model of an error.
+
+        Parameters
+        ----------
+        error : Diagnostic
+            The error, whose models file is the resolved path of the file that defines its model.
+
+        Returns
+        -------
+        tuple[Path, dict[str, dict[str, int]]]
+            The models file and the LSP range of the name of the model, which is at the start of the file if the model isn't found.
+        """
+        models_file = Path(error.models_file)
+        text = self.get_text(models_file)
+        span = find_model_span(text, error.model) or (0, 0)
+
+        return models_file, get_range(text, self.get_line_starts(models_file), *span)
+
+
+def run_language_server() -> int:
+    """
+    Run the language server over stdin and stdout.
+
+    Returns
+    -------
+    int
+        The exit code of the server.
+    """
+    return LanguageServer(
+        input_stream=sys.stdin.buffer, output_stream=sys.stdout.buffer
+    ).serve()
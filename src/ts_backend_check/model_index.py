@@ -0,0 +1,70 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Index of the models of several backend models files that records where each model is defined.
+"""
+
+from dataclasses import dataclass, field
+
+from ts_backend_check.parsers.django_parser import DjangoModel
+
+
+@dataclass
+class ModelIndex:
+    """
+    The merged models of the backend models files of an identifier.
+
+    Files are parsed on their own and added in order, with models in later files replacing those of the same name in earlier files.
+    Replaced models are recorded so that they can be reported rather than being silently dropped.
+
+    Attributes
+    ----------
+    models : dict[str, DjangoModel]
+        The models of all files in the order they're first defined.
+
+    model_files : dict[str, str]
+        The path of the file that defines each model.
+
+    duplicates : dict[str, list[tuple[str, int]]]
+        The files and lines of every definition of each model that's defined in more than one file.
+    """
+
+    models: dict[str, DjangoModel] = field(default_factory=dict)
+    model_files: dict[str, str] = field(default_factory=dict)
+    duplicates: dict[str, list[tuple[str, int]]] = field(default_factory=dict)
+
+    def add_file(self, file_path: str, models: dict[str, DjangoModel]) -> None:
+        """
+        Add the models of a file to the index.
+
+        Parameters
+        ----------
+        file_path : str
+            The path of the file.
+
+        models : dict[str, DjangoModel]
+            The models of the file.
+        """
+        for name, model in models.items():
+            if name in self.model_files:
+                self.duplicates.setdefault(name, [self.get_location(name)]).append(
+                    (file_path, model.line)
+                )
+
+            self.model_files[name] = file_path
+            self.models[name] = model
+
+    def get_location(self, model_name: str) -> tuple[str, int]:
+        """
+        Get the file and line of the definition of a model that's checked.
+
+        Parameters
+        ----------
+        model_name : str
+            The name of the model.
+
+        Returns
+        -------
+        tuple[str, int]
+            The path of the file that defines the model and the line of its class definition, which is 0 if it isn't known.
+        """
+        return self.model_files[model_name], self.models[model_name].line
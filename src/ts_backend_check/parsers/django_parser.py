@@ -4,18 +4,242 @@ Module for parsing Django models and extracting field information.
 """
 
 import ast
+import bisect
+import io
 import re
-from typing import Any
+import sys
+import tokenize
+from dataclasses import dataclass, field
+from typing import NamedTuple
 
+from ts_backend_check.utils import Deadline
 
-class DjangoModelVisitor(ast.NodeVisitor):
+# Increment when changes to the parser change its output so that cached artifacts are invalidated.
+PARSER_VERSION = 3
+
+# Directives that don't inherit a field consume the rest of the comment so that it isn't searched again from each later '#'.
+INHERIT_DIRECTIVE_PATTERN = re.compile(
+    r"#\s*(?:tsbc|ts-backend-check): (?:.*inherit\s+(\w+)(?:\s*\((blank=True)\))?|.*)"
+)
+
+DIRECTIVE_PREFIX_PATTERN = re.compile("tsbc:|ts-backend-check:")
+
+
+@dataclass(frozen=True, slots=True)
+class DjangoModel:
+    """
+    Represents a Django model with its ordered fields and the fields that are marked 'blank=True'.
+
+    Fields are kept as ordered tuples for order checks and as frozensets for membership checks.
+    The line of the class definition within the models file is kept so that errors can be located.
+    """
+
+    name: str
+    fields: tuple[str, ...]
+    blank_fields: tuple[str, ...]
+    line: int = field(default=0, compare=False)
+    field_set: frozenset[str] = field(init=False, repr=False, compare=False)
+    blank_field_set: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """
+        Derive the membership sets from the ordered fields.
+        """
+        object.__setattr__(self, "field_set", frozenset(self.fields))
+        object.__setattr__(self, "blank_field_set", frozenset(self.blank_fields))
+
+
+class InheritDirective(NamedTuple):
+    """
+    A comment that marks a field as inherited, such as '# tsbc: inherit email (blank=True)'.
+
+    Attributes
+    ----------
+    line : int
+        The line of the comment, starting at 1.
+
+    column : int
+        The column of the comment, starting at 0.
+
+    field : str
+        The name of the inherited field.
+
+    blank : bool
+        Whether the inherited field is marked 'blank=True'.
+    """
+
+    line: int
+    column: int
+    field: str
+    blank: bool
+
+
+def find_inherit_directives(source: str) -> dict[int, InheritDirective]:
+    """
+    Find the inherit directives of a models file via the lines that have a directive prefix, reading each from the first '#' of its line.
+
+    The first '#' of a line only starts its comment if the line isn't within a statement that could have strings, so the lines of statements are reread via tokenize_inherit_directives as the file is walked.
+
+    Parameters
+    ----------
+    source : str
+        The text of the models file.
+
+    Returns
+    -------
+    dict[int, InheritDirective]
+        The inherit directives by their line, in the order they're in the file.
+    """
+    directives: dict[int, InheritDirective] = {}
+    line, counted = 1, 0
+    prefix = DIRECTIVE_PREFIX_PATTERN.search(source)
+    while prefix is not None:
+        line_start = source.rfind("\n", 0, prefix.start()) + 1
+        line += source.count("\n", counted, line_start)
+        counted = line_start
+        line_end = source.find("\n", prefix.end())
+        if line_end == -1:
+            line_end = len(source)
+
+        text = source[line_start:line_end]
+        column = text.find("#")
+        if (
+            column != -1
+            and (directive := INHERIT_DIRECTIVE_PATTERN.search(text, column))
+            and directive[1]
+        ):
+            directives[line] = InheritDirective(
+                line=line,
+                column=column,
+                field=directive[1],
+                blank=directive[2] is not None,
+            )
+
+        # Each line is read once however many prefixes it has.
+        prefix = DIRECTIVE_PREFIX_PATTERN.search(source, line_end)
+
+    return directives
+
+
+def tokenize_inherit_directives(
+    source: str, first_line: int = 1
+) -> list[InheritDirective]:
+    """
+    Find the inherit directives within the comments of a models file or of lines of it via their tokens, so that directives within strings aren't found.
+
+    Parameters
+    ----------
+    source : str
+        The text of the models file or of whole lines of it that start at a statement.
+
+    first_line : int, default=1
+        The line of the models file that the text starts at.
+
+    Returns
+    -------
+    list[InheritDirective]
+        The inherit directives in the order they're in the file.
+    """
+    return [
+        InheritDirective(
+            line=token.start[0] + first_line - 1,
+            column=token.start[1],
+            field=directive[1],
+            blank=directive[2] is not None,
+        )
+        for token in tokenize.generate_tokens(io.StringIO(source).readline)
+        if token.type == tokenize.COMMENT
+        and (directive := INHERIT_DIRECTIVE_PATTERN.search(token.string))
+        and directive[1]
+    ]
+
+
+def get_child_statements(node: ast.stmt) -> list[ast.stmt]:
+    """
+    Get the statements that are nested within a compound statement in the order they're in the file.
+
+    Parameters
+    ----------
+    node : ast.stmt
+        The statement.
+
+    Returns
+    -------
+    list[ast.stmt]
+        The statements of all blocks of the statement, including those of except handlers and match cases.
+    """
+    statements: list[ast.stmt] = []
+    for name in ("body", "handlers", "cases", "orelse", "finalbody"):
+        for child in getattr(node, name, ()):
+            if isinstance(child, (ast.ExceptHandler, ast.match_case)):
+                statements.extend(child.body)
+
+            elif isinstance(child, ast.stmt):
+                statements.append(child)
+
+    return statements
+
+
+def get_first_line(node: ast.stmt) -> int:
+    """
+    Get the first line of a statement, which is that of its first decorator for decorated definitions.
+
+    Parameters
+    ----------
+    node : ast.stmt
+        The statement.
+
+    Returns
+    -------
+    int
+        The first line of the statement, starting at 1.
+    """
+    return min([node.lineno, *(d.lineno for d in getattr(node, "decorator_list", ()))])
+
+
+def get_statement_lines(node: ast.stmt) -> list[tuple[int, int]]:
     """
-    AST visitor to extract fields from Django models.
+    Get the ranges of lines of a statement that can have strings, which are those before its blocks for compound statements.
+
+    Parameters
+    ----------
+    node : ast.stmt
+        The statement.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        The first and last line of each range, including those of the headers of except handlers and match cases.
+    """
+    body = getattr(node, "body", None)
+    if not body:
+        return [(get_first_line(node), node.end_lineno or node.lineno)]
+
+    ranges = [(get_first_line(node), get_first_line(body[0]) - 1)]
+    for child in (*getattr(node, "handlers", ()), *getattr(node, "cases", ())):
+        first_line = (
+            child.pattern.lineno if isinstance(child, ast.match_case) else child.lineno
+        )
+        ranges.append((first_line, get_first_line(child.body[0]) - 1))
+
+    return ranges
+
+
+class DjangoModelVisitor:
+    """
+    Extract the fields of Django models in a single walk over the statements of a models file along with its inherit directives.
+
+    Comments aren't part of the AST, so the directives from find_inherit_directives are merged in as the statements are walked in source order.
+    Directives on lines of statements that could have strings are reread from the tokens of those lines as the statements are reached.
+    Each directive belongs to the innermost class that it's within by line and that it's indented further than.
 
     Parameters
     ----------
     models_to_ignore : list[str]
         Model classes to ignore, obtained from the config file.
+
+    source : str, default=None
+        The text of the models file, without which inherit directives aren't added.
     """
 
     DJANGO_FIELD_TYPES = {
@@ -36,78 +260,256 @@ class DjangoModelVisitor(ast.NodeVisitor):
         "AutoField",
     }
 
-    def __init__(self, models_to_ignore: list[str] | None) -> None:
-        self.current_model: str | None = None
+    def __init__(
+        self,
+        models_to_ignore: list[str] | None,
+        source: str | None = None,
+    ) -> None:
         self.models_and_fields: dict[str, list[str]] = {}
         self.models_and_blank_fields: dict[str, list[str]] = {}
+        self.model_lines: dict[str, int] = {}
         self.models_to_ignore: set[str] = set(models_to_ignore or [])
+        self.source = source or ""
+        self.inherit_directives = find_inherit_directives(self.source)
+        self._directive_lines = list(self.inherit_directives)
+        self._next_directive = 0
+        self._source_lines: list[str] | None = None
 
-    # MARK: Visit Class
+    def visit(self, tree: ast.Module) -> None:
+        """
+        Walk the statements of a models file, recording the fields of each model.
 
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        Parameters
+        ----------
+        tree : ast.Module
+            The AST of the models file.
+        """
+        self._visit_statements(statements=tree.body, classes=[], end_line=sys.maxsize)
+
+    # MARK: Visit Statements
+
+    def _visit_statements(
+        self,
+        statements: list[ast.stmt],
+        classes: list[tuple[str | None, int]],
+        end_line: int,
+    ) -> None:
         """
-        Check class definitions, specifically those that inherit from other classes and not listed in ignore classes.
+        Walk a block of statements, adding the directives before each statement to the classes that they're within.
 
         Parameters
         ----------
-        node : ast.ClassDef
-            A class definition from Python AST (Abstract Syntax Tree).
-            It contains information about the class, such as its name, base classes, body, decorators, etc.
+        statements : list[ast.stmt]
+            The statements of the block.
+
+        classes : list[tuple[str | None, int]]
+            The name of each class and function that the block is within, or None for those that aren't models, along with its column.
+
+        end_line : int
+            The line of the first statement after the block, before which directives can still be within it.
+        """
+        for i, statement in enumerate(statements):
+            self._add_inherit_directives(
+                classes=classes, before_line=get_first_line(statement)
+            )
+            if self._next_directive < len(self._directive_lines):
+                for first_line, last_line in get_statement_lines(statement):
+                    self._reread_inherit_directives(
+                        first_line=first_line, last_line=last_line
+                    )
+
+            next_line = (
+                get_first_line(statements[i + 1])
+                if i + 1 < len(statements)
+                else end_line
+            )
+            if isinstance(
+                statement, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+            ):
+                self._visit_definition(
+                    definition=statement, classes=classes, end_line=next_line
+                )
+
+            elif (
+                classes
+                and classes[-1][0] is not None
+                and isinstance(statement, (ast.Assign, ast.AnnAssign))
+            ):
+                self._add_field(model=classes[-1][0], node=statement)
+
+            else:
+                self._visit_statements(
+                    statements=get_child_statements(statement),
+                    classes=classes,
+                    end_line=next_line,
+                )
+
+        self._add_inherit_directives(classes=classes, before_line=end_line)
+
+    def _visit_definition(
+        self,
+        definition: ast.ClassDef | ast.FunctionDef | ast.AsyncFunctionDef,
+        classes: list[tuple[str | None, int]],
+        end_line: int,
+    ) -> None:
         """
-        # Only process classes that inherit from something and are not ignored.
-        if node.bases and node.name not in self.models_to_ignore:
-            self.current_model = node.name
-            if self.current_model not in self.models_and_fields:
-                self.models_and_fields[self.current_model] = []
+        Walk the body of a class or function, adding it as a model if it's a class that's a model.
 
-            self.generic_visit(node)
+        Parameters
+        ----------
+        definition : ast.ClassDef | ast.FunctionDef | ast.AsyncFunctionDef
+            The definition of the class or function.
 
-        self.current_model = None
+        classes : list[tuple[str | None, int]]
+            The name of each class and function that the definition is within, or None for those that aren't models, along with its column.
 
-    # MARK: Visit Assign
+        end_line : int
+            The line of the first statement after the definition, before which directives can still be within it.
+        """
+        # Only classes that inherit from something and aren't ignored are models, with assignments within functions not being fields.
+        model = (
+            definition.name
+            if isinstance(definition, ast.ClassDef)
+            and definition.bases
+            and definition.name not in self.models_to_ignore
+            else None
+        )
+        if model is not None:
+            self.models_and_fields[model] = []
+            self.models_and_blank_fields[model] = []
+            self.model_lines[model] = definition.lineno
+
+        self._visit_statements(
+            statements=definition.body,
+            classes=[*classes, (model, definition.col_offset)],
+            end_line=end_line,
+        )
 
-    def visit_Assign(self, node: ast.Assign) -> None:
+    def _add_field(self, model: str, node: ast.Assign | ast.AnnAssign) -> None:
         """
-        Check assignment statements within a class.
+        Add the targets of an assignment within the body of a model as fields if it assigns a Django field.
+
+        Fields can be declared via an attribute of a module such as 'models.CharField()' or via a directly imported name such as 'CharField()'.
 
         Parameters
         ----------
-        node : ast.Assign
-            An assignment definition from Python AST (Abstract Syntax Tree).
-            It represents an assignment statement (e.g., x = 42).
+        model : str
+            The name of the model.
+
+        node : ast.Assign | ast.AnnAssign
+            The assignment.
         """
-        if not self.current_model:
+        value = node.value
+        if not isinstance(value, ast.Call):
             return
 
-        for target in node.targets:
-            if (
-                isinstance(target, ast.Name)
-                and not target.id.startswith("_")
-                and isinstance(node.value, ast.Call)
-                and isinstance(node.value.func, ast.Attribute)
-            ) and any(
-                field_type in node.value.func.attr
-                for field_type in self.DJANGO_FIELD_TYPES
-            ):
-                self.models_and_fields[self.current_model].append(target.id)
-                if any(
-                    kw.arg == "blank"
-                    and isinstance(kw.value, ast.Constant)
-                    and kw.value.value is True
-                    for kw in node.value.keywords
-                ):
-                    if self.current_model not in self.models_and_blank_fields:
-                        self.models_and_blank_fields[self.current_model] = []
+        if isinstance(value.func, ast.Attribute):
+            field_type = value.func.attr
+
+        elif isinstance(value.func, ast.Name):
+            field_type = value.func.id
+
+        else:
+            return
+
+        if not any(t in field_type for t in self.DJANGO_FIELD_TYPES):
+            return
+
+        is_blank = any(
+            kw.arg == "blank"
+            and isinstance(kw.value, ast.Constant)
+            and kw.value.value is True
+            for kw in value.keywords
+        )
+        targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+        for target in targets:
+            if isinstance(target, ast.Name) and not target.id.startswith("_"):
+                self.models_and_fields[model].append(target.id)
+                if is_blank:
+                    self.models_and_blank_fields[model].append(target.id)
+
+    def _add_inherit_directives(
+        self, classes: list[tuple[str | None, int]], before_line: int
+    ) -> None:
+        """
+        Add the inherit directives before a line to the innermost classes that they're indented further than.
+
+        Parameters
+        ----------
+        classes : list[tuple[str | None, int]]
+            The name of each class and function that the directives are within, or None for those that aren't models, along with its column.
+
+        before_line : int
+            The line before which directives are added.
+        """
+        lines = self._directive_lines
+        while (
+            self._next_directive < len(lines)
+            and lines[self._next_directive] < before_line
+        ):
+            directive = self.inherit_directives.get(lines[self._next_directive])
+            self._next_directive += 1
+            if directive is None:
+                continue
+
+            model = next(
+                (m for m, column in reversed(classes) if column < directive.column),
+                None,
+            )
+            if model is not None:
+                self.models_and_fields[model].append(directive.field)
+                if directive.blank:
+                    self.models_and_blank_fields[model].append(directive.field)
+
+    def _reread_inherit_directives(self, first_line: int, last_line: int) -> None:
+        """
+        Replace the inherit directives of lines of a statement with those of the comments of the lines' tokens.
+
+        Parameters
+        ----------
+        first_line : int
+            The first line of the statement, starting at 1.
+
+        last_line : int
+            The last line of the statement that could have strings.
+        """
+        lines = self._directive_lines
+        start = bisect.bisect_left(lines, first_line, lo=self._next_directive)
+        end = bisect.bisect_right(lines, last_line, lo=start)
+        if start == end:
+            return
+
+        if self._source_lines is None:
+            self._source_lines = io.StringIO(self.source, newline="").readlines()
+
+        try:
+            directives = tokenize_inherit_directives(
+                source="".join(self._source_lines[first_line - 1 : last_line]),
+                first_line=first_line,
+            )
+
+        except (SyntaxError, tokenize.TokenError):
+            # Lines that a statement shares with its blocks can't be tokenized on their own, so the whole file is instead.
+            directives = tokenize_inherit_directives(source=self.source)
+            start, end = self._next_directive, len(lines)
 
-                    self.models_and_blank_fields[self.current_model].append(target.id)
+        for line in lines[start:end]:
+            self.inherit_directives.pop(line, None)
+
+        for directive in directives:
+            if directive.line >= lines[start]:
+                self.inherit_directives[directive.line] = directive
 
 
 # MARK: Extract Fields
 
 
 def extract_model_fields(
-    models_file: str, models_to_ignore: list[str] | None
-) -> tuple[dict[str, list[Any]], dict[str, list[Any]], dict[str, list[Any]]]:
+    models_file: str,
+    models_to_ignore: list[str] | None,
+    source: str | None = None,
+    timeout: float | None = None,
+) -> dict[str, DjangoModel]:
     """
     Extract fields from Django models file.
 
@@ -119,87 +521,57 @@ def extract_model_fields(
     models_to_ignore : list[str]
         Model classes to ignore, obtained from the config file.
 
+    source : str, default=None
+        The text of the models file if it has already been read.
+
+    timeout : float, default=None
+        The number of seconds that extracting the fields can take, with no limit if not passed.
+
     Returns
     -------
-    tuple(dict[str, list[Any]], dict[str, list[Any]], dict[str, list[Any]])
-        The fields from the models file extracted into dictionaries for future processing.
+    dict[str, DjangoModel]
+        The models from the models file with their ordered and blank fields for future processing.
+
+    Raises
+    ------
+    ParseTimeoutError
+        If extracting the fields takes longer than the timeout.
+
+    Notes
+    -----
+    The file is read once, parsed into an AST and walked once, with the inherit directives of its comments being merged in as it's walked.
+    Fields and inherited fields are ordered as they're declared, and blank fields are those of either that are marked 'blank=True'.
     """
-    with open(models_file, "r", encoding="utf-8") as f:
-        content = f.read().strip()
-        # Skip any empty lines at the beginning.
-        while content.startswith("\n"):
-            content = content[1:]
+    deadline = Deadline(models_file, timeout) if timeout is not None else None
+    if source is None:
+        with open(models_file, "r", encoding="utf-8") as f:
+            source = f.read()
 
     try:
-        tree = ast.parse(content)
+        tree = ast.parse(source)
 
     except SyntaxError as e:
         raise SyntaxError(
             f"Failed to parse {models_file}. Make sure it's a valid Python file. Error: {str(e)}"
         ) from e
 
-    visitor = DjangoModelVisitor(models_to_ignore=models_to_ignore)
-    visitor.visit(tree)
-
-    # Derive texts for all model classes.
-    MODEL_TEXT_REGEX = re.compile(
-        r"^(class\s+(\w+).+?)(?=\nclass|\Z)", re.MULTILINE | re.DOTALL
-    )
-    model_lines = {
-        match.group(2): match.group(1).strip()
-        for match in MODEL_TEXT_REGEX.finditer(content)
-    }
+    if deadline is not None:
+        deadline.check()
 
-    # Derive fields inherited from other classes via comments.
-    INHERIT_FIELD_COMMENT_REGEX = re.compile(
-        r"#.*?(?:tsbc|ts-backend-check): .*inherit\s+(\w+)\b(?!\s*\(blank=True\))"
-    )
-    INHERIT_BLANK_FIELD_COMMENT_REGEX = re.compile(
-        r"#\s*?(?:tsbc|ts-backend-check): .*inherit\s+(\w+)\s+\((blank=True)\)"
-    )
-
-    model_inherited_fields = {}
-    for k, v in model_lines.items():
-        model_inherited_fields[k] = {
-            "inherited_fields": INHERIT_FIELD_COMMENT_REGEX.findall(v)
-        }
-        model_inherited_fields[k]["inherited_blank_fields"] = [
-            match.group(1).strip()
-            for match in INHERIT_BLANK_FIELD_COMMENT_REGEX.finditer(v)
-        ]
-
-    # Derive all fields ordered.
-    ALL_MODEL_FIELDS_ORDERED_REGEX = re.compile(
-        r"(?:^\s*(?!\s*_)(\w+)\s*=\s*\w+)"  # field (not including private)
-        r"|"
-        r"(?:#\s*(?:tsbc|ts-backend-check): .*inherit\s+(\w+)(?:\s*\((blank=True)\))?)",  # inherited
-        re.MULTILINE,
-    )
-    models_all_fields_and_blank_fields_ordered = {
-        m: [
-            f[0] if f[0] != "" else f[1]
-            for f in ALL_MODEL_FIELDS_ORDERED_REGEX.findall(model_lines[m])
-        ]
-        for m in set(
-            list(visitor.models_and_fields.keys())
-            + list(visitor.models_and_blank_fields.keys())
+    visitor = DjangoModelVisitor(models_to_ignore=models_to_ignore, source=source)
+    visitor.visit(tree)
+    if deadline is not None:
+        deadline.check()
+
+    # Names are interned as they repeat across models.
+    return {
+        sys.intern(m): DjangoModel(
+            name=sys.intern(m),
+            fields=tuple(sys.intern(f) for f in fields),
+            blank_fields=tuple(
+                sys.intern(f) for f in visitor.models_and_blank_fields[m]
+            ),
+            line=visitor.model_lines[m],
         )
+        for m, fields in visitor.models_and_fields.items()
     }
-
-    # Combine all fields for the model.
-    models_all_fields = {}
-    models_all_blank_fields = {}
-    for m in list(models_all_fields_and_blank_fields_ordered.keys()):
-        models_all_fields[m] = model_inherited_fields.get(m, {}).get(
-            "inherited_fields", []
-        ) + visitor.models_and_fields.get(m, [])
-
-        models_all_blank_fields[m] = model_inherited_fields.get(m, {}).get(
-            "inherited_blank_fields", []
-        ) + visitor.models_and_blank_fields.get(m, [])
-
-    return (
-        models_all_fields_and_blank_fields_ordered,
-        models_all_fields,
-        models_all_blank_fields,
-    )
@@ -4,35 +4,655 @@ Module for parsing TypeScript interfaces and types.
 """
 
 import re
-from dataclasses import dataclass
+import sys
+from array import array
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, NamedTuple
 
+from ts_backend_check.utils import (
+    SCAN_CHUNK_SIZE,
+    Deadline,
+    LineCounter,
+    map_file,
+    release_mapped_pages,
+)
 
-@dataclass
+# Increment when changes to the parser change its output so that cached artifacts are invalidated.
+PARSER_VERSION = 7
+
+# Tokens are searched for within chunks plus this many bytes so that tokens at the end of a chunk aren't cut off.
+TOKEN_LOOKAHEAD = 1 << 12
+# Deadlines are checked each time the scan has moved on by this many bytes.
+DEADLINE_CHECK_INTERVAL = 1 << 16
+# Types that are nested more deeply than this are skipped rather than parsed so that parsing can't run out of stack.
+MAX_TYPE_DEPTH = 64
+# Files are split into segments that are parsed in parallel only if each segment would be at least this large.
+MIN_SEGMENT_SIZE = 1 << 21
+
+# MARK: Tokens
+
+# Names also match non-ASCII UTF-8 bytes as byte patterns only treat ASCII characters as word characters.
+NAME_PATTERN = rb"[\w\x80-\xff]+"
+# Tokens that can be longer than TOKEN_LOOKAHEAD match even when they're cut off so that they're matched again in full.
+LINE_COMMENT_PATTERN = rb"(?P<line_comment>//[^\n]*)"
+BLOCK_COMMENT_PATTERN = rb"(?P<block_comment>/\*(?:[\s\S]*?\*/|[\s\S]*))"
+STRING_PATTERN = rb"(?P<string>'(?:[^'\\\n]|\\[\s\S])*'?|\"(?:[^\"\\\n]|\\[\s\S])*\"?)"
+TEMPLATE_PATTERN = rb"(?P<template>`)"
+OPEN_PATTERN = rb"(?P<open>[{(\[])"
+CLOSE_PATTERN = rb"(?P<close>[})\]])"
+SEPARATOR_PATTERN = rb"(?P<separator>[;,\n])"
+# Simple types and the separator, line comment and newline after them are part of the property so that most properties are a single token.
+# Whitespace around the optional marker is matched possessively as otherwise runs of whitespace without a colon are backtracked over quadratically.
+PROPERTY_PATTERN = (
+    rb"(?P<property>(?:readonly\s+)?(?P<property_name>"
+    + NAME_PATTERN
+    + rb")\s*+(?:(?P<optional>\?)\s*+)?:[^;,\n{}()\[\]'\"`/]*"
+    rb"(?P<property_end>[;,][ \t\r]*(?P<property_comment>//[^\n]*)?\n?|\n)?)"
+)
+QUOTED_PROPERTY_PATTERN = (
+    rb"(?P<quoted_property>(?P<quote>['\"])(?P<quoted_name>"
+    + NAME_PATTERN
+    + rb")(?P=quote)\s*+(?:(?P<quoted_optional>\?)\s*+)?:)"
+)
+COMMENT_AND_STRING_FIRST_BYTES = rb"/'\"`"
+COMMENT_AND_STRING_PREFIXES = (b"/", b"'", b'"', b"`")
+COMMENT_AND_STRING_PATTERNS = (
+    LINE_COMMENT_PATTERN,
+    BLOCK_COMMENT_PATTERN,
+    STRING_PATTERN,
+    TEMPLATE_PATTERN,
+)
+
+
+def compile_token_pattern(
+    first_bytes: bytes, patterns: list[bytes]
+) -> re.Pattern[bytes]:
+    """
+    Compile the alternatives of a scanner pattern behind a lookahead of the bytes that they start with.
+
+    The lookahead lets the regular expression engine skip quickly over bytes that can't start a token rather than trying every alternative at each of them.
+
+    Parameters
+    ----------
+    first_bytes : bytes
+        All bytes that the alternatives can start with, escaped for use within a character set.
+
+    patterns : list[bytes]
+        The alternatives of the pattern.
+
+    Returns
+    -------
+    re.Pattern[bytes]
+        The compiled pattern.
+    """
+    return re.compile(rb"(?=[" + first_bytes + rb"])(?:" + b"|".join(patterns) + rb")")
+
+
+# Exports are only matched when they re-export bindings as declarations are found via their own keywords.
+RE_EXPORT_PATTERN = rb"export\s*(?:type\s*)?[{*]"
+# Outside of interfaces only the keywords of declarations and the tokens that could hide them are matched.
+CODE_TOKEN_PREFIXES: tuple[bytes | re.Pattern[bytes], ...] = (
+    *COMMENT_AND_STRING_PREFIXES,
+    b"interface",
+    b"type",
+    b"import",
+    re.compile(RE_EXPORT_PATTERN),
+)
+CODE_PATTERN = compile_token_pattern(
+    COMMENT_AND_STRING_FIRST_BYTES + b"ite",
+    [
+        *COMMENT_AND_STRING_PATTERNS,
+        rb"(?P<interface>\binterface\b)",
+        rb"(?P<type>\btype\b)",
+        rb"(?P<import>\bimport\b)",
+        rb"(?P<export>\b(?=" + RE_EXPORT_PATTERN + rb")export)",
+    ],
+)
+HEADER_PATTERN = re.compile(
+    b"|".join(
+        [
+            *COMMENT_AND_STRING_PATTERNS,
+            rb"(?P<name>" + NAME_PATTERN + rb"(?:\s*\.\s*" + NAME_PATTERN + rb")*)",
+            rb"(?P<arrow>=>)",
+            rb"(?P<punctuation>[<>{}()\[\],;&|=*])",
+        ]
+    )
+)
+# Members are where properties can be declared, which is at the start of the body and after separators.
+MEMBER_PATTERN = re.compile(
+    b"|".join(
+        [
+            LINE_COMMENT_PATTERN,
+            BLOCK_COMMENT_PATTERN,
+            QUOTED_PROPERTY_PATTERN,
+            STRING_PATTERN,
+            TEMPLATE_PATTERN,
+            PROPERTY_PATTERN,
+            OPEN_PATTERN,
+            CLOSE_PATTERN,
+            SEPARATOR_PATTERN,
+            rb"(?P<other>\S)",
+        ]
+    )
+)
+# Types are skipped over other than the tokens that nest and those that end the member.
+TYPE_PATTERN = compile_token_pattern(
+    COMMENT_AND_STRING_FIRST_BYTES + rb"{}()\[\];,\n",
+    [*COMMENT_AND_STRING_PATTERNS, OPEN_PATTERN, CLOSE_PATTERN, SEPARATOR_PATTERN],
+)
+# Braced blocks whose contents are skipped only need their braces and the tokens that could hide them to be matched.
+BRACE_PATTERN = compile_token_pattern(
+    COMMENT_AND_STRING_FIRST_BYTES + b"{}",
+    [*COMMENT_AND_STRING_PATTERNS, rb"(?P<open>{)", rb"(?P<close>})"],
+)
+# Files are split where declarations start lines, which are checked to be outside of comments and strings with braces being counted between them.
+SPLIT_PATTERN = re.compile(b"|".join(COMMENT_AND_STRING_PATTERNS))
+SPLIT_POINT_PATTERN = re.compile(rb"\n(?=(?:export|declare|interface|type|import)\b)")
+TEMPLATE_TEXT_PATTERN = re.compile(rb"(?:[^`\\$]|\\[\s\S]|\$(?!\{))*(?P<end>`|\$\{)?")
+# The changes in the depth of brackets of the tokens of members and types.
+BRACKET_DEPTH_CHANGES = {"open": 1, "close": -1}
+IGNORE_PATTERN = re.compile(
+    rb"(?:tsbc|ts-backend-check): ignore\s+(" + NAME_PATTERN + rb")"
+)
+IGNORE_PROPERTY_PATTERN = re.compile(
+    rb"//\s*ts-backend-check:\s*ignore\s+(" + NAME_PATTERN + rb")"
+)
+
+
+class SourcePosition(NamedTuple):
+    """
+    The position of a name within a file.
+
+    Attributes
+    ----------
+    offset : int
+        The offset of the first byte of the name within the UTF-8 encoded file.
+
+    line : int
+        The line of the name, starting at 1.
+
+    column : int
+        The column of the first character of the name in characters, starting at 1.
+    """
+
+    offset: int
+    line: int
+    column: int
+
+
+@dataclass(frozen=True, slots=True)
 class TypeScriptInterface:
     """
     Represents a TypeScript interface with its properties and parent interfaces.
+
+    Properties are kept as ordered tuples for order checks and as frozensets for membership checks.
+    The positions of the name of the interface and of each property are kept so that errors can be located.
+    Property positions are flattened into a sequence of the offset, line and column of each property as one tuple per property would take up more memory than the rest of the interface.
+    """
+
+    name: str
+    properties: tuple[str, ...]
+    optional_properties: tuple[str, ...]
+    parents: tuple[str, ...]
+    position: SourcePosition | None = field(default=None, compare=False)
+    property_positions: Sequence[int] = field(default=(), compare=False)
+    property_set: frozenset[str] = field(init=False, repr=False, compare=False)
+    optional_property_set: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """
+        Derive the membership sets from the ordered properties.
+        """
+        object.__setattr__(self, "property_set", frozenset(self.properties))
+        object.__setattr__(
+            self, "optional_property_set", frozenset(self.optional_properties)
+        )
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """
+        Pickle interfaces without their membership sets, which are derived again when they're unpickled, so that results of worker processes are compact.
+
+        Returns
+        -------
+        tuple[Any, ...]
+            The class and the arguments that recreate the interface.
+        """
+        return (
+            TypeScriptInterface,
+            (
+                self.name,
+                self.properties,
+                self.optional_properties,
+                self.parents,
+                self.position,
+                self.property_positions,
+            ),
+        )
+
+    def get_property_position(self, property_name: str) -> SourcePosition | None:
+        """
+        Get the position of the first declaration of a property.
+
+        Parameters
+        ----------
+        property_name : str
+            The name of the property.
+
+        Returns
+        -------
+        SourcePosition | None
+            The position of the property, or None if it isn't declared or positions weren't recorded.
+        """
+        if property_name not in self.property_set or not self.property_positions:
+            return None
+
+        i = 3 * self.properties.index(property_name)
+
+        return SourcePosition(*self.property_positions[i : i + 3])
+
+
+# MARK: Type Expressions
+
+
+@dataclass(frozen=True, slots=True)
+class TypeReference:
+    """
+    A reference to a named type, such as an interface, a type alias, a type parameter or a utility type.
+
+    Attributes
+    ----------
+    name : str
+        The name of the type, including any namespaces that qualify it.
+
+    arguments : tuple[TypeExpression, ...], default=()
+        The type arguments that the type is given.
+    """
+
+    name: str
+    arguments: tuple["TypeExpression", ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class IntersectionType:
+    """
+    An intersection of types that are joined with '&'.
+
+    Attributes
+    ----------
+    types : tuple[TypeExpression, ...]
+        The types of the intersection.
+    """
+
+    types: tuple["TypeExpression", ...]
+
+
+@dataclass(frozen=True, slots=True)
+class UnionType:
+    """
+    A union of types that are joined with '|'.
+
+    Attributes
+    ----------
+    types : tuple[TypeExpression, ...]
+        The types of the union.
+    """
+
+    types: tuple["TypeExpression", ...]
+
+
+@dataclass(frozen=True, slots=True)
+class StringLiteralType:
+    """
+    A string literal type, such as the keys that are passed to Pick and Omit.
+
+    Attributes
+    ----------
+    value : str
+        The value of the string without its quotes.
+    """
+
+    value: str
+
+
+@dataclass(frozen=True, slots=True)
+class UnsupportedType:
+    """
+    A type that isn't evaluated, such as primitives, arrays, functions and conditional types.
+    """
+
+
+UNSUPPORTED_TYPE = UnsupportedType()
+
+# Object literal types are parsed as anonymous interfaces.
+TypeExpression = (
+    TypeReference
+    | IntersectionType
+    | UnionType
+    | StringLiteralType
+    | TypeScriptInterface
+    | UnsupportedType
+)
+
+# Operators that are followed by a type but don't produce an object type from it.
+TYPE_OPERATORS = frozenset({"keyof", "typeof", "unique", "infer", "readonly"})
+
+
+@dataclass(frozen=True, slots=True)
+class TypeScriptTypeAlias:
+    """
+    Represents a TypeScript type alias with the unevaluated expression of its type.
+
+    Attributes
+    ----------
+    name : str
+        The name of the type alias.
+
+    parameters : tuple[str, ...]
+        The names of the type parameters of the type alias.
+
+    type : TypeExpression
+        The type that the type alias is for.
+
+    position : SourcePosition | None, default=None
+        The position of the name of the type alias.
+    """
+
+    name: str
+    parameters: tuple[str, ...]
+    type: TypeExpression
+    position: SourcePosition | None = field(default=None, compare=False)
+
+
+class TypeScriptImport(NamedTuple):
+    """
+    A binding that a TypeScript file imports from another module or re-exports from it.
+
+    Attributes
+    ----------
+    name : str
+        The local name of an imported binding or the exported name of a re-exported binding, which is '*' for the bindings of 'export * from'.
+
+    imported_name : str
+        The name of the binding within the module, which is '*' for namespaces and 'default' for default imports.
+
+    module : str
+        The specifier of the module.
+
+    is_export : bool
+        Whether the binding is re-exported rather than imported.
+    """
+
+    name: str
+    imported_name: str
+    module: str
+    is_export: bool
+
+
+class UnparsedInterface(NamedTuple):
+    """
+    An interface whose body was skipped by a lazy parse, which is parsed via parse_ts_interfaces if it's needed.
+
+    Attributes
+    ----------
+    name : str
+        The name of the interface.
+
+    parents : tuple[str, ...]
+        The names of the interfaces that the interface extends.
+
+    position : SourcePosition | None
+        The position of the name of the interface.
+
+    body_position : SourcePosition
+        The position after the opening brace of the body of the interface.
     """
 
     name: str
-    properties: list[str]
-    optional_properties: list[str]
-    parents: list[str]
+    parents: tuple[str, ...]
+    position: SourcePosition | None
+    body_position: SourcePosition
+
+
+class TypeScriptFile(NamedTuple):
+    """
+    The declarations of a parsed TypeScript file.
+
+    Attributes
+    ----------
+    interfaces : dict[str, TypeScriptInterface]
+        The interfaces of the file.
+
+    type_aliases : dict[str, TypeScriptTypeAlias]
+        The type aliases of the file, which are evaluated once the declarations of all files are known.
+
+    ignored_fields : frozenset[str]
+        The fields marked as ignored within the file.
+
+    imports : tuple[TypeScriptImport, ...], default=()
+        The bindings that the file imports or re-exports from other modules.
+
+    unparsed_interfaces : tuple[UnparsedInterface, ...], default=()
+        The interfaces whose bodies were skipped by a lazy parse in the order they're declared.
+    """
+
+    interfaces: dict[str, TypeScriptInterface]
+    type_aliases: dict[str, TypeScriptTypeAlias]
+    ignored_fields: frozenset[str]
+    imports: tuple[TypeScriptImport, ...] = ()
+    unparsed_interfaces: tuple[UnparsedInterface, ...] = ()
+
+
+def get_nesting_depths(
+    punctuation: bytes, angle_depth: int, brace_depth: int
+) -> tuple[int, int]:
+    """
+    Update the depths of the angle brackets and braces that a header is nested within for a punctuation token.
+
+    Parameters
+    ----------
+    punctuation : bytes
+        The punctuation, which is empty for tokens that aren't punctuation.
+
+    angle_depth : int
+        The number of open angle brackets.
+
+    brace_depth : int
+        The number of open braces.
+
+    Returns
+    -------
+    tuple[int, int]
+        The depths of angle brackets and braces after the punctuation, neither of which drops below 0.
+    """
+    if punctuation == b"<":
+        return angle_depth + 1, brace_depth
+
+    if punctuation == b">":
+        return max(angle_depth - 1, 0), brace_depth
+
+    if punctuation == b"{":
+        return angle_depth, brace_depth + 1
+
+    if punctuation == b"}":
+        return angle_depth, max(brace_depth - 1, 0)
+
+    return angle_depth, brace_depth
+
+
+def read_interface_parent(
+    token: re.Match[bytes], parents: list[str], expect_parent: bool
+) -> bool:
+    """
+    Read a token of the header of an interface that isn't nested within its generic parameters, adding the parent that it names if one is expected.
+
+    Parameters
+    ----------
+    token : re.Match[bytes]
+        The token of the header.
+
+    parents : list[str]
+        The names of the parents of the interface so far.
+
+    expect_parent : bool
+        Whether the token follows 'extends' or a comma between parents.
+
+    Returns
+    -------
+    bool
+        Whether the next name is a parent.
+    """
+    if token.lastgroup == "punctuation":
+        return expect_parent or token[0] == b","
+
+    if token.lastgroup != "name":
+        return expect_parent
+
+    if token[0] == b"extends":
+        return True
+
+    if expect_parent:
+        parents.append(sys.intern(re.sub(rb"\s+", b"", token[0]).decode("utf-8")))
+
+    return False
+
+
+def read_import_punctuation(
+    text: str, bindings: list[list[str]], in_braces: bool
+) -> bool:
+    """
+    Read a punctuation mark of the bindings of an import declaration or of a re-export.
+
+    Parameters
+    ----------
+    text : str
+        The punctuation mark, which is a brace, an asterisk or a comma.
+
+    bindings : list[list[str]]
+        The pairs of the imported name and the local name of the bindings read so far.
+
+    in_braces : bool
+        Whether the punctuation mark is within the braces of named bindings.
+
+    Returns
+    -------
+    bool
+        Whether the tokens after the punctuation mark are within the braces of named bindings.
+    """
+    if text == "*":
+        bindings.append(["*", "*"])
+
+    return text == "{" or (in_braces and text != "}")
+
+
+def read_import_binding(
+    text: str,
+    bindings: list[list[str]],
+    in_braces: bool,
+    expect_alias: bool,
+    type_modifier: bool,
+) -> tuple[bool, bool]:
+    """
+    Read a name of the bindings of an import declaration or of a re-export into its bindings.
+
+    Parameters
+    ----------
+    text : str
+        The name.
+
+    bindings : list[list[str]]
+        The pairs of the imported name and the local name of the bindings read so far.
+
+    in_braces : bool
+        Whether the name is within the braces of named bindings.
+
+    expect_alias : bool
+        Whether the name follows the as keyword and is the local name of the last binding.
+
+    type_modifier : bool
+        Whether the name follows the type keyword that marks a named binding as type-only.
+
+    Returns
+    -------
+    tuple[bool, bool]
+        Whether the next name is expected to be a local name and whether it follows the type keyword of a named binding.
+    """
+    if text == "as":
+        return True, False
+
+    if expect_alias and bindings:
+        bindings[-1][1] = text
+        return False, type_modifier
+
+    if in_braces:
+        # Bindings can be marked as type-only with the type keyword before them.
+        if type_modifier:
+            bindings[-1] = [text, text]
+
+        else:
+            bindings.append([text, text])
+
+        return expect_alias, text == "type" and not type_modifier
+
+    if text != "type":
+        # Type-only imports and exports are otherwise followed by the same bindings.
+        bindings.append(["default", text])
+
+    return expect_alias, type_modifier
+
+
+# MARK: Parser
 
 
 class TypeScriptParser:
     """
     Parser for TypeScript interface files.
 
+    Files are read once by a scanner that tracks comments, strings, template literals and brackets so that interfaces, their properties, optionality and parents, type aliases, imports and ignore comments are all found in a single pass.
+    Only the tokens that matter in the current context are matched, with the text between them being skipped by the regular expression engine.
+    Files are scanned as bytes in chunks so that memory-mapped files can be parsed in bounded memory.
+    Lazy parses only record the names, parents and spans of interfaces and skip over their bodies, which are parsed via parse_interface_bodies once it's known which interfaces are needed.
+
     Parameters
     ----------
-    concatenated_types_file : str
-        The file path for the TypeScript file to parse.
-    """
+    concatenated_types_file : str | bytes | Any
+        The text of the TypeScript file to parse, or a bytes-like buffer of it such as a memory-mapped file.
 
-    def __init__(self, concatenated_types_file: str) -> None:
-        self.content = concatenated_types_file
+    lazy : bool, default=False
+        Whether the bodies of interfaces are skipped and recorded as unparsed interfaces.
+
+    deadline : Deadline, default=None
+        The time by which parsing has to finish, which is checked as the content is scanned.
+    """
 
-    # MARK: Parse Interfaces
+    def __init__(
+        self,
+        concatenated_types_file: str | bytes | Any,
+        lazy: bool = False,
+        deadline: Deadline | None = None,
+    ) -> None:
+        self.content = (
+            concatenated_types_file.encode("utf-8")
+            if isinstance(concatenated_types_file, str)
+            else concatenated_types_file
+        )
+        self.lazy = lazy
+        self.deadline = deadline
+        self._next_deadline_check = (
+            DEADLINE_CHECK_INTERVAL if deadline is not None else sys.maxsize
+        )
+        self._type_depth = 0
+        self._line_counter = LineCounter(self.content)
+        self._released = 0
+        self._prefix_positions = [-1] * len(CODE_TOKEN_PREFIXES)
+        self._interfaces: dict[str, TypeScriptInterface] = {}
+        self._type_aliases: dict[str, TypeScriptTypeAlias] = {}
+        self._imports: list[TypeScriptImport] = []
+        self._unparsed_interfaces: list[UnparsedInterface] = []
+        self._ignored_fields: set[str] = set()
+        self._scanned = False
 
     def parse_interfaces(self) -> dict[str, TypeScriptInterface]:
         """
@@ -43,89 +663,1594 @@ class TypeScriptParser:
         dict[str, TypeScriptInterface]
             The interface parsed into a dictionary for future processing.
         """
-        interfaces: dict[str, TypeScriptInterface] = {}
-        interface_pattern = (
-            r"(?:export\s+|declare\s+)?interface\s+(\w+)"
-            r"(?:\s+extends\s+([^{]+))?\s*{([\s\S]*?)}"
+        self._scan()
+
+        return self._interfaces
+
+    def parse_file(self) -> TypeScriptFile:
+        """
+        Parse all declarations of the file.
+
+        Returns
+        -------
+        TypeScriptFile
+            The interfaces, type aliases, ignored fields and imports of the file, with the interfaces being unparsed for lazy parses.
+        """
+        self._scan()
+
+        return TypeScriptFile(
+            interfaces=self._interfaces,
+            type_aliases=self._type_aliases,
+            ignored_fields=frozenset(self._ignored_fields),
+            imports=tuple(self._imports),
+            unparsed_interfaces=tuple(self._unparsed_interfaces),
         )
 
-        for match in re.finditer(interface_pattern, self.content):
-            name = match.group(1)
-            parents = (
-                [p.strip() for p in match.group(2).split(",")] if match.group(2) else []
-            )
-            properties = self._extract_properties(match.group(3))
-            optional_properties = self._extract_optional_properties(match.group(3))
+    def parse_interface_bodies(
+        self, unparsed_interfaces: Iterable[UnparsedInterface]
+    ) -> dict[str, TypeScriptInterface]:
+        """
+        Parse the bodies of interfaces that a lazy parse skipped, reading only their spans of the file.
+
+        Parameters
+        ----------
+        unparsed_interfaces : Iterable[UnparsedInterface]
+            The interfaces from the lazy parse of the same content.
 
-            interfaces[name] = TypeScriptInterface(
-                name, properties, optional_properties, parents
+        Returns
+        -------
+        dict[str, TypeScriptInterface]
+            The parsed interfaces in the order they're declared.
+        """
+        interfaces: dict[str, TypeScriptInterface] = {}
+        for unparsed in sorted(unparsed_interfaces, key=lambda u: u.body_position):
+            self._seek(unparsed.body_position)
+            interfaces[unparsed.name], _ = self._parse_object_type(
+                name=unparsed.name,
+                position=unparsed.position,
+                parents=list(unparsed.parents),
+                pos=unparsed.body_position.offset,
             )
 
         return interfaces
 
-    def get_ignored_fields(self) -> set[str]:
+    def find_split_points(self, n_segments: int) -> list[SourcePosition]:
         """
-        Extract fields marked as ignored in comments.
+        Find where to split the file into segments of about equal size that can be parsed on their own via parse_segment.
+
+        Segments start at lines that start with a declaration and that are outside of braces, comments and strings.
+        Only comments and strings are matched by the pre-scan, with the braces between them being counted, so that it's quicker than a parse.
+        Fewer segments are returned if there aren't enough such lines.
+
+        Parameters
+        ----------
+        n_segments : int
+            The number of segments to split the file into.
 
         Returns
         -------
-        set[str]
-            The field names that are marked with a ts-backend-check ignore identifier.
+        list[SourcePosition]
+            The starts of all segments other than the first.
         """
-        ignore_pattern = r"//.*?(?:tsbc|ts-backend-check): ignore\s+(\w+)"
-        return set(re.findall(ignore_pattern, self.content))
+        content = self.content
+        split_points: list[SourcePosition] = []
+        # The next position of each prefix of comments and strings is kept until it's been passed as in _next_code_token.
+        prefix_positions = [-1] * len(COMMENT_AND_STRING_PREFIXES)
+        pos = depth = 0
+        for segment in range(1, n_segments):
+            search_pos = max(pos, len(content) * segment // n_segments)
+            while (
+                split_point := SPLIT_POINT_PATTERN.search(content, search_pos)
+            ) is not None:
+                split_offset = split_point.end()
+                pos, depth = self._scan_braces(
+                    pos=pos,
+                    end=split_offset,
+                    depth=depth,
+                    prefix_positions=prefix_positions,
+                )
+                if pos == split_offset and depth == 0:
+                    split_points.append(self._get_position(split_offset))
+                    break
+
+                search_pos = max(pos, split_offset)
 
-    # MARK: Extract Properties
+        return split_points
 
-    @staticmethod
-    def _extract_properties(interface_body: str) -> list[str]:
+    def _scan_braces(
+        self, pos: int, end: int, depth: int, prefix_positions: list[int]
+    ) -> tuple[int, int]:
         """
-        Extract both real properties and 'ignored' comment backend fields from interface bodies.
+        Count the braces up to an offset that are outside of comments and strings for the pre-scan of find_split_points.
 
         Parameters
         ----------
-        interface_body : str
-            A string representation of the interface body of the model.
+        pos : int
+            The offset to scan from, which is outside of comments and strings.
+
+        end : int
+            The offset to scan up to.
+
+        depth : int
+            The depth of the braces that the offset to scan from is within.
+
+        prefix_positions : list[int]
+            The next position of each prefix of comments and strings, which are updated as they're passed.
 
         Returns
         -------
-        list[str]
-            The property names from the model interface body.
+        tuple[int, int]
+            The offset that the scan stopped at, which is after the end if it's within a comment or string, and the depth of the braces there.
         """
-        combined_pattern = (
-            r"^\s*(?:"
-            r"(?:readonly\s+)?(\w+)\s*\??\s*:|"  # standard/readonly properties
-            r"//\s*ts-backend-check:\s*ignore\s+(\w+)"  # ts-backend-check ignore comment properties
-            r")"
-        )
+        content = self.content
+        while pos < end:
+            if pos >= self._next_deadline_check:
+                self._check_deadline(pos)
 
-        properties: list[str] = []
-        for match in re.finditer(combined_pattern, interface_body, flags=re.MULTILINE):
-            if field_name := match.group(1) or match.group(2):
-                properties.append(field_name)
+            if pos - self._released >= SCAN_CHUNK_SIZE:
+                self._release_scanned(pos)
+
+            for i, prefix in enumerate(COMMENT_AND_STRING_PREFIXES):
+                if prefix_positions[i] < pos:
+                    found = content.find(prefix, pos)
+                    prefix_positions[i] = len(content) if found == -1 else found
 
-        return properties
+            token_start = min(*prefix_positions, end)
+            depth = max(depth + self._count_braces(pos, token_start), 0)
+            pos = self._skip_split_token(token_start=token_start, end=end)
 
-    @staticmethod
-    def _extract_optional_properties(interface_body: str) -> list[str]:
+        return pos, depth
+
+    def _skip_split_token(self, token_start: int, end: int) -> int:
         """
-        Extract all optional properties from interface bodies.
+        Skip over a comment or string that's found by the pre-scan of find_split_points.
 
         Parameters
         ----------
-        interface_body : str
-            A string representation of the interface body of the model.
+        token_start : int
+            The offset of the prefix of the comment or string.
+
+        end : int
+            The offset that's being scanned up to, which is returned if it's before the comment or string.
 
         Returns
         -------
-        list[str]
-            The optional property names from the model interface body.
+        int
+            The offset after the comment or string, or after the prefix if it doesn't start one.
         """
-        pattern = r"^\s*(?:readonly\s+)?(\w+)\s*\?:"  # optional properties
+        if token_start == end:
+            return end
 
-        optional_properties: list[str] = []
-        for match in re.finditer(pattern, interface_body, flags=re.MULTILINE):
-            if field_name := match.group(1):
-                optional_properties.append(field_name)
+        if (token := SPLIT_PATTERN.match(self.content, token_start)) is None:
+            return token_start + 1
+
+        if token.lastgroup == "template":
+            return self._skip_template(token.end())
+
+        # Ignore comments don't need to be recorded by the pre-scan.
+        return token.end()
+
+    def parse_segment(self, start: SourcePosition, end: int) -> TypeScriptFile | None:
+        """
+        Parse the declarations that start within a segment of the file.
+
+        Parameters
+        ----------
+        start : SourcePosition
+            The start of the segment, which is the start of the file or a split point from find_split_points.
+
+        end : int
+            The offset of the end of the segment.
+
+        Returns
+        -------
+        TypeScriptFile | None
+            The declarations of the segment, or None if a declaration or comment runs past its end so that the segment can't be parsed on its own.
+        """
+        self._seek(start)
+        pos = start.offset
+        while (token := self._next_code_token(pos)) is not None and token.start() < end:
+            pos = self._parse_code_token(token)
+
+        self._scanned = True
+
+        return self.parse_file() if pos <= end else None
+
+    def parse_type_aliases(self) -> dict[str, TypeScriptTypeAlias]:
+        """
+        Parse TypeScript type aliases from the file.
+
+        Returns
+        -------
+        dict[str, TypeScriptTypeAlias]
+            The type aliases with the unevaluated expressions of their types.
+        """
+        self._scan()
+
+        return self._type_aliases
 
-        return optional_properties
+    def get_ignored_fields(self) -> set[str]:
+        """
+        Extract fields marked as ignored in comments.
+
+        Returns
+        -------
+        set[str]
+            The field names that are marked with a ts-backend-check ignore identifier.
+        """
+        self._scan()
+
+        return set(self._ignored_fields)
+
+    # MARK: Tokens
+
+    def _next_token(
+        self, pattern: re.Pattern[bytes], pos: int
+    ) -> re.Match[bytes] | None:
+        """
+        Find the next token of a pattern, searching at most a chunk ahead at a time.
+
+        Parameters
+        ----------
+        pattern : re.Pattern[bytes]
+            The pattern of the tokens that matter in the current context.
+
+        pos : int
+            The offset to search from.
+
+        Returns
+        -------
+        re.Match[bytes] | None
+            The next token, or None if there are no more tokens.
+        """
+        content = self.content
+        while pos < len(content):
+            if pos >= self._next_deadline_check:
+                self._check_deadline(pos)
+
+            chunk_end = pos + SCAN_CHUNK_SIZE
+            token = pattern.search(content, pos, chunk_end + TOKEN_LOOKAHEAD)
+            if token is None or token.start() >= chunk_end:
+                pos = chunk_end
+                if pos - self._released >= SCAN_CHUNK_SIZE:
+                    self._release_scanned(pos)
+
+                continue
+
+            if token.end() >= chunk_end + TOKEN_LOOKAHEAD:
+                # Tokens that reach the end of the search may have been cut off.
+                token = self._match_full_token(pattern, token)
+
+            if token.start() - self._released >= SCAN_CHUNK_SIZE:
+                self._release_scanned(token.start())
+
+            return token
+
+        return None
+
+    def _match_full_token(
+        self, pattern: re.Pattern[bytes], token: re.Match[bytes]
+    ) -> re.Match[bytes]:
+        """
+        Match a token again from its start without the end of the search that it was found within.
+
+        Parameters
+        ----------
+        pattern : re.Pattern[bytes]
+            The pattern that the token was found with.
+
+        token : re.Match[bytes]
+            The token, which may have been cut off by the end of the search.
+
+        Returns
+        -------
+        re.Match[bytes]
+            The token matched against the rest of the content, or the token itself if the pattern doesn't match from its start.
+        """
+        full_token = pattern.match(self.content, token.start())
+        if full_token is None:
+            return token
+
+        return full_token
+
+    def _next_code_token(self, pos: int) -> re.Match[bytes] | None:
+        """
+        Find the next token outside of interfaces, only matching where the prefix of a token is found.
+
+        The next position of each prefix is kept until it's been passed so that the content is only searched once for each prefix.
+
+        Parameters
+        ----------
+        pos : int
+            The offset to search from.
+
+        Returns
+        -------
+        re.Match[bytes] | None
+            The next token, or None if there are no more tokens.
+        """
+        content = self.content
+        while pos < len(content):
+            if pos >= self._next_deadline_check:
+                self._check_deadline(pos)
+
+            chunk_end = pos + SCAN_CHUNK_SIZE
+            candidate = chunk_end
+            for i, prefix in enumerate(CODE_TOKEN_PREFIXES):
+                if self._prefix_positions[i] < pos:
+                    self._prefix_positions[i] = self._find_prefix(
+                        prefix=prefix, pos=pos, chunk_end=chunk_end
+                    )
+
+                candidate = min(candidate, self._prefix_positions[i])
+
+            if candidate - self._released >= SCAN_CHUNK_SIZE:
+                self._release_scanned(candidate)
+
+            if candidate < len(content) and (
+                token := CODE_PATTERN.match(content, candidate)
+            ):
+                return token
+
+            pos = max(candidate + 1, pos) if candidate < chunk_end else chunk_end
+
+        return None
+
+    def _find_prefix(
+        self, prefix: bytes | re.Pattern[bytes], pos: int, chunk_end: int
+    ) -> int:
+        """
+        Find the next position of the prefix of a code token within a chunk.
+
+        Parameters
+        ----------
+        prefix : bytes | re.Pattern[bytes]
+            The prefix, which is a pattern for prefixes that can't be found as plain bytes.
+
+        pos : int
+            The offset to search from.
+
+        chunk_end : int
+            The offset of the end of the chunk.
+
+        Returns
+        -------
+        int
+            The offset of the prefix, or the end of the chunk if it isn't within the chunk.
+        """
+        if isinstance(prefix, bytes):
+            found = self.content.find(prefix, pos, chunk_end + len(prefix) - 1)
+
+        else:
+            match = prefix.search(self.content, pos, chunk_end + TOKEN_LOOKAHEAD)
+            found = -1 if match is None else match.start()
+
+        # Prefixes that aren't within the chunk are searched for again once it's been scanned.
+        return chunk_end if found == -1 else found
+
+    def _check_deadline(self, pos: int) -> None:
+        """
+        Check that the deadline of the parse hasn't passed and schedule the next check.
+
+        Parameters
+        ----------
+        pos : int
+            The offset that the content has been scanned up to.
+        """
+        self._next_deadline_check = pos + DEADLINE_CHECK_INTERVAL
+        if self.deadline is not None:
+            self.deadline.check()
+
+    def _release_scanned(self, pos: int) -> None:
+        """
+        Release the pages of a memory-mapped file before an offset, which is called once a chunk has been scanned.
+
+        Lines are counted up to the offset first so that released pages don't need to be read again to count them.
+
+        Parameters
+        ----------
+        pos : int
+            The offset that the content has been scanned up to.
+        """
+        self._line_counter.get_line_and_column(pos)
+        release_mapped_pages(self.content, self._released, pos)
+        self._released = pos
+
+    def _skip_token(self, token: re.Match[bytes]) -> int:
+        """
+        Skip over a token, recording the ignore comments of line comments and skipping over the whole of template literals.
+
+        Parameters
+        ----------
+        token : re.Match[bytes]
+            The token to skip.
+
+        Returns
+        -------
+        int
+            The offset after the token.
+        """
+        if token.lastgroup == "line_comment" and (
+            ignore := IGNORE_PATTERN.search(token[0])
+        ):
+            self._ignored_fields.add(sys.intern(ignore[1].decode("utf-8")))
+
+        elif token.lastgroup == "template":
+            return self._skip_template(token.end())
+
+        return token.end()
+
+    def _skip_template(self, pos: int) -> int:
+        """
+        Skip over the rest of a template literal, including any expressions and template literals that it contains.
+
+        Template literals that are nested within expressions are tracked on a stack rather than skipped recursively so that deep nesting can't run out of stack.
+
+        Parameters
+        ----------
+        pos : int
+            The offset after the opening backtick.
+
+        Returns
+        -------
+        int
+            The offset after the closing backtick, or the end of the content if there isn't one.
+        """
+        # The brace depths of the expressions that the nested template literals are within.
+        expression_depths: list[int] = []
+        while True:
+            text = TEMPLATE_TEXT_PATTERN.match(self.content, pos)
+            if text is None or text["end"] is None:
+                return len(self.content)
+
+            pos = text.end()
+            if text["end"] == b"${":
+                depth = 0
+
+            elif expression_depths:
+                depth = expression_depths.pop()
+
+            else:
+                return pos
+
+            pos = self._skip_template_expression(
+                pos=pos, depth=depth, expression_depths=expression_depths
+            )
+
+    def _skip_template_expression(
+        self, pos: int, depth: int, expression_depths: list[int]
+    ) -> int:
+        """
+        Skip over the rest of an expression of a template literal up to its closing brace or a nested template literal.
+
+        Parameters
+        ----------
+        pos : int
+            The offset within the expression.
+
+        depth : int
+            The depth of the braces that the offset is within in the expression.
+
+        expression_depths : list[int]
+            The brace depths of the expressions that the nested template literals are within, which the depth is added to if a nested template literal is found.
+
+        Returns
+        -------
+        int
+            The offset after the closing brace or the opening backtick of the nested template literal, or the end of the content if there isn't either.
+        """
+        while (token := self._next_token(BRACE_PATTERN, pos)) is not None:
+            if token.lastgroup == "template":
+                expression_depths.append(depth)
+                return token.end()
+
+            pos = self._skip_token(token)
+            if token.lastgroup == "close" and depth == 0:
+                return pos
+
+            depth += BRACKET_DEPTH_CHANGES.get(token.lastgroup, 0)
+
+        return len(self.content)
+
+    def _skip_braced_block(self, pos: int) -> int:
+        """
+        Skip over the rest of a braced block such as the body of an interface.
+
+        Parameters
+        ----------
+        pos : int
+            The offset after the opening brace or '${'.
+
+        Returns
+        -------
+        int
+            The offset after the closing brace, or the end of the content if there isn't one.
+        """
+        depth = 0
+        while (token := self._next_token(BRACE_PATTERN, pos)) is not None:
+            pos = self._skip_token(token)
+            if token.lastgroup == "open":
+                depth += 1
+
+            elif token.lastgroup == "close":
+                if depth == 0:
+                    return pos
+
+                depth -= 1
+
+        return len(self.content)
+
+    def _next_type_token(self, pos: int) -> re.Match[bytes] | None:
+        """
+        Find the next token of a declaration that isn't a comment, recording the ignore comments that are skipped.
+
+        Parameters
+        ----------
+        pos : int
+            The offset to search from.
+
+        Returns
+        -------
+        re.Match[bytes] | None
+            The next token, or None if there are no more tokens.
+        """
+        while (token := self._next_token(HEADER_PATTERN, pos)) is not None:
+            if token.lastgroup not in ("line_comment", "block_comment"):
+                return token
+
+            pos = self._skip_token(token)
+
+        return None
+
+    def _skip_brackets(self, pos: int) -> int:
+        """
+        Skip over the rest of a pair of brackets, including any brackets nested within it.
+
+        Angle brackets are also counted as arrows are matched as their own tokens.
+
+        Parameters
+        ----------
+        pos : int
+            The offset after the opening bracket.
+
+        Returns
+        -------
+        int
+            The offset after the closing bracket, or the end of the content if there isn't one.
+        """
+        depth = 0
+        while (token := self._next_type_token(pos)) is not None:
+            pos = self._skip_token(token)
+            if token[0] in (b"(", b"[", b"{", b"<"):
+                depth += 1
+
+            elif token[0] in (b")", b"]", b"}", b">"):
+                if depth == 0:
+                    return pos
+
+                depth -= 1
+
+        return len(self.content)
+
+    def _count_braces(self, start: int, end: int) -> int:
+        """
+        Count the opening braces minus the closing braces between two offsets, a chunk at a time.
+
+        Parameters
+        ----------
+        start : int
+            The offset to count from.
+
+        end : int
+            The offset to count to.
+
+        Returns
+        -------
+        int
+            The change in the depth of braces.
+        """
+        if end - start <= SCAN_CHUNK_SIZE:
+            chunk = self.content[start:end]
+
+            return chunk.count(b"{") - chunk.count(b"}")
+
+        count = 0
+        for chunk_start in range(start, end, SCAN_CHUNK_SIZE):
+            chunk = self.content[chunk_start : min(chunk_start + SCAN_CHUNK_SIZE, end)]
+            count += chunk.count(b"{") - chunk.count(b"}")
+
+        return count
+
+    def _get_position(self, offset: int) -> SourcePosition:
+        """
+        Get the position of an offset of the content.
+
+        Parameters
+        ----------
+        offset : int
+            The byte offset within the content, which is after all offsets that positions have been gotten for.
+
+        Returns
+        -------
+        SourcePosition
+            The offset along with its line and column.
+        """
+        return SourcePosition(offset, *self._line_counter.get_line_and_column(offset))
+
+    def _seek(self, position: SourcePosition) -> None:
+        """
+        Count lines on from a position rather than from the start of the content, which is before the offsets of all further positions.
+
+        Parameters
+        ----------
+        position : SourcePosition
+            The position to count lines from.
+        """
+        if position.offset > self._line_counter.offset:
+            self._line_counter.offset = position.offset
+            self._line_counter.line = position.line
+            self._line_counter.column = position.column
+            self._released = position.offset
+
+    # MARK: Scan
+
+    def _scan(self) -> None:
+        """
+        Scan the content for interfaces and ignore comments if it hasn't been scanned yet.
+        """
+        if self._scanned:
+            return
+
+        pos = 0
+        while (token := self._next_code_token(pos)) is not None:
+            pos = self._parse_code_token(token)
+
+        self._scanned = True
+
+    def _parse_code_token(self, token: re.Match[bytes]) -> int:
+        """
+        Parse the declaration that a token outside of interfaces starts, or skip over the token.
+
+        Parameters
+        ----------
+        token : re.Match[bytes]
+            The token from _next_code_token.
+
+        Returns
+        -------
+        int
+            The offset after the declaration or token.
+        """
+        pos = self._skip_token(token)
+        if token.lastgroup == "interface":
+            return self._parse_interface(pos)
+
+        if token.lastgroup == "type":
+            return self._parse_type_alias(pos)
+
+        if token.lastgroup == "import":
+            return self._parse_import(pos, is_export=False)
+
+        if token.lastgroup == "export":
+            return self._parse_import(pos, is_export=True)
+
+        return pos
+
+    def _parse_interface(self, pos: int) -> int:
+        """
+        Parse the header of an interface for its name and parents and then its body.
+
+        Parameters
+        ----------
+        pos : int
+            The offset after the interface keyword.
+
+        Returns
+        -------
+        int
+            The offset after the interface, or of the token that showed that the keyword wasn't for an interface.
+        """
+        name_token, pos = self._find_interface_name(pos)
+        if name_token is None:
+            return pos
+
+        name = sys.intern(name_token[0].decode("utf-8"))
+        position = self._get_position(name_token.start())
+        parents: list[str] = []
+        expect_parent = False
+        # Generic parameters and their defaults are nested within angle brackets and braces.
+        angle_depth = brace_depth = 0
+        while (token := self._next_type_token(pos)) is not None:
+            pos = self._skip_token(token)
+            punctuation = token[0] if token.lastgroup == "punctuation" else b""
+            if angle_depth == 0 and brace_depth == 0:
+                if punctuation == b"{":
+                    return self._parse_interface_body(
+                        name=name, position=position, parents=parents, pos=pos
+                    )
+
+                if punctuation in (b";", b"}"):
+                    return token.start()
+
+                expect_parent = read_interface_parent(
+                    token=token, parents=parents, expect_parent=expect_parent
+                )
+
+            angle_depth, brace_depth = get_nesting_depths(
+                punctuation=punctuation,
+                angle_depth=angle_depth,
+                brace_depth=brace_depth,
+            )
+
+        return len(self.content)
+
+    def _find_interface_name(self, pos: int) -> tuple[re.Match[bytes] | None, int]:
+        """
+        Find the name of an interface, which has to directly follow the keyword that otherwise isn't for an interface.
+
+        Parameters
+        ----------
+        pos : int
+            The offset after the interface keyword.
+
+        Returns
+        -------
+        tuple[re.Match[bytes] | None, int]
+            The name and the offset after it, or None and the offset of the token that showed that the keyword wasn't for an interface.
+        """
+        while (token := self._next_token(HEADER_PATTERN, pos)) is not None:
+            gap = self.content[pos : token.start()]
+            pos = self._skip_token(token)
+            if token.lastgroup in ("line_comment", "block_comment"):
+                continue
+
+            if token.lastgroup != "name" or gap.strip():
+                return None, token.start()
+
+            return token, pos
+
+        return None, len(self.content)
+
+    def _parse_interface_body(
+        self, name: str, position: SourcePosition, parents: list[str], pos: int
+    ) -> int:
+        """
+        Parse the body of an interface, or record where it starts to parse it later if the parse is lazy.
+
+        Parameters
+        ----------
+        name : str
+            The name of the interface.
+
+        position : SourcePosition
+            The position of the name of the interface.
+
+        parents : list[str]
+            The names of the interfaces that the interface extends.
+
+        pos : int
+            The offset after the opening brace of the body.
+
+        Returns
+        -------
+        int
+            The offset after the closing brace of the body, or the end of the content if there isn't one.
+        """
+        if self.lazy:
+            self._unparsed_interfaces.append(
+                UnparsedInterface(
+                    name=name,
+                    parents=tuple(parents),
+                    position=position,
+                    body_position=self._get_position(pos),
+                )
+            )
+
+            return self._skip_braced_block(pos)
+
+        interface, pos = self._parse_object_type(
+            name=name, position=position, parents=parents, pos=pos
+        )
+        self._interfaces[name] = interface
+
+        return pos
+
+    def _parse_object_type(
+        self,
+        name: str,
+        position: SourcePosition | None,
+        parents: list[str],
+        pos: int,
+    ) -> tuple[TypeScriptInterface, int]:
+        """
+        Parse the properties of the body of an interface or of an object literal type.
+
+        Parameters
+        ----------
+        name : str
+            The name of the interface.
+
+        position : SourcePosition | None
+            The position of the name of the interface.
+
+        parents : list[str]
+            The names of the interfaces that the interface extends.
+
+        pos : int
+            The offset after the opening brace of the body.
+
+        Returns
+        -------
+        tuple[TypeScriptInterface, int]
+            The parsed interface and the offset after the closing brace of the body, or the end of the content if there isn't one.
+        """
+        properties: list[str] = []
+        optional_properties: list[str] = []
+        property_positions = array("q")
+        depth = 0
+        at_member_start = at_line_start = True
+        while (
+            token := self._next_token(
+                MEMBER_PATTERN if at_member_start else TYPE_PATTERN, pos
+            )
+        ) is not None:
+            kind = token.lastgroup
+            pos = (
+                self._skip_token(token)
+                if kind in ("line_comment", "template")
+                else token.end()
+            )
+            if kind in ("property", "quoted_property") and self._add_property(
+                token=token,
+                properties=properties,
+                optional_properties=optional_properties,
+                property_positions=property_positions,
+            ):
+                at_line_start = token["property_end"].endswith(b"\n")
+                continue
+
+            if kind in ("line_comment", "block_comment"):
+                at_line_start = self._read_member_comment(
+                    token=token,
+                    at_line_start=at_member_start and at_line_start,
+                    properties=properties,
+                    property_positions=property_positions,
+                )
+                continue
+
+            if kind == "separator":
+                # Separators within brackets are part of the type of the member, before which neither holds.
+                at_member_start = depth == 0
+                at_line_start = at_member_start and token[0] == b"\n"
+                continue
+
+            if kind == "close" and depth == 0:
+                break
+
+            depth += BRACKET_DEPTH_CHANGES.get(kind, 0)
+            at_member_start = at_line_start = False
+
+        interface = TypeScriptInterface(
+            name=name,
+            properties=tuple(properties),
+            optional_properties=tuple(optional_properties),
+            parents=tuple(parents),
+            position=position,
+            property_positions=property_positions,
+        )
+
+        return interface, pos
+
+    def _add_property(
+        self,
+        token: re.Match[bytes],
+        properties: list[str],
+        optional_properties: list[str],
+        property_positions: array,
+    ) -> bool:
+        """
+        Add the property of a member token of an object type.
+
+        Parameters
+        ----------
+        token : re.Match[bytes]
+            The token of a property or a quoted property.
+
+        properties : list[str]
+            The properties of the object type that the property is added to.
+
+        optional_properties : list[str]
+            The optional properties of the object type that the property is added to if it's optional.
+
+        property_positions : array
+            The flattened positions of the properties that the position of the property is added to.
+
+        Returns
+        -------
+        bool
+            Whether the type and separator of the property are part of the token, in which case the next member follows it.
+        """
+        is_quoted = token.lastgroup == "quoted_property"
+        name_group = "quoted_name" if is_quoted else "property_name"
+        properties.append(sys.intern(token[name_group].decode("utf-8")))
+        property_positions.extend(self._get_position(token.start(name_group)))
+        if token["quoted_optional" if is_quoted else "optional"]:
+            optional_properties.append(properties[-1])
+
+        # Simple types and their separators are part of the token and so the next member follows it.
+        if is_quoted or not token["property_end"]:
+            return False
+
+        if (comment := token["property_comment"]) and (
+            ignore := IGNORE_PATTERN.search(comment)
+        ):
+            self._ignored_fields.add(sys.intern(ignore[1].decode("utf-8")))
+
+        return True
+
+    def _read_member_comment(
+        self,
+        token: re.Match[bytes],
+        at_line_start: bool,
+        properties: list[str],
+        property_positions: array,
+    ) -> bool:
+        """
+        Read a comment within an object type, adding the field of an ignore comment that starts a line of a member.
+
+        Ignore comments at the start of a line hold the place of their fields for order checks.
+
+        Parameters
+        ----------
+        token : re.Match[bytes]
+            The token of the comment.
+
+        at_line_start : bool
+            Whether the comment is at the start of a line and a member.
+
+        properties : list[str]
+            The properties of the object type that the field is added to.
+
+        property_positions : array
+            The flattened positions of the properties that the position of the field is added to.
+
+        Returns
+        -------
+        bool
+            Whether the next token is still at the start of a line, which is only the case after line comments.
+        """
+        if token.lastgroup != "line_comment" or not at_line_start:
+            return False
+
+        if ignore := IGNORE_PROPERTY_PATTERN.match(token[0]):
+            properties.append(sys.intern(ignore[1].decode("utf-8")))
+            property_positions.extend(
+                self._get_position(token.start() + ignore.start(1))
+            )
+
+        return True
+
+    # MARK: Imports
+
+    def _parse_import(self, pos: int, is_export: bool) -> int:
+        """
+        Parse the bindings and module of an import declaration or of a re-export.
+
+        Parameters
+        ----------
+        pos : int
+            The offset after the import or export keyword.
+
+        is_export : bool
+            Whether the keyword is export and is followed by the bindings of a re-export.
+
+        Returns
+        -------
+        int
+            The offset after the module specifier, or of the token that showed that the keyword isn't for an import or re-export.
+        """
+        # Bindings are pairs of the imported name and the local name.
+        bindings: list[list[str]] = []
+        in_braces = expect_alias = expect_module = type_modifier = False
+        while (token := self._next_type_token(pos)) is not None:
+            text = token[0].decode("utf-8")
+            if token.lastgroup == "string" and expect_module:
+                self._add_imports(
+                    bindings=bindings, module=text[1:-1], is_export=is_export
+                )
+                return token.end()
+
+            if token.lastgroup == "punctuation" and text in ("{", "}", "*", ","):
+                in_braces = read_import_punctuation(
+                    text=text, bindings=bindings, in_braces=in_braces
+                )
+                type_modifier = False
+
+            elif token.lastgroup != "name":
+                # Other uses of the keywords, such as dynamic imports, are scanned as usual.
+                return token.start()
+
+            elif text == "from" and not in_braces:
+                expect_module = True
+
+            else:
+                expect_alias, type_modifier = read_import_binding(
+                    text=text,
+                    bindings=bindings,
+                    in_braces=in_braces,
+                    expect_alias=expect_alias,
+                    type_modifier=type_modifier,
+                )
+
+            pos = token.end()
+
+        return len(self.content)
+
+    def _add_imports(
+        self, bindings: list[list[str]], module: str, is_export: bool
+    ) -> None:
+        """
+        Add the imports of the bindings of an import declaration or of a re-export.
+
+        Parameters
+        ----------
+        bindings : list[list[str]]
+            The pairs of the imported name and the local name of the bindings.
+
+        module : str
+            The module specifier that the bindings are imported from.
+
+        is_export : bool
+            Whether the bindings are re-exported.
+        """
+        self._imports.extend(
+            TypeScriptImport(
+                name=sys.intern(local_name),
+                imported_name=sys.intern(imported_name),
+                module=module,
+                is_export=is_export,
+            )
+            for imported_name, local_name in bindings
+        )
+
+    # MARK: Type Aliases
+
+    def _parse_type_alias(self, pos: int) -> int:
+        """
+        Parse the header of a type alias for its name and type parameters and then its type.
+
+        Parameters
+        ----------
+        pos : int
+            The offset after the type keyword.
+
+        Returns
+        -------
+        int
+            The offset after the type of the type alias, or of the token that showed that the keyword wasn't for a type alias.
+        """
+        token = self._next_type_token(pos)
+        # The name has to directly follow the keyword, which otherwise isn't for a type alias.
+        if (
+            token is None
+            or token.lastgroup != "name"
+            or self.content[pos : token.start()].strip()
+        ):
+            return pos if token is None else token.start()
+
+        name = sys.intern(token[0].decode("utf-8"))
+        position = self._get_position(token.start())
+        parameters, pos = self._parse_type_parameters(token.end())
+        if parameters is None:
+            return pos
+
+        type_, pos = self._parse_type(pos)
+        # Types that continue past the parsed expression are conditional types.
+        if (token := self._next_type_token(pos)) is not None and token[0] == b"extends":
+            type_ = UNSUPPORTED_TYPE
+
+        self._type_aliases[name] = TypeScriptTypeAlias(
+            name=name, parameters=tuple(parameters), type=type_, position=position
+        )
+
+        return pos
+
+    def _parse_type_parameters(self, pos: int) -> tuple[list[str] | None, int]:
+        """
+        Parse the names of the type parameters of a type alias up to the equals sign before its type.
+
+        Parameters
+        ----------
+        pos : int
+            The offset after the name of the type alias.
+
+        Returns
+        -------
+        tuple[list[str] | None, int]
+            The names of the type parameters and the offset after the equals sign, or None and the offset of the token that showed that the keyword wasn't for a type alias.
+        """
+        parameters: list[str] = []
+        expect_parameter = False
+        # Constraints and defaults of type parameters are nested within angle brackets and braces.
+        angle_depth = brace_depth = 0
+        while (token := self._next_type_token(pos)) is not None:
+            pos = self._skip_token(token)
+            if token.lastgroup == "name" and expect_parameter:
+                parameters.append(sys.intern(token[0].decode("utf-8")))
+                expect_parameter = False
+
+            elif token[0] == b"<":
+                angle_depth += 1
+                expect_parameter = angle_depth == 1
+
+            elif token[0] == b">" and angle_depth > 0:
+                angle_depth -= 1
+
+            elif token[0] in (b"{", b"(", b"["):
+                brace_depth += 1
+
+            elif token[0] in (b"}", b")", b"]") and brace_depth > 0:
+                brace_depth -= 1
+
+            elif angle_depth == 1 and brace_depth == 0 and token[0] == b",":
+                expect_parameter = True
+
+            elif angle_depth == 0 and token[0] == b"=":
+                return parameters, pos
+
+            elif angle_depth == 0:
+                return None, token.start()
+
+        return None, len(self.content)
+
+    def _parse_type(self, pos: int) -> tuple[TypeExpression, int]:
+        """
+        Parse a union of types, which may be a single type.
+
+        Parameters
+        ----------
+        pos : int
+            The offset of the type.
+
+        Returns
+        -------
+        tuple[TypeExpression, int]
+            The type and the offset after it.
+        """
+        return self._parse_type_list(pos, operator=b"|", parse=self._parse_intersection)
+
+    def _parse_intersection(self, pos: int) -> tuple[TypeExpression, int]:
+        """
+        Parse an intersection of types, which may be a single type.
+
+        Parameters
+        ----------
+        pos : int
+            The offset of the type.
+
+        Returns
+        -------
+        tuple[TypeExpression, int]
+            The type and the offset after it.
+        """
+        return self._parse_type_list(pos, operator=b"&", parse=self._parse_primary_type)
+
+    def _parse_type_list(
+        self,
+        pos: int,
+        operator: bytes,
+        parse: Callable[[int], tuple[TypeExpression, int]],
+    ) -> tuple[TypeExpression, int]:
+        """
+        Parse types that are joined by an operator, which may also precede the first type.
+
+        Parameters
+        ----------
+        pos : int
+            The offset of the first type.
+
+        operator : bytes
+            The operator that joins the types.
+
+        parse : Callable[[int], tuple[TypeExpression, int]]
+            The function that parses each of the types.
+
+        Returns
+        -------
+        tuple[TypeExpression, int]
+            The type if there's only one, or otherwise the union or intersection of the types, and the offset after them.
+        """
+        if (token := self._next_type_token(pos)) is not None and token[0] == operator:
+            pos = token.end()
+
+        types: list[TypeExpression] = []
+        while True:
+            type_, pos = parse(pos)
+            types.append(type_)
+            token = self._next_type_token(pos)
+            if token is None or token[0] != operator:
+                break
+
+            pos = token.end()
+
+        if len(types) == 1:
+            return types[0], pos
+
+        return (
+            UnionType(tuple(types))
+            if operator == b"|"
+            else IntersectionType(tuple(types))
+        ), pos
+
+    def _parse_primary_type(self, pos: int) -> tuple[TypeExpression, int]:
+        """
+        Parse an object literal type, a type reference, a string literal type or a parenthesized type.
+
+        Parameters
+        ----------
+        pos : int
+            The offset of the type.
+
+        Returns
+        -------
+        tuple[TypeExpression, int]
+            The type, which is unsupported for other kinds of types, and the offset after it.
+        """
+        token = self._next_type_token(pos)
+        if token is None:
+            return UNSUPPORTED_TYPE, len(self.content)
+
+        if self._type_depth >= MAX_TYPE_DEPTH:
+            return UNSUPPORTED_TYPE, self._skip_primary_type(token)
+
+        self._type_depth += 1
+        type_, pos = self._parse_nested_primary_type(token)
+        self._type_depth -= 1
+
+        return type_, pos
+
+    def _skip_primary_type(self, token: re.Match[bytes]) -> int:
+        """
+        Skip over a type along with any brackets or type arguments that directly follow its first token.
+
+        Parameters
+        ----------
+        token : re.Match[bytes]
+            The first token of the type.
+
+        Returns
+        -------
+        int
+            The offset after the type.
+        """
+        if token[0] in (b"{", b"(", b"[", b"<"):
+            return self._skip_brackets(token.end())
+
+        pos = self._skip_token(token)
+        if (
+            token.lastgroup == "name"
+            and (opening := self._next_type_token(pos)) is not None
+            and opening[0] == b"<"
+        ):
+            return self._skip_brackets(opening.end())
+
+        return pos
+
+    def _parse_nested_primary_type(
+        self, token: re.Match[bytes]
+    ) -> tuple[TypeExpression, int]:
+        """
+        Parse a primary type from its first token, recursing into the types that it contains.
+
+        Parameters
+        ----------
+        token : re.Match[bytes]
+            The first token of the type.
+
+        Returns
+        -------
+        tuple[TypeExpression, int]
+            The type, which is unsupported for other kinds of types, and the offset after it.
+        """
+        if token[0] == b"(":
+            return self._parse_parenthesized_type(token.end())
+
+        if token.lastgroup == "name" and token[0].decode("utf-8") in TYPE_OPERATORS:
+            return UNSUPPORTED_TYPE, self._parse_primary_type(token.end())[1]
+
+        if token[0] == b"<":
+            # The type parameters of generic function types are skipped.
+            pos = self._skip_brackets(token.end())
+            return UNSUPPORTED_TYPE, self._parse_primary_type(pos)[1]
+
+        type_: TypeExpression
+        if token[0] == b"{":
+            type_, pos = self._parse_object_type(
+                name="", position=None, parents=[], pos=token.end()
+            )
+
+        elif token.lastgroup == "string" and len(token[0]) > 1:
+            type_, pos = StringLiteralType(token[0][1:-1].decode("utf-8")), token.end()
+
+        elif token.lastgroup == "name":
+            type_, pos = self._parse_type_reference(token)
+
+        elif token[0] == b"[":
+            # Tuples are skipped.
+            type_, pos = UNSUPPORTED_TYPE, self._skip_brackets(token.end())
+
+        else:
+            return UNSUPPORTED_TYPE, self._skip_token(token)
+
+        return self._parse_array_types(type_=type_, pos=pos)
+
+    def _parse_parenthesized_type(self, pos: int) -> tuple[TypeExpression, int]:
+        """
+        Parse a parenthesized type or skip a function type that starts with its parameters.
+
+        Parameters
+        ----------
+        pos : int
+            The offset after the opening parenthesis.
+
+        Returns
+        -------
+        tuple[TypeExpression, int]
+            The type, which is unsupported for function types, and the offset after it.
+        """
+        type_, pos = self._parse_type(pos)
+        if (close := self._next_type_token(pos)) is not None and close[0] == b")":
+            pos = close.end()
+
+        else:
+            type_, pos = UNSUPPORTED_TYPE, self._skip_brackets(pos)
+
+        if (arrow := self._next_type_token(pos)) is not None and (
+            arrow.lastgroup == "arrow"
+        ):
+            # Function types are skipped along with their return types.
+            return UNSUPPORTED_TYPE, self._parse_type(arrow.end())[1]
+
+        return self._parse_array_types(type_=type_, pos=pos)
+
+    def _parse_array_types(
+        self, type_: TypeExpression, pos: int
+    ) -> tuple[TypeExpression, int]:
+        """
+        Parse the brackets of array types and indexed access types that follow a type.
+
+        Parameters
+        ----------
+        type_ : TypeExpression
+            The type that the brackets follow.
+
+        pos : int
+            The offset after the type.
+
+        Returns
+        -------
+        tuple[TypeExpression, int]
+            The type, which is unsupported if it's followed by brackets, and the offset after the brackets.
+        """
+        # Array types and indexed access types aren't object types.
+        while (suffix := self._next_type_token(pos)) is not None and suffix[0] == b"[":
+            type_, pos = UNSUPPORTED_TYPE, self._skip_brackets(suffix.end())
+
+        return type_, pos
+
+    def _parse_type_reference(
+        self, token: re.Match[bytes]
+    ) -> tuple[TypeExpression, int]:
+        """
+        Parse a reference to a named type along with its type arguments.
+
+        Parameters
+        ----------
+        token : re.Match[bytes]
+            The name of the type.
+
+        Returns
+        -------
+        tuple[TypeExpression, int]
+            The type reference and the offset after it.
+        """
+        name = sys.intern(re.sub(rb"\s+", b"", token[0]).decode("utf-8"))
+        pos = token.end()
+        if (opening := self._next_type_token(pos)) is None or opening[0] != b"<":
+            return TypeReference(name=name), pos
+
+        arguments: list[TypeExpression] = []
+        pos = opening.end()
+        while True:
+            argument, pos = self._parse_type(pos)
+            arguments.append(argument)
+            if (separator := self._next_type_token(pos)) is None:
+                return UNSUPPORTED_TYPE, len(self.content)
+
+            pos = separator.end()
+            if separator[0] == b">":
+                return TypeReference(name=name, arguments=tuple(arguments)), pos
+
+            if separator[0] != b",":
+                return UNSUPPORTED_TYPE, self._skip_brackets(pos)
+
+
+# MARK: Parse Files
+
+
+def parse_ts_file(
+    file_path: str | Path,
+    lazy: bool = False,
+    timeout: float | None = None,
+    executor: Executor | None = None,
+    max_segments: int = 1,
+) -> TypeScriptFile:
+    """
+    Parse a TypeScript file via a memory map so that memory use stays bounded regardless of the size of the file.
+
+    Large files are split into segments at top-level declarations that are parsed in parallel on the executor.
+    The declarations of the segments are merged in source order so that the result is the same as that of a serial parse.
+    Files are parsed serially if a declaration runs past the end of its segment.
+
+    Parameters
+    ----------
+    file_path : str | Path
+        The path to the TypeScript file.
+
+    lazy : bool, default=False
+        Whether the bodies of interfaces are skipped and recorded as unparsed interfaces.
+
+    timeout : float, default=None
+        The number of seconds that parsing the file can take, with no limit if not passed.
+
+    executor : Executor, default=None
+        The process pool that the segments of large files are parsed on, with files being parsed serially if not passed.
+
+    max_segments : int, default=1
+        The number of segments that large files can be split into, which is the number of workers of the executor.
+
+    Returns
+    -------
+    TypeScriptFile
+        The interfaces, type aliases and ignored fields of the file.
+
+    Raises
+    ------
+    ParseTimeoutError
+        If parsing the file takes longer than the timeout.
+    """
+    deadline = Deadline(file_path, timeout) if timeout is not None else None
+    with map_file(file_path) as mapped_file:
+        n_segments = min(max_segments, len(mapped_file) // MIN_SEGMENT_SIZE)
+        if executor is None or n_segments < 2:
+            return TypeScriptParser(
+                mapped_file, lazy=lazy, deadline=deadline
+            ).parse_file()
+
+        split_points = TypeScriptParser(
+            mapped_file, deadline=deadline
+        ).find_split_points(n_segments)
+        file_size = len(mapped_file)
+
+    starts = [SourcePosition(0, 1, 1), *split_points]
+    ends = [split_point.offset for split_point in split_points] + [file_size]
+    futures = [
+        executor.submit(parse_ts_segment, file_path, start, end, lazy, deadline)
+        for start, end in zip(starts, ends)
+    ]
+    segments = [future.result() for future in futures]
+    if any(segment is None for segment in segments):
+        with map_file(file_path) as mapped_file:
+            return TypeScriptParser(
+                mapped_file, lazy=lazy, deadline=deadline
+            ).parse_file()
+
+    return merge_ts_files([segment for segment in segments if segment is not None])
+
+
+def parse_ts_segment(
+    file_path: str | Path,
+    start: SourcePosition,
+    end: int,
+    lazy: bool = False,
+    deadline: Deadline | None = None,
+) -> TypeScriptFile | None:
+    """
+    Parse a segment of a TypeScript file, which is run on the workers of the executor of parse_ts_file.
+
+    Parameters
+    ----------
+    file_path : str | Path
+        The path to the TypeScript file.
+
+    start : SourcePosition
+        The start of the segment.
+
+    end : int
+        The offset of the end of the segment.
+
+    lazy : bool, default=False
+        Whether the bodies of interfaces are skipped and recorded as unparsed interfaces.
+
+    deadline : Deadline, default=None
+        The time by which parsing the whole file has to finish.
+
+    Returns
+    -------
+    TypeScriptFile | None
+        The declarations of the segment, or None if a declaration or comment runs past its end.
+
+    Raises
+    ------
+    ParseTimeoutError
+        If parsing the segment doesn't finish by the deadline.
+    """
+    with map_file(file_path) as mapped_file:
+        return TypeScriptParser(
+            mapped_file, lazy=lazy, deadline=deadline
+        ).parse_segment(start=start, end=end)
+
+
+def merge_ts_files(ts_files: Sequence[TypeScriptFile]) -> TypeScriptFile:
+    """
+    Merge the declarations of the segments of a file in source order.
+
+    Parameters
+    ----------
+    ts_files : Sequence[TypeScriptFile]
+        The parsed segments in the order they're in the file.
+
+    Returns
+    -------
+    TypeScriptFile
+        The declarations of the whole file, with later declarations of the same name replacing earlier ones in place as within a serial parse.
+    """
+    interfaces: dict[str, TypeScriptInterface] = {}
+    type_aliases: dict[str, TypeScriptTypeAlias] = {}
+    for ts_file in ts_files:
+        interfaces.update(ts_file.interfaces)
+        type_aliases.update(ts_file.type_aliases)
+
+    return TypeScriptFile(
+        interfaces=interfaces,
+        type_aliases=type_aliases,
+        ignored_fields=frozenset().union(*(f.ignored_fields for f in ts_files)),
+        imports=tuple(i for f in ts_files for i in f.imports),
+        unparsed_interfaces=tuple(u for f in ts_files for u in f.unparsed_interfaces),
+    )
+
+
+def parse_ts_interfaces(
+    file_path: str | Path,
+    unparsed_interfaces: Iterable[UnparsedInterface],
+    timeout: float | None = None,
+) -> dict[str, TypeScriptInterface]:
+    """
+    Parse the bodies of interfaces that a lazy parse of a TypeScript file skipped.
+
+    Parameters
+    ----------
+    file_path : str | Path
+        The path to the TypeScript file, which has to have the same contents as when it was lazily parsed.
+
+    unparsed_interfaces : Iterable[UnparsedInterface]
+        The interfaces from the lazy parse of the file that are needed.
+
+    timeout : float, default=None
+        The number of seconds that parsing the bodies can take, with no limit if not passed.
+
+    Returns
+    -------
+    dict[str, TypeScriptInterface]
+        The parsed interfaces in the order they're declared.
+
+    Raises
+    ------
+    ParseTimeoutError
+        If parsing the bodies takes longer than the timeout.
+    """
+    deadline = Deadline(file_path, timeout) if timeout is not None else None
+    with map_file(file_path) as mapped_file:
+        return TypeScriptParser(mapped_file, deadline=deadline).parse_interface_bodies(
+            unparsed_interfaces
+        )
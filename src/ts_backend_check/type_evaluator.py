@@ -0,0 +1,589 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Evaluation of TypeScript type aliases into the properties of the object types that they describe.
+"""
+
+from array import array
+from collections.abc import Mapping
+from typing import Callable, NamedTuple
+
+from ts_backend_check.parsers.typescript_parser import (
+    IntersectionType,
+    SourcePosition,
+    StringLiteralType,
+    TypeExpression,
+    TypeReference,
+    TypeScriptInterface,
+    TypeScriptTypeAlias,
+    UnionType,
+)
+
+
+class EvaluatedProperty(NamedTuple):
+    """
+    A property of an evaluated object type along with where it's declared.
+
+    Attributes
+    ----------
+    name : str
+        The name of the property.
+
+    optional : bool
+        Whether the property is optional (?).
+
+    file : str | None
+        The path of the file that declares the property, if known.
+
+    position : SourcePosition | None
+        The position of the property within its file.
+    """
+
+    name: str
+    optional: bool
+    file: str | None
+    position: SourcePosition | None
+
+
+# Object types evaluate to their properties and string literal types to the set of their values.
+# Types that can't be evaluated are None.
+EvaluatedType = tuple[EvaluatedProperty, ...] | frozenset[str] | None
+
+
+# MARK: Utility Types
+
+
+def _make_partial(properties: tuple[EvaluatedProperty, ...]) -> EvaluatedType:
+    """
+    Make all properties of an object type optional as Partial does.
+
+    Parameters
+    ----------
+    properties : tuple[EvaluatedProperty, ...]
+        The properties of the object type.
+
+    Returns
+    -------
+    EvaluatedType
+        The properties with all of them being optional.
+    """
+    return tuple(p._replace(optional=True) for p in properties)
+
+
+def _make_required(properties: tuple[EvaluatedProperty, ...]) -> EvaluatedType:
+    """
+    Make all properties of an object type required as Required does.
+
+    Parameters
+    ----------
+    properties : tuple[EvaluatedProperty, ...]
+        The properties of the object type.
+
+    Returns
+    -------
+    EvaluatedType
+        The properties with none of them being optional.
+    """
+    return tuple(p._replace(optional=False) for p in properties)
+
+
+def _pick(
+    properties: tuple[EvaluatedProperty, ...], keys: frozenset[str]
+) -> EvaluatedType:
+    """
+    Keep the properties of an object type that are among keys as Pick does.
+
+    Parameters
+    ----------
+    properties : tuple[EvaluatedProperty, ...]
+        The properties of the object type.
+
+    keys : frozenset[str]
+        The names of the properties to keep.
+
+    Returns
+    -------
+    EvaluatedType
+        The properties that are kept.
+    """
+    return tuple(p for p in properties if p.name in keys)
+
+
+def _omit(
+    properties: tuple[EvaluatedProperty, ...], keys: frozenset[str]
+) -> EvaluatedType:
+    """
+    Remove the properties of an object type that are among keys as Omit does.
+
+    Parameters
+    ----------
+    properties : tuple[EvaluatedProperty, ...]
+        The properties of the object type.
+
+    keys : frozenset[str]
+        The names of the properties to remove.
+
+    Returns
+    -------
+    EvaluatedType
+        The properties that aren't removed.
+    """
+    return tuple(p for p in properties if p.name not in keys)
+
+
+# Utility types that take an object type, which Readonly doesn't change.
+OBJECT_UTILITY_TYPES: dict[
+    str, Callable[[tuple[EvaluatedProperty, ...]], EvaluatedType]
+] = {
+    "Partial": _make_partial,
+    "Required": _make_required,
+    "Readonly": lambda properties: properties,
+}
+# Utility types that take an object type and a union of the string literal types of its keys.
+KEY_UTILITY_TYPES: dict[
+    str, Callable[[tuple[EvaluatedProperty, ...], frozenset[str]], EvaluatedType]
+] = {
+    "Pick": _pick,
+    "Omit": _omit,
+}
+
+
+def intersect(
+    types: list[tuple[EvaluatedProperty, ...]],
+) -> tuple[EvaluatedProperty, ...]:
+    """
+    Combine the properties of object types as an intersection of them does.
+
+    Properties that are in more than one of the types keep their first position and are only optional if they're optional in all types.
+
+    Parameters
+    ----------
+    types : list[tuple[EvaluatedProperty, ...]]
+        The properties of each of the object types.
+
+    Returns
+    -------
+    tuple[EvaluatedProperty, ...]
+        The properties of the intersection in the order they're first declared.
+    """
+    properties: dict[str, EvaluatedProperty] = {}
+    for type_properties in types:
+        for p in type_properties:
+            if (existing := properties.get(p.name)) is not None:
+                properties[p.name] = existing._replace(
+                    optional=existing.optional and p.optional
+                )
+
+            else:
+                properties[p.name] = p
+
+    return tuple(properties.values())
+
+
+def extend(
+    inherited: tuple[EvaluatedProperty, ...], own: tuple[EvaluatedProperty, ...]
+) -> tuple[EvaluatedProperty, ...]:
+    """
+    Combine inherited properties with the own properties of an interface as extending interfaces does.
+
+    Own properties replace inherited properties of the same name while keeping the place of the inherited property so that the order of properties is that of their first declaration along the extends chain.
+
+    Parameters
+    ----------
+    inherited : tuple[EvaluatedProperty, ...]
+        The properties of the parents of the interface.
+
+    own : tuple[EvaluatedProperty, ...]
+        The properties that the interface declares.
+
+    Returns
+    -------
+    tuple[EvaluatedProperty, ...]
+        The inherited properties followed by the own properties that aren't inherited.
+    """
+    properties = {p.name: p for p in inherited}
+    properties.update((p.name, p) for p in own)
+
+    return tuple(properties.values())
+
+
+# MARK: Evaluator
+
+
+class TypeEvaluator:
+    """
+    Evaluate type aliases and interfaces into the properties of object types, including those that interfaces inherit.
+
+    Object literal types, intersections, references to interfaces and other type aliases, generic type aliases and the Partial, Required, Readonly, Pick and Omit utility types are evaluated.
+    Other types can't be evaluated, in which case the type aliases that use them aren't evaluated.
+    Interfaces are flattened along their extends chains, with parents that aren't declared or that extend the interface themselves being skipped.
+    The evaluation of each type alias and interface is memoized for each set of type arguments so that types that many others are derived from or extend are only evaluated once.
+
+    Parameters
+    ----------
+    interfaces : Mapping[str, TypeScriptInterface]
+        The interfaces that type aliases can reference.
+
+    type_aliases : Mapping[str, TypeScriptTypeAlias]
+        The type aliases to evaluate.
+
+    files : Mapping[str, str], default=None
+        The path of the file that declares each interface and type alias so that properties from other files aren't located within the file of a type alias.
+    """
+
+    def __init__(
+        self,
+        interfaces: Mapping[str, TypeScriptInterface],
+        type_aliases: Mapping[str, TypeScriptTypeAlias],
+        files: Mapping[str, str] | None = None,
+    ) -> None:
+        self.interfaces = interfaces
+        self.type_aliases = type_aliases
+        self.files = files or {}
+        self._evaluated: dict[tuple[str, tuple[EvaluatedType, ...]], EvaluatedType] = {}
+        self._evaluating: set[tuple[str, tuple[EvaluatedType, ...]]] = set()
+
+    def evaluate(
+        self, name: str, arguments: tuple[EvaluatedType, ...] = ()
+    ) -> EvaluatedType:
+        """
+        Evaluate a type alias or interface, memoizing the result.
+
+        Parameters
+        ----------
+        name : str
+            The name of the type alias or interface.
+
+        arguments : tuple[EvaluatedType, ...], default=()
+            The evaluated type arguments of a generic type alias.
+
+        Returns
+        -------
+        EvaluatedType
+            The evaluated type, or None if it isn't declared, can't be evaluated or references itself.
+        """
+        key = (name, arguments)
+        if key in self._evaluated:
+            return self._evaluated[key]
+
+        if key in self._evaluating:
+            return None
+
+        self._evaluating.add(key)
+        try:
+            if (type_alias := self.type_aliases.get(name)) is not None:
+                evaluated = self._evaluate_type_alias(type_alias, arguments)
+
+            elif (interface := self.interfaces.get(name)) is not None:
+                evaluated = self._evaluate_interface(interface)
+
+            else:
+                evaluated = None
+
+        finally:
+            self._evaluating.discard(key)
+
+        self._evaluated[key] = evaluated
+
+        return evaluated
+
+    def get_interface(self, name: str) -> TypeScriptInterface | None:
+        """
+        Evaluate a type alias or interface into an interface with all of its properties that can be checked against a backend model.
+
+        Parameters
+        ----------
+        name : str
+            The name of the type alias or interface.
+
+        Returns
+        -------
+        TypeScriptInterface | None
+            The interface with the properties of the type alias or the flattened properties of the interface, or None if it doesn't evaluate to an object type.
+
+        Notes
+        -----
+        Properties that are declared within other files are located at the name of the type alias or interface.
+        """
+        declaration = self.type_aliases.get(name) or self.interfaces.get(name)
+        if isinstance(declaration, TypeScriptInterface) and not declaration.parents:
+            return declaration
+
+        evaluated = self.evaluate(name)
+        if (
+            declaration is None
+            or (isinstance(declaration, TypeScriptTypeAlias) and declaration.parameters)
+            or not isinstance(evaluated, tuple)
+        ):
+            return None
+
+        file = self.files.get(name)
+        positions = [
+            position
+            for p in evaluated
+            if (position := p.position if p.file == file else declaration.position)
+            is not None
+        ]
+        property_positions = array("q")
+        # Positions are only kept if all properties have one as they're looked up by index.
+        if len(positions) == len(evaluated):
+            for position in positions:
+                property_positions.extend(position)
+
+        return TypeScriptInterface(
+            name=name,
+            properties=tuple(p.name for p in evaluated),
+            optional_properties=tuple(p.name for p in evaluated if p.optional),
+            parents=declaration.parents
+            if isinstance(declaration, TypeScriptInterface)
+            else (),
+            position=declaration.position,
+            property_positions=property_positions,
+        )
+
+    def evaluate_type_aliases(self) -> dict[str, TypeScriptInterface]:
+        """
+        Evaluate all type aliases that describe object types into interfaces.
+
+        Returns
+        -------
+        dict[str, TypeScriptInterface]
+            The interfaces of the type aliases that could be evaluated in the order the type aliases are declared.
+        """
+        return {
+            name: interface
+            for name in self.type_aliases
+            if (interface := self.get_interface(name)) is not None
+        }
+
+    def _evaluate_type_alias(
+        self, type_alias: TypeScriptTypeAlias, arguments: tuple[EvaluatedType, ...]
+    ) -> EvaluatedType:
+        """
+        Evaluate the type of a type alias with its type parameters bound to type arguments.
+
+        Parameters
+        ----------
+        type_alias : TypeScriptTypeAlias
+            The type alias to evaluate.
+
+        arguments : tuple[EvaluatedType, ...]
+            The evaluated type arguments, with missing arguments being unevaluated.
+
+        Returns
+        -------
+        EvaluatedType
+            The evaluated type.
+        """
+        parameters = dict.fromkeys(type_alias.parameters)
+        parameters.update(zip(type_alias.parameters, arguments))
+
+        return self._evaluate_expression(
+            expression=type_alias.type,
+            parameters=parameters,
+            file=self.files.get(type_alias.name),
+        )
+
+    def _evaluate_interface(self, interface: TypeScriptInterface) -> EvaluatedType:
+        """
+        Evaluate an interface into its properties and those that it inherits.
+
+        Parameters
+        ----------
+        interface : TypeScriptInterface
+            The interface to evaluate.
+
+        Returns
+        -------
+        EvaluatedType
+            The properties that the interface inherits in the order of its parents followed by its own.
+        """
+        parents = [
+            self.evaluate(self._resolve_name(parent)) for parent in interface.parents
+        ]
+        own_properties = self._get_object_properties(
+            interface, file=self.files.get(interface.name)
+        )
+        # Parents that can't be evaluated, such as those from other packages, don't add properties.
+        inherited = intersect([p for p in parents if isinstance(p, tuple)])
+
+        return extend(inherited, own_properties)
+
+    def _resolve_name(self, name: str) -> str:
+        """
+        Resolve a name that's qualified by a namespace import to the name of its declaration.
+
+        Parameters
+        ----------
+        name : str
+            The name of a type, which may be qualified.
+
+        Returns
+        -------
+        str
+            The name itself if it's declared, or otherwise the name without its namespaces.
+        """
+        if name in self.type_aliases or name in self.interfaces:
+            return name
+
+        return name.rpartition(".")[2]
+
+    def _get_object_properties(
+        self, interface: TypeScriptInterface, file: str | None
+    ) -> tuple[EvaluatedProperty, ...]:
+        """
+        Get the properties that an interface or object literal type declares.
+
+        Parameters
+        ----------
+        interface : TypeScriptInterface
+            The interface or object literal type.
+
+        file : str | None
+            The path of the file that declares it.
+
+        Returns
+        -------
+        tuple[EvaluatedProperty, ...]
+            The declared properties.
+        """
+        return tuple(
+            EvaluatedProperty(
+                name=name,
+                optional=name in interface.optional_property_set,
+                file=file,
+                position=interface.get_property_position(name),
+            )
+            for name in interface.properties
+        )
+
+    def _evaluate_expression(
+        self,
+        expression: TypeExpression,
+        parameters: dict[str, EvaluatedType],
+        file: str | None,
+    ) -> EvaluatedType:
+        """
+        Evaluate a type expression.
+
+        Parameters
+        ----------
+        expression : TypeExpression
+            The type expression to evaluate.
+
+        parameters : dict[str, EvaluatedType]
+            The evaluated type arguments of the type parameters that are in scope.
+
+        file : str | None
+            The path of the file that the type expression is within.
+
+        Returns
+        -------
+        EvaluatedType
+            The evaluated type.
+        """
+        if isinstance(expression, TypeScriptInterface):
+            return self._get_object_properties(expression, file=file)
+
+        if isinstance(expression, StringLiteralType):
+            return frozenset({expression.value})
+
+        if isinstance(expression, (IntersectionType, UnionType)):
+            return self._evaluate_type_list(
+                expression, parameters=parameters, file=file
+            )
+
+        if isinstance(expression, TypeReference):
+            return self._evaluate_reference(
+                expression, parameters=parameters, file=file
+            )
+
+        return None
+
+    def _evaluate_type_list(
+        self,
+        expression: IntersectionType | UnionType,
+        parameters: dict[str, EvaluatedType],
+        file: str | None,
+    ) -> EvaluatedType:
+        """
+        Evaluate an intersection of object types or a union of key types.
+
+        Parameters
+        ----------
+        expression : IntersectionType | UnionType
+            The intersection or union to evaluate.
+
+        parameters : dict[str, EvaluatedType]
+            The evaluated type arguments of the type parameters that are in scope.
+
+        file : str | None
+            The path of the file that the type expression is within.
+
+        Returns
+        -------
+        EvaluatedType
+            The evaluated type, which is None for intersections of other types than object types and unions of other types than key types.
+        """
+        types = [
+            self._evaluate_expression(t, parameters=parameters, file=file)
+            for t in expression.types
+        ]
+        if isinstance(expression, IntersectionType):
+            object_types = [t for t in types if isinstance(t, tuple)]
+
+            return intersect(object_types) if len(object_types) == len(types) else None
+
+        key_types = [t for t in types if isinstance(t, frozenset)]
+
+        return frozenset().union(*key_types) if len(key_types) == len(types) else None
+
+    def _evaluate_reference(
+        self,
+        reference: TypeReference,
+        parameters: dict[str, EvaluatedType],
+        file: str | None,
+    ) -> EvaluatedType:
+        """
+        Evaluate a reference to a type parameter, utility type, type alias or interface.
+
+        Parameters
+        ----------
+        reference : TypeReference
+            The type reference to evaluate.
+
+        parameters : dict[str, EvaluatedType]
+            The evaluated type arguments of the type parameters that are in scope.
+
+        file : str | None
+            The path of the file that the type reference is within.
+
+        Returns
+        -------
+        EvaluatedType
+            The evaluated type.
+        """
+        name = self._resolve_name(reference.name)
+        if name in parameters and not reference.arguments:
+            return parameters[name]
+
+        arguments = tuple(
+            self._evaluate_expression(a, parameters=parameters, file=file)
+            for a in reference.arguments
+        )
+        # Declared types shadow the utility types of the same name.
+        if name in self.type_aliases:
+            return self.evaluate(name, arguments)
+
+        if name in self.interfaces:
+            return self.evaluate(name)
+
+        if name in OBJECT_UTILITY_TYPES and len(arguments) == 1:
+            if isinstance(arguments[0], tuple):
+                return OBJECT_UTILITY_TYPES[name](arguments[0])
+
+        elif name in KEY_UTILITY_TYPES and len(arguments) == 2:
+            properties, keys = arguments
+            if isinstance(properties, tuple) and isinstance(keys, frozenset):
+                return KEY_UTILITY_TYPES[name](properties, keys)
+
+        return None
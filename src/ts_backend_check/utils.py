@@ -3,10 +3,26 @@
 Utility functions for ts-backend-check.
 """
 
+import glob
+import math
+import mmap
+import os
+import re
+import time
+from collections.abc import Generator, Sequence
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 CWD_PATH = Path.cwd()
+CGROUP_ROOT_PATH = Path("/sys/fs/cgroup")
+# Large files are scanned and released in chunks of this many bytes so that memory use stays bounded.
+SCAN_CHUNK_SIZE = 1 << 22
+UTF8_CONTINUATION_BYTES = bytes(range(0x80, 0xC0))
+# Directories of a models package that don't define models.
+EXCLUDED_MODEL_DIR_NAMES = frozenset({"migrations", "__pycache__"})
+GLOB_CHARACTERS_PATTERN = re.compile(r"[*?[]")
 
 
 def get_config_file_path() -> Path:
@@ -35,6 +51,57 @@ def get_config_file_path() -> Path:
         return yaml_path
 
 
+def get_backend_model_file_paths(backend_model_path: Path) -> list[Path]:
+    """
+    Get the models files that the backend model path of an identifier refers to.
+
+    Parameters
+    ----------
+    backend_model_path : Path
+        The path to a models file, to a directory such as a models package or a glob of models files and directories.
+
+    Returns
+    -------
+    list[Path]
+        The models files in sorted order, which is empty if the path doesn't lead to any.
+
+    Notes
+    -----
+    The Python files of directories are found recursively, skipping migrations.
+    Globs are expanded with '**' matching any number of directories.
+    """
+    if backend_model_path.is_file():
+        return [backend_model_path]
+
+    if GLOB_CHARACTERS_PATTERN.search(str(backend_model_path)):
+        matched_paths = [
+            Path(p) for p in sorted(glob.glob(str(backend_model_path), recursive=True))
+        ]
+
+    else:
+        matched_paths = [backend_model_path]
+
+    models_file_paths: list[Path] = []
+    for path in matched_paths:
+        if path.is_file():
+            models_file_paths.append(path)
+
+        elif path.is_dir():
+            models_file_paths.extend(
+                sorted(
+                    p
+                    for p in path.rglob("*.py")
+                    if p.is_file()
+                    and EXCLUDED_MODEL_DIR_NAMES.isdisjoint(
+                        p.relative_to(path).parts[:-1]
+                    )
+                )
+            )
+
+    return list(dict.fromkeys(models_file_paths))
+
+
+@lru_cache(maxsize=None)
 def snake_to_camel(input_str: str) -> str:
     """
     Convert snake_case to camelCase while preserving existing camelCase components.
@@ -71,16 +138,18 @@ def snake_to_camel(input_str: str) -> str:
     return result
 
 
-def is_ordered_subset(reference_list: list[Any], candidate_sub_list: list[Any]) -> bool:
+def is_ordered_subset(
+    reference_list: Sequence[Any], candidate_sub_list: Sequence[Any]
+) -> bool:
     """
     Return True if candidate elements appear in the same relative order as they do in the reference.
 
     Parameters
     ----------
-    reference_list : list
+    reference_list : Sequence
         The original list to reference.
 
-    candidate_sub_list : list
+    candidate_sub_list : Sequence
         A potential list that has elements that are in the same relative order to the reference.
 
     Returns
@@ -90,3 +159,239 @@ def is_ordered_subset(reference_list: list[Any], candidate_sub_list: list[Any])
     """
     it = iter(reference_list)
     return all(item in it for item in candidate_sub_list)
+
+
+def get_line_starts(text: str) -> list[int]:
+    """
+    Get the offsets of the start of each line of a text.
+
+    Parameters
+    ----------
+    text : str
+        The text to index.
+
+    Returns
+    -------
+    list[int]
+        The offset of the first character of each line.
+    """
+    return [0, *(m.end() for m in re.finditer("\n", text))]
+
+
+@contextmanager
+def map_file(file_path: str | Path) -> Generator[mmap.mmap | bytes, None, None]:
+    """
+    Memory-map a file for reading so that it can be scanned without being read into memory.
+
+    Parameters
+    ----------
+    file_path : str | Path
+        The path to the file to map.
+
+    Yields
+    ------
+    mmap.mmap | bytes
+        The read-only mapping of the file, or empty bytes for an empty file as these can't be mapped.
+    """
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mapped_file.madvise(mmap.MADV_SEQUENTIAL)
+
+            yield mapped_file
+
+
+def release_mapped_pages(buffer: Any, start: int, end: int) -> None:
+    """
+    Let the operating system drop the pages of a memory-mapped file that have already been scanned.
+
+    Pages are read from the page cache again if they're accessed afterwards, so this only bounds memory use and never changes what's read.
+
+    Parameters
+    ----------
+    buffer : Any
+        The buffer that was scanned, with nothing being done if it isn't a memory-mapped file.
+
+    start : int
+        The offset of the start of the scanned span.
+
+    end : int
+        The offset of the end of the scanned span, with only whole pages before it being released.
+    """
+    if not isinstance(buffer, mmap.mmap) or not hasattr(mmap, "MADV_DONTNEED"):
+        return
+
+    start -= start % mmap.PAGESIZE
+    end -= end % mmap.PAGESIZE
+    if end > start:
+        buffer.madvise(mmap.MADV_DONTNEED, start, end - start)
+
+
+class LineCounter:
+    """
+    Convert increasing byte offsets of UTF-8 text to lines and columns without indexing every line.
+
+    Only the bytes between consecutive offsets are counted, in chunks of at most SCAN_CHUNK_SIZE, so that memory use doesn't depend on the size of the text.
+
+    Parameters
+    ----------
+    buffer : Any
+        The bytes or memory-mapped file that the offsets are within.
+    """
+
+    def __init__(self, buffer: Any) -> None:
+        self.buffer = buffer
+        self.offset = 0
+        self.line = 1
+        self.column = 1
+
+    def get_line_and_column(self, offset: int) -> tuple[int, int]:
+        """
+        Get the line and column of an offset that's at or after the previous offset.
+
+        Parameters
+        ----------
+        offset : int
+            The byte offset within the buffer.
+
+        Returns
+        -------
+        tuple[int, int]
+            The line and column of the offset, both starting at 1 and with columns counted in characters.
+        """
+        if offset <= self.offset:
+            return self.line, self.column
+
+        for start in range(self.offset, offset, SCAN_CHUNK_SIZE):
+            chunk = self.buffer[start : min(start + SCAN_CHUNK_SIZE, offset)]
+            if n_newlines := chunk.count(b"\n"):
+                self.line += n_newlines
+                self.column = 1
+                chunk = chunk[chunk.rindex(b"\n") + 1 :]
+
+            # Continuation bytes are removed so that each character is counted once.
+            self.column += len(chunk.translate(None, UTF8_CONTINUATION_BYTES))
+
+        self.offset = offset
+
+        return self.line, self.column
+
+
+class ParseTimeoutError(Exception):
+    """
+    Raised when parsing a file takes longer than its time budget.
+
+    Parameters
+    ----------
+    file_path : str | Path
+        The path to the file that was being parsed.
+
+    timeout : float
+        The number of seconds that parsing the file could take.
+    """
+
+    def __init__(self, file_path: str | Path, timeout: float) -> None:
+        super().__init__(file_path, timeout)
+        self.file_path = file_path
+        self.timeout = timeout
+
+    def __str__(self) -> str:
+        """
+        Describe which file took too long to parse.
+
+        Returns
+        -------
+        str
+            The message of the error.
+        """
+        return f"Parsing {self.file_path} took longer than the parse timeout of {self.timeout:g} seconds."
+
+
+class Deadline:
+    """
+    The time by which parsing a file has to finish, which parsers check as they make progress through the file.
+
+    Parameters
+    ----------
+    file_path : str | Path
+        The path to the file that's being parsed.
+
+    timeout : float
+        The number of seconds from now that parsing the file can take.
+    """
+
+    def __init__(self, file_path: str | Path, timeout: float) -> None:
+        self.file_path = file_path
+        self.timeout = timeout
+        self.end = time.monotonic() + timeout
+
+    def check(self) -> None:
+        """
+        Raise an error if the deadline has passed.
+
+        Raises
+        ------
+        ParseTimeoutError
+            If parsing the file has taken longer than the timeout.
+        """
+        if time.monotonic() > self.end:
+            raise ParseTimeoutError(file_path=self.file_path, timeout=self.timeout)
+
+
+def get_cgroup_cpu_quota() -> float | None:
+    """
+    Get the number of CPUs that the cgroup of the process is limited to.
+
+    Both cgroup v2 (cpu.max) and v1 (cpu.cfs_quota_us and cpu.cfs_period_us) limits are checked.
+
+    Returns
+    -------
+    float | None
+        The CPU quota of the process, or None if there is no quota or it can't be read.
+    """
+    try:
+        quota, period = (CGROUP_ROOT_PATH / "cpu.max").read_text().split()[:2]
+        if quota != "max":
+            return int(quota) / int(period)
+
+        return None
+
+    except (OSError, ValueError):
+        pass
+
+    try:
+        quota = (CGROUP_ROOT_PATH / "cpu" / "cpu.cfs_quota_us").read_text().strip()
+        period = (CGROUP_ROOT_PATH / "cpu" / "cpu.cfs_period_us").read_text().strip()
+        if int(quota) > 0 and int(period) > 0:
+            return int(quota) / int(period)
+
+    except (OSError, ValueError):
+        pass
+
+    return None
+
+
+def get_available_cpu_count() -> int:
+    """
+    Get the number of CPUs that the process can use given its CPU affinity and cgroup quota.
+
+    Returns
+    -------
+    int
+        The number of CPUs available to the process, which is at least 1.
+    """
+    try:
+        cpu_count = len(os.sched_getaffinity(0))
+
+    except AttributeError:
+        # CPU affinity isn't available on macOS or Windows.
+        cpu_count = os.cpu_count() or 1
+
+    if cpu_quota := get_cgroup_cpu_quota():
+        cpu_count = min(cpu_count, math.ceil(cpu_quota))
+
+    return max(cpu_count, 1)
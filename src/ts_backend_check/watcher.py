@@ -0,0 +1,268 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Watchers that report when the files of identifiers change.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Iterable
+
+POLL_INTERVAL_SECONDS = 0.5
+# Editors often write a file in several steps, so events are collected until the files are quiet.
+DEBOUNCE_INTERVAL_SECONDS = 0.1
+
+# Flags of inotify_init1 and inotify_add_watch from <sys/inotify.h>.
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+INOTIFY_EVENT_HEADER = struct.Struct("iIII")
+
+
+# MARK: Polling
+
+
+class PollingWatcher:
+    """
+    Watch files for changes by polling their modification times and sizes.
+
+    Parameters
+    ----------
+    file_paths : Iterable[Path]
+        The files to watch, which don't need to exist yet.
+
+    poll_interval : float, default=POLL_INTERVAL_SECONDS
+        The number of seconds between polls of the files.
+    """
+
+    def __init__(
+        self, file_paths: Iterable[Path], poll_interval: float = POLL_INTERVAL_SECONDS
+    ) -> None:
+        self.file_paths = {Path(p).resolve() for p in file_paths}
+        self.poll_interval = poll_interval
+        self._signatures = {p: self._get_signature(p) for p in self.file_paths}
+
+    @staticmethod
+    def _get_signature(file_path: Path) -> tuple[int, int] | None:
+        """
+        Get the modification time and size of a file.
+
+        Parameters
+        ----------
+        file_path : Path
+            The file to stat.
+
+        Returns
+        -------
+        tuple[int, int] | None
+            The modification time in nanoseconds and size of the file, or None if it doesn't exist.
+        """
+        try:
+            stat = file_path.stat()
+
+        except OSError:
+            return None
+
+        return stat.st_mtime_ns, stat.st_size
+
+    def poll(self) -> set[Path]:
+        """
+        Check the files for changes since the last poll.
+
+        Returns
+        -------
+        set[Path]
+            The resolved paths of the files that changed.
+        """
+        changed_paths: set[Path] = set()
+        for file_path in self.file_paths:
+            signature = self._get_signature(file_path)
+            if signature != self._signatures[file_path]:
+                self._signatures[file_path] = signature
+                changed_paths.add(file_path)
+
+        return changed_paths
+
+    def wait_for_changes(self, timeout: float | None = None) -> set[Path]:
+        """
+        Wait until at least one of the files changes.
+
+        Parameters
+        ----------
+        timeout : float, default=None
+            The maximum number of seconds to wait, with None waiting indefinitely.
+
+        Returns
+        -------
+        set[Path]
+            The resolved paths of the files that changed, which is empty if the timeout passed.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not (changed_paths := self.poll()):
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+
+            time.sleep(self.poll_interval)
+
+        return changed_paths
+
+    def close(self) -> None:
+        """
+        Release the resources of the watcher.
+        """
+
+
+# MARK: inotify
+
+
+class InotifyWatcher:
+    """
+    Watch files for changes via the Linux inotify API.
+
+    The parent directories of the files are watched so that files that are replaced by editors or version control are still tracked.
+
+    Parameters
+    ----------
+    file_paths : Iterable[Path]
+        The files to watch, which don't need to exist yet if their directories do.
+
+    Raises
+    ------
+    OSError
+        If inotify isn't available or a directory can't be watched.
+    """
+
+    def __init__(self, file_paths: Iterable[Path]) -> None:
+        self.file_paths = {Path(p).resolve() for p in file_paths}
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify isn't available on this platform.")
+
+        self._fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+        self._watched_dirs: dict[int, Path] = {}
+        mask = (
+            IN_MODIFY
+            | IN_CLOSE_WRITE
+            | IN_MOVED_FROM
+            | IN_MOVED_TO
+            | IN_CREATE
+            | IN_DELETE
+        )
+        for dir_path in sorted({p.parent for p in self.file_paths}):
+            if not dir_path.is_dir():
+                continue
+
+            wd = libc.inotify_add_watch(self._fd, os.fsencode(dir_path), mask)
+            if wd < 0:
+                errno = ctypes.get_errno()
+                os.close(self._fd)
+                raise OSError(errno, os.strerror(errno), str(dir_path))
+
+            self._watched_dirs[wd] = dir_path
+
+    def _read_events(self) -> set[Path]:
+        """
+        Read the pending events of the watched directories.
+
+        Returns
+        -------
+        set[Path]
+            The resolved paths of the watched files that the events are for.
+        """
+        try:
+            buffer = os.read(self._fd, 64 * 1024)
+
+        except BlockingIOError:
+            return set()
+
+        changed_paths: set[Path] = set()
+        offset = 0
+        while offset < len(buffer):
+            wd, _, _, name_length = INOTIFY_EVENT_HEADER.unpack_from(buffer, offset)
+            offset += INOTIFY_EVENT_HEADER.size
+            name = buffer[offset : offset + name_length].rstrip(b"\0")
+            offset += name_length
+
+            if (dir_path := self._watched_dirs.get(wd)) is not None and (
+                file_path := dir_path / os.fsdecode(name)
+            ) in self.file_paths:
+                changed_paths.add(file_path)
+
+        return changed_paths
+
+    def wait_for_changes(self, timeout: float | None = None) -> set[Path]:
+        """
+        Wait until at least one of the files changes.
+
+        Parameters
+        ----------
+        timeout : float, default=None
+            The maximum number of seconds to wait, with None waiting indefinitely.
+
+        Returns
+        -------
+        set[Path]
+            The resolved paths of the files that changed, which is empty if the timeout passed.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        changed_paths: set[Path] = set()
+        while not changed_paths:
+            remaining = (
+                None if deadline is None else max(deadline - time.monotonic(), 0)
+            )
+            if not select.select([self._fd], [], [], remaining)[0]:
+                return changed_paths
+
+            changed_paths = self._read_events()
+
+        while select.select([self._fd], [], [], DEBOUNCE_INTERVAL_SECONDS)[0]:
+            changed_paths |= self._read_events()
+
+        return changed_paths
+
+    def close(self) -> None:
+        """
+        Release the resources of the watcher.
+        """
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def create_file_watcher(file_paths: Iterable[Path]) -> InotifyWatcher | PollingWatcher:
+    """
+    Create the most efficient watcher that's available for the platform.
+
+    Parameters
+    ----------
+    file_paths : Iterable[Path]
+        The files to watch.
+
+    Returns
+    -------
+    InotifyWatcher | PollingWatcher
+        An inotify watcher on Linux, or a polling watcher if inotify isn't available.
+    """
+    file_paths = list(file_paths)
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(file_paths)
+
+        except OSError:
+            pass
+
+    return PollingWatcher(file_paths)
@@ -0,0 +1,396 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Writers that stream diagnostics in machine-readable formats for CI systems and other tools.
+"""
+
+import json
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, TextIO
+from xml.sax.saxutils import escape, quoteattr
+
+from ts_backend_check.cache import get_tool_version
+from ts_backend_check.diagnostics import DIAGNOSTIC_DESCRIPTIONS, Diagnostic
+
+TEXT_OUTPUT_FORMAT = "text"
+SARIF_SCHEMA_URI = "https://json.schemastore.org/sarif-2.1.0.json"
+TOOL_INFORMATION_URI = "https://github.com/activist-org/ts-backend-check"
+
+
+class DiagnosticWriter(ABC):
+    """
+    Abstract base class for writers that write each diagnostic as soon as it's found.
+
+    Parameters
+    ----------
+    stream : TextIO
+        The stream that the output is written to.
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        self.stream = stream
+
+    def start(self) -> None:
+        """
+        Write what comes before the diagnostics of the first identifier.
+        """
+
+    @abstractmethod
+    def write(self, identifier: str, diagnostic: Diagnostic) -> None:
+        """
+        Write a diagnostic.
+
+        Parameters
+        ----------
+        identifier : str
+            The identifier whose check found the diagnostic.
+
+        diagnostic : Diagnostic
+            The diagnostic to write.
+        """
+
+    def end_identifier(
+        self, identifier: str, backend_model_file_path: Path, n_errors: int
+    ) -> None:
+        """
+        Write what comes after the diagnostics of an identifier.
+
+        Parameters
+        ----------
+        identifier : str
+            The identifier that was checked.
+
+        backend_model_file_path : Path
+            The path to the backend models of the identifier.
+
+        n_errors : int
+            The number of diagnostics that were written for the identifier.
+        """
+
+    def end(self) -> None:
+        """
+        Write what comes after the diagnostics of the last identifier.
+        """
+
+
+# MARK: JSON Lines
+
+
+class JsonLinesWriter(DiagnosticWriter):
+    """
+    Write each diagnostic as a line of JSON.
+    """
+
+    def write(self, identifier: str, diagnostic: Diagnostic) -> None:
+        """
+        Write a diagnostic as a line of JSON.
+
+        Parameters
+        ----------
+        identifier : str
+            The identifier whose check found the diagnostic.
+
+        diagnostic : Diagnostic
+            The diagnostic to write.
+        """
+        self.stream.write(
+            json.dumps(
+                {
+                    "identifier": identifier,
+                    **diagnostic.to_dict(),
+                    "message": diagnostic.message.strip(),
+                }
+            )
+            + "\n"
+        )
+
+
+# MARK: SARIF
+
+
+class SarifWriter(DiagnosticWriter):
+    """
+    Write diagnostics as the results of a SARIF 2.1.0 log, with each result being written as it's found.
+
+    Parameters
+    ----------
+    stream : TextIO
+        The stream that the output is written to.
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        super().__init__(stream=stream)
+        self._n_results = 0
+
+    def start(self) -> None:
+        """
+        Write the description of the tool and its rules and open the list of results.
+        """
+        driver = {
+            "name": "ts-backend-check",
+            "version": get_tool_version(),
+            "informationUri": TOOL_INFORMATION_URI,
+            "rules": [
+                {"id": code, "shortDescription": {"text": description}}
+                for code, description in DIAGNOSTIC_DESCRIPTIONS.items()
+            ],
+        }
+        header = json.dumps(
+            {
+                "$schema": SARIF_SCHEMA_URI,
+                "version": "2.1.0",
+                "runs": [{"tool": {"driver": driver}, "results": []}],
+            }
+        )
+        # The document is split at the empty list of results so that results can be streamed into it.
+        self.stream.write(header[: header.rindex("[]") + 1])
+
+    def write(self, identifier: str, diagnostic: Diagnostic) -> None:
+        """
+        Write a diagnostic as a SARIF result.
+
+        Parameters
+        ----------
+        identifier : str
+            The identifier whose check found the diagnostic.
+
+        diagnostic : Diagnostic
+            The diagnostic to write.
+        """
+        result: dict[str, Any] = {
+            "ruleId": diagnostic.code,
+            "level": "error",
+            "message": {"text": diagnostic.message.strip()},
+            "properties": {
+                "identifier": identifier,
+                "model": diagnostic.model,
+                "field": diagnostic.field,
+                "interfaces": list(diagnostic.interfaces),
+            },
+        }
+        if diagnostic.file is not None:
+            physical_location: dict[str, Any] = {
+                "artifactLocation": {"uri": Path(diagnostic.file).as_posix()}
+            }
+            if diagnostic.line is not None:
+                physical_location["region"] = {
+                    "startLine": diagnostic.line,
+                    "startColumn": diagnostic.column or 1,
+                }
+
+            result["locations"] = [{"physicalLocation": physical_location}]
+
+        self.stream.write(("," if self._n_results else "") + json.dumps(result))
+        self._n_results += 1
+
+    def end(self) -> None:
+        """
+        Close the list of results and the log.
+        """
+        self.stream.write("]}]}\n")
+
+
+# MARK: JUnit XML
+
+
+class JUnitWriter(DiagnosticWriter):
+    """
+    Write diagnostics as failed JUnit XML test cases, with a test suite for each identifier.
+
+    Identifiers without errors are written as a test suite with a single passing test case.
+
+    Parameters
+    ----------
+    stream : TextIO
+        The stream that the output is written to.
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        super().__init__(stream=stream)
+        self._open_identifier: str | None = None
+
+    def start(self) -> None:
+        """
+        Write the XML declaration and open the test suites.
+        """
+        self.stream.write(
+            '<?xml version="1.0" encoding="UTF-8"?>\n<testsuites name="ts-backend-check">\n'
+        )
+
+    def _open_test_suite(self, identifier: str) -> None:
+        """
+        Open the test suite of an identifier if it isn't already open.
+
+        Parameters
+        ----------
+        identifier : str
+            The identifier to open the test suite of.
+        """
+        if self._open_identifier != identifier:
+            self.stream.write(f"  <testsuite name={quoteattr(identifier)}>\n")
+            self._open_identifier = identifier
+
+    def write(self, identifier: str, diagnostic: Diagnostic) -> None:
+        """
+        Write a diagnostic as a failed test case.
+
+        Parameters
+        ----------
+        identifier : str
+            The identifier whose check found the diagnostic.
+
+        diagnostic : Diagnostic
+            The diagnostic to write.
+        """
+        self._open_test_suite(identifier=identifier)
+        name = (
+            f"{diagnostic.model}.{diagnostic.field}"
+            if diagnostic.field
+            else diagnostic.model
+        )
+        location = (
+            f" file={quoteattr(diagnostic.file)}" if diagnostic.file is not None else ""
+        ) + (f' line="{diagnostic.line}"' if diagnostic.line is not None else "")
+        self.stream.write(
+            f"    <testcase classname={quoteattr(identifier)} name={quoteattr(name)}{location}>\n"
+            f"      <failure type={quoteattr(diagnostic.code)} message={quoteattr(diagnostic.summary)}>"
+            f"{escape(diagnostic.message.strip())}</failure>\n"
+            "    </testcase>\n"
+        )
+
+    def end_identifier(
+        self, identifier: str, backend_model_file_path: Path, n_errors: int
+    ) -> None:
+        """
+        Close the test suite of an identifier, writing a passing test case if it has no errors.
+
+        Parameters
+        ----------
+        identifier : str
+            The identifier that was checked.
+
+        backend_model_file_path : Path
+            The path to the backend models of the identifier.
+
+        n_errors : int
+            The number of diagnostics that were written for the identifier.
+        """
+        self._open_test_suite(identifier=identifier)
+        if not n_errors:
+            self.stream.write(
+                f"    <testcase classname={quoteattr(identifier)} name={quoteattr(str(backend_model_file_path))}/>\n"
+            )
+
+        self.stream.write("  </testsuite>\n")
+        self._open_identifier = None
+
+    def end(self) -> None:
+        """
+        Close the test suite of an identifier that was stopped early and the test suites.
+        """
+        if self._open_identifier is not None:
+            self.stream.write("  </testsuite>\n")
+
+        self.stream.write("</testsuites>\n")
+
+
+# MARK: GitHub
+
+
+def escape_github_data(value: str) -> str:
+    """
+    Escape the message of a GitHub Actions workflow command.
+
+    Parameters
+    ----------
+    value : str
+        The message to escape.
+
+    Returns
+    -------
+    str
+        The message with percent signs and line breaks escaped.
+    """
+    return value.replace("%", "%25").replace("\r", "%0D").replace("\n", "%0A")
+
+
+def escape_github_property(value: str) -> str:
+    """
+    Escape a property of a GitHub Actions workflow command.
+
+    Parameters
+    ----------
+    value : str
+        The value of the property to escape.
+
+    Returns
+    -------
+    str
+        The value with the characters that separate properties also escaped.
+    """
+    return escape_github_data(value).replace(":", "%3A").replace(",", "%2C")
+
+
+class GitHubWriter(DiagnosticWriter):
+    """
+    Write each diagnostic as a GitHub Actions error annotation.
+    """
+
+    def write(self, identifier: str, diagnostic: Diagnostic) -> None:
+        """
+        Write a diagnostic as an error workflow command.
+
+        Parameters
+        ----------
+        identifier : str
+            The identifier whose check found the diagnostic.
+
+        diagnostic : Diagnostic
+            The diagnostic to write.
+        """
+        properties = {
+            "file": Path(diagnostic.file).as_posix() if diagnostic.file else None,
+            "line": diagnostic.line,
+            "col": diagnostic.column,
+            "title": f"ts-backend-check ({identifier}): {diagnostic.summary}",
+        }
+        property_text = ",".join(
+            f"{k}={escape_github_property(str(v))}"
+            for k, v in properties.items()
+            if v is not None
+        )
+        self.stream.write(
+            f"::error {property_text}::{escape_github_data(diagnostic.message.strip())}\n"
+        )
+
+
+OUTPUT_FORMAT_WRITERS: dict[str, type[DiagnosticWriter]] = {
+    "jsonl": JsonLinesWriter,
+    "sarif": SarifWriter,
+    "junit": JUnitWriter,
+    "github": GitHubWriter,
+}
+OUTPUT_FORMATS = [TEXT_OUTPUT_FORMAT, *OUTPUT_FORMAT_WRITERS]
+
+
+def create_writer(output_format: str, stream: TextIO) -> DiagnosticWriter | None:
+    """
+    Create the writer for an output format.
+
+    Parameters
+    ----------
+    output_format : str
+        One of OUTPUT_FORMATS.
+
+    stream : TextIO
+        The stream that the output is written to.
+
+    Returns
+    -------
+    DiagnosticWriter | None
+        The writer, or None for the text output that's rendered for people.
+    """
+    if output_format == TEXT_OUTPUT_FORMAT:
+        return None
+
+    return OUTPUT_FORMAT_WRITERS[output_format](stream=stream)
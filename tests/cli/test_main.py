@@ -3,16 +3,33 @@
 Tests for the CLI main functionality rewritten in unittest style.
 """
 
+import json
+import os
 import subprocess
 import sys
 import tempfile
+import time
 import unittest
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
+import rich
 import yaml
 
-from ts_backend_check.cli.main import main
+from ts_backend_check.cache import ResultCache
+from ts_backend_check.cli.main import (
+    ErrorBudget,
+    handle_daemon_request,
+    main,
+    watch_identifiers,
+)
+from ts_backend_check.daemon import (
+    DAEMON_IS_SUPPORTED,
+    DAEMON_SOCKET_ENV_VAR,
+    DaemonState,
+    is_daemon_running,
+)
+from ts_backend_check.diagnostics import MISSING_FIELD, Diagnostic
 from ts_backend_check.utils import get_config_file_path
 
 YAML_CONFIG_FILE_PATH = get_config_file_path()
@@ -292,6 +309,11 @@ class TestCliMain(unittest.TestCase):
                 "UserModel": ["User"],
             },
             backend_models_to_ignore=["BackendOnlyModel"],
+            parse_cache=ANY,
+            result_cache=None,
+            model_results=None,
+            error_budget=ANY,
+            writer=None,
         )
 
     def test_all_flag_invokes_check_files_and_print_results_for_all_identifiers(self):
@@ -339,14 +361,229 @@ class TestCliMain(unittest.TestCase):
                 check_blank=expected_check_blank,
                 model_name_conversions=expected_model_name_conversions,
                 backend_models_to_ignore=expected_backend_models_to_ignore,
+                parse_cache=ANY,
+                result_cache=None,
+                model_results=None,
+                error_budget=ANY,
+                writer=None,
             )
 
+    def test_all_flag_with_jobs_matches_serial_output(self):
+        """
+        Checking identifiers in parallel should print the same output in the same order and exit the same way.
+        """
+        serial = subprocess.run(
+            [sys.executable, "src/ts_backend_check/cli/main.py", "--all"],
+            capture_output=True,
+            text=True,
+        )
+        parallel = subprocess.run(
+            [
+                sys.executable,
+                "src/ts_backend_check/cli/main.py",
+                "--all",
+                "--jobs",
+                "2",
+            ],
+            capture_output=True,
+            text=True,
+        )
+
+        self.assertEqual(parallel.returncode, serial.returncode)
+        self.assertEqual(parallel.stdout, serial.stdout)
+        self.assertIn("'valid_model'", parallel.stdout)
+        self.assertIn("'invalid_model'", parallel.stdout)
+
+    def test_handle_daemon_request_matches_cold_output(self):
+        """
+        Checks that are forwarded to the daemon should print the same output and exit the same way as a cold run.
+        """
+        cold = subprocess.run(
+            [sys.executable, "src/ts_backend_check/cli/main.py", "--all"],
+            capture_output=True,
+            text=True,
+        )
+
+        daemon_state = DaemonState()
+        self.addCleanup(daemon_state.close)
+        # The daemon renders output for the client via the global console of rich.
+        self.addCleanup(rich.reconfigure)
+        request = {
+            "argv": ["--all"],
+            "console": {
+                "force_terminal": False,
+                "color_system": None,
+                "no_color": False,
+                "width": 80,
+            },
+        }
+        for _ in range(2):
+            response = handle_daemon_request(request, daemon_state=daemon_state)
+
+            self.assertEqual(response["exit_code"], cold.returncode)
+            self.assertEqual(response["stdout"], cold.stdout)
+
+        self.assertIn("valid_model", daemon_state.model_results)
+
+    @unittest.skipUnless(DAEMON_IS_SUPPORTED, "Requires Unix domain sockets.")
+    def test_daemon_serves_forwarded_checks(self):
+        """
+        The CLI should forward checks to a running daemon and the daemon should remove its socket when stopped.
+        """
+        socket_path = self.tmp_path / "tsbc.sock"
+        env = {**os.environ, DAEMON_SOCKET_ENV_VAR: str(socket_path)}
+        cold = subprocess.run(
+            [sys.executable, "src/ts_backend_check/cli/main.py", "--all"],
+            capture_output=True,
+            text=True,
+        )
+
+        daemon = subprocess.Popen(
+            [sys.executable, "src/ts_backend_check/cli/main.py", "--daemon"],
+            env=env,
+            stdout=subprocess.DEVNULL,
+        )
+        try:
+            for _ in range(100):
+                if is_daemon_running(socket_path):
+                    break
+
+                time.sleep(0.05)
+
+            warm = subprocess.run(
+                [sys.executable, "src/ts_backend_check/cli/main.py", "--all"],
+                env=env,
+                capture_output=True,
+                text=True,
+            )
+
+        finally:
+            daemon.terminate()
+            daemon.wait(timeout=10)
+
+        self.assertEqual(warm.returncode, cold.returncode)
+        self.assertEqual(warm.stdout, cold.stdout)
+        self.assertFalse(socket_path.exists())
+
+    def test_error_budget_limits_errors_without_consuming_more(self) -> None:
+        """
+        The error budget should yield errors until it's exhausted without pulling further errors.
+        """
+        consumed: list[str] = []
+
+        def errors():
+            for error in ["first", "second", "third"]:
+                consumed.append(error)
+                yield error
+
+        error_budget = ErrorBudget(max_errors=2)
+
+        self.assertEqual(list(error_budget.limit(errors())), ["first", "second"])
+        self.assertEqual(consumed, ["first", "second"])
+        self.assertTrue(error_budget.exhausted)
+        self.assertEqual(list(error_budget.limit(["fourth"])), [])
+        self.assertFalse(ErrorBudget().exhausted)
+
+    def test_fail_fast_stops_after_first_error(self) -> None:
+        """
+        --fail-fast should print a single error, skip later identifiers and exit with 1.
+        """
+        for args in (["--fail-fast"], ["--max-errors", "1", "--jobs", "2"]):
+            result = subprocess.run(
+                [sys.executable, "src/ts_backend_check/cli/main.py", "--all", *args],
+                capture_output=True,
+                text=True,
+            )
+            stdout_flat = " ".join(result.stdout.split())
+
+            self.assertEqual(result.returncode, 1)
+            self.assertIn("Please fix the 1 error above", stdout_flat)
+            self.assertIn(
+                "Stopped checking after reaching the maximum of 1 error.", stdout_flat
+            )
+            self.assertEqual(stdout_flat.count("ts-backend-check error"), 1)
+
+    def test_parse_timeout_reports_the_file_that_took_too_long(self) -> None:
+        """
+        --parse-timeout should name the file whose parse took too long and exit with 1 rather than hang.
+        """
+        for args in ([], ["--jobs", "2"]):
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    "src/ts_backend_check/cli/main.py",
+                    "--all",
+                    "--parse-timeout",
+                    "0.000001",
+                    *args,
+                ],
+                capture_output=True,
+                text=True,
+            )
+            stdout_flat = " ".join(result.stdout.split())
+
+            self.assertEqual(result.returncode, 1)
+            self.assertIn(
+                f"Parsing {config['valid_model']['backend_model_path']} took longer than the parse timeout of 1e-06 seconds.",
+                stdout_flat,
+            )
+
+    def test_output_format_writes_only_machine_readable_output_to_stdout(self) -> None:
+        """
+        --output-format should write the diagnostics to stdout and other messages to stderr.
+        """
+        result = subprocess.run(
+            [
+                sys.executable,
+                "src/ts_backend_check/cli/main.py",
+                "--all",
+                "--output-format",
+                "jsonl",
+            ],
+            capture_output=True,
+            text=True,
+        )
+        diagnostics = [json.loads(line) for line in result.stdout.splitlines()]
+
+        self.assertEqual(result.returncode, 1)
+        self.assertEqual(
+            [d["code"] for d in diagnostics],
+            ["missing-field", "blank-field-not-optional", "missing-interface"],
+        )
+        self.assertTrue(all(d["identifier"] == "invalid_model" for d in diagnostics))
+        self.assertIn("is not a valid file", " ".join(result.stderr.split()))
+
+    def test_cache_flag_replays_results_without_parsing(self):
+        """
+        A second run with --cache should replay the results of the first run without parsing any files.
+        """
+        cache_dir = self.tmp_path / ".tsbc-cache"
+        with patch(
+            "ts_backend_check.cli.main.ResultCache",
+            side_effect=lambda: ResultCache(cache_dir=cache_dir),
+        ):
+            with patch("ts_backend_check.cli.main.rprint") as first_rprint:
+                with patch(
+                    "sys.argv", ["ts-backend-check", "-i", "valid_model", "--cache"]
+                ):
+                    main()
+
+            with patch("ts_backend_check.cli.main.TypeChecker") as MockTypeChecker:
+                with patch("ts_backend_check.cli.main.rprint") as second_rprint:
+                    with patch(
+                        "sys.argv", ["ts-backend-check", "-i", "valid_model", "--cache"]
+                    ):
+                        main()
+
+        MockTypeChecker.assert_not_called()
+        self.assertEqual(second_rprint.call_args_list, first_rprint.call_args_list)
+
     def test_typechecker_no_missing_fields_prints_success(self):
         """
-        When TypeChecker.check() returns an empty list, the CLI should print the success message.
+        When TypeChecker.iter_diagnostics() yields no errors, the CLI should print the success message.
         """
         with patch("ts_backend_check.cli.main.TypeChecker") as MockTypeChecker:
-            MockTypeChecker.return_value.check.return_value = []
+            MockTypeChecker.return_value.iter_diagnostics.return_value = iter([])
 
             with patch("ts_backend_check.cli.main.rprint") as mock_rprint:
                 with patch(
@@ -370,31 +607,34 @@ class TestCliMain(unittest.TestCase):
 
     def test_typechecker_missing_fields_exits_with_one_and_prints_errors(self):
         """
-        When TypeChecker.check() returns missing fields, the CLI should print errors
+        When TypeChecker.iter_diagnostics() yields missing fields, the CLI should print errors
         and exit with status code 1.
         """
-        # Patch TypeChecker so its .check() returns a list of missing-field messages.
+        # Patch TypeChecker so its .iter_diagnostics() yields a missing-field diagnostic.
         with patch("ts_backend_check.cli.main.TypeChecker") as MockTypeChecker:
-            MockTypeChecker.return_value.check.return_value = [
-                "TestModel.age is missing in TypeScript type"
-            ]
+            MockTypeChecker.return_value.iter_diagnostics.return_value = iter(
+                [
+                    Diagnostic(
+                        code=MISSING_FIELD,
+                        model="TestModel",
+                        models_file="models.py",
+                        field="age",
+                        interfaces=("Test",),
+                    )
+                ]
+            )
 
-            # Make Text.from_markup return the raw string to simplify assertions.
-            with patch(
-                "ts_backend_check.cli.main.Text.from_markup",
-                side_effect=lambda s: s,
-            ):
-                with patch("ts_backend_check.cli.main.rprint") as mock_rprint:
-                    with patch(
-                        "sys.argv",
-                        [
-                            "ts-backend-check",
-                            "--identifier",
-                            "invalid_model",
-                        ],
-                    ):
-                        with self.assertRaises(SystemExit) as cm:
-                            main()
+            with patch("ts_backend_check.cli.main.rprint") as mock_rprint:
+                with patch(
+                    "sys.argv",
+                    [
+                        "ts-backend-check",
+                        "--identifier",
+                        "invalid_model",
+                    ],
+                ):
+                    with self.assertRaises(SystemExit) as cm:
+                        main()
 
         # Check that the exit code is 1.
         self.assertEqual(cm.exception.code, 1)
@@ -415,6 +655,106 @@ class TestCliMain(unittest.TestCase):
             msg=f"Expected error header in rprint calls, got: {calls_str}",
         )
 
+    def test_watch_identifiers_rechecks_changed_identifiers(self) -> None:
+        """
+        Watch mode should check all identifiers, then re-check only those whose files changed.
+        """
+        models_file = self.tmp_path / "models.py"
+        models_file.write_text(
+            "from django.db import models\n\n\n"
+            "class Event(models.Model):\n"
+            "    title = models.CharField(max_length=255)\n"
+            "    date = models.DateField()\n"
+        )
+        ts_file = self.tmp_path / "event.ts"
+        ts_file.write_text("export interface Event {\n  title: string;\n}\n")
+        other_ts_file = self.tmp_path / "other.ts"
+        other_ts_file.write_text(
+            "export interface Event {\n  title: string;\n  date: string;\n}\n"
+        )
+        watch_config = {
+            "event": {
+                "backend_model_path": str(models_file),
+                "ts_interface_paths": [str(ts_file)],
+            },
+            "other": {
+                "backend_model_path": str(models_file),
+                "ts_interface_paths": [str(other_ts_file)],
+            },
+        }
+
+        edits: list[str] = [
+            "export interface Event {\n  title: string;\n  date: string;\n}\n"
+        ]
+
+        def wait_for_changes() -> set[Path]:
+            if not edits:
+                raise KeyboardInterrupt
+
+            ts_file.write_text(edits.pop())
+            return {ts_file.resolve()}
+
+        with patch("ts_backend_check.cli.main.create_file_watcher") as mock_watcher:
+            mock_watcher.return_value.wait_for_changes.side_effect = wait_for_changes
+            with patch("ts_backend_check.cli.main.rprint") as mock_rprint:
+                watch_identifiers(watch_config, ["event", "other"])
+
+        mock_watcher.return_value.close.assert_called_once()
+        calls = [str(call_args[0][0]) for call_args in mock_rprint.call_args_list]
+        results = [c for c in calls if "ts-backend-check error" in c or "Success" in c]
+
+        self.assertEqual(len(results), 3)
+        self.assertIn("ts-backend-check error", results[0])
+        self.assertIn("'other'", results[1])
+        self.assertIn("Success", results[2])
+        self.assertIn("'event'", results[2])
+        self.assertIn("Stopped watching for changes", calls[-1])
+
+    def test_watch_identifiers_reports_invalid_files_and_keeps_watching(
+        self,
+    ) -> None:
+        """
+        Watch mode should print errors from models files that can't be parsed and re-check once they're fixed.
+        """
+        models = (
+            "from django.db import models\n\n\n"
+            "class Event(models.Model):\n"
+            "    title = models.CharField(max_length=255)\n"
+        )
+        models_file = self.tmp_path / "models.py"
+        models_file.write_text(models)
+        ts_file = self.tmp_path / "event.ts"
+        ts_file.write_text("export interface Event {\n  title: string;\n}\n")
+        watch_config = {
+            "event": {
+                "backend_model_path": str(models_file),
+                "ts_interface_paths": [str(ts_file)],
+            }
+        }
+
+        edits: list[str] = [models, models.replace("class Event(", "class Event((")]
+
+        def wait_for_changes() -> set[Path]:
+            if not edits:
+                raise KeyboardInterrupt
+
+            models_file.write_text(edits.pop())
+            return {models_file.resolve()}
+
+        with patch("ts_backend_check.cli.main.create_file_watcher") as mock_watcher:
+            mock_watcher.return_value.wait_for_changes.side_effect = wait_for_changes
+            with patch("ts_backend_check.cli.main.rprint") as mock_rprint:
+                watch_identifiers(watch_config, ["event"])
+
+        calls = [str(call_args[0][0]) for call_args in mock_rprint.call_args_list]
+        results = [c for c in calls if "Could not check" in c or "Success" in c]
+
+        self.assertEqual(len(results), 3)
+        self.assertIn("Success", results[0])
+        self.assertIn("Could not check 'event'", results[1])
+        self.assertIn("Success", results[2])
+        self.assertIn("Stopped watching for changes", calls[-1])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,37 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""
+Tests for the cache statistics and pruning functionality.
+"""
+
+from unittest.mock import patch
+
+from ts_backend_check.artifact_store import ArtifactStore
+from ts_backend_check.cache import ARTIFACT_STORE_FILE_NAME
+from ts_backend_check.cli.manage_cache import print_cache_stats, prune_cache
+
+
+def test_print_cache_stats_without_cache(tmp_path):
+    with patch("ts_backend_check.cli.manage_cache.rprint") as mock_rprint:
+        print_cache_stats(cache_dir=tmp_path / ".tsbc-cache")
+
+    assert "There is no ts-backend-check cache" in mock_rprint.call_args[0][0]
+
+
+def test_print_cache_stats_and_prune(tmp_path):
+    cache_dir = tmp_path / ".tsbc-cache"
+    artifact_store = ArtifactStore(db_path=cache_dir / ARTIFACT_STORE_FILE_NAME)
+    artifact_store.put(key="key", kind="ts", data="data")
+    artifact_store.get("key")
+    artifact_store.close()
+
+    with patch("ts_backend_check.cli.manage_cache.rprint") as mock_rprint:
+        print_cache_stats(cache_dir=cache_dir)
+
+    output = "\n".join(c[0][0] for c in mock_rprint.call_args_list)
+    assert "Parsed files: 1 entries" in output
+    assert "Parsed file hit rate: 100.0% (1 hits, 0 misses)" in output
+
+    with patch("ts_backend_check.cli.manage_cache.rprint") as mock_rprint:
+        prune_cache(max_size_mb=0, max_age_days=30, cache_dir=cache_dir)
+
+    assert "Pruned 1 parsed files and 0 check results" in mock_rprint.call_args[0][0]
@@ -37,6 +37,11 @@ def return_valid_concatenated_types_file():
     return concatenated_types_file
 
 
+@pytest.fixture
+def return_valid_ts_interface_paths():
+    return valid_ts_interfaces
+
+
 @pytest.fixture
 def return_valid_check_blank_models():
     return valid_check_blank_models
@@ -1,17 +1,58 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import timeit
+
 import pytest
 
 from ts_backend_check.parsers.django_parser import (
     extract_model_fields,
 )
+from ts_backend_check.utils import ParseTimeoutError
+
+MODEL_HEADER = "class A(models.Model):\n    a = models.CharField()\n"
+# Inputs that backtracking regular expressions take quadratic time on, by the number of repetitions.
+ADVERSARIAL_INPUTS = {
+    "blank_lines": lambda n: MODEL_HEADER + "    \n" * n + "    pass\n",
+    "directives_without_inherit": lambda n: (
+        MODEL_HEADER + "    " + "# tsbc: " * n + "\n"
+    ),
+    "inherit_directives": lambda n: (
+        MODEL_HEADER + "    " + "# tsbc: inherit b " * n + "\n"
+    ),
+    "long_name": lambda n: MODEL_HEADER + "    " + "a" * n + "\n",
+    "classes": lambda n: "class A(B):\n    pass\n" * n,
+}
+
+
+@pytest.mark.parametrize("name", ADVERSARIAL_INPUTS)
+def test_extract_model_fields_of_adversarial_inputs_in_linear_time(name):
+    sources = [ADVERSARIAL_INPUTS[name](n) for n in (2_000, 8_000)]
+    times = [
+        min(
+            timeit.repeat(
+                lambda: extract_model_fields("models.py", [], source=source),
+                number=1,
+                repeat=2,
+            )
+        )
+        for source in sources
+    ]
+
+    # Linear scans take about four times as long on inputs that are four times as large, whereas quadratic ones take sixteen times as long.
+    assert times[1] < 8 * times[0] + 0.05
+
+
+def test_extract_model_fields_raises_parse_timeout_error(return_valid_django_models):
+    assert extract_model_fields(return_valid_django_models, [], timeout=60)
+    with pytest.raises(ParseTimeoutError, match="took longer than the parse timeout"):
+        extract_model_fields(return_valid_django_models, [], timeout=1e-9)
 
 
 def test_extract_model_fields(return_invalid_django_models):
     fields = extract_model_fields(return_invalid_django_models, [])
 
-    assert "EventModel" in fields[0]
-    event_fields = fields[0]["EventModel"]
+    assert "EventModel" in fields
+    event_fields = fields["EventModel"].fields
 
     # Check that all non-private fields are extracted.
     assert "title" in event_fields
@@ -38,10 +79,159 @@ def test_extract_model_fields_with_empty_file(tmp_path):
     empty_file.write_text("")
 
     fields = extract_model_fields(str(empty_file), [])
-    assert fields == ({}, {}, {})
+    assert fields == {}
 
 
 def backend_models_to_ignore_from_config(return_invalid_django_models):
     fields = extract_model_fields(return_invalid_django_models, ["BackendOnlyModel"])
 
-    assert fields[0]["backend_models_to_ignore"][0] == "BackendOnlyModel"
+    assert "BackendOnlyModel" not in fields
+
+
+def test_extract_model_fields_blank_fields(return_valid_django_models):
+    fields = extract_model_fields(return_valid_django_models, ["BackendOnlyModel"])
+
+    user = fields["UserModel"]
+    assert user.fields == ("id", "name", "email", "password")
+    assert user.blank_fields == ("email",)
+    assert user.blank_field_set == frozenset({"email"})
+    assert fields["EventModel"].blank_fields == ("participants",)
+
+
+def test_extract_model_fields_records_model_lines(tmp_path):
+    models_file = tmp_path / "models.py"
+    models_file.write_text(
+        "\n\nfrom django.db import models\n\n\n"
+        "class Event(models.Model):\n"
+        "    title = models.CharField()\n\n\n"
+        "class User(models.Model):\n"
+        "    name = models.CharField()\n"
+    )
+
+    models = extract_model_fields(str(models_file), models_to_ignore=[])
+
+    assert models["Event"].line == 6
+    assert models["User"].line == 10
+
+
+def test_extract_model_fields_in_source_order_with_inherit_directives(tmp_path):
+    models_file = tmp_path / "models.py"
+    models_file.write_text(
+        "from django.db import models\n"
+        "from django.db.models import CharField, ForeignKey\n\n\n"
+        "class Event(models.Model):  # tsbc: inherit id\n"
+        "    title = CharField(max_length=200, blank=True)\n"
+        '    description = models.TextField(help_text="# tsbc: inherit quoted")\n'
+        '    help_text = """\n'
+        "    # tsbc: inherit docstring\n"
+        '    """\n'
+        "    # ts-backend-check: from Base inherit slug (blank=True)\n"
+        "    organizer: ForeignKey = ForeignKey('User', on_delete=models.CASCADE)\n"
+        "    objects = models.Manager()\n"
+        "    ordering_default = 'title'\n\n"
+        "    class Meta:\n"
+        "        abstract = True\n"
+        "        # tsbc: inherit meta_field\n\n"
+        "    def save(self, *args, **kwargs):\n"
+        "        local = models.CharField()\n\n"
+        "    date = models.DateTimeField()\n"
+        "    # tsbc: inherit created_at\n"
+        "# tsbc: inherit module_comment\n\n\n"
+        "class User(models.Model):\n"
+        "    name = models.CharField()\n\n\n"
+        "class Tag(  # tsbc: inherit label\n"
+        "    models.Model): name = CharField()\n"
+    )
+
+    models = extract_model_fields(str(models_file), models_to_ignore=[])
+
+    assert models["Event"].fields == (
+        "id",
+        "title",
+        "description",
+        "slug",
+        "organizer",
+        "date",
+        "created_at",
+    )
+    assert models["Event"].blank_fields == ("title", "slug")
+    assert models["User"].fields == ("name",)
+    assert models["Tag"].fields == ("label", "name")
+
+
+# Models with fields, directives and statements in the places that the visitor has to handle.
+MODEL_SOURCES = {
+    "fields": "from django.db import models\n"
+    "from django.db.models import CharField\n\n\n"
+    "class Event(models.Model, metaclass=Meta):  # tsbc: inherit id\n"
+    '    """\n    Events with # tsbc: inherit docstring in their docstring.\n    """\n\n'
+    "    title = CharField(max_length=200, blank=True)\n"
+    "    organizer = models.ForeignKey(\n"
+    "        'User',  # tsbc: inherit organizer_id\n"
+    "        on_delete=models.CASCADE,\n"
+    "        blank = True,\n"
+    "    )\n"
+    "    slug = models.SlugField(validators=[validate(blank=True)], blank=False)\n"
+    "    _private = models.CharField()\n"
+    "    objects = models.Manager()\n"
+    '    help_text = "# tsbc: inherit quoted"\n\n'
+    "    class Meta:\n"
+    "        ordering = ['-date']\n"
+    "        # tsbc: inherit meta_field\n\n"
+    "    @property\n"
+    "    def label(self):\n"
+    "        title = models.CharField()\n"
+    '        return f"{self.title!r:>{10}}"\n'
+    "    # ts-backend-check: inherit date (blank=True)\n\n\n"
+    "class Tag(Base):\n"
+    "    if DEBUG:\n"
+    "        debug = models.BooleanField(blank=True)\n"
+    "    else:\n"
+    "        # tsbc: inherit release\n"
+    "        pass\n",
+    "assignments": "from django.db import models\n\n\n"
+    "class Event(models.Model):\n"
+    "    title = subtitle = models.CharField(blank=True)\n"
+    "    date = models.DateTimeField(blank=(True))\n"
+    "    slug = models.SlugField() if SLUGS else None\n"
+    "    class Meta: abstract = True\n\n\n"
+    "class User(models.Model):\n"
+    "    name = models.CharField(\n"
+    "        max_length=200\n"
+    "    )\n"
+    "    bio = models.TextField(help_text='Line \\\n"
+    "continued', blank=True)\n"
+    "    email = models.EmailField(blank=True, \\\n"
+    "        max_length=200)\n",
+}
+
+
+MODEL_SOURCE_RESULTS = {
+    "fields": [
+        (
+            "Event",
+            ("id", "title", "organizer", "organizer_id", "slug", "date"),
+            ("title", "organizer", "date"),
+            5,
+        ),
+        ("Tag", ("debug", "release"), ("debug",), 32),
+    ],
+    "assignments": [
+        (
+            "Event",
+            ("title", "subtitle", "date"),
+            ("title", "subtitle", "date"),
+            4,
+        ),
+        ("User", ("name", "bio", "email"), ("bio", "email"), 11),
+    ],
+}
+
+
+@pytest.mark.parametrize("name", MODEL_SOURCES)
+def test_extract_model_fields_of_model_sources(name):
+    models = extract_model_fields("models.py", ["Ignored"], source=MODEL_SOURCES[name])
+
+    assert [
+        (m.name, m.fields, m.blank_fields, m.line) for m in models.values()
+    ] == MODEL_SOURCE_RESULTS[name]
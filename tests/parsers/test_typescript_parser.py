@@ -1,6 +1,85 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from ts_backend_check.parsers.typescript_parser import TypeScriptParser
+import pickle
+import timeit
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from ts_backend_check.artifact_store import serialize_ts_file
+from ts_backend_check.parsers.typescript_parser import (
+    UNSUPPORTED_TYPE,
+    IntersectionType,
+    SourcePosition,
+    StringLiteralType,
+    TypeReference,
+    TypeScriptImport,
+    TypeScriptParser,
+    UnionType,
+    parse_ts_file,
+    parse_ts_interfaces,
+)
+from ts_backend_check.utils import Deadline, ParseTimeoutError
+
+# Inputs that backtracking or recursive scanners take quadratic time or run out of stack on, by the number of repetitions.
+ADVERSARIAL_INPUTS = {
+    "long_name": lambda n: "interface A {\n" + "a" * n + "\n}\n",
+    "whitespace_without_colon": lambda n: "interface A {\n  a" + " " * n + "\n}\n",
+    "optional_without_colon": lambda n: "interface A {\n  'a'" + " " * n + "?\n}\n",
+    "header_without_body": lambda n: "interface A extends " + "B, " * n,
+    "keywords_without_names": lambda n: "interface type import export " * n,
+    "unterminated_comments": lambda n: "/* " * n,
+    "unterminated_strings": lambda n: "'a\n" * n,
+    "nested_object_types": lambda n: (
+        "interface A {\n  a: " + "{ b: " * n + "string" + " }" * n + ";\n}\n"
+    ),
+    "nested_type_arguments": lambda n: (
+        "type A = " + "Array<" * n + "B" + ">" * n + ";\n"
+    ),
+    "nested_parentheses": lambda n: "type A = " + "(" * n + "B" + ")" * n + ";\n",
+    "nested_templates": lambda n: "const a = " + "`${" * n + "`" * n + ";\n",
+    "minified": lambda n: "".join(
+        f"export interface I{i}{{a:string;b?:number}}" for i in range(n)
+    ),
+}
+
+
+@pytest.mark.parametrize("name", ADVERSARIAL_INPUTS)
+def test_parse_adversarial_inputs_in_linear_time(name):
+    texts = [ADVERSARIAL_INPUTS[name](n) for n in (2_000, 8_000)]
+    times = [
+        min(
+            timeit.repeat(
+                lambda: TypeScriptParser(text).parse_file(), number=1, repeat=2
+            )
+        )
+        for text in texts
+    ]
+
+    # Linear scans take about four times as long on inputs that are four times as large, whereas quadratic ones take sixteen times as long.
+    assert times[1] < 8 * times[0] + 0.05
+
+
+def test_deeply_nested_types_are_unsupported():
+    ts_file = TypeScriptParser(
+        ADVERSARIAL_INPUTS["nested_type_arguments"](1_000) + "type B = C;\n"
+    ).parse_file()
+
+    assert list(ts_file.type_aliases) == ["A", "B"]
+    assert ts_file.type_aliases["B"].type == TypeReference(name="C")
+
+
+def test_parse_raises_parse_timeout_error_once_the_deadline_passes(tmp_path):
+    file_path = tmp_path / "types.ts"
+    file_path.write_text(
+        "interface A {\n  title: string;\n}\n" * 10_000, encoding="utf-8"
+    )
+
+    assert "A" in parse_ts_file(file_path, timeout=60).interfaces
+    with pytest.raises(ParseTimeoutError, match="types.ts took longer"):
+        TypeScriptParser(
+            file_path.read_bytes(), deadline=Deadline(file_path, timeout=0)
+        ).parse_file()
 
 
 def test_parse_interfaces(return_invalid_concatenated_types_file):
@@ -66,5 +145,320 @@ def test_parse_interfaces_with_extends(tmp_path):
     assert "ExtendedEvent" in interfaces
 
     extended = interfaces["ExtendedEvent"]
-    assert extended.parents == ["BaseEvent"]
+    assert extended.parents == ("BaseEvent",)
     assert "description" in extended.properties
+
+
+def test_parse_interfaces_property_sets(return_valid_concatenated_types_file):
+    parser = TypeScriptParser(return_valid_concatenated_types_file)
+    event = parser.parse_interfaces()["Event"]
+
+    assert event.properties == ("title", "description", "organizer", "participants")
+    assert event.property_set == frozenset(event.properties)
+    assert event.optional_property_set == frozenset({"participants"})
+
+
+def test_parse_interfaces_records_positions():
+    text = "interface A {\n  title: string;\n}\ninterface B {\n  title?: string;\n  // tsbc: ignore date\n}\n"
+    interfaces = TypeScriptParser(text).parse_interfaces()
+
+    assert interfaces["B"].position == SourcePosition(offset=43, line=4, column=11)
+    assert interfaces["B"].get_property_position("title") == SourcePosition(
+        offset=49, line=5, column=3
+    )
+    assert interfaces["A"].get_property_position("date") is None
+
+
+def test_parse_interfaces_records_byte_offsets_and_character_columns():
+    text = "// Événements\ninterface Événement {\n  titre: string;\n}\n"
+    interfaces = TypeScriptParser(text).parse_interfaces()
+
+    position = interfaces["Événement"].position
+    encoded_text = text.encode("utf-8")
+    assert encoded_text[position.offset :].startswith("Événement".encode("utf-8"))
+    assert (position.line, position.column) == (2, 11)
+    assert interfaces["Événement"].get_property_position("titre")[1:] == (3, 3)
+
+
+def test_parse_ts_file_matches_parsing_text(tmp_path):
+    text = "// tsbc: ignore id\ninterface A {\n  title?: string;\n}\ntype B = A;\n" * 3
+    file_path = tmp_path / "types.ts"
+    file_path.write_text(text, encoding="utf-8")
+    ts_parser = TypeScriptParser(text)
+
+    ts_file = parse_ts_file(file_path)
+    assert ts_file == ts_parser.parse_file()
+    assert (
+        ts_file.interfaces["A"].position == ts_parser.parse_interfaces()["A"].position
+    )
+    assert (
+        ts_file.type_aliases["B"].position
+        == ts_parser.parse_type_aliases()["B"].position
+    )
+    assert ts_file.ignored_fields == frozenset(ts_parser.get_ignored_fields()) == {"id"}
+
+
+def test_lazy_parse_skips_interface_bodies(tmp_path):
+    text = (
+        "interface Base {\n  id: string;\n}\n"
+        "// tsbc: ignore secret\n"
+        "export interface Événement extends Base, models.Named {\n"
+        "  title?: string;\n  nested: { inner: `${'}'}` };\n  date: string;\n}\n"
+        "type Draft = Partial<Événement>;\n"
+    )
+    file_path = tmp_path / "types.ts"
+    file_path.write_text(text, encoding="utf-8")
+    ts_file = parse_ts_file(file_path)
+
+    lazy_ts_file = parse_ts_file(file_path, lazy=True)
+    assert lazy_ts_file.interfaces == {}
+    assert [(u.name, u.parents) for u in lazy_ts_file.unparsed_interfaces] == [
+        ("Base", ()),
+        ("Événement", ("Base", "models.Named")),
+    ]
+    # Type aliases and ignored fields are still found by the first pass.
+    assert lazy_ts_file.type_aliases == ts_file.type_aliases
+    assert lazy_ts_file.ignored_fields == {"secret"}
+
+    interfaces = parse_ts_interfaces(file_path, lazy_ts_file.unparsed_interfaces[1:])
+    assert interfaces == {"Événement": ts_file.interfaces["Événement"]}
+    assert interfaces["Événement"].position == ts_file.interfaces["Événement"].position
+    assert (
+        interfaces["Événement"].property_positions
+        == ts_file.interfaces["Événement"].property_positions
+    )
+
+
+def test_pickled_interfaces_leave_out_derived_sets():
+    interface = TypeScriptParser(
+        "interface Event {\n  title?: string;\n  date: string;\n}\n"
+    ).parse_interfaces()["Event"]
+    data = pickle.dumps(interface)
+    unpickled_interface = pickle.loads(data)
+
+    assert b"frozenset" not in data
+    assert unpickled_interface == interface
+    assert unpickled_interface.position == interface.position
+    assert unpickled_interface.property_positions == interface.property_positions
+    assert unpickled_interface.optional_property_set == {"title"}
+
+
+def test_parse_interfaces_in_chunks_matches_parsing_at_once(monkeypatch):
+    text = (
+        "// tsbc: ignore id\nexport interface Event extends Base {\n  title?: string;\n  date: string;\n}\n"
+        * 5
+    ).replace("Event", "Événement", 2)
+    expected_interfaces = TypeScriptParser(text).parse_interfaces()
+    expected_ignored_fields = TypeScriptParser(text).get_ignored_fields()
+
+    # Chunks that are smaller than the prefixes of the patterns check that matches across chunks are found.
+    monkeypatch.setattr("ts_backend_check.parsers.typescript_parser.SCAN_CHUNK_SIZE", 3)
+    ts_parser = TypeScriptParser(text)
+    interfaces = ts_parser.parse_interfaces()
+
+    assert interfaces == expected_interfaces
+    assert [i.position for i in interfaces.values()] == [
+        i.position for i in expected_interfaces.values()
+    ]
+    assert ts_parser.get_ignored_fields() == expected_ignored_fields == {"id"}
+
+
+SEGMENTED_TEXT = (
+    "".join(
+        f"// tsbc: ignore id{i}\n"
+        f"export interface Model{i} extends Base {{\n  title?: string;\n  date: string;\n}}\n"
+        f"type Alias{i} = Partial<Model{i}>;\n"
+        f'export {{ Model{i} as Renamed{i} }} from "./models{i}";\n'
+        for i in range(20)
+    )
+    + "/*\ninterface Commented {\n  title: string;\n}\n*/\n"
+    + "declare namespace Nested {\ninterface Inner {\n  name: string;\n}\n}\n"
+    + "export interface Model0 {\n  replaced: string;\n}\n"
+)
+
+
+def test_find_split_points_are_at_top_level_declarations():
+    text = (
+        "interface A {\n  a: string;\n}\n"
+        "/*\ninterface Commented {}\n*/\n"
+        "const s = `\ninterface Templated {}\n`;\n"
+        "declare namespace N {\ninterface Nested {}\n}\n"
+        "interface B {\n  b: string;\n}\n"
+    )
+    split_points = TypeScriptParser(text).find_split_points(n_segments=4)
+
+    # Lines in comments, template literals and braces are passed over for the next top-level declaration.
+    assert [text.encode("utf-8")[p.offset :].split(b"\n")[0] for p in split_points] == [
+        b"declare namespace N {",
+        b"interface B {",
+    ]
+    assert [(p.line, p.column) for p in split_points] == [(10, 1), (13, 1)]
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_parse_ts_file_in_segments_matches_serial_parse(tmp_path, monkeypatch, lazy):
+    file_path = tmp_path / "types.ts"
+    file_path.write_text(SEGMENTED_TEXT, encoding="utf-8")
+    ts_file = parse_ts_file(file_path, lazy=lazy)
+
+    monkeypatch.setattr(
+        "ts_backend_check.parsers.typescript_parser.MIN_SEGMENT_SIZE", 1
+    )
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        segmented_ts_file = parse_ts_file(
+            file_path, lazy=lazy, executor=executor, max_segments=8
+        )
+
+    assert len(TypeScriptParser(SEGMENTED_TEXT).find_split_points(8)) == 7
+    # Serializing the files also compares the positions of declarations and properties.
+    assert serialize_ts_file(segmented_ts_file) == serialize_ts_file(ts_file)
+    assert list(segmented_ts_file.interfaces) == list(ts_file.interfaces)
+
+
+def test_parse_ts_file_in_segments_falls_back_to_serial_parse(tmp_path, monkeypatch):
+    file_path = tmp_path / "types.ts"
+    file_path.write_text(SEGMENTED_TEXT, encoding="utf-8")
+    ts_file = parse_ts_file(file_path)
+    # The split point is within the body of the first interface.
+    split_point = TypeScriptParser(SEGMENTED_TEXT)._get_position(
+        SEGMENTED_TEXT.index("date")
+    )
+
+    assert (
+        TypeScriptParser(SEGMENTED_TEXT).parse_segment(
+            start=SourcePosition(0, 1, 1), end=split_point.offset
+        )
+        is None
+    )
+
+    monkeypatch.setattr(
+        "ts_backend_check.parsers.typescript_parser.MIN_SEGMENT_SIZE", 1
+    )
+    monkeypatch.setattr(
+        TypeScriptParser, "find_split_points", lambda self, n_segments: [split_point]
+    )
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        segmented_ts_file = parse_ts_file(file_path, executor=executor, max_segments=2)
+
+    assert serialize_ts_file(segmented_ts_file) == serialize_ts_file(ts_file)
+
+
+def test_parse_interfaces_tracks_comments_strings_templates_and_nesting():
+    text = """
+// interface Commented { title: string }
+const text = "interface Quoted { title: string } // tsbc: ignore quoted";
+const template = `interface ${name} { ${`nested ${"}"}`} }`;
+type Keyword = { interface: string };
+
+/** Generic interfaces with nested object types. */
+export interface Page<T extends { id: string } = Item> extends Base<T>, models.Named {
+  readonly items: T[];
+  meta: {
+    total: number;
+    next?: string;
+  };
+  format?: "{" | "}";
+  label: `${string}-label`;
+  "quotedName"?: string;
+  callback(value: number): void;
+  [key: string]: unknown;
+  first: string; second?: number
+  // ts-backend-check: ignore ignored
+}
+"""
+    ts_parser = TypeScriptParser(text)
+    interfaces = ts_parser.parse_interfaces()
+
+    assert list(interfaces) == ["Page"]
+    page = interfaces["Page"]
+    assert page.properties == (
+        "items",
+        "meta",
+        "format",
+        "label",
+        "quotedName",
+        "first",
+        "second",
+        "ignored",
+    )
+    assert page.optional_properties == ("format", "quotedName", "second")
+    assert page.parents == ("Base", "models.Named")
+    assert ts_parser.get_ignored_fields() == {"ignored"}
+
+    position = page.get_property_position("second")
+    assert (position.line, position.column) == (19, 18)
+
+
+def test_parse_type_aliases():
+    text = """import type { Base } from "./base";
+export type { Other };
+type Event = Base & {
+  title: string; // ts-backend-check: ignore slug
+};
+type Draft<T extends { id: string } = Event> = Partial<Omit<T, "id" | 'slug'>>;
+type Handler = (event: Event) => { handled: boolean };
+type Events = Event[];
+type Conditional<T> = T extends Event ? { a: string } : never;
+"""
+    ts_parser = TypeScriptParser(text)
+    type_aliases = ts_parser.parse_type_aliases()
+
+    assert list(type_aliases) == ["Event", "Draft", "Handler", "Events", "Conditional"]
+    event = type_aliases["Event"]
+    assert (event.position.line, event.position.column) == (3, 6)
+    assert isinstance(event.type, IntersectionType)
+    assert event.type.types[0] == TypeReference(name="Base")
+    assert event.type.types[1].properties == ("title",)
+
+    draft = type_aliases["Draft"]
+    assert draft.parameters == ("T",)
+    assert draft.type == TypeReference(
+        name="Partial",
+        arguments=(
+            TypeReference(
+                name="Omit",
+                arguments=(
+                    TypeReference(name="T"),
+                    UnionType((StringLiteralType("id"), StringLiteralType("slug"))),
+                ),
+            ),
+        ),
+    )
+    assert {
+        type_aliases[name].type for name in ["Handler", "Events", "Conditional"]
+    } == {UNSUPPORTED_TYPE}
+    assert ts_parser.parse_interfaces() == {}
+    assert ts_parser.get_ignored_fields() == {"slug"}
+
+
+def test_parse_imports():
+    text = """import type { User, Event as BaseEvent } from "./models";
+import * as api from '../api';
+import Default, { type Tag } from "@/tags";
+import "./side-effects";
+const lazy = import("./lazy");
+export { Named as Renamed } from "./named";
+export type * from "./types";
+export * as shared from "./shared";
+export { Local };
+export interface Event extends BaseEvent {
+  // import { Ignored } from "./ignored";
+  title: string;
+}
+export type Draft = Partial<Event>;
+"""
+    ts_file = TypeScriptParser(text).parse_file()
+
+    assert ts_file.imports == (
+        TypeScriptImport("User", "User", "./models", False),
+        TypeScriptImport("BaseEvent", "Event", "./models", False),
+        TypeScriptImport("api", "*", "../api", False),
+        TypeScriptImport("Default", "default", "@/tags", False),
+        TypeScriptImport("Tag", "Tag", "@/tags", False),
+        TypeScriptImport("Renamed", "Named", "./named", True),
+        TypeScriptImport("*", "*", "./types", True),
+        TypeScriptImport("shared", "*", "./shared", True),
+    )
+    assert list(ts_file.interfaces) == ["Event"]
+    assert ts_file.interfaces["Event"].parents == ("BaseEvent",)
+    assert list(ts_file.type_aliases) == ["Draft"]
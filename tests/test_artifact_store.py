@@ -0,0 +1,164 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from ts_backend_check.artifact_store import (
+    ArtifactStore,
+    deserialize_interfaces,
+    deserialize_models,
+    deserialize_ts_file,
+    serialize_interfaces,
+    serialize_models,
+    serialize_ts_file,
+)
+from ts_backend_check.cache import ParseCache
+from ts_backend_check.parsers.django_parser import extract_model_fields
+from ts_backend_check.parsers.typescript_parser import TypeScriptParser
+
+
+def test_serialization_round_trip(
+    return_valid_django_models, return_valid_concatenated_types_file
+):
+    models = extract_model_fields(return_valid_django_models, [])
+    assert deserialize_models(serialize_models(models)) == models
+
+    ts_file = TypeScriptParser(
+        return_valid_concatenated_types_file
+        + "type Draft<T> = Partial<Omit<T, 'id' | \"slug\">> & { draft: boolean };\n"
+        + "type Other = string[] | Draft<User>;\n"
+    ).parse_file()
+    assert list(ts_file.type_aliases) == ["Draft", "Other"]
+
+    deserialized_ts_file = deserialize_ts_file(serialize_ts_file(ts_file))
+    assert deserialized_ts_file == ts_file
+    # Positions aren't compared by equality and so are checked separately.
+    assert [
+        (i.position, i.property_positions)
+        for i in deserialized_ts_file.interfaces.values()
+    ] == [(i.position, i.property_positions) for i in ts_file.interfaces.values()]
+    assert [t.position for t in deserialized_ts_file.type_aliases.values()] == [
+        t.position for t in ts_file.type_aliases.values()
+    ]
+
+    lazy_ts_file = TypeScriptParser(
+        return_valid_concatenated_types_file, lazy=True
+    ).parse_file()
+    assert deserialize_ts_file(serialize_ts_file(lazy_ts_file)) == lazy_ts_file
+    assert deserialize_interfaces(serialize_interfaces(ts_file.interfaces)) == (
+        ts_file.interfaces
+    )
+
+
+def test_artifact_store_get_put_and_stats(tmp_path):
+    artifact_store = ArtifactStore(db_path=tmp_path / "artifacts.sqlite3")
+
+    assert artifact_store.get("key") is None
+    artifact_store.put(key="key", kind="ts", data="data")
+    assert artifact_store.get("key") == "data"
+
+    stats = artifact_store.get_stats()
+    assert stats["entries"] == 1
+    assert stats["size"] == 4
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+    artifact_store.close()
+
+
+def test_artifact_store_lookups_are_written_on_flush(tmp_path):
+    db_path = tmp_path / "artifacts.sqlite3"
+    artifact_store = ArtifactStore(db_path=db_path)
+    artifact_store.put(key="key", kind="ts", data="data")
+    reader = sqlite3.connect(db_path)
+    (created_at,) = reader.execute("SELECT last_used_at FROM artifacts").fetchone()
+
+    # Lookups only read from the database until they're flushed.
+    assert artifact_store.get("key") == "data"
+    assert artifact_store.get("missing") is None
+    assert reader.execute("SELECT name, value FROM stats").fetchall() == []
+    assert reader.execute("SELECT last_used_at FROM artifacts").fetchone() == (
+        created_at,
+    )
+
+    artifact_store.flush()
+    assert dict(reader.execute("SELECT name, value FROM stats")) == {
+        "hits": 1,
+        "misses": 1,
+    }
+    assert reader.execute("SELECT last_used_at FROM artifacts").fetchone()[0] > (
+        created_at
+    )
+
+    reader.close()
+    artifact_store.close()
+
+
+def test_artifact_store_prune(tmp_path):
+    artifact_store = ArtifactStore(db_path=tmp_path / "artifacts.sqlite3")
+    for i in range(3):
+        artifact_store.put(key=f"key_{i}", kind="ts", data="x" * 10)
+        time.sleep(0.01)
+
+    # The least recently used entries are evicted first when over the max size.
+    artifact_store.get("key_0")
+    assert artifact_store.prune(max_size=20, max_age_days=1) == 1
+    assert artifact_store.get("key_1") is None
+    assert artifact_store.get("key_0") == "x" * 10
+
+    # All entries are evicted when older than the max age.
+    assert artifact_store.prune(max_size=100, max_age_days=0) == 2
+    assert artifact_store.get_stats()["entries"] == 0
+
+    artifact_store.close()
+
+
+def parse_with_store(db_path, models_file):
+    artifact_store = ArtifactStore(db_path=db_path)
+    try:
+        return len(
+            ParseCache(artifact_store=artifact_store).get_models(models_file, [])
+        )
+
+    finally:
+        artifact_store.close()
+
+
+def test_artifact_store_concurrent_processes(tmp_path, return_valid_django_models):
+    db_path = tmp_path / "artifacts.sqlite3"
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(
+                parse_with_store,
+                [db_path] * 8,
+                [return_valid_django_models] * 8,
+            )
+        )
+
+    assert results == [3] * 8
+
+    artifact_store = ArtifactStore(db_path=db_path)
+    stats = artifact_store.get_stats()
+    assert stats["entries"] == 1
+    assert stats["hits"] + stats["misses"] == 8
+
+    artifact_store.close()
+
+
+def test_parse_cache_uses_artifact_store(tmp_path, return_valid_django_models):
+    artifact_store = ArtifactStore(db_path=tmp_path / "artifacts.sqlite3")
+    models = ParseCache(artifact_store=artifact_store).get_models(
+        return_valid_django_models, []
+    )
+
+    # A new in-memory cache loads the parsed file from the store.
+    assert (
+        ParseCache(artifact_store=artifact_store).get_models(
+            return_valid_django_models, []
+        )
+        == models
+    )
+    assert artifact_store.get_stats()["hits"] == 1
+
+    artifact_store.close()
@@ -0,0 +1,268 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+from ts_backend_check import cache
+from ts_backend_check.cache import ParseCache, ResultCache
+from ts_backend_check.diagnostics import MISSING_FIELD, MISSING_INTERFACE, Diagnostic
+
+
+def test_parse_cache_parses_each_file_once(
+    return_valid_django_models,
+    return_valid_ts_interface_paths,
+    return_valid_backend_models_to_ignore,
+):
+    parse_cache = ParseCache()
+
+    first = parse_cache.get_models(
+        return_valid_django_models, return_valid_backend_models_to_ignore
+    )
+    second = parse_cache.get_models(
+        return_valid_django_models, return_valid_backend_models_to_ignore
+    )
+
+    assert first is second
+    assert parse_cache.misses == 1
+    assert parse_cache.hits == 1
+
+    parse_cache.get_ts_files(return_valid_ts_interface_paths)
+    interface_index = parse_cache.get_ts_files(return_valid_ts_interface_paths)
+
+    assert parse_cache.misses == 1 + len(return_valid_ts_interface_paths)
+    assert parse_cache.hits == 1 + len(return_valid_ts_interface_paths)
+    assert list(interface_index.interfaces) == ["Event", "EventExtended", "User"]
+    assert interface_index.interface_files["User"] == str(
+        return_valid_ts_interface_paths[1]
+    )
+    assert "date" in interface_index.ignored_fields
+    assert not interface_index.duplicates
+
+
+def test_parse_cache_reparses_changed_files(tmp_path):
+    ts_file = tmp_path / "interfaces.ts"
+    ts_file.write_text("export interface Event {\n  title: string;\n}\n")
+
+    parse_cache = ParseCache()
+    interfaces = parse_cache.get_ts_file(ts_file).interfaces
+    assert interfaces["Event"].properties == ("title",)
+
+    ts_file.write_text(
+        "export interface Event {\n  title: string;\n  date: string;\n}\n"
+    )
+    interfaces = parse_cache.get_ts_file(ts_file).interfaces
+
+    assert interfaces["Event"].properties == ("title", "date")
+    assert parse_cache.misses == 2
+
+
+def test_parse_cache_parses_only_needed_interface_bodies(tmp_path):
+    base_file = tmp_path / "base.ts"
+    base_file.write_text(
+        "export interface Base {\n  id: string;\n}\n"
+        "export interface Unused {\n  id: string;\n}\n"
+    )
+    event_file = tmp_path / "event.ts"
+    event_file.write_text(
+        "export interface Event extends Base {\n  title: string;\n}\n"
+        "export interface Other {\n  name: string;\n}\n"
+    )
+    parse_cache = ParseCache()
+
+    with patch(
+        "ts_backend_check.cache.parse_ts_interfaces",
+        wraps=cache.parse_ts_interfaces,
+    ) as parse_ts_interfaces:
+        interface_index = parse_cache.get_ts_files(
+            [base_file, event_file], interface_names=["Event"]
+        )
+        parse_cache.get_ts_files([base_file, event_file], interface_names=["Event"])
+
+    # Parents that are declared in other files that are checked are parsed as well.
+    assert list(interface_index.interfaces) == ["Base", "Event"]
+    assert [
+        [u.name for u in c.args[1]] for c in parse_ts_interfaces.call_args_list
+    ] == [["Base"], ["Event"]]
+
+    base_file.write_text("export interface Base {\n  id: string;\n  slug: string;\n}\n")
+    interface_index = parse_cache.get_ts_files(
+        [base_file, event_file], interface_names=["Event"]
+    )
+
+    assert interface_index.interfaces["Base"].properties == ("id", "slug")
+
+
+def test_parse_cache_parses_files_in_parallel_on_its_executor(tmp_path):
+    ts_files = []
+    for i in range(4):
+        ts_files.append(tmp_path / f"models{i}.ts")
+        ts_files[-1].write_text(
+            f"// tsbc: ignore secret{i}\n"
+            f"export interface Event{i} extends Base {{\n  title: string;\n}}\n"
+            f"export interface Unused{i} {{\n  id: string;\n}}\n"
+        )
+
+    (tmp_path / "base.ts").write_text("export interface Base {\n  id: string;\n}\n")
+    ts_files.append(tmp_path / "base.ts")
+    interface_names = [f"Event{i}" for i in range(4)]
+    expected_index = ParseCache().get_ts_files(ts_files, interface_names)
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        parse_cache = ParseCache(executor=executor, max_workers=2)
+        interface_index = parse_cache.get_ts_files(ts_files, interface_names)
+        # Files are parsed on the workers before they're loaded so that loading them only hits the cache.
+        assert (parse_cache.hits, parse_cache.misses) == (10, 10)
+
+    assert interface_index == expected_index
+    assert [i.property_positions for i in interface_index.interfaces.values()] == [
+        i.property_positions for i in expected_index.interfaces.values()
+    ]
+
+
+def test_parse_cache_merges_models_files_parsed_in_parallel(tmp_path):
+    models_files = []
+    for i in range(3):
+        models_files.append(tmp_path / f"models{i}.py")
+        models_files[-1].write_text(
+            f"class Event{i}(models.Model):\n    title = models.CharField()\n\n"
+            "class Shared(models.Model):\n    name = models.CharField()\n"
+        )
+
+    expected_index = ParseCache().get_model_index(models_files, [])
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        parse_cache = ParseCache(executor=executor, max_workers=2)
+        model_index = parse_cache.get_model_index(models_files, [])
+        # Files are parsed on the workers before they're merged so that merging them only hits the cache.
+        assert (parse_cache.hits, parse_cache.misses) == (3, 3)
+
+    assert model_index == expected_index
+    assert list(model_index.models) == ["Event0", "Shared", "Event1", "Event2"]
+    assert model_index.model_files["Shared"] == str(models_files[2])
+    assert model_index.duplicates["Shared"] == [(str(p), 4) for p in models_files]
+
+
+def test_parse_cache_revalidates_touched_files_by_hash(tmp_path):
+    ts_file = tmp_path / "interfaces.ts"
+    ts_file.write_text("export interface Event {\n  title: string;\n}\n")
+
+    parse_cache = ParseCache()
+    first = parse_cache.get_ts_file(ts_file).interfaces
+    os.utime(ts_file, ns=(0, 0))
+    second = parse_cache.get_ts_file(ts_file).interfaces
+
+    assert first is second
+    assert parse_cache.misses == 1
+    assert parse_cache.hits == 1
+
+
+def test_parse_cache_keys_models_by_models_to_ignore(return_valid_django_models):
+    parse_cache = ParseCache()
+
+    assert "BackendOnlyModel" in parse_cache.get_models(return_valid_django_models, [])
+    assert "BackendOnlyModel" not in parse_cache.get_models(
+        return_valid_django_models, ["BackendOnlyModel"]
+    )
+
+
+def test_result_cache_round_trip(tmp_path, return_valid_django_models):
+    ts_file = tmp_path / "interfaces.ts"
+    ts_file.write_text("export interface Event {\n  title: string;\n}\n")
+    identifier_config = {
+        "backend_model_file_path": Path(return_valid_django_models),
+        "ts_interface_file_paths": [ts_file],
+        "check_blank": True,
+        "model_name_conversions": {},
+        "backend_models_to_ignore": [],
+    }
+
+    result_cache = ResultCache(cache_dir=tmp_path / ".tsbc-cache")
+    key = result_cache.get_key(**identifier_config)
+    assert result_cache.load(key) is None
+
+    diagnostic = Diagnostic(
+        code=MISSING_FIELD,
+        model="EventModel",
+        models_file="models.py",
+        field="date",
+        interfaces=("Event",),
+        file="models.py",
+        line=4,
+        column=1,
+    )
+    result_cache.save(key=key, errors=[diagnostic])
+    result_cache.close()
+
+    # A new cache reuses the stored file hashes without reading unchanged files.
+    result_cache = ResultCache(cache_dir=tmp_path / ".tsbc-cache")
+    with patch("pathlib.Path.read_bytes") as mock_read_bytes:
+        assert result_cache.get_key(**identifier_config) == key
+
+    mock_read_bytes.assert_not_called()
+    assert result_cache.load(key) == [diagnostic]
+
+    # Changes to the files or the configuration lead to new keys.
+    assert result_cache.get_key(**identifier_config | {"check_blank": False}) != key
+
+    ts_file.write_text("export interface Event {\n  date: string;\n}\n")
+    assert result_cache.get_key(**identifier_config) != key
+
+
+def test_result_cache_key_covers_the_files_of_models_directories(tmp_path):
+    models_dir = tmp_path / "models"
+    models_dir.mkdir()
+    (models_dir / "event.py").write_text("class Event(models.Model):\n    pass\n")
+    identifier_config = {
+        "backend_model_file_path": models_dir,
+        "ts_interface_file_paths": [],
+        "check_blank": False,
+        "model_name_conversions": {},
+        "backend_models_to_ignore": [],
+    }
+
+    result_cache = ResultCache(cache_dir=tmp_path / ".tsbc-cache")
+    key = result_cache.get_key(**identifier_config)
+    identifier_key = result_cache.get_identifier_key(**identifier_config)
+
+    # Adding a models file to the directory leads to a new key for the results but not for the identifier.
+    (models_dir / "user.py").write_text("class User(models.Model):\n    pass\n")
+    assert result_cache.get_key(**identifier_config) != key
+    assert result_cache.get_identifier_key(**identifier_config) == identifier_key
+
+
+def test_result_cache_checks_imported_files(tmp_path):
+    imported_file = tmp_path / "models.ts"
+    imported_file.write_text("export interface Event {\n  title: string;\n}\n")
+    result_cache = ResultCache(cache_dir=tmp_path / ".tsbc-cache")
+    result_cache.save(key="key", errors=[], imported_files=[str(imported_file)])
+
+    imported_files: set[Path] = set()
+    assert result_cache.load("key", imported_files=imported_files) == []
+    assert imported_files == {imported_file.resolve()}
+
+    # Results are stale once a file that the checked files imported from changes.
+    imported_file.write_text("export interface Event {\n  date: string;\n}\n")
+    assert result_cache.load("key") is None
+
+
+def test_result_cache_model_results_round_trip(tmp_path):
+    identifier_config = {
+        "backend_model_file_path": Path("models.py"),
+        "ts_interface_file_paths": [Path("interfaces.ts")],
+        "check_blank": False,
+    }
+    result_cache = ResultCache(cache_dir=tmp_path / ".tsbc-cache")
+    key = result_cache.get_identifier_key(**identifier_config)
+
+    assert result_cache.load_model_results(key) == {}
+
+    diagnostic = Diagnostic(
+        code=MISSING_INTERFACE, model="Event", models_file="models.py"
+    )
+    result_cache.save_model_results(
+        key=key, model_results={"Event": ("abc", [diagnostic])}
+    )
+    assert result_cache.load_model_results(key) == {"Event": ("abc", [diagnostic])}
+    assert result_cache.get_identifier_key(**identifier_config) == key
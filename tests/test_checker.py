@@ -1,6 +1,17 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from ts_backend_check.checker import TypeChecker
+from ts_backend_check.diagnostics import (
+    BLANK_FIELD_NOT_OPTIONAL,
+    DUPLICATE_INTERFACE,
+    DUPLICATE_MODEL,
+    MISSING_FIELD,
+    MISSING_INTERFACE,
+)
+from ts_backend_check.interface_index import InterfaceIndex
+from ts_backend_check.model_index import ModelIndex
+from ts_backend_check.parsers.django_parser import extract_model_fields
+from ts_backend_check.parsers.typescript_parser import TypeScriptParser
 
 
 def test_checker_invalid_checks_fail(
@@ -160,3 +171,258 @@ def test_checker_with_ignored_backend_models(
     errors = checker.check()
 
     assert len(errors) == 0
+
+
+def test_checker_model_interfaces_index(
+    return_valid_django_models,
+    return_valid_concatenated_types_file,
+    return_valid_backend_to_ts_conversions,
+    return_valid_backend_models_to_ignore,
+):
+    """
+    Check that matching interfaces are resolved once for each model in the order of the TypeScript files.
+    """
+    checker = TypeChecker(
+        models_file=return_valid_django_models,
+        concatenated_types_file=return_valid_concatenated_types_file,
+        model_name_conversions={"EventModel": ["EventExtended", "Event", "Missing"]},
+        backend_models_to_ignore=return_valid_backend_models_to_ignore,
+    )
+
+    interfaces = checker.model_interfaces["EventModel"]
+    assert list(interfaces.keys()) == ["Event", "EventExtended"]
+    assert "participants" in interfaces["Event"].optional_property_set
+
+    # Models without conversions are matched against interfaces of the same name.
+    assert checker.model_interfaces["UserModel"] == {}
+
+
+def test_checker_reuses_results_of_unchanged_models(tmp_path):
+    """
+    Check that only models whose dependencies have changed are checked again.
+    """
+    model_file = tmp_path / "models.py"
+    model_file.write_text(
+        """from django.db import models
+
+class Event(models.Model):
+    title = models.CharField(max_length=100)
+
+class User(models.Model):
+    name = models.CharField(max_length=100)
+"""
+    )
+    types = """export interface Event {
+    title: string;
+}
+
+export interface User {
+    name: string;
+}
+"""
+    checker = TypeChecker(models_file=str(model_file), concatenated_types_file=types)
+    assert checker.check() == []
+    assert checker.rechecked_models == ["Event", "User"]
+
+    updated_checker = TypeChecker(
+        models_file=str(model_file),
+        concatenated_types_file=types.replace("name: string;", "id: string;"),
+        previous_model_results=checker.model_results,
+    )
+    errors = updated_checker.check()
+
+    assert updated_checker.rechecked_models == ["User"]
+    assert len(errors) == 1
+    assert "Field 'name'" in errors[0]
+
+    # Ignore comments for the fields of a model are also dependencies.
+    ignored_checker = TypeChecker(
+        models_file=str(model_file),
+        concatenated_types_file=types.replace("name: string;", "// tsbc: ignore name"),
+        previous_model_results=updated_checker.model_results,
+    )
+
+    assert ignored_checker.check() == []
+    assert ignored_checker.rechecked_models == ["User"]
+
+
+def test_checker_iter_check_stops_with_consumer(
+    return_invalid_django_models,
+    return_invalid_concatenated_types_file,
+    return_invalid_check_blank_models,
+    return_invalid_backend_to_ts_conversions,
+    return_invalid_backend_models_to_ignore,
+):
+    """
+    Test that errors are yielded as models are checked and that checks stop with the consumer.
+    """
+    checker = TypeChecker(
+        models_file=return_invalid_django_models,
+        concatenated_types_file=return_invalid_concatenated_types_file,
+        check_blank=return_invalid_check_blank_models,
+        model_name_conversions=return_invalid_backend_to_ts_conversions,
+        backend_models_to_ignore=return_invalid_backend_models_to_ignore,
+    )
+    errors = checker.iter_check()
+    first_error = next(errors)
+
+    assert first_error == checker.check()[0]
+
+    checker.previous_model_results = {}
+    errors = checker.iter_check()
+    next(errors)
+    errors.close()
+
+    assert len(checker.rechecked_models) < len(checker.models)
+
+
+def test_checker_locates_diagnostics_in_interface_files(tmp_path):
+    """
+    Check that diagnostics are located at the declarations that they're about and that duplicate interfaces are reported.
+    """
+    model_file = tmp_path / "models.py"
+    model_file.write_text(
+        """from django.db import models
+
+class Event(models.Model):
+    title = models.CharField(max_length=100)
+    date = models.DateField(blank=True)
+
+class User(models.Model):
+    name = models.CharField(max_length=100)
+"""
+    )
+    interface_index = InterfaceIndex()
+    for file_path, text in [
+        ("first.ts", "export interface Event {\n  title: string;\n}\n"),
+        (
+            "second.ts",
+            "export interface Event {\n  title: string;\n  date: string;\n}\n",
+        ),
+    ]:
+        ts_parser = TypeScriptParser(text)
+        interface_index.add_file(
+            file_path, ts_parser.parse_interfaces(), ts_parser.get_ignored_fields()
+        )
+
+    checker = TypeChecker(
+        models_file=str(model_file), check_blank=True, interface_index=interface_index
+    )
+    diagnostics = list(checker.iter_diagnostics())
+
+    assert [(d.code, d.file, d.line, d.column) for d in diagnostics] == [
+        (DUPLICATE_INTERFACE, "second.ts", 1, 18),
+        (BLANK_FIELD_NOT_OPTIONAL, "second.ts", 3, 3),
+        (MISSING_INTERFACE, str(model_file), 7, 1),
+    ]
+    assert "Only the last declaration, in 'second.ts'" in diagnostics[0].message
+
+
+def test_checker_locates_diagnostics_in_models_files(tmp_path):
+    """
+    Check that the diagnostics of models are located in the files that define them and that duplicate models are reported.
+    """
+    model_index = ModelIndex()
+    for file_path, source in [
+        (
+            "models/event.py",
+            "class Event(models.Model):\n    title = models.CharField()\n",
+        ),
+        (
+            "models/user.py",
+            "class User(models.Model):\n    name = models.CharField()\n\n"
+            "class Event(models.Model):\n    date = models.DateField()\n",
+        ),
+    ]:
+        model_index.add_file(file_path, extract_model_fields(file_path, [], source))
+
+    checker = TypeChecker(
+        models_file="models",
+        concatenated_types_file="export interface Event {\n  date: string;\n}\n",
+        model_index=model_index,
+    )
+    diagnostics = list(checker.iter_diagnostics())
+
+    assert [(d.code, d.models_file, d.file, d.line) for d in diagnostics] == [
+        (DUPLICATE_MODEL, "models/user.py", "models/user.py", 4),
+        (MISSING_INTERFACE, "models/user.py", "models/user.py", 1),
+    ]
+    assert "Only the last definition, in 'models/user.py'" in diagnostics[0].message
+
+
+def test_checker_matches_models_to_type_aliases(tmp_path):
+    model_file = tmp_path / "models.py"
+    model_file.write_text(
+        """from django.db import models
+
+class Event(models.Model):
+    title = models.CharField(max_length=100)
+    date = models.DateField(blank=True)
+    location = models.CharField(max_length=100)
+"""
+    )
+    checker = TypeChecker(
+        models_file=str(model_file),
+        concatenated_types_file="""interface BaseEvent {
+  title: string;
+  date: string;
+  secret: string;
+}
+
+export type Event = Omit<BaseEvent, "secret" | "date"> & { date?: string };
+""",
+        check_blank=True,
+    )
+    diagnostics = list(checker.iter_diagnostics())
+
+    assert [(d.code, d.model, d.field) for d in diagnostics] == [
+        (MISSING_FIELD, "Event", "location")
+    ]
+    assert checker.model_interfaces["Event"]["Event"].properties == ("title", "date")
+
+
+def test_checker_flattens_inherited_properties(tmp_path):
+    model_file = tmp_path / "models.py"
+    model_file.write_text(
+        """from django.db import models
+
+class Event(models.Model):
+    title = models.CharField(max_length=100)
+    date = models.DateField(blank=True)
+    is_private = models.BooleanField()
+"""
+    )
+    interface_index = InterfaceIndex()
+    for file_path, text in [
+        ("base.ts", "export interface BaseEvent {\n  title: string;\n}\n"),
+        (
+            "event.ts",
+            "export interface DatedEvent extends BaseEvent {\n  date: string;\n}\n\n"
+            "export interface EventExtended extends DatedEvent {\n  isPrivate: boolean;\n}\n",
+        ),
+    ]:
+        ts_file = TypeScriptParser(text).parse_file()
+        interface_index.add_file(
+            file_path,
+            interfaces=ts_file.interfaces,
+            ignored_fields=ts_file.ignored_fields,
+            type_aliases=ts_file.type_aliases,
+        )
+
+    checker = TypeChecker(
+        models_file=str(model_file),
+        check_blank=True,
+        model_name_conversions={"Event": ["EventExtended"]},
+        interface_index=interface_index,
+    )
+    diagnostics = list(checker.iter_diagnostics())
+
+    # Only the blank field is reported, at the property that the interface inherits.
+    assert [(d.code, d.field, d.file, d.line, d.column) for d in diagnostics] == [
+        (BLANK_FIELD_NOT_OPTIONAL, "date", "event.ts", 2, 3)
+    ]
+    assert checker.model_interfaces["Event"]["EventExtended"].properties == (
+        "title",
+        "date",
+        "isPrivate",
+    )
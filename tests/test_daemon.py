@@ -0,0 +1,125 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import os
+import socket
+import threading
+
+import pytest
+
+from ts_backend_check.daemon import (
+    DAEMON_IS_SUPPORTED,
+    DAEMON_PROTOCOL_VERSION,
+    DAEMON_SOCKET_ENV_VAR,
+    create_private_directory,
+    get_daemon_socket_path,
+    get_response,
+    receive_message,
+    send_message,
+    send_request,
+)
+
+pytestmark = pytest.mark.skipif(
+    not DAEMON_IS_SUPPORTED, reason="Requires Unix domain sockets."
+)
+
+
+def test_get_daemon_socket_path_is_unique_to_project(tmp_path, monkeypatch):
+    monkeypatch.delenv(DAEMON_SOCKET_ENV_VAR, raising=False)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+
+    first = get_daemon_socket_path(tmp_path / "first")
+    second = get_daemon_socket_path(tmp_path / "second")
+
+    assert first.parent == tmp_path / f"tsbc-{os.getuid()}"
+    assert first != second
+    assert first == get_daemon_socket_path(tmp_path / "first")
+
+    monkeypatch.setenv(DAEMON_SOCKET_ENV_VAR, str(tmp_path / "tsbc.sock"))
+    assert get_daemon_socket_path() == tmp_path / "tsbc.sock"
+
+
+def test_send_request_without_daemon_returns_none(tmp_path):
+    assert (
+        send_request(argv=["--all"], console_options={}, socket_path=tmp_path / "none")
+        is None
+    )
+
+    # A socket file that's left behind by a daemon that was killed.
+    stale_socket_path = tmp_path / "stale.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale_socket:
+        stale_socket.bind(str(stale_socket_path))
+
+    assert (
+        send_request(argv=["--all"], console_options={}, socket_path=stale_socket_path)
+        is None
+    )
+
+    # A file that isn't a socket, such as one placed at a predictable path by another user.
+    file_path = tmp_path / "file.sock"
+    file_path.write_text("")
+    assert (
+        send_request(argv=["--all"], console_options={}, socket_path=file_path) is None
+    )
+
+
+def test_create_private_directory_rejects_shared_directories(tmp_path):
+    private_dir = tmp_path / "private"
+    create_private_directory(private_dir)
+    assert private_dir.stat().st_mode & 0o777 == 0o700
+
+    shared_dir = tmp_path / "shared"
+    shared_dir.mkdir(mode=0o755)
+    shared_dir.chmod(0o755)
+    with pytest.raises(PermissionError):
+        create_private_directory(shared_dir)
+
+    linked_dir = tmp_path / "linked"
+    linked_dir.symlink_to(private_dir)
+    with pytest.raises(PermissionError):
+        create_private_directory(linked_dir)
+
+
+def test_messages_round_trip():
+    server, client = socket.socketpair()
+    with server, client:
+        thread = threading.Thread(
+            target=send_message, args=(client, {"argv": ["--all"]})
+        )
+        thread.start()
+        assert receive_message(server) == {"argv": ["--all"]}
+        thread.join()
+
+        client.close()
+        assert receive_message(server) is None
+
+
+def test_get_response_rejects_mismatched_clients():
+    request = {
+        "protocol": DAEMON_PROTOCOL_VERSION,
+        "version": "0.0.0-other",
+        "cwd": os.getcwd(),
+        "argv": ["--all"],
+    }
+
+    def handle_request(request):
+        return {"exit_code": 0, "stdout": "", "stderr": ""}
+
+    assert "error" in get_response(request, handle_request)
+    assert "error" in get_response({**request, "protocol": -1}, handle_request)
+
+
+def test_get_response_returns_error_for_failed_requests(monkeypatch):
+    monkeypatch.setattr("ts_backend_check.daemon.get_tool_version", lambda: "1.0.0")
+    request = {
+        "protocol": DAEMON_PROTOCOL_VERSION,
+        "version": "1.0.0",
+        "cwd": os.getcwd(),
+        "argv": ["--all"],
+    }
+
+    def handle_request(request):
+        raise RuntimeError("Failed request")
+
+    response = get_response(request, handle_request)
+    assert "exit_code" not in response
+    assert "Failed request" in response["error"]
@@ -0,0 +1,53 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import pickle
+
+from ts_backend_check.diagnostics import (
+    BLANK_FIELD_NOT_OPTIONAL,
+    DIAGNOSTIC_DESCRIPTIONS,
+    MESSAGE_FORMATTERS,
+    MISSING_FIELD,
+    MISSING_INTERFACE,
+    Diagnostic,
+)
+
+
+def test_diagnostic_formats_message_from_fields():
+    diagnostic = Diagnostic(
+        code=MISSING_FIELD,
+        model="EventModel",
+        models_file="models.py",
+        field="start_date",
+        interfaces=("Event",),
+    )
+
+    assert diagnostic.camel_field == "startDate"
+    assert diagnostic.summary == (
+        "Field 'start_date' (camelCase: 'startDate') from model 'EventModel' is missing in the TypeScript interfaces."
+    )
+    assert diagnostic.message.startswith(f"\n{diagnostic.summary}\n")
+    assert "in the frontend interface: Event\n" in diagnostic.message
+    assert diagnostic.message.endswith("'// ts-backend-check: ignore startDate'")
+
+
+def test_diagnostic_round_trips_through_dict_and_pickle():
+    diagnostic = Diagnostic(
+        code=BLANK_FIELD_NOT_OPTIONAL,
+        model="EventModel",
+        models_file="models.py",
+        field="description",
+        interfaces=("Event", "EventExtended"),
+        file="models.py",
+        line=9,
+        column=1,
+    )
+
+    assert Diagnostic.from_dict(diagnostic.to_dict()) == diagnostic
+    assert Diagnostic.from_dict(
+        {"code": MISSING_INTERFACE, "model": "EventModel", "models_file": "models.py"}
+    ) == Diagnostic(code=MISSING_INTERFACE, model="EventModel", models_file="models.py")
+    assert pickle.loads(pickle.dumps(diagnostic)) == diagnostic
+
+
+def test_every_code_has_a_description_and_message():
+    assert set(DIAGNOSTIC_DESCRIPTIONS) == set(MESSAGE_FORMATTERS)
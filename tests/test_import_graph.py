@@ -0,0 +1,148 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from pathlib import Path
+
+from ts_backend_check.cache import ParseCache
+from ts_backend_check.import_graph import (
+    ImportGraphLoader,
+    load_jsonc,
+    read_ts_config,
+)
+
+
+def write_files(root: Path, files: dict[str, str]) -> None:
+    for file_path, text in files.items():
+        (root / file_path).parent.mkdir(parents=True, exist_ok=True)
+        (root / file_path).write_text(text, encoding="utf-8")
+
+
+def test_load_follows_only_needed_imports(tmp_path):
+    write_files(
+        tmp_path,
+        {
+            "src/entry.ts": 'import type { Event as BaseEvent, User } from "./models.js";\n'
+            'import * as shared from "./shared";\n'
+            "export interface Event extends BaseEvent, shared.Named {\n"
+            "  isPrivate: boolean;\n"
+            "}\n",
+            "src/models.ts": 'export { Base as Event } from "./base";\n'
+            'export * from "./users";\n'
+            'export * from "./missing";\n',
+            "src/base.ts": "export interface Base {\n  title: string;\n}\n"
+            "export interface Unused {\n  id: string;\n}\n",
+            "src/users/index.ts": 'import { Event } from "../entry";\n'
+            "export type User = Pick<Person, 'name'>;\n"
+            "interface Person {\n  name: string;\n  event: Event;\n}\n",
+            "src/shared.ts": "export interface Named {\n  name: string;\n}\n",
+            "src/unrelated.ts": "export interface Unrelated {\n  id: string;\n}\n",
+        },
+    )
+    parsed_files = []
+    parse_cache = ParseCache()
+
+    def get_ts_file(path):
+        parsed_files.append(path)
+        return parse_cache.get_ts_file(path)
+
+    loaded_files = ImportGraphLoader(get_ts_file=get_ts_file).load(
+        entry_files=[tmp_path / "src/entry.ts"], names=["Event", "User", "Missing"]
+    )
+
+    assert [p.relative_to(tmp_path).as_posix() for p, _ in loaded_files] == [
+        "src/entry.ts",
+        "src/models.ts",
+        "src/shared.ts",
+        "src/users/index.ts",
+        "src/base.ts",
+    ]
+    assert len(parsed_files) == len(loaded_files)
+    declarations = {
+        p.name: [*ts_file.interfaces, *ts_file.type_aliases]
+        for p, ts_file in loaded_files
+    }
+    # Only the declarations that checked interfaces need are taken from imported files.
+    assert declarations == {
+        "entry.ts": ["Event"],
+        "models.ts": [],
+        "shared.ts": ["Named"],
+        "index.ts": ["Person", "User"],
+        "base.ts": ["Base"],
+    }
+
+
+def test_load_resolves_ts_config_paths(tmp_path):
+    write_files(
+        tmp_path,
+        {
+            "tsconfig.base.json": """{
+  // Aliases are inherited by configurations that extend this one.
+  "compilerOptions": {
+    "baseUrl": "./frontend",
+    "paths": { "@/*": ["./src/*", "./generated/*"], "api": ["./api/index.ts"], },
+  },
+}""",
+            "frontend/tsconfig.json": '{ "extends": "../tsconfig.base" }',
+            "frontend/src/entry.ts": 'import type { Event } from "@/models";\n'
+            'import type { User } from "api";\n'
+            'import type { Tag } from "types/tags";\n',
+            "frontend/generated/models.ts": "export interface Event {\n  title: string;\n}\n",
+            "frontend/api/index.ts": "export interface User {\n  name: string;\n}\n",
+            "frontend/types/tags.ts": "export interface Tag {\n  name: string;\n}\n",
+        },
+    )
+    ts_config = read_ts_config(tmp_path / "frontend/tsconfig.json")
+
+    assert ts_config.base_url == tmp_path / "frontend"
+    assert ts_config.paths == {
+        "@/*": ["./src/*", "./generated/*"],
+        "api": ["./api/index.ts"],
+    }
+
+    loaded_files = ImportGraphLoader(get_ts_file=ParseCache().get_ts_file).load(
+        entry_files=[tmp_path / "frontend/src/entry.ts"], names=["Event", "User", "Tag"]
+    )
+
+    assert [p.relative_to(tmp_path).as_posix() for p, _ in loaded_files] == [
+        "frontend/src/entry.ts",
+        "frontend/generated/models.ts",
+        "frontend/api/index.ts",
+        "frontend/types/tags.ts",
+    ]
+
+
+def test_load_jsonc():
+    assert load_jsonc('{\n  // "a": 1,\n  "b": "/* not a comment */", /* c */\n}') == {
+        "b": "/* not a comment */"
+    }
+
+
+def test_parse_cache_loads_interfaces_imported_by_ts_files(
+    return_valid_ts_interface_paths,
+):
+    interface_index = ParseCache().get_ts_files(
+        return_valid_ts_interface_paths[:1], interface_names=["Event", "User"]
+    )
+
+    # Interfaces that aren't checked are skipped rather than parsed.
+    assert list(interface_index.interfaces) == ["Event", "User"]
+    assert interface_index.interface_files["User"] == str(
+        return_valid_ts_interface_paths[1]
+    )
+    assert interface_index.imported_files == [str(return_valid_ts_interface_paths[1])]
+
+
+def test_parse_cache_labels_files_of_repeated_ts_files_by_path(tmp_path):
+    write_files(
+        tmp_path,
+        {
+            "a.ts": 'import type { User } from "./c";\n',
+            "c.ts": "export interface User {\n  name: string;\n}\n",
+        },
+    )
+    entry_file = tmp_path / "a.ts"
+    interface_index = ParseCache().get_ts_files(
+        [entry_file, entry_file], interface_names=["User"]
+    )
+
+    assert interface_index.interface_files == {"User": str(tmp_path / "c.ts")}
+    assert interface_index.imported_files == [str(tmp_path / "c.ts")]
@@ -0,0 +1,74 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from ts_backend_check.interface_index import InterfaceIndex
+from ts_backend_check.parsers.typescript_parser import TypeScriptParser
+
+
+def test_interface_index_records_files_and_duplicates():
+    first = TypeScriptParser(
+        "export interface Event {\n  title: string;\n}\n"
+    ).parse_interfaces()
+    second = TypeScriptParser(
+        "// tsbc: ignore id\nexport interface User {\n  name: string;\n}\n\nexport interface Event {\n  date: string;\n}\n"
+    ).parse_interfaces()
+
+    interface_index = InterfaceIndex()
+    interface_index.add_file("first.ts", first, frozenset())
+    interface_index.add_file("second.ts", second, frozenset({"id"}))
+
+    # Later declarations replace earlier ones while keeping the order of first declaration.
+    assert list(interface_index.interfaces) == ["Event", "User"]
+    assert interface_index.interfaces["Event"].properties == ("date",)
+    assert interface_index.ignored_fields == {"id"}
+    assert [(f, p.line) for f, p in interface_index.duplicates["Event"]] == [
+        ("first.ts", 1),
+        ("second.ts", 6),
+    ]
+
+    file_path, position = interface_index.get_property_location("Event", "date")
+    assert (file_path, position.line, position.column) == ("second.ts", 7, 3)
+    assert interface_index.get_property_location("User", "id") == (
+        interface_index.get_location("User")
+    )
+
+
+def test_interface_index_resolves_type_aliases_across_files():
+    base_file = TypeScriptParser(
+        "export interface Base {\n  id: string;\n}\n"
+    ).parse_file()
+    event_file = TypeScriptParser(
+        "export type Event = Base & {\n  title?: string;\n};\n"
+        "export type User = Omit<Missing, 'id'>;\n"
+    ).parse_file()
+
+    interface_index = InterfaceIndex()
+    for file_path, ts_file in [("base.ts", base_file), ("event.ts", event_file)]:
+        interface_index.add_file(
+            file_path,
+            interfaces=ts_file.interfaces,
+            ignored_fields=ts_file.ignored_fields,
+            type_aliases=ts_file.type_aliases,
+        )
+    interface_index.resolve_type_aliases()
+
+    assert list(interface_index.interfaces) == ["Base", "Event"]
+    assert interface_index.interfaces["Event"].properties == ("id", "title")
+    assert interface_index.interfaces["Event"].optional_properties == ("title",)
+    file_path, position = interface_index.get_location("Event")
+    assert (file_path, position.line, position.column) == ("event.ts", 1, 13)
+    file_path, position = interface_index.get_property_location("Event", "title")
+    assert (file_path, position.line, position.column) == ("event.ts", 2, 3)
+
+    # Type aliases replace interfaces of the same name in earlier files.
+    base_alias_file = TypeScriptParser("type Base = { id: string };\n").parse_file()
+    interface_index.add_file(
+        "base_alias.ts",
+        interfaces=base_alias_file.interfaces,
+        ignored_fields=base_alias_file.ignored_fields,
+        type_aliases=base_alias_file.type_aliases,
+    )
+    assert "Base" not in interface_index.interfaces
+    assert [f for f, _ in interface_index.duplicates["Base"]] == [
+        "base.ts",
+        "base_alias.ts",
+    ]
@@ -0,0 +1,239 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import io
+import json
+
+from ts_backend_check.lsp import (
+    LanguageServer,
+    get_line_starts,
+    get_range,
+)
+
+MODELS = """from django.db import models
+
+
+class EventModel(models.Model):
+    title = models.CharField(max_length=255)
+    description = models.TextField(blank=True)
+
+
+class UserModel(models.Model):
+    name = models.CharField(max_length=255)
+"""
+
+INTERFACES = """export interface Event {
+  title: string;
+  description: string;
+}
+"""
+
+
+def encode_messages(*messages):
+    stream = b""
+    for message in messages:
+        body = json.dumps({"jsonrpc": "2.0", **message}).encode("utf-8")
+        stream += f"Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body
+
+    return stream
+
+
+def decode_messages(stream):
+    messages = []
+    while stream:
+        header, _, stream = stream.partition(b"\r\n\r\n")
+        content_length = int(header.decode("ascii").split(":")[1])
+        messages.append(json.loads(stream[:content_length]))
+        stream = stream[content_length:]
+
+    return messages
+
+
+def create_project(tmp_path):
+    (tmp_path / "models.py").write_text(MODELS)
+    (tmp_path / "interfaces.ts").write_text(INTERFACES)
+    (tmp_path / ".ts-backend-check.yaml").write_text(
+        "events:\n"
+        "  backend_model_path: models.py\n"
+        "  ts_interface_paths:\n"
+        "    - interfaces.ts\n"
+        "  check_blank_model_fields: true\n"
+        "  backend_to_ts_model_name_conversions:\n"
+        "    EventModel: ['Event']\n"
+        "    UserModel: ['User']\n"
+    )
+
+    return (tmp_path / "interfaces.ts").as_uri()
+
+
+def test_get_range_counts_utf16_code_units():
+    text = "// 🙂\nexport interface Event {}\n"
+    line_starts = get_line_starts(text)
+
+    assert get_range(text, line_starts, 3, 4) == {
+        "start": {"line": 0, "character": 3},
+        "end": {"line": 0, "character": 5},
+    }
+    assert get_range(text, line_starts, 5, 11)["start"] == {"line": 1, "character": 0}
+
+
+def test_language_server_ranges_count_characters_before_names(tmp_path):
+    uri = create_project(tmp_path)
+    interfaces = INTERFACES.replace("  description:", "  /* café 🙂 */ description:")
+    server = LanguageServer(input_stream=io.BytesIO(), output_stream=io.BytesIO())
+    server.initialize({"rootUri": tmp_path.as_uri()})
+
+    server.update_document(uri=uri, text=interfaces)
+
+    # The accented character is two bytes and one UTF-16 code unit, the emoji four bytes and two.
+    diagnostics = server.diagnostics["events"][tmp_path / "interfaces.ts"]
+    assert [d["range"] for d in diagnostics] == [
+        {
+            "start": {"line": 2, "character": 16},
+            "end": {"line": 2, "character": 27},
+        }
+    ]
+
+
+def test_language_server_publishes_diagnostics_for_open_documents(tmp_path):
+    uri = create_project(tmp_path)
+    fixed_interfaces = INTERFACES.replace("description:", "description?:")
+    input_stream = io.BytesIO(
+        encode_messages(
+            {"id": 1, "method": "initialize", "params": {"rootUri": tmp_path.as_uri()}},
+            {"method": "initialized", "params": {}},
+            {
+                "method": "textDocument/didOpen",
+                "params": {
+                    "textDocument": {
+                        "uri": uri,
+                        "languageId": "typescript",
+                        "version": 1,
+                        "text": INTERFACES,
+                    }
+                },
+            },
+            {
+                "method": "textDocument/didChange",
+                "params": {
+                    "textDocument": {"uri": uri, "version": 2},
+                    "contentChanges": [{"text": fixed_interfaces}],
+                },
+            },
+            {"id": 2, "method": "unknown/method"},
+            {"id": 3, "method": "shutdown"},
+            {"method": "exit"},
+        )
+    )
+    output_stream = io.BytesIO()
+    server = LanguageServer(input_stream=input_stream, output_stream=output_stream)
+
+    assert server.serve() == 0
+
+    messages = decode_messages(output_stream.getvalue())
+    assert messages[0]["result"]["capabilities"]["textDocumentSync"]["change"] == 1
+
+    published = [
+        m["params"]
+        for m in messages
+        if m.get("method") == "textDocument/publishDiagnostics"
+    ]
+    models_uri = (tmp_path / "models.py").as_uri()
+
+    # The optional mismatch is shown at the property and the missing interface at the model.
+    first = {p["uri"]: p["diagnostics"] for p in published[:2]}
+    assert [d["range"]["start"] for d in first[uri]] == [{"line": 2, "character": 2}]
+    assert "blank to optional" in first[uri][0]["message"]
+    assert [d["range"]["start"] for d in first[models_uri]] == [
+        {"line": 8, "character": 6}
+    ]
+
+    # Fixing the document clears its diagnostics while those of the models file remain.
+    second = {p["uri"]: p["diagnostics"] for p in published[2:]}
+    assert second[uri] == []
+    assert len(second[models_uri]) == 1
+
+    assert messages[-2]["error"]["code"] == -32601
+    assert messages[-1] == {"jsonrpc": "2.0", "id": 3, "result": None}
+
+
+def test_language_server_reparses_only_changed_documents(tmp_path):
+    uri = create_project(tmp_path)
+    server = LanguageServer(input_stream=io.BytesIO(), output_stream=io.BytesIO())
+    server.initialize({"rootUri": tmp_path.as_uri()})
+
+    server.update_document(uri=uri, text=INTERFACES)
+    server.update_document(uri=uri, text=INTERFACES.replace("title", "name"))
+    server.update_document(uri=uri, text=None)
+
+    # The models file is parsed once and the interfaces file is only read from disk once it's closed.
+    assert server.parse_cache.misses == 2
+    assert server.parse_cache.hits == 2
+    assert tmp_path / "interfaces.ts" not in server.documents
+
+
+def test_language_server_tracks_files_imported_by_repeated_ts_files(tmp_path):
+    uri = create_project(tmp_path)
+    (tmp_path / "users.ts").write_text("export interface User {\n  name: string;\n}\n")
+    config_path = tmp_path / ".ts-backend-check.yaml"
+    config_path.write_text(
+        config_path.read_text().replace(
+            "    - interfaces.ts\n", "    - interfaces.ts\n    - interfaces.ts\n"
+        )
+    )
+    server = LanguageServer(input_stream=io.BytesIO(), output_stream=io.BytesIO())
+    server.initialize({"rootUri": tmp_path.as_uri()})
+
+    server.update_document(
+        uri=uri, text=f'import type {{ User }} from "./users";\n{INTERFACES}'
+    )
+
+    # Edits to the imported file recheck the identifier even though the entry file is repeated.
+    assert server.imported_files["events"] == {(tmp_path / "users.ts").resolve()}
+
+
+def test_language_server_reports_parse_errors_and_bad_requests(tmp_path):
+    create_project(tmp_path)
+    models_uri = (tmp_path / "models.py").as_uri()
+    invalid_models = MODELS.replace("class UserModel", "class UserModel(")
+    input_stream = io.BytesIO(
+        encode_messages(
+            {"id": 1, "method": "initialize", "params": {"rootUri": tmp_path.as_uri()}},
+            {
+                "method": "textDocument/didOpen",
+                "params": {"textDocument": {"uri": models_uri, "text": invalid_models}},
+            },
+            {
+                "method": "textDocument/didChange",
+                "params": {
+                    "textDocument": {"uri": models_uri},
+                    "contentChanges": [{"text": MODELS}],
+                },
+            },
+            {"id": 2, "method": "initialize", "params": {"rootUri": 1}},
+            {"method": "textDocument/didOpen", "params": {}},
+        )
+        + b"Content-Length: 5\r\n\r\n{bad}"
+        + encode_messages({"id": 3, "method": "shutdown"}, {"method": "exit"})
+    )
+    output_stream = io.BytesIO()
+    server = LanguageServer(input_stream=input_stream, output_stream=output_stream)
+
+    # Half-typed models and bad requests are reported without stopping the server.
+    assert server.serve() == 0
+
+    messages = decode_messages(output_stream.getvalue())
+    published = [
+        m["params"]["diagnostics"]
+        for m in messages
+        if m.get("method") == "textDocument/publishDiagnostics"
+        and m["params"]["uri"] == models_uri
+    ]
+    assert [d["range"]["start"] for d in published[0]] == [{"line": 8, "character": 0}]
+    assert "Failed to parse" in published[0][0]["message"]
+    # Fixing the document replaces the parse error with the errors of the check.
+    assert "Failed to parse" not in published[1][0]["message"]
+
+    assert messages[-4]["error"]["code"] == -32603
+    assert messages[-3]["method"] == "window/logMessage"
+    assert messages[-2]["error"]["code"] == -32700
+    assert messages[-1] == {"jsonrpc": "2.0", "id": 3, "result": None}
@@ -0,0 +1,29 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from ts_backend_check.model_index import ModelIndex
+from ts_backend_check.parsers.django_parser import extract_model_fields
+
+
+def test_model_index_records_files_and_duplicates():
+    first = extract_model_fields(
+        "events.py",
+        [],
+        source="class Event(models.Model):\n    title = models.CharField()\n",
+    )
+    second = extract_model_fields(
+        "users.py",
+        [],
+        source="class User(models.Model):\n    name = models.CharField()\n\n\n"
+        "class Event(models.Model):\n    date = models.DateField()\n",
+    )
+
+    model_index = ModelIndex()
+    model_index.add_file("events.py", first)
+    model_index.add_file("users.py", second)
+
+    # Later definitions replace earlier ones while keeping the order of first definition.
+    assert list(model_index.models) == ["Event", "User"]
+    assert model_index.models["Event"].fields == ("date",)
+    assert model_index.model_files == {"Event": "users.py", "User": "users.py"}
+    assert model_index.duplicates == {"Event": [("events.py", 1), ("users.py", 5)]}
+    assert model_index.get_location("User") == ("users.py", 1)
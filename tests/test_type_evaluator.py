@@ -0,0 +1,142 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from ts_backend_check.parsers.typescript_parser import TypeScriptParser
+from ts_backend_check.type_evaluator import TypeEvaluator
+
+TYPES = """
+export interface Base {
+  id: string;
+  createdAt?: string;
+}
+
+export interface Event extends Base {
+  title: string;
+  date?: string;
+}
+
+type Timestamped<T> = T & { updatedAt: string };
+export type EventDraft = Partial<Omit<Event, "id" | 'createdAt'>> & {
+  draft: boolean;
+};
+export type EventSummary = Pick<Timestamped<Event>, "title" | "updatedAt">;
+export type RequiredEvent = Readonly<Required<Event>>;
+type EventOrUser = Event | User;
+type Loop = Loop & { loop: string };
+"""
+
+
+def get_type_evaluator(text: str) -> TypeEvaluator:
+    ts_file = TypeScriptParser(text).parse_file()
+
+    return TypeEvaluator(
+        interfaces=ts_file.interfaces, type_aliases=ts_file.type_aliases
+    )
+
+
+def test_evaluate_type_aliases():
+    interfaces = get_type_evaluator(TYPES).evaluate_type_aliases()
+
+    assert list(interfaces) == ["EventDraft", "EventSummary", "RequiredEvent"]
+    assert interfaces["EventDraft"].properties == ("title", "date", "draft")
+    assert interfaces["EventDraft"].optional_properties == ("title", "date")
+    assert interfaces["EventSummary"].properties == ("title", "updatedAt")
+    assert interfaces["EventSummary"].optional_properties == ()
+    assert interfaces["RequiredEvent"].properties == (
+        "id",
+        "createdAt",
+        "title",
+        "date",
+    )
+    assert interfaces["RequiredEvent"].optional_properties == ()
+
+    draft_position = interfaces["EventDraft"].get_property_position("draft")
+    assert draft_position is not None
+    assert (draft_position.line, draft_position.column) == (14, 3)
+
+
+def test_evaluate_memoizes_shared_types(monkeypatch):
+    text = "interface Base {\n  id: string;\n}\n" + "".join(
+        f"type Derived{i} = Omit<Base, 'id'> & {{ value{i}: string }};\n"
+        for i in range(100)
+    )
+    type_evaluator = get_type_evaluator(text)
+    evaluated_interfaces = []
+    evaluate_interface = type_evaluator._evaluate_interface
+
+    def record_interface(interface):
+        evaluated_interfaces.append(interface.name)
+        return evaluate_interface(interface)
+
+    monkeypatch.setattr(type_evaluator, "_evaluate_interface", record_interface)
+
+    interfaces = type_evaluator.evaluate_type_aliases()
+
+    assert len(interfaces) == 100
+    assert interfaces["Derived99"].properties == ("value99",)
+    assert evaluated_interfaces == ["Base"]
+
+
+def test_evaluate_unsupported_and_cyclic_types():
+    type_evaluator = get_type_evaluator(TYPES)
+
+    assert type_evaluator.evaluate("EventOrUser") is None
+    assert type_evaluator.evaluate("Loop") is None
+    assert type_evaluator.evaluate("Missing") is None
+    # Generic type aliases are only evaluated with their type arguments.
+    assert type_evaluator.get_interface("Timestamped") is None
+
+
+def test_properties_of_other_files_are_located_at_the_type_alias():
+    base_file = TypeScriptParser("interface Base {\n  id: string;\n}\n").parse_file()
+    alias_file = TypeScriptParser(
+        "\n\ntype Event = Base & {\n  title: string;\n};\n"
+    ).parse_file()
+    type_evaluator = TypeEvaluator(
+        interfaces=base_file.interfaces,
+        type_aliases=alias_file.type_aliases,
+        files={"Base": "base.ts", "Event": "event.ts"},
+    )
+
+    event = type_evaluator.get_interface("Event")
+
+    assert event is not None
+    assert event.get_property_position("id") == event.position
+    assert event.get_property_position("title")[1:] == (4, 3)
+
+
+def test_get_interface_flattens_extends_chains():
+    type_evaluator = get_type_evaluator(
+        """interface Base {
+  id: string;
+  title?: string;
+}
+interface Named extends Base {
+  name: string;
+}
+interface Dated extends Base {
+  date: string;
+}
+interface Event extends Named, models.Dated, external.Missing {
+  title: string;
+  isPrivate: boolean;
+}
+interface A extends B {
+  a: string;
+}
+interface B extends A {
+  b: string;
+}
+"""
+    )
+
+    event = type_evaluator.get_interface("Event")
+
+    assert event.properties == ("id", "title", "name", "date", "isPrivate")
+    # Own properties replace inherited ones while keeping their place.
+    assert event.optional_properties == ()
+    assert event.get_property_position("title")[1:] == (12, 3)
+    assert event.get_property_position("id")[1:] == (2, 3)
+    assert event.parents == ("Named", "models.Dated", "external.Missing")
+    assert type_evaluator.get_interface("Base") is type_evaluator.interfaces["Base"]
+    # Parents that extend the interface themselves are skipped.
+    assert type_evaluator.get_interface("A").properties == ("b", "a")
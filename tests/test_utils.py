@@ -3,7 +3,19 @@
 Tests for utility functions in ts-backend-check.
 """
 
-from ts_backend_check.utils import is_ordered_subset, snake_to_camel
+from unittest.mock import patch
+
+from ts_backend_check.utils import (
+    LineCounter,
+    get_available_cpu_count,
+    get_backend_model_file_paths,
+    get_cgroup_cpu_quota,
+    get_line_starts,
+    is_ordered_subset,
+    map_file,
+    release_mapped_pages,
+    snake_to_camel,
+)
 
 
 def test_snake_to_camel():
@@ -25,3 +37,90 @@ def test_is_ordered_subset():
     assert is_ordered_subset([1, 2, 3], [1, 2])
     assert is_ordered_subset([1, 2, 3], [2])
     assert not is_ordered_subset([1, 2, 3], [2, 1])
+
+
+def test_get_line_starts():
+    assert get_line_starts("ab\ncd\n\nef") == [0, 3, 6, 7]
+
+
+def test_line_counter_counts_characters(monkeypatch):
+    # A small chunk size checks that lines and columns are carried across chunks.
+    monkeypatch.setattr("ts_backend_check.utils.SCAN_CHUNK_SIZE", 2)
+    buffer = "ab\ncd\n\néf".encode("utf-8")
+    line_counter = LineCounter(buffer)
+
+    assert line_counter.get_line_and_column(0) == (1, 1)
+    assert line_counter.get_line_and_column(4) == (2, 2)
+    assert line_counter.get_line_and_column(6) == (3, 1)
+    assert line_counter.get_line_and_column(buffer.index(b"f")) == (4, 2)
+
+
+def test_map_file(tmp_path):
+    file_path = tmp_path / "types.ts"
+    file_path.write_bytes(b"")
+    with map_file(file_path) as mapped_file:
+        assert mapped_file == b""
+
+    file_path.write_bytes(b"interface A {}\n" * 2000)
+    with map_file(file_path) as mapped_file:
+        release_mapped_pages(mapped_file, 0, len(mapped_file))
+        # Released pages are read again from the file when they're accessed.
+        assert mapped_file[:14] == b"interface A {}"
+        assert len(mapped_file) == 30000
+
+
+def test_get_cgroup_cpu_quota_v2(tmp_path):
+    (tmp_path / "cpu.max").write_text("150000 100000\n")
+
+    with patch("ts_backend_check.utils.CGROUP_ROOT_PATH", tmp_path):
+        assert get_cgroup_cpu_quota() == 1.5
+
+    (tmp_path / "cpu.max").write_text("max 100000\n")
+
+    with patch("ts_backend_check.utils.CGROUP_ROOT_PATH", tmp_path):
+        assert get_cgroup_cpu_quota() is None
+
+
+def test_get_cgroup_cpu_quota_v1(tmp_path):
+    (tmp_path / "cpu").mkdir()
+    (tmp_path / "cpu" / "cpu.cfs_quota_us").write_text("200000\n")
+    (tmp_path / "cpu" / "cpu.cfs_period_us").write_text("100000\n")
+
+    with patch("ts_backend_check.utils.CGROUP_ROOT_PATH", tmp_path):
+        assert get_cgroup_cpu_quota() == 2.0
+
+
+def test_get_available_cpu_count_respects_quota():
+    with patch("ts_backend_check.utils.get_cgroup_cpu_quota", return_value=1.5):
+        assert 1 <= get_available_cpu_count() <= 2
+
+    with patch("ts_backend_check.utils.get_cgroup_cpu_quota", return_value=None):
+        assert get_available_cpu_count() >= 1
+
+
+def test_get_backend_model_file_paths(tmp_path):
+    for file_path in [
+        "events/models/__init__.py",
+        "events/models/event.py",
+        "events/models/tags/tag.py",
+        "events/models/migrations/0001_initial.py",
+        "events/models/README.md",
+        "users/models.py",
+    ]:
+        (tmp_path / file_path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / file_path).write_text("")
+
+    models_file = tmp_path / "users/models.py"
+    assert get_backend_model_file_paths(models_file) == [models_file]
+    # The Python files of directories are found recursively without migrations.
+    assert get_backend_model_file_paths(tmp_path / "events/models") == [
+        tmp_path / "events/models/__init__.py",
+        tmp_path / "events/models/event.py",
+        tmp_path / "events/models/tags/tag.py",
+    ]
+    assert get_backend_model_file_paths(tmp_path / "*/models.py") == [models_file]
+    assert get_backend_model_file_paths(tmp_path / "**/tag*.py") == [
+        tmp_path / "events/models/tags/tag.py"
+    ]
+    assert get_backend_model_file_paths(tmp_path / "missing.py") == []
+    assert get_backend_model_file_paths(tmp_path / "*/missing.py") == []
@@ -0,0 +1,59 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import sys
+import threading
+
+import pytest
+
+from ts_backend_check.watcher import (
+    InotifyWatcher,
+    PollingWatcher,
+    create_file_watcher,
+)
+
+
+def test_polling_watcher_reports_changed_files(tmp_path):
+    watched_file = tmp_path / "interfaces.ts"
+    watched_file.write_text("export interface Event {}\n")
+    other_file = tmp_path / "other.ts"
+    other_file.write_text("export interface Other {}\n")
+
+    watcher = PollingWatcher([watched_file, other_file], poll_interval=0.01)
+    assert watcher.wait_for_changes(timeout=0) == set()
+
+    watched_file.write_text("export interface Event {\n  title: string;\n}\n")
+    assert watcher.wait_for_changes(timeout=1) == {watched_file.resolve()}
+
+    watched_file.unlink()
+    assert watcher.poll() == {watched_file.resolve()}
+    assert watcher.poll() == set()
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Requires inotify.")
+def test_inotify_watcher_reports_replaced_files(tmp_path):
+    watched_file = tmp_path / "interfaces.ts"
+    watched_file.write_text("export interface Event {}\n")
+    (tmp_path / "unwatched.ts").write_text("")
+
+    watcher = InotifyWatcher([watched_file])
+    try:
+        assert watcher.wait_for_changes(timeout=0) == set()
+
+        def replace_file() -> None:
+            (tmp_path / "unwatched.ts").write_text("export interface Other {}\n")
+            new_file = tmp_path / "interfaces.ts.tmp"
+            new_file.write_text("export interface Event {\n  title: string;\n}\n")
+            new_file.replace(watched_file)
+
+        threading.Timer(0.05, replace_file).start()
+        assert watcher.wait_for_changes(timeout=5) == {watched_file.resolve()}
+
+    finally:
+        watcher.close()
+
+
+def test_create_file_watcher_falls_back_to_polling(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "platform", "darwin")
+    watcher = create_file_watcher([tmp_path / "interfaces.ts"])
+
+    assert isinstance(watcher, PollingWatcher)
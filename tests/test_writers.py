@@ -0,0 +1,125 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import io
+import json
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pytest
+
+from ts_backend_check.diagnostics import (
+    MISSING_FIELD,
+    MISSING_INTERFACE,
+    Diagnostic,
+)
+from ts_backend_check.writers import (
+    DiagnosticWriter,
+    GitHubWriter,
+    JsonLinesWriter,
+    JUnitWriter,
+    SarifWriter,
+    create_writer,
+)
+
+MISSING_FIELD_DIAGNOSTIC = Diagnostic(
+    code=MISSING_FIELD,
+    model="EventModel",
+    models_file="backend/models.py",
+    field="title",
+    interfaces=("Event",),
+    file="backend/models.py",
+    line=9,
+    column=1,
+)
+MISSING_INTERFACE_DIAGNOSTIC = Diagnostic(
+    code=MISSING_INTERFACE, model="UserModel", models_file="backend/models.py"
+)
+
+
+def write_results(writer_class):
+    stream = io.StringIO()
+    writer = writer_class(stream=stream)
+    writer.start()
+    writer.write(identifier="events", diagnostic=MISSING_FIELD_DIAGNOSTIC)
+    writer.write(identifier="events", diagnostic=MISSING_INTERFACE_DIAGNOSTIC)
+    writer.end_identifier(
+        identifier="events", backend_model_file_path=Path("models.py"), n_errors=2
+    )
+    writer.end_identifier(
+        identifier="users", backend_model_file_path=Path("models.py"), n_errors=0
+    )
+    writer.end()
+
+    return stream.getvalue()
+
+
+def test_create_writer_returns_none_for_text():
+    assert create_writer(output_format="text", stream=io.StringIO()) is None
+    assert isinstance(
+        create_writer(output_format="sarif", stream=io.StringIO()), SarifWriter
+    )
+
+
+def test_writers_without_write_cannot_be_created():
+    class IncompleteWriter(DiagnosticWriter):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteWriter(stream=io.StringIO())
+
+
+def test_json_lines_writer():
+    lines = [json.loads(line) for line in write_results(JsonLinesWriter).splitlines()]
+
+    assert [line["code"] for line in lines] == [MISSING_FIELD, MISSING_INTERFACE]
+    assert lines[0]["identifier"] == "events"
+    assert lines[0]["line"] == 9
+    assert lines[0]["message"] == MISSING_FIELD_DIAGNOSTIC.message.strip()
+
+
+def test_sarif_writer_produces_a_valid_log():
+    sarif = json.loads(write_results(SarifWriter))
+    run = sarif["runs"][0]
+
+    assert sarif["version"] == "2.1.0"
+    assert {r["id"] for r in run["tool"]["driver"]["rules"]} >= {
+        MISSING_FIELD,
+        MISSING_INTERFACE,
+    }
+    assert [r["ruleId"] for r in run["results"]] == [MISSING_FIELD, MISSING_INTERFACE]
+    assert run["results"][0]["locations"][0]["physicalLocation"] == {
+        "artifactLocation": {"uri": "backend/models.py"},
+        "region": {"startLine": 9, "startColumn": 1},
+    }
+    assert "locations" not in run["results"][1]
+
+
+def test_sarif_writer_without_results():
+    stream = io.StringIO()
+    writer = SarifWriter(stream=stream)
+    writer.start()
+    writer.end()
+
+    assert json.loads(stream.getvalue())["runs"][0]["results"] == []
+
+
+def test_junit_writer_produces_a_test_suite_per_identifier():
+    root = ET.fromstring(write_results(JUnitWriter))
+    suites = root.findall("testsuite")
+
+    assert [s.get("name") for s in suites] == ["events", "users"]
+    assert [c.get("name") for c in suites[0]] == ["EventModel.title", "UserModel"]
+    assert suites[0][0].find("failure").get("type") == MISSING_FIELD
+    assert suites[0][0].get("line") == "9"
+    assert suites[1][0].find("failure") is None
+
+
+def test_github_writer_escapes_annotations():
+    lines = write_results(GitHubWriter).splitlines()
+
+    assert len(lines) == 2
+    assert lines[0].startswith(
+        "::error file=backend/models.py,line=9,col=1,title=ts-backend-check (events)%3A Field 'title'"
+    )
+    assert "%0AExpected to find this field" in lines[0]
+    assert lines[1].startswith("::error title=")